@@ -57,6 +57,7 @@ from cgwidgets.utils import (
 from cgwidgets.delegates import SlideDelegate
 
 from cgwidgets.settings.colors import (iColor)
+from cgwidgets.settings.stylesheets import compileStyleSheet
 from cgwidgets.settings import attrs
 
 from cgwidgets.widgets import AbstractFloatInputWidget, AbstractIntInputWidget, IntInputWidget
@@ -371,7 +372,6 @@ Notes:
 
     """ COLORS """
     def updateStyleSheet(self):
-        style_sheet_args = iColor.style_sheet_args
         update_kwargs = {
             'border_width': self.borderWidth(),
             'selected_color': repr(self.rgba_selection),
@@ -381,10 +381,7 @@ Notes:
             'rgba_fg_slide': self.rgba_fg_slide,
         }
 
-        style_sheet_args.update(update_kwargs)
-
-        #
-        style_sheet = """
+        style_sheet = compileStyleSheet("""
         LadderDelegate{{
             background-color: rgba{rgba_background_00};
             border: {border_width}px solid rgba{rgba_selected_hover}
@@ -416,9 +413,10 @@ Notes:
            stop:1 rgba{rgba_fg_slide}
        );
        }}
-        """.format(**style_sheet_args)
+        """, **update_kwargs)
 
-        self.setStyleSheet(style_sheet)
+        if style_sheet != self.styleSheet():
+            self.setStyleSheet(style_sheet)
 
     @property
     def rgba_bg_slide(self):
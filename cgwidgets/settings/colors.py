@@ -19,7 +19,13 @@ from cgwidgets.settings import attrs
 
 
 class Colors(dict):
+    """
+    Attributes:
+        version (int): incremented every time a color is changed, so that
+            anything caching values created from the colors knows to update
+    """
     def __init__(self):
+        self._version = 0
 
         """ COLOR GENERATOR """
         # CONSTANT
@@ -80,6 +86,17 @@ class Colors(dict):
 
         self.style_sheet_args = self.createStyleSheetArgs()
 
+    def __setitem__(self, key, value):
+        super(Colors, self).__setitem__(key, value)
+        self._version += 1
+
+    def update(self, *args, **kwargs):
+        super(Colors, self).update(*args, **kwargs)
+        self._version += 1
+
+    def version(self):
+        return self._version
+
     def createStyleSheetArgs(self):
         args = {}
         for color in list(self.keys()):
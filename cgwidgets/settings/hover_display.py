@@ -10,14 +10,27 @@ be wrapped like:
     {type}:focus{focus_properties}{{
                 {focus_ss}
     }}
+
+Hover displays are driven by dynamic properties.  Each unique set of arguments
+provided to "installHoverDisplaySS()" creates one block of rules (HoverDisplayRules),
+which is matched using the "hover_display_ss_<name>" property of the widget.  The
+rules are installed once in the widgets own style sheet, or in the style sheet of
+the scope provided (ie the parent layout), so installing, or removing a hover display
+afterwards will only change that property, and re-polish that one widget.
+    Note:
+        Widgets that set their own style sheet should append "getHoverDisplaySS()"
+        to it, or use "updateHoverDisplaySS()", so that they keep their hover displays.
 """
 import re
 import copy
 
+from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import Qt
+
 from cgwidgets.settings import attrs
 
 from .colors import iColor
-from .stylesheets import convertDictToCSSFlags, background_radial
+from .stylesheets import convertDictToCSSFlags, background_radial, compileStyleSheet
 
 
 """ UTILS """
@@ -39,7 +52,7 @@ def compileSSArgs(widget, hover_type_flags, hover_object):
 
     """
     # get default colors
-    style_sheet_args = iColor.style_sheet_args
+    style_sheet_args = dict(iColor.style_sheet_args)
 
     # add dynamic properties
     style_sheet_args.update({
@@ -52,16 +65,20 @@ def compileSSArgs(widget, hover_type_flags, hover_object):
     style_sheet_args.update({
         "rgba_selected_hover": iColor["rgba_selected_hover"],
         "rgba_selected_background": iColor["rgba_selected_background"],
-        "background_hover_radial": background_radial.format(
+        "background_hover_radial": compileStyleSheet(
+            background_radial,
             rgba_background_00=iColor["rgba_background_00"],
             rgba_background_2=iColor["rgba_selected_background"]),
-        "background_cancel_radial":background_radial.format(
+        "background_cancel_radial": compileStyleSheet(
+            background_radial,
             rgba_background_00=iColor["rgba_background_00"],
             rgba_background_2=iColor["rgba_cancel"]),
-        "background_accept_radial":background_radial.format(
+        "background_accept_radial": compileStyleSheet(
+            background_radial,
             rgba_background_00=iColor["rgba_background_00"],
             rgba_background_2=iColor["rgba_accept"]),
-        "background_select_hover_radial":background_radial.format(
+        "background_select_hover_radial": compileStyleSheet(
+            background_radial,
             rgba_background_00=iColor["rgba_background_00"],
             rgba_background_2=iColor["rgba_selected_hover"])
     })
@@ -69,10 +86,10 @@ def compileSSArgs(widget, hover_type_flags, hover_object):
     # add widget SS
     style_sheet_args.update({
         'type': type(widget).__name__,
-        'hover_ss': hover_object.hoverSS().format(**style_sheet_args),
-        'focus_ss': hover_object.focusSS().format(**style_sheet_args),
-        'hover_focus_ss': hover_object.focusSS().format(**style_sheet_args),
-        'default_ss': hover_object.defaultSS().format(**style_sheet_args)
+        'hover_ss': compileStyleSheet(hover_object.hoverSS(), style_sheet_args),
+        'focus_ss': compileStyleSheet(hover_object.focusSS(), style_sheet_args),
+        'hover_focus_ss': compileStyleSheet(hover_object.focusSS(), style_sheet_args),
+        'default_ss': compileStyleSheet(hover_object.defaultSS(), style_sheet_args)
     })
 
     return style_sheet_args
@@ -94,6 +111,9 @@ class BorderStyleSheet(object):
     SOLID = "solid"
     DOTTED = "dotted"
 
+    # cache of the style sheets created, by (walls, style, color)
+    STYLE_SHEETS = {}
+
     def __init__(self):
         self._style = BorderStyleSheet.SOLID
         self._color = iColor["rgba_selected_hover"]
@@ -142,6 +162,11 @@ class BorderStyleSheet(object):
 
         Returns (string): Style Sheet
         """
+        # get cached style sheet
+        key = (tuple(self.walls()), self.style(), repr(self.color()))
+        if key in BorderStyleSheet.STYLE_SHEETS:
+            return BorderStyleSheet.STYLE_SHEETS[key]
+
         # create default attrs
         all_walls = ['top', 'bottom', 'right', 'left']
         style_sheet = ""
@@ -153,6 +178,7 @@ class BorderStyleSheet(object):
 
             all_walls.remove(side)
 
+        BorderStyleSheet.STYLE_SHEETS[key] = style_sheet
         return style_sheet
 
 
@@ -361,12 +387,12 @@ class HoverStyleSheet(object):
             self.setDefaultSS(style_sheet_object.styleSheet())
 
             # setup hover
-            hover_style_sheet = copy.deepcopy(style_sheet_object)
+            hover_style_sheet = copy.copy(style_sheet_object)
             hover_style_sheet.setColor(self.hoverColor())
             hover_style_sheet.setStyle(self.borderHoverStyleType())
 
             # setup focus
-            focus_style_sheet = copy.deepcopy(style_sheet_object)
+            focus_style_sheet = copy.copy(style_sheet_object)
             focus_style_sheet.setStyle(self.borderFocusStyleType())
             focus_style_sheet.setColor(self.focusColor())
 
@@ -376,6 +402,164 @@ class HoverStyleSheet(object):
             self.setHoverSS(hover_style_sheet.styleSheet())
 
 
+""" RULES """
+class HoverDisplayRules(object):
+    """
+    Shared rule set for all of the hover displays.
+
+    Each unique set of arguments passed to installHoverDisplaySS() is registered
+    once, and given a key.  Widgets then select their rules by setting the
+    "hover_display_ss_<name>" property to that key.  The rules are installed in
+    the style sheet of the widget, or of the scope provided, see getHoverDisplaySS().
+    """
+    def __init__(self):
+        self._keys = {}
+        self._rules = {}
+
+    def key(self, args):
+        """
+        Args:
+            args (tuple): hashable arguments used to create the rules
+
+        Returns (str): key of the rules registered for the args, or None
+        """
+        return self._keys.get(args)
+
+    def addRules(self, args, create_rules):
+        """
+        Registers a new set of rules
+
+        Args:
+            args (tuple): hashable arguments used to create the rules
+            create_rules (function): takes the key, and returns the style sheet
+
+        Returns (str): key of the rules
+        """
+        key = "k{num}".format(num=len(self._keys))
+        self._keys[args] = key
+        self._rules[key] = create_rules(key)
+        return key
+
+    def rules(self, key):
+        """
+        Args:
+            key (str): key of the rules
+
+        Returns (str): style sheet of the rules
+        """
+        return self._rules[key]
+
+
+hover_display_rules = HoverDisplayRules()
+
+
+def getHoverDisplayPropertyName(name):
+    """
+    Args:
+        name (str): name of the hover display
+
+    Returns (str): name of the dynamic property used to select the hover display rules
+    """
+    return "hover_display_ss_{name}".format(name=re.sub(r"\W", "_", name))
+
+
+def repolishWidget(widget):
+    """ Re-polishes a widget after one of the properties used by its style sheet has changed"""
+    # widgets that have not been polished yet will be when they are shown
+    if not widget.testAttribute(Qt.WA_WState_Polished):
+        return
+
+    # some views overwrite style()
+    style = QWidget.style(widget)
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+
+
+def setHoverDisplayProperty(widget, name, key, repolish=True):
+    """
+    Sets the hover display property, and re-polishes the widget if it has changed
+
+    Args:
+        widget (QWidget): widget to update
+        name (str): name of the hover display
+        key (str): key of the rules to display, an empty string disables the hover display
+        repolish (bool): determines if the widget should be re-polished when the property changes
+
+    Returns (bool): True if the property has changed
+    """
+    property_name = getHoverDisplayPropertyName(name)
+    if widget.property(property_name) == key:
+        return False
+    if widget.property(property_name) is None and not key:
+        return False
+    widget.setProperty(property_name, key)
+
+    if repolish:
+        repolishWidget(widget)
+    return True
+
+
+def getHoverDisplayKeys(widget):
+    """
+    Args:
+        widget (QWidget):
+
+    Returns (list): of the keys of the rules that need to be in the widgets style sheet.
+        These are the hover displays installed on the widget, and the hover displays
+        that were installed using this widget as their scope.
+    """
+    keys = set()
+    for property_name in widget.dynamicPropertyNames():
+        property_name = bytes(property_name).decode()
+        if property_name.startswith("hover_display_ss_"):
+            key = widget.property(property_name)
+            if key:
+                keys.add(key)
+
+    scope_keys = widget.property("hover_display_scope")
+    if scope_keys:
+        keys.update(scope_keys.split())
+
+    return sorted(keys, key=lambda key: int(key[1:]))
+
+
+def getHoverDisplaySS(widget):
+    """
+    Widgets that set their own style sheet should append this to it, so that
+    the hover displays installed on them are not removed.
+
+    Args:
+        widget (QWidget):
+
+    Returns (StyleSheet): rules of all of the hover displays that need to be in the widgets style sheet
+    """
+    return "".join([hover_display_rules.rules(key) for key in getHoverDisplayKeys(widget)])
+
+
+def updateHoverDisplaySS(widget, style_sheet=None):
+    """
+    Sets the widgets style sheet, with the rules of its hover displays appended.  The
+    style sheet is only set if it has changed, as this will re-polish the widget,
+    and all of its children.
+
+    Args:
+        widget (QWidget):
+        style_sheet (StyleSheet): style sheet without any hover displays, if None is
+            provided, the widgets current style sheet is used
+
+    Returns (bool): True if the style sheet has changed
+    """
+    if style_sheet is None:
+        style_sheet = removeHoverDisplays(widget.styleSheet())
+    style_sheet += getHoverDisplaySS(widget)
+    if style_sheet == widget.styleSheet():
+        return False
+
+    widget.setStyleSheet(style_sheet)
+    return True
+
+
 """ CREATE MAIN STYLE SHEET """
 def installHoverDisplaySS(
         widget,
@@ -390,7 +574,9 @@ def installHoverDisplaySS(
         focus=True,
         hover=True,
         hover_focus=True,
-        hover_type_flags={'focus':{}, 'hover_focus':{}, 'hover':{}}):
+        hover_type_flags={'focus':{}, 'hover_focus':{}, 'hover':{}},
+        scope=None,
+        update_style_sheet=True):
     """
     Adds a hover display to a widget.  This makes it so that when
     a users cursor hovers over a widget that widget will show that
@@ -403,6 +589,11 @@ def installHoverDisplaySS(
     Hover
     Hover Select (Mouse pressed after hover)
     Selected No Hover
+
+    The rules for each unique set of arguments are only created once, and shared
+    by every widget using the "hover_display_ss_<name>" property.  Installing the
+    same hover display again will only update that property.
+
     Args:
         widget (QWidget):
         border_walls (list): of attrs.DIRECTION that will have the border shown on
@@ -435,11 +626,91 @@ def installHoverDisplaySS(
             Note:
                 This is to allow extra properties to be added and called to dynamically control the
                 hover display later
+        scope (QWidget): ancestor of the widget whose style sheet the rules are installed in,
+            so that they are only installed once for all of its children.  Widgets that have
+            their own style sheet will always have the rules installed in it, as Qt prefers
+            a widgets own style sheet over the style sheets of its ancestors.
+        update_style_sheet (bool): if False, only the property is set, and the caller is
+            responsible for appending getHoverDisplaySS() to the style sheet that it sets.
+    """
 
-    Returns (StyleSheet): that has already been formatted
+    # get rules
+    args = (
+        name, tuple(border_walls), border_focus_style_type, border_hover_style_type, default_ss, hover_style_type,
+        repr(hover_color), repr(focus_color), focus, hover, hover_focus,
+        repr([(hover_type, sorted(flags.items())) for hover_type, flags in sorted(hover_type_flags.items())]))
+    key = hover_display_rules.key(args)
+    if not key:
+        key = hover_display_rules.addRules(args, lambda key: createHoverDisplayRules(
+            widget,
+            key,
+            name=name,
+            border_walls=border_walls,
+            border_focus_style_type=border_focus_style_type,
+            border_hover_style_type=border_hover_style_type,
+            default_ss=default_ss,
+            hover_style_type=hover_style_type,
+            hover_color=hover_color,
+            focus_color=focus_color,
+            focus=focus,
+            hover=hover,
+            hover_focus=hover_focus,
+            hover_type_flags=hover_type_flags))
+
+    # widgets own style sheet takes precedence over its ancestors
+    if scope is None or widget.styleSheet():
+        scope = widget
+    else:
+        scope_keys = scope.property("hover_display_scope") or ""
+        if key not in scope_keys.split():
+            scope.setProperty("hover_display_scope", (scope_keys + " " + key).strip())
+
+    # setting the style sheet will re-polish the widget, so it only needs to be done once
+    is_property_changed = setHoverDisplayProperty(widget, name, key, repolish=False)
+    is_style_sheet_changed = False
+    if update_style_sheet and hover_display_rules.rules(key) not in scope.styleSheet():
+        is_style_sheet_changed = updateHoverDisplaySS(scope)
+    if is_property_changed and not is_style_sheet_changed:
+        repolishWidget(widget)
+
+
+def uninstallHoverDisplaySS(widget, name=""):
+    """
+    Removes the hover display from a widget
+
+    Args:
+        widget (QWidget): widget to remove the hover display from
+        name (str): name of the hover display provided to installHoverDisplaySS()
+    """
+    setHoverDisplayProperty(widget, name, "")
 
+
+def createHoverDisplayRules(
+        widget,
+        key,
+        name="",
+        border_walls=(attrs.NORTH, attrs.SOUTH, attrs.EAST, attrs.WEST),
+        border_focus_style_type=BorderStyleSheet.SOLID,
+        border_hover_style_type=BorderStyleSheet.DOTTED,
+        default_ss=None,
+        hover_style_type=HoverStyleSheet.BORDER,
+        hover_color=iColor["rgba_selected_hover"],
+        focus_color=iColor["rgba_selected"],
+        focus=True,
+        hover=True,
+        hover_focus=True,
+        hover_type_flags={'focus':{}, 'hover_focus':{}, 'hover':{}}):
     """
+    Creates the block of rules for a hover display, these rules are matched by
+    the widgets "hover_display_ss_<name>" property being set to the key provided.
 
+    Args:
+        widget (QWidget): widget used to compile the style sheet args
+        key (str): value of the property that the rules will match
+        **kwargs: see installHoverDisplaySS()
+
+    Returns (StyleSheet): that has already been formatted
+    """
     # create hover object
     hover_object = HoverStyleSheet()
     hover_object.setHoverStyleType(hover_style_type)
@@ -459,53 +730,51 @@ def installHoverDisplaySS(
     # compile style sheet args
     style_sheet_args = compileSSArgs(widget, hover_type_flags, hover_object)
 
-    style_sheet = "{widget_style_sheet}".format(widget_style_sheet=widget.styleSheet())
+    style_sheet_args['type'] = '*[{property_name}="{key}"]'.format(
+        property_name=getHoverDisplayPropertyName(name), key=key)
 
-    # remove previous hover display
-    style_sheet = removeHoverDisplay(style_sheet, name)
     # START
-    style_sheet += "\n/* << HOVER {name} DISPLAY START >> */ \n".format(name=name)
+    style_sheet = "\n/* << HOVER {name} DISPLAY START >> */ \n".format(name=name)
 
     # add border padding
-    style_sheet += """
+    style_sheet += compileStyleSheet("""
 /* Hover Display Border Padding */
 {type}{{
     {default_ss}
 }}
-    """.format(**style_sheet_args)
+    """, style_sheet_args)
     # HOVER
     if hover:
-        style_sheet += """
+        style_sheet += compileStyleSheet("""
 /* Hover Display Hover */
 {type}::hover{hover_properties}{{
     {hover_ss}
 }}
-            """.format(**style_sheet_args)
+            """, style_sheet_args)
 
     # HOVER FOCUS
     if hover_focus:
-        style_sheet += """
+        style_sheet += compileStyleSheet("""
 /* Hover Display Hover Focus */
 {type}:hover:focus{hover_focus_properties}{{
     {hover_focus_ss}
 }}
-""".format(**style_sheet_args)
+""", style_sheet_args)
 
     # FOCUS
     if focus:
-        style_sheet += """
+        style_sheet += compileStyleSheet("""
 /* Hover Display Hover */
 {type}:focus{focus_properties}{{
     {focus_ss}
 }}
-""".format(**style_sheet_args)
+""", style_sheet_args)
 
     # END
     style_sheet += "\n/* << HOVER {name} DISPLAY END >> */ \n".format(name=name)
 
-    # print ('==============================')
-    # print(style_sheet)
-    widget.setStyleSheet(style_sheet)
+    return style_sheet
+
 
 def removeHoverDisplay(style_sheet, name):
     """
@@ -528,3 +797,17 @@ def removeHoverDisplay(style_sheet, name):
     return new_style_sheet
 
 
+def removeHoverDisplays(style_sheet):
+    """
+    Removes all of the hover displays from a style sheet
+
+    Args:
+        style_sheet (StyleSheet): style sheet to have the hover displays removed from
+
+    Returns (StyleSheet):
+    """
+    return re.sub(
+        r"\n/\* << HOVER (.*?) DISPLAY START >> \*/ \n.*?\n/\* << HOVER \1 DISPLAY END >> \*/ \n",
+        "",
+        style_sheet,
+        flags=re.DOTALL)
@@ -8,10 +8,156 @@ Note:
         **style_sheet_args,
         splitter_handle_ss=splitter_handle_ss.format(**style_sheet_args)
     )
+
+    Style sheets that are generated repeatedly should be compiled with compileStyleSheet(),
+    which only formats a template once for each unique set of arguments that it uses
+        ie
+    compileStyleSheet(splitter_handle_ss, type="ShojiLayout", ...)
 """
+from collections import OrderedDict
+from string import Formatter
 
 from .colors import iColor
 
+
+""" COMPILER """
+class StyleSheetCompiler(object):
+    """
+    Compiles style sheet templates, and caches the rendered style sheets.
+
+    Each template is parsed once to find the fields that it uses, and the
+    rendered style sheet is cached by the values of those fields only.  So a
+    template formatted with the entire iColor.style_sheet_args, will only be
+    formatted again if one of the arguments that it uses changes.  Identical
+    arguments return the identical string, which allows widgets to skip
+    reapplying a style sheet that has not changed.
+
+    Attributes:
+        max_size (int): maximum number of rendered style sheets to cache.
+            The least recently used style sheets are discarded first.
+        hits (int): number of times a rendered style sheet was returned from the cache
+        misses (int): number of times a template had to be formatted
+    """
+    MAX_SIZE = 1024
+
+    def __init__(self, max_size=MAX_SIZE):
+        self._max_size = max_size
+        self._templates = {}
+        self._style_sheets = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def compile(self, template, style_sheet_args=None, **kwargs):
+        """
+        Formats the template provided, reusing the cached result when the
+        arguments used by the template are unchanged.
+
+        Args:
+            template (str): template to be formatted with str.format()
+            style_sheet_args (dict): arguments to format the template with,
+                if not provided this will default to iColor.style_sheet_args
+            **kwargs: additional arguments, these take precedence over the
+                style_sheet_args
+
+        Returns (str): style sheet
+        """
+        if style_sheet_args is None:
+            style_sheet_args = iColor.style_sheet_args
+
+        # get args used by template
+        field_names = self.getTemplateFieldNames(template)
+        args = {}
+        for field_name in field_names:
+            if field_name in kwargs:
+                args[field_name] = kwargs[field_name]
+            elif field_name in style_sheet_args:
+                args[field_name] = style_sheet_args[field_name]
+
+        # get cached style sheet
+        key = (template, tuple(args.get(field_name) for field_name in field_names))
+        try:
+            hash(key)
+        except TypeError:
+            key = (template, repr(key[1]))
+
+        if key in self._style_sheets:
+            self._hits += 1
+            self._style_sheets.move_to_end(key)
+            return self._style_sheets[key]
+
+        # compile style sheet
+        self._misses += 1
+        style_sheet = template.format(**args)
+        self._style_sheets[key] = style_sheet
+        if self._max_size < len(self._style_sheets):
+            self._style_sheets.popitem(last=False)
+        return style_sheet
+
+    def getTemplateFieldNames(self, template):
+        """
+        Args:
+            template (str): template to be parsed
+
+        Returns (tuple): of the names of the arguments used by the template
+        """
+        if template not in self._templates:
+            field_names = []
+            for _literal_text, field_name, _format_spec, _conversion in Formatter().parse(template):
+                if field_name:
+                    field_name = field_name.split(".")[0].split("[")[0]
+                    if field_name not in field_names:
+                        field_names.append(field_name)
+            self._templates[template] = tuple(field_names)
+        return self._templates[template]
+
+    def clearCache(self):
+        """ Removes all of the cached templates / style sheets"""
+        self._templates = {}
+        self._style_sheets = OrderedDict()
+
+    def resetCounters(self):
+        self._hits = 0
+        self._misses = 0
+
+    """ PROPERTIES """
+    def maxSize(self):
+        return self._max_size
+
+    def setMaxSize(self, max_size):
+        self._max_size = max_size
+        while self._max_size < len(self._style_sheets):
+            self._style_sheets.popitem(last=False)
+
+    def numCachedStyleSheets(self):
+        return len(self._style_sheets)
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+
+style_sheet_compiler = StyleSheetCompiler()
+
+
+def compileStyleSheet(template, style_sheet_args=None, **kwargs):
+    """
+    Formats a style sheet template using the shared StyleSheetCompiler
+
+    Args:
+        template (str): template to be formatted with str.format()
+        style_sheet_args (dict): arguments to format the template with,
+            if not provided this will default to iColor.style_sheet_args
+        **kwargs: additional arguments, these take precedence over the
+            style_sheet_args
+
+    Returns (str): style sheet
+    """
+    return style_sheet_compiler.compile(template, style_sheet_args, **kwargs)
+
 def createRadialGradientSS(radius, center_radius, focal_radius, stops):
     """
 
@@ -0,0 +1,116 @@
+import unittest
+import sys
+
+from qtpy.QtWidgets import QApplication, QLabel
+
+from cgwidgets.settings import iColor
+from cgwidgets.settings.hover_display import (
+    installHoverDisplaySS, uninstallHoverDisplaySS, getHoverDisplayPropertyName, getHoverDisplaySS,
+    hover_display_rules, removeHoverDisplays
+)
+from cgwidgets.widgets import AbstractStringInputWidget, ShojiLayout
+
+
+class InputWidget(AbstractStringInputWidget):
+    def __init__(self, parent=None):
+        self.num_style_sheets = 0
+        super(InputWidget, self).__init__(parent)
+
+    def setStyleSheet(self, style_sheet):
+        self.num_style_sheets += 1
+        return AbstractStringInputWidget.setStyleSheet(self, style_sheet)
+
+
+class TestHoverDisplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def getKey(self, widget, name):
+        return widget.property(getHoverDisplayPropertyName(name))
+
+    def test_sharedRules(self):
+        app_style_sheet = self.app.styleSheet()
+        labels = [QLabel(), QLabel()]
+        for label in labels:
+            installHoverDisplaySS(label, name="TEST SHARED")
+        key = self.getKey(labels[0], "TEST SHARED")
+        self.assertEqual(self.getKey(labels[1], "TEST SHARED"), key)
+
+        # the rules are installed in the widgets style sheet, not the applications
+        rules = hover_display_rules.rules(key)
+        self.assertEqual(labels[0].styleSheet(), rules)
+        self.assertEqual(self.app.styleSheet(), app_style_sheet)
+
+        # different arguments create different rules
+        installHoverDisplaySS(labels[1], name="TEST SHARED", hover_color=iColor["rgba_accept"])
+        self.assertNotEqual(self.getKey(labels[1], "TEST SHARED"), key)
+        self.assertEqual(labels[1].styleSheet().count("HOVER TEST SHARED DISPLAY START"), 1)
+
+    def test_uninstall(self):
+        label = QLabel()
+        installHoverDisplaySS(label, name="TEST UNINSTALL")
+        style_sheet = label.styleSheet()
+        uninstallHoverDisplaySS(label, name="TEST UNINSTALL")
+        self.assertEqual(self.getKey(label, "TEST UNINSTALL"), "")
+        self.assertEqual(label.styleSheet(), style_sheet)
+        self.assertEqual(getHoverDisplaySS(label), "")
+
+    def test_inputWidget(self):
+        widget = InputWidget()
+        self.assertEqual(widget.num_style_sheets, 1)
+        key = self.getKey(widget, "INPUT WIDGETS")
+        self.assertIn(hover_display_rules.rules(key), widget.styleSheet())
+
+        # updating the style sheet keeps the hover display, and is only applied if it has changed
+        widget.updateStyleSheet()
+        self.assertEqual(widget.num_style_sheets, 1)
+        widget.rgba_background = (1, 2, 3, 255)
+        widget.updateStyleSheet()
+        self.assertEqual(widget.num_style_sheets, 2)
+        self.assertEqual(widget.styleSheet().count("HOVER INPUT WIDGETS DISPLAY START"), 1)
+
+        # toggling the hover display only changes the property
+        uninstallHoverDisplaySS(widget, name="INPUT WIDGETS")
+        widget.installHoverDisplay()
+        self.assertEqual(self.getKey(widget, "INPUT WIDGETS"), key)
+        self.assertEqual(widget.num_style_sheets, 2)
+
+    def test_scope(self):
+        shoji_layout = ShojiLayout()
+        labels = [QLabel(), QLabel()]
+        for label in labels:
+            shoji_layout.addWidget(label)
+        key = self.getKey(labels[0], "SHOJI VIEW")
+        rules = hover_display_rules.rules(key)
+
+        # the rules are installed once in the scope
+        self.assertEqual([label.styleSheet() for label in labels], ["", ""])
+        self.assertEqual(shoji_layout.styleSheet().count(rules), 1)
+        shoji_layout.setHandleLength(10)
+        self.assertEqual(shoji_layout.styleSheet().count(rules), 1)
+
+        # widgets with their own style sheet have the rules installed in it
+        widget = InputWidget()
+        shoji_layout.addWidget(widget)
+        self.assertIn(rules, widget.styleSheet())
+        widget.rgba_background = (1, 2, 3, 255)
+        widget.updateStyleSheet()
+        self.assertIn(rules, widget.styleSheet())
+        self.assertEqual(self.getKey(widget, "SHOJI VIEW"), key)
+
+    def test_removeHoverDisplays(self):
+        label = QLabel()
+        label.setStyleSheet("QLabel{color: red;}")
+        installHoverDisplaySS(label, name="TEST REMOVE A")
+        installHoverDisplaySS(label, name="TEST REMOVE B")
+        self.assertEqual(removeHoverDisplays(label.styleSheet()), "QLabel{color: red;}")
+
+
+def mainFunction():
+    app = QApplication(sys.argv)
+    unittest.main()
+
+
+if __name__ == '__main__':
+    mainFunction()
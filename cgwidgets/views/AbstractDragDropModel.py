@@ -1,15 +1,289 @@
 # https://doc.qt.io/qt-5/model-view-programming.html#model-view-classes
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+import copy
+import json
+import operator
+import re
+import time
+import weakref
 
 from qtpy.QtWidgets import (QApplication, QWidget)
 from qtpy.QtCore import (
     Qt, QModelIndex, QAbstractItemModel, QSortFilterProxyModel,
-    QSize, QMimeData, QByteArray)
+    QSize, QMimeData, QByteArray, QRegExp, QObject, QTimer)
 from qtpy.QtGui import QColor
 
 from cgwidgets.settings import iColor
 
+
+class AbstractDragDropModelItemSchema(object):
+    """ Ordered set of column keys that is shared between all items with the same keys.
+
+    Items only store a list of values, and look up the position of each key
+    through their schema.  Schemas are interned, so that every item with the
+    same keys (in the same order) points to the same schema.
+
+    Attributes:
+        keys (tuple): of column names
+        indexes (dict): of column name to position in the items values
+        transitions (dict): cache of column name to the schema that is
+            created when that column is appended to this schema
+    """
+    __slots__ = ("_keys", "_indexes", "_transitions")
+    _schemas = {}
+
+    def __init__(self, keys):
+        self._keys = keys
+        self._indexes = {key: index for index, key in enumerate(keys)}
+        self._transitions = {}
+
+    @classmethod
+    def getSchema(cls, keys):
+        """ Returns the shared schema for the keys provided
+
+        Args:
+            keys (tuple): of column names
+
+        Returns (AbstractDragDropModelItemSchema)"""
+        keys = tuple(keys)
+        try:
+            return cls._schemas[keys]
+        except KeyError:
+            schema = cls(keys)
+            cls._schemas[keys] = schema
+            return schema
+
+    def keys(self):
+        return self._keys
+
+    def indexOf(self, key):
+        """ Returns the position of the key provided, or None if it is not in this schema"""
+        return self._indexes.get(key)
+
+    def addKey(self, key):
+        """ Returns the schema with the key provided appended to it"""
+        try:
+            return self._transitions[key]
+        except KeyError:
+            schema = AbstractDragDropModelItemSchema.getSchema(self._keys + (key, ))
+            self._transitions[key] = schema
+            return schema
+
+    def removeKey(self, key):
+        """ Returns the schema with the key provided removed from it"""
+        return AbstractDragDropModelItemSchema.getSchema(
+            [schema_key for schema_key in self._keys if schema_key != key])
+
+    def __contains__(self, key):
+        return key in self._indexes
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class AbstractDragDropModelItemColumnData(MutableMapping):
+    """ Dictionary like view of an items column data.
+
+    This is what is returned from AbstractDragDropModelItem.columnData(), and
+    writes all changes straight through to the item.  Copying this will return
+    an OrderedDict.
+
+    Note:
+        This is not a dict, so it cannot be passed to anything that requires
+        one, such as json.dumps().  Use AbstractDragDropModelItem.columnDataAsDict()
+        to get the column data as an OrderedDict.
+    """
+    __slots__ = ("_item", )
+
+    def __init__(self, item):
+        self._item = item
+
+    def __getitem__(self, key):
+        index = self._item._column_schema.indexOf(key)
+        if index is None:
+            raise KeyError(key)
+        return self._item._column_values[index]
+
+    def __setitem__(self, key, value):
+        self._item.setArg(key, value)
+
+    def __delitem__(self, key):
+        if not self._item.hasArg(key):
+            raise KeyError(key)
+        self._item.removeArg(key)
+
+    def __iter__(self):
+        return iter(self._item._column_schema.keys())
+
+    def __len__(self):
+        return len(self._item._column_schema)
+
+    def __repr__(self):
+        return repr(OrderedDict(self.items()))
+
+    def __copy__(self):
+        return self._item.columnDataAsDict()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(OrderedDict(self.items()), memo)
+
+
+class AbstractDragDropNameIndex(object):
+    """ Hash index of item names to the items with that name.
+
+    Every item holds one of these for its children, which is used to look up
+    siblings by name, and to create unique names.  The model holds one for
+    all of the descendants of its root item, which is registered against the
+    root item, so that items can update it when they are inserted, removed, or
+    renamed.
+
+    Attributes:
+        names (dict): of item name to a list of the items with that name
+        unique_name_hints (dict): of name to the last unique name that was
+            created from it, so that the next search can resume from there
+            rather than stepping through every suffix that is already taken
+    """
+    __slots__ = ("_names", "_unique_name_hints", "__weakref__")
+    _root_indexes = weakref.WeakKeyDictionary()
+
+    def __init__(self, items=None):
+        self._names = {}
+        self._unique_name_hints = {}
+        if items:
+            for item in items:
+                self.addItem(item)
+
+    @classmethod
+    def getRootIndex(cls, item):
+        """ Returns the index registered to the root of the item provided
+
+        Args:
+            item (AbstractDragDropModelItem): item to find the root index of
+
+        Returns (AbstractDragDropNameIndex): or None if the root of the item
+            has no index registered to it"""
+        if not cls._root_indexes:
+            return None
+        while item._parent is not None:
+            item = item._parent
+        return cls._root_indexes.get(item)
+
+    @classmethod
+    def setRootIndex(cls, root_item, name_index):
+        """ Registers the index provided to the root item provided
+
+        Args:
+            root_item (AbstractDragDropModelItem): root item of the index
+            name_index (AbstractDragDropNameIndex): index of all of the root items descendants"""
+        cls._root_indexes[root_item] = name_index
+
+    def addItem(self, item, name=None):
+        try:
+            self._names.setdefault(item.name() if name is None else name, []).append(item)
+        except TypeError:
+            # unhashable names are not indexed
+            pass
+
+    def removeItem(self, item, name=None):
+        """ Removes the item provided from this index
+
+        Args:
+            item (AbstractDragDropModelItem): item to remove
+            name (str): name the item is indexed under, if None is provided
+                the items current name will be used
+
+        Returns (bool): if the item was indexed"""
+        if name is None:
+            name = item.name()
+        try:
+            items = self._names[name]
+            items.remove(item)
+        except (KeyError, ValueError, TypeError):
+            return False
+        if not items:
+            del self._names[name]
+        return True
+
+    def renameItem(self, item, old_name, new_name):
+        if self.removeItem(item, old_name):
+            self.addItem(item, new_name)
+
+    def addItems(self, items):
+        """ Adds the items provided, and all of their descendants to this index"""
+        for item in self.__iterDescendants(items):
+            self.addItem(item)
+
+    def removeItems(self, items):
+        """ Removes the items provided, and all of their descendants from this index"""
+        for item in self.__iterDescendants(items):
+            self.removeItem(item)
+
+    def items(self, name):
+        """ Returns a list of all of the items with the name provided"""
+        try:
+            return list(self._names.get(name, ()))
+        except TypeError:
+            return []
+
+    def names(self):
+        return self._names.keys()
+
+    def hasName(self, name, exclude=None):
+        """ Determines if an item other than the one provided has the name provided
+
+        Args:
+            name (str): name to look for
+            exclude (AbstractDragDropModelItem): item to ignore
+
+        Returns (bool)"""
+        try:
+            items = self._names.get(name, ())
+        except TypeError:
+            return False
+        for item in items:
+            if item is not exclude:
+                return True
+        return False
+
+    def getUniqueName(self, name, exclude=None):
+        """ Finds a name that no other item in this index has
+
+        If the name is taken, the last character of the name is incremented if
+        it is a number, or a "0" is appended to it, until a free name is found.
+
+        Args:
+            name (str): name to start from
+            exclude (AbstractDragDropModelItem): item to ignore, this is
+                normally the item that the name is being created for
+
+        Returns (str)"""
+        if not self.hasName(name, exclude=exclude):
+            return name
+
+        unique_name = self._unique_name_hints.get(name, name)
+        while self.hasName(unique_name, exclude=exclude):
+            try:
+                suffix = int(unique_name[-1])
+                unique_name = unique_name[:-1] + str(suffix + 1)
+            except (ValueError, IndexError):
+                unique_name = unique_name + "0"
+        self._unique_name_hints[name] = unique_name
+        return unique_name
+
+    def __iterDescendants(self, items):
+        stack = list(reversed(items))
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(reversed(item._children))
+
+
 class AbstractDragDropModelItem(object):
     """
 
@@ -23,35 +297,56 @@ class AbstractDragDropModelItem(object):
                 name
                 value
                 items_list
+            This is stored as a list of values, and a AbstractDragDropModelItemSchema
+            of keys that is shared between items.
+        flags (int): bitfield of all of the items flags.  Each flag uses two bits,
+            one for if the flag has been set, and one for its value, so that
+            flags can be unset (None) to fall back to the models value.
+        name_index (AbstractDragDropNameIndex): index of the names of this items
+            children.  This is created the first time that it is needed, and
+            then updated as children are added, removed, or renamed.
     """
+    __slots__ = (
+        "_column_schema", "_column_values", "_children", "_parent", "_row",
+        "_delegate_widget", "_dynamicWidgetFunction", "_flags", "_name_index", "__weakref__")
+
+    # flag positions
+    COPYABLE = 0
+    DELETABLE = 2
+    DELETE_ON_DROP = 4
+    DRAGGABLE = 6
+    DROPPABLE = 8
+    ENABLED = 10
+    ENABLEABLE = 12
+    EDITABLE = 14
+    EXPANDED = 16
+    SELECTABLE = 18
+
+    # column values of these types are shared when copying the column data
+    IMMUTABLE_TYPES = frozenset((str, bytes, int, float, bool, type(None)))
+
     def __init__(self, parent=None):
-        #self._data = data
-        self._column_data = OrderedDict()
+        self._column_schema = AbstractDragDropModelItemSchema.getSchema(())
+        self._column_values = []
         self._children = []
         self._parent = parent
+        self._row = None
         self._delegate_widget = None
         self._dynamicWidgetFunction = None
+        self._name_index = None
 
-        # flags
-
-        #self._is_selected = False
-        self._is_copyable = None
-        self._is_deletable = None
-        self._delete_on_drop = None
-        self._is_draggable = None
-        self._is_droppable = None
-        self._is_enabled = True
-        self._is_enableable = None
-        self._is_editable = None
-        self._is_expanded = None
-        self._is_selectable = None
+        # flags (enabled by default)
+        self._flags = 3 << AbstractDragDropModelItem.ENABLED
 
         # default parent
         if parent is not None:
             parent.addChild(self)
 
     def addChild(self, child):
+        child._parent = self
+        child._row = len(self._children)
         self._children.append(child)
+        self.__addToNameIndexes([child])
 
     def insertChild(self, position, child):
         if position < 0 or position > len(self._children):
@@ -59,6 +354,61 @@ class AbstractDragDropModelItem(object):
 
         self._children.insert(position, child)
         child._parent = self
+        child._row = position
+        self.__addToNameIndexes([child])
+        return True
+
+    def insertChildren(self, position, children):
+        """ Inserts multiple children at once, starting at the position provided
+
+        Args:
+            position (int): row to insert the children at
+            children (list): of AbstractDragDropModelItem"""
+        if position < 0 or position > len(self._children):
+            return False
+
+        self._children[position:position] = children
+        for child in children:
+            child._parent = self
+        self.updateChildRows(position)
+        self.__addToNameIndexes(children)
+        return True
+
+    def moveChildren(self, first, last, parent, position):
+        """ Moves the children in the range provided to a new parent
+
+        Args:
+            first (int): first row to move
+            last (int): last row to move (inclusive)
+            parent (AbstractDragDropModelItem): new parent, this can be this item
+            position (int): row to move the children to.  This is the row
+                before the move has happened, as expected by beginMoveRows()"""
+        children = self._children[first:last + 1]
+        del self._children[first:last + 1]
+
+        # update rows
+        if parent is self:
+            if first < position:
+                position -= len(children)
+            parent._children[position:position] = children
+            self.updateChildRows(min(first, position), max(last, position + len(children) - 1) + 1)
+        else:
+            root_index = AbstractDragDropNameIndex.getRootIndex(self)
+            self.__removeFromNameIndexes(children, root_index=False)
+            for child in children:
+                child._parent = parent
+            parent._children[position:position] = children
+            self.updateChildRows(first)
+            parent.updateChildRows(position)
+
+            # only update the root index if the children have moved to a different tree
+            parent_root_index = AbstractDragDropNameIndex.getRootIndex(parent)
+            if root_index is not parent_root_index:
+                if root_index is not None:
+                    root_index.removeItems(children)
+                parent.__addToNameIndexes(children)
+            else:
+                parent.__addToNameIndexes(children, root_index=False)
         return True
 
     def removeChild(self, position):
@@ -66,13 +416,87 @@ class AbstractDragDropModelItem(object):
             return False
 
         child = self._children.pop(position)
+        self.__removeFromNameIndexes([child])
         child._parent = None
+        child._row = None
 
         return True
 
+    def removeChildren(self, first, last):
+        """ Removes all of the children in the range provided at once
+
+        Args:
+            first (int): first row to remove
+            last (int): last row to remove (inclusive)
+
+        Returns (list): of AbstractDragDropModelItem that were removed"""
+        children = self._children[first:last + 1]
+        self.__removeFromNameIndexes(children)
+        del self._children[first:last + 1]
+        for child in children:
+            child._parent = None
+            child._row = None
+        self.updateChildRows(first)
+
+        return children
+
     def childCount(self):
         return len(self._children)
 
+    def childNameIndex(self):
+        """ Returns the index of the names of this items children
+
+        Returns (AbstractDragDropNameIndex)"""
+        if self._name_index is None:
+            self._name_index = AbstractDragDropNameIndex(self._children)
+        return self._name_index
+
+    def __addToNameIndexes(self, children, root_index=True):
+        """ Adds the children provided to this items name index, and the index of its root
+
+        Args:
+            children (list): of AbstractDragDropModelItem that have been parented to this item
+            root_index (bool): determines if the root index should be updated"""
+        if self._name_index is not None:
+            for child in children:
+                self._name_index.addItem(child)
+        if root_index:
+            name_index = AbstractDragDropNameIndex.getRootIndex(self)
+            if name_index is not None:
+                name_index.addItems(children)
+
+    def __removeFromNameIndexes(self, children, root_index=True):
+        """ Removes the children provided from this items name index, and the index of its root
+
+        This must be called before the children are unparented.
+
+        Args:
+            children (list): of AbstractDragDropModelItem
+            root_index (bool): determines if the root index should be updated"""
+        if self._name_index is not None:
+            for child in children:
+                self._name_index.removeItem(child)
+        if root_index:
+            name_index = AbstractDragDropNameIndex.getRootIndex(self)
+            if name_index is not None:
+                name_index.removeItems(children)
+
+    def __updateNameIndexes(self, old_name):
+        """ Updates the name indexes that this item is in after its name may have changed
+
+        Args:
+            old_name (str): name of this item before it was changed"""
+        new_name = self.name()
+        if old_name == new_name:
+            return
+        if self._parent is None:
+            return
+        if self._parent._name_index is not None:
+            self._parent._name_index.renameItem(self, old_name, new_name)
+        name_index = AbstractDragDropNameIndex.getRootIndex(self)
+        if name_index is not None:
+            name_index.renameItem(self, old_name, new_name)
+
     def children(self):
         return self._children
 
@@ -89,11 +513,43 @@ class AbstractDragDropModelItem(object):
         self._parent = parent
 
     def row(self):
-        if self._parent is not None:
-            if self in self._parent._children:
-                return self._parent._children.index(self)
-            else:
-                return None
+        """ Returns the row of this item under its parent
+
+        The row is cached on the item, and validated against the parents
+        children before being returned.  If the children have been
+        reordered since it was last cached, the rows of all of the siblings
+        are rebuilt in a single pass, so that subsequent lookups are O(1).
+
+        Returns (int): or None if the item is not parented"""
+        parent = self._parent
+        if parent is None:
+            return None
+
+        # check cached row
+        children = parent._children
+        row = self._row
+        if row is not None and row < len(children) and children[row] is self:
+            return row
+
+        # rebuild row index
+        parent.updateChildRows()
+        row = self._row
+        if row is not None and row < len(children) and children[row] is self:
+            return row
+        return None
+
+    def updateChildRows(self, start=0, end=None):
+        """ Updates the cached row of every child from the start position provided
+
+        Args:
+            start (int): row to start updating from
+            end (int): row to stop updating at (exclusive), if None is provided
+                this will update until the last child"""
+        children = self._children
+        if end is None or len(children) < end:
+            end = len(children)
+        for row in range(start, end):
+            children[row]._row = row
 
     def log(self, tabLevel=-1):
         output = ""
@@ -101,7 +557,7 @@ class AbstractDragDropModelItem(object):
 
         for i in range(tabLevel):
             output += "\t"
-        output += "|------" + self._name + "\n"
+        output += "|------" + str(self.name()) + "\n"
 
         for child in self._children:
             output += child.log(tabLevel)
@@ -113,128 +569,221 @@ class AbstractDragDropModelItem(object):
 
     """ ARGS """
     def columnData(self):
-        return self._column_data
+        """ Returns a view of the column data, which writes any changes straight through to this item
+
+        Note:
+            This is no longer the dict stored on the item, as the column data is
+            stored as a list of values, see AbstractDragDropModelItemColumnData.
+            Use columnDataAsDict() when a dict is required, ie for json.dumps().
+
+        Returns (AbstractDragDropModelItemColumnData)"""
+        return AbstractDragDropModelItemColumnData(self)
+
+    def columnDataAsDict(self):
+        """ Returns a copy of the column data, changes made to it will not update this item
+
+        Returns (OrderedDict)"""
+        return OrderedDict(zip(self._column_schema.keys(), self._column_values))
 
     def setColumnData(self, _column_data):
-        self._column_data = _column_data
+        """ Sets the column data of this item
+
+        Note:
+            The values are copied out of the dict provided, so changes made to
+            the dict afterwards will not update this item.  Use setArg(), or the
+            view returned from columnData() to update the column data.
+
+        Args:
+            _column_data (dict): of column name to value"""
+        # items that are not parented are not in any name index
+        old_name = self.name() if self._parent is not None else None
+        self._column_schema = AbstractDragDropModelItemSchema.getSchema(_column_data.keys())
+        self._column_values = list(_column_data.values())
+        if self._parent is not None:
+            self.__updateNameIndexes(old_name)
+
+    def copyColumnData(self, item):
+        """ Copies the column data from the item provided
+
+        The schema of keys is shared with the item provided, and only
+        the values that are mutable are deep copied.
+
+        Args:
+            item (AbstractDragDropModelItem): item to copy the column data from"""
+        old_name = self.name()
+        self._column_schema = item._column_schema
+        self._column_values = [
+            value if type(value) in AbstractDragDropModelItem.IMMUTABLE_TYPES else copy.deepcopy(value)
+            for value in item._column_values]
+        self.__updateNameIndexes(old_name)
 
     def hasArg(self, arg):
-        if arg in self.columnData().keys():
-            return True
-        return False
+        return arg in self._column_schema
 
     def args(self):
         return self.columnData()
 
     def setArg(self, arg, value):
-        self.columnData()[arg] = value
+        old_name = self.name()
+        index = self._column_schema.indexOf(arg)
+        if index is None:
+            self._column_schema = self._column_schema.addKey(arg)
+            self._column_values.append(value)
+        else:
+            self._column_values[index] = value
+        self.__updateNameIndexes(old_name)
 
     def getArg(self, arg):
-        try:
-            return self.columnData()[arg]
-        except KeyError:
+        index = self._column_schema.indexOf(arg)
+        if index is None:
             return None
+        return self._column_values[index]
 
     def getArgsList(self):
-        return list(self.columnData().keys())
+        return list(self._column_schema.keys())
 
     def removeArg(self, arg):
-        self.columnData().pop(arg, None)
+        index = self._column_schema.indexOf(arg)
+        if index is not None:
+            old_name = self.name()
+            self._column_schema = self._column_schema.removeKey(arg)
+            del self._column_values[index]
+            self.__updateNameIndexes(old_name)
 
     def clearArgsList(self):
-        for key in list(self.columnData().keys()):
-            self.columnData().pop(key, None)
+        old_name = self.name()
+        self._column_schema = AbstractDragDropModelItemSchema.getSchema(())
+        self._column_values = []
+        self.__updateNameIndexes(old_name)
 
     def name(self):
         """ Note: If name is not found, then it will return the first key in the dictionary."""
+        index = self._column_schema.indexOf("name")
+        if index is None:
+            index = 0
         try:
-            return self.columnData()["name"]
-        except KeyError:
-            try:
-                return self.columnData()[list(self.columnData().keys())[0]]
-            except IndexError:
-                return None
+            return self._column_values[index]
+        except IndexError:
+            return None
 
     def setName(self, name):
-        self.columnData()[list(self.columnData().keys())[0]] = name
+        old_name = self.name()
+        self._column_values[0] = name
+        self.__updateNameIndexes(old_name)
+
+    """ FLAGS """
+    def __getFlag(self, flag):
+        """ Returns the value of the flag provided, or None if it has not been set
+
+        Args:
+            flag (int): position of flag in the bitfield
+
+        Returns (bool)"""
+        flags = self._flags >> flag
+        if not flags & 1:
+            return None
+        return bool(flags & 2)
+
+    def __setFlag(self, flag, value):
+        """ Sets the value of the flag provided, setting None will unset the flag
+
+        Args:
+            flag (int): position of flag in the bitfield
+            value (bool)"""
+        flags = self._flags & ~(3 << flag)
+        if value is not None:
+            flags |= (3 if value else 1) << flag
+        self._flags = flags
+
+    def __getQtFlag(self, flag, qt_flag):
+        """ Returns the Qt.ItemFlag provided if the flag is enabled, 0 if it
+        is disabled, or None if it has not been set"""
+        value = self.__getFlag(flag)
+        if value is None:
+            return None
+        return qt_flag if value else 0
 
     """ DRAG / DROP PROPERTIES """
     def deleteOnDrop(self):
-        return self._delete_on_drop
+        return self.__getFlag(AbstractDragDropModelItem.DELETE_ON_DROP)
 
     def setDeleteOnDrop(self, _delete_on_drop):
-        self._delete_on_drop = _delete_on_drop
+        self.__setFlag(AbstractDragDropModelItem.DELETE_ON_DROP, _delete_on_drop)
 
     def isCopyable(self):
-        return self._is_copyable
+        return self.__getFlag(AbstractDragDropModelItem.COPYABLE)
 
     def setIsCopyable(self, is_copyable):
-        self._is_copyable = is_copyable
+        self.__setFlag(AbstractDragDropModelItem.COPYABLE, is_copyable)
 
     def isDeletable(self):
-        return self._is_deletable
+        return self.__getFlag(AbstractDragDropModelItem.DELETABLE)
 
     def setIsDeletable(self, enable):
-        self._is_deletable = enable
+        self.__setFlag(AbstractDragDropModelItem.DELETABLE, enable)
 
     def isDraggable(self):
-        return self._is_draggable
+        return self.__getQtFlag(AbstractDragDropModelItem.DRAGGABLE, Qt.ItemIsDragEnabled)
 
     def setIsDraggable(self, _is_draggable):
-        if _is_draggable is None: self._is_draggable = None
-        elif _is_draggable: self._is_draggable = Qt.ItemIsDragEnabled
-        elif not _is_draggable: self._is_draggable = 0
-        else: self._is_draggable = Qt.ItemIsDragEnabled
+        self.__setFlag(AbstractDragDropModelItem.DRAGGABLE, _is_draggable)
 
     def isDroppable(self):
-        return self._is_droppable
+        return self.__getQtFlag(AbstractDragDropModelItem.DROPPABLE, Qt.ItemIsDropEnabled)
 
     def setIsDroppable(self, _is_droppable):
-        if _is_droppable is None: self._is_droppable = None
-        elif _is_droppable: self._is_droppable = Qt.ItemIsDropEnabled
-        elif not _is_droppable: self._is_droppable = 0
-        else: self._is_droppable = Qt.ItemIsDropEnabled
+        self.__setFlag(AbstractDragDropModelItem.DROPPABLE, _is_droppable)
 
     def isEditable(self):
-        return self._is_editable
+        return self.__getQtFlag(AbstractDragDropModelItem.EDITABLE, Qt.ItemIsEditable)
 
     def setIsEditable(self, _is_editable):
-        if _is_editable is None: self._is_editable = None
-        elif _is_editable: self._is_editable = Qt.ItemIsEditable
-        elif not _is_editable: self._is_editable = 0
-        else: self._is_editable = Qt.ItemIsEditable
+        self.__setFlag(AbstractDragDropModelItem.EDITABLE, _is_editable)
 
     def isEnabled(self):
-        return self._is_enabled
+        return self.__getFlag(AbstractDragDropModelItem.ENABLED)
 
     def setIsEnabled(self, enable):
-        self._is_enabled = enable
+        self.__setFlag(AbstractDragDropModelItem.ENABLED, enable)
 
     def isExpanded(self):
-        return self._is_expanded
+        return self.__getFlag(AbstractDragDropModelItem.EXPANDED)
 
     def setIsExpanded(self, is_expanded):
-        self._is_expanded = is_expanded
+        self.__setFlag(AbstractDragDropModelItem.EXPANDED, is_expanded)
 
     def isEnableable(self):
-        return self._is_enableable
+        return self.__getFlag(AbstractDragDropModelItem.ENABLEABLE)
 
     def setIsEnableable(self, enable):
-        self._is_enableable = enable
+        self.__setFlag(AbstractDragDropModelItem.ENABLEABLE, enable)
 
     def isSelectable(self):
-        return self._is_selectable
+        return self.__getQtFlag(AbstractDragDropModelItem.SELECTABLE, Qt.ItemIsSelectable)
 
     def setIsSelectable(self, _is_selectable):
-        if _is_selectable is None: self._is_selectable = None
-        elif _is_selectable: self._is_selectable = Qt.ItemIsSelectable
-        elif not _is_selectable: self._is_selectable = 0
-        else: self._is_selectable = False
+        self.__setFlag(AbstractDragDropModelItem.SELECTABLE, _is_selectable)
 
 
 class AbstractDragDropFilterProxyModel(QSortFilterProxyModel):
     """ Proxy model designed for use with the abstract drag/drop system
 
+    Each filter is compiled into a predicate when it is added or updated, and
+    the result of each filter is cached per item.  When a filter is updated, only
+    that filters cache is cleared, so re-filtering only has to evaluate the
+    filter that has changed.  The caches of items are cleared when the source
+    model changes their data, or removes them.
+
+    Recursive filtering (showing the ancestors of items that are accepted) is
+    done by this model rather than by Qt, so that it can use the cached results
+    rather than asking the source model for the index and row count of every
+    item that is filtered out.  Whether an item or any of its descendants is
+    accepted is cached as well, and when an item changes only it and its
+    ancestors are filtered again.
+
+    Filters are unique by name, adding a filter with the same name as an
+    existing filter will replace it.
+
     Note:
         Anything added here needs to have the virtual classes updated...
             AbstractDrag/DropView
@@ -242,17 +791,101 @@ class AbstractDragDropFilterProxyModel(QSortFilterProxyModel):
             AbstractShojiModelViewWidget
 
     Attributes:
-        filters (list): of dict's containing regex filters to be used when on this model
-            {"filter": QRegExp, "arg": str(arg)}
-            arg is arg in the items data to check, please note that this needs to be a string value
+        filters (list): of dict's containing the filters to be used when on this model
+            {"filter": QRegExp, "arg": str(arg), "name": str(name), "type": REGEX,
+                "predicate": function, "generation": int, "cache": dict}
+            arg is arg in the items data to check.
+            filter is the QRegExp for REGEX filters, or the value to compare to for
+                COMPARISON filters, which will also have an "operator" key.
+            predicate is the compiled filter, which takes an item and returns a bool.
+            cache is a dict of item to the result of the predicate, for the current
+                generation of the filter.
+        filters_by_name (dict): of filter name to filter
+        filter_generation (int): incremented every time that any filter changes
+        recursive_filter_cache (dict): of item to whether it, or any of its descendants
+            is accepted, for the recursive_filter_generation
+        recursive_filter_generation (int): filter_generation of the recursive_filter_cache
+        is_recursive_filtering_enabled (bool): determines if the ancestors of items
+            that are accepted by the filters will also be accepted
     """
+    REGEX = "regex"
+    COMPARISON = "comparison"
+    OPERATORS = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "in": lambda item_value, value: item_value in value,
+        "contains": lambda item_value, value: value in item_value
+    }
+
     def __init__(self, parent=None):
         super(AbstractDragDropFilterProxyModel, self).__init__(parent)
         self._filters = []
-        self.setRecursiveFilteringEnabled(True)
-
+        self._filters_by_name = {}
+        self._filter_generation = 0
+        self._recursive_filter_cache = {}
+        self._recursive_filter_generation = 0
+        self._is_updating_ancestors = False
+        self._is_recursive_filtering_enabled = True
+        QSortFilterProxyModel.setRecursiveFilteringEnabled(self, False)
+        self._filter_scheduler = AbstractDragDropFilterScheduler(self)
+
+    def setSourceModel(self, source_model):
+        """ Connects the cache clearing to the source model.
+
+        This is connected before the base class connects to the source model, so that
+        the caches are cleared before the rows are filtered again."""
+        old_source_model = self.sourceModel()
+        if old_source_model is not None:
+            old_source_model.dataChanged.disconnect(self.__sourceDataChanged)
+            old_source_model.rowsAboutToBeRemoved.disconnect(self.__sourceRowsAboutToBeRemoved)
+            old_source_model.modelAboutToBeReset.disconnect(self.clearFilterCache)
+            old_source_model.rowsInserted.disconnect(self.__sourceRowsChanged)
+            old_source_model.rowsRemoved.disconnect(self.__sourceRowsChanged)
+            old_source_model.rowsMoved.disconnect(self.__sourceRowsMoved)
+            old_source_model.layoutAboutToBeChanged.disconnect(self.__clearRecursiveFilterCache)
+            old_source_model.dataChanged.disconnect(self.__updateAncestorsOfChangedData)
+            old_source_model.rowsInserted.disconnect(self.__updateAncestorsOfChangedRows)
+            old_source_model.rowsRemoved.disconnect(self.__updateAncestorsOfRemovedRows)
+            old_source_model.rowsMoved.disconnect(self.__updateAncestorsOfMovedRows)
+
+        source_model.dataChanged.connect(self.__sourceDataChanged)
+        source_model.rowsAboutToBeRemoved.connect(self.__sourceRowsAboutToBeRemoved)
+        source_model.modelAboutToBeReset.connect(self.clearFilterCache)
+        source_model.rowsInserted.connect(self.__sourceRowsChanged)
+        source_model.rowsRemoved.connect(self.__sourceRowsChanged)
+        source_model.rowsMoved.connect(self.__sourceRowsMoved)
+        source_model.layoutAboutToBeChanged.connect(self.__clearRecursiveFilterCache)
+        self.clearFilterCache()
+        QSortFilterProxyModel.setSourceModel(self, source_model)
+
+        # update ancestors after the base class has updated its rows
+        source_model.dataChanged.connect(self.__updateAncestorsOfChangedData)
+        source_model.rowsInserted.connect(self.__updateAncestorsOfChangedRows)
+        source_model.rowsRemoved.connect(self.__updateAncestorsOfRemovedRows)
+        source_model.rowsMoved.connect(self.__updateAncestorsOfMovedRows)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """ Sorts the source model, rather than comparing the data of every pair of rows
+
+        The proxy keeps the order of the source model, which caches the
+        sort key of each item."""
+        self.sourceModel().sort(column, order)
+
+    def isRecursiveFilteringEnabled(self):
+        return self._is_recursive_filtering_enabled
+
+    def setRecursiveFilteringEnabled(self, enabled):
+        self._is_recursive_filtering_enabled = enabled
+        self.__clearRecursiveFilterCache()
+        self.invalidateFilter()
+
+    """ FILTERS """
     def addFilter(self, regex_filter, arg="name", name=None):
-        """ Add's a new proxy filter
+        """ Add's a new proxy filter, replacing any existing filter with the same name
 
         Args:
             regex_filter (QRegExp):
@@ -260,55 +893,582 @@ class AbstractDragDropFilterProxyModel(QSortFilterProxyModel):
             name (str): internal name of this filter
         """
         name = name or regex_filter.pattern() + arg
-        new_filter = {"filter": regex_filter, "arg": arg, "name":name}
+        new_filter = {"filter": regex_filter, "arg": arg, "name":name, "type": AbstractDragDropFilterProxyModel.REGEX}
+        self.__addFilter(new_filter)
+
+    def addComparisonFilter(self, value, arg="name", operator="==", name=None):
+        """ Add's a new proxy filter that compares the items data to a value.
+        Any existing filter with the same name will be replaced.
+
+        The items data is converted to the type of the value before it is compared,
+        so that numbers stored as strings are compared as numbers.  Items whose data
+        cannot be converted will be filtered out.
+
+        Args:
+            value: to compare the items data to
+            arg (str): column data arg to query
+            operator (str): comparison to use, one of the keys in OPERATORS
+                "==" | "!=" | "<" | "<=" | ">" | ">=" | "in" | "contains"
+            name (str): internal name of this filter
+        """
+        name = name or "{arg}{operator}{value}".format(arg=arg, operator=operator, value=value)
+        new_filter = {
+            "filter": value, "arg": arg, "name": name, "operator": operator,
+            "type": AbstractDragDropFilterProxyModel.COMPARISON}
+        self.__addFilter(new_filter)
+
+    def __addFilter(self, new_filter):
+        # replace existing filter
+        if new_filter["name"] in self._filters_by_name:
+            self._filters.remove(self._filters_by_name[new_filter["name"]])
+
         self._filters.append(new_filter)
+        self._filters_by_name[new_filter["name"]] = new_filter
+        self.__compileFilter(new_filter)
+        self.invalidateFilter()
 
     def clearFilters(self):
         self._filters = []
+        self._filters_by_name = {}
+        self._filter_generation += 1
+        self.invalidateFilter()
 
     def filters(self):
         return self._filters
 
+    def getFilterByName(self, name):
+        return self._filters_by_name.get(name)
+
     def removeFilter(self, regex_filter, arg="name"):
-        try:
-            self._filters.remove({"filter": regex_filter, "arg": arg})
-        except ValueError:
-            # Invalid filter
-            pass
+        for _filter in self._filters:
+            if _filter["filter"] is regex_filter and _filter["arg"] == arg:
+                self.__removeFilter(_filter)
+                return
 
     def removeFilterByIndex(self, index):
-        del self._filters[index]
+        self.__removeFilter(self._filters[index])
 
     def removeFilterByName(self, name):
-        for _filter in self._filters:
-            if _filter["name"] == name:
-                del self._filters[_filter]
+        if name in self._filters_by_name:
+            self.__removeFilter(self._filters_by_name[name])
 
-    def updateFilterByName(self, pattern, name):
+    def __removeFilter(self, _filter):
+        self._filters.remove(_filter)
+        del self._filters_by_name[_filter["name"]]
+        self._filter_generation += 1
+        self.invalidateFilter()
+
+    def updateFilterByName(self, pattern, name, invalidate=True):
         """ Updates the given filter with the regex provided
 
         Args:
-            pattern (str): regex pattern to be updated
+            pattern (str): regex pattern to be updated, or the value to compare
+                to if this is a comparison filter
             name (str): name of filter to update
+            invalidate (bool): determines if the rows should be filtered again
         """
+        _filter = self._filters_by_name.get(name)
+        if not _filter:
+            return
+
+        if _filter["type"] == AbstractDragDropFilterProxyModel.REGEX:
+            if _filter["filter"].pattern() == pattern:
+                return
+            _filter["filter"].setPattern(pattern)
+        else:
+            if _filter["filter"] == pattern:
+                return
+            _filter["filter"] = pattern
+
+        self.__compileFilter(_filter)
+        if invalidate:
+            self.invalidateFilter()
+
+    def scheduleFilterUpdate(self, pattern, name):
+        """ Updates the given filter once the user has stopped updating it, and
+        filters the rows in the background.  See AbstractDragDropFilterScheduler
+
+        Args:
+            pattern (str): regex pattern to be updated, or the value to compare
+                to if this is a comparison filter
+            name (str): name of filter to update
+        """
+        self.filterScheduler().updateFilterByName(pattern, name)
+
+    def filterScheduler(self):
+        return self._filter_scheduler
+
+    """ FILTER ENGINE """
+    def filterGeneration(self):
+        return self._filter_generation
+
+    def cacheFilterResults(self, items):
+        """ Caches the result of every filter for the items provided
+
+        Args:
+            items (list): of AbstractDragDropModelItem"""
+        for _filter in self._filters:
+            cache = _filter["cache"]
+            predicate = _filter["predicate"]
+            for item in items:
+                if item not in cache:
+                    cache[item] = predicate(item)
+
+    def clearFilterCache(self):
+        """ Clears the cached results of every filter"""
         for _filter in self._filters:
-            if _filter["name"] == name:
-                _filter["filter"].setPattern(pattern)
-                self.invalidateFilter()
+            _filter["cache"] = {}
+        self.__clearRecursiveFilterCache()
 
-    def filterAcceptsRow(self, source_row, source_parent):
-        source_index = self.sourceModel().index(source_row, 0, source_parent)
-        item = source_index.internalPointer()
-        if item:
-            for filter in self.filters():
-                item_data = item.getArg(filter["arg"])
-                match = filter["filter"].indexIn(item_data, 0)
-                if match == -1:
+    def __clearRecursiveFilterCache(self, *args):
+        self._recursive_filter_cache = {}
+
+    def __clearItemsFilterCache(self, items):
+        """ Removes the items provided from the cache of every filter
+
+        Args:
+            items (list): of AbstractDragDropModelItem"""
+        for _filter in self._filters:
+            cache = _filter["cache"]
+            if cache:
+                for item in items:
+                    cache.pop(item, None)
+
+        cache = self._recursive_filter_cache
+        if cache:
+            for item in items:
+                cache.pop(item, None)
+
+    def __clearAncestorsFilterCache(self, item):
+        """ Removes the item provided, and all of its ancestors from the recursive filter cache,
+        as whether any of their descendants are accepted may have changed.
+
+        Args:
+            item (AbstractDragDropModelItem)"""
+        cache = self._recursive_filter_cache
+        if not cache:
+            return
+        while item is not None:
+            cache.pop(item, None)
+            item = item.parent()
+
+    def __sourceDataChanged(self, top_left, bottom_right, roles=None):
+        parent_item = self.sourceModel().getItem(top_left.parent())
+        self.__clearItemsFilterCache(parent_item.children()[top_left.row():bottom_right.row() + 1])
+        self.__clearAncestorsFilterCache(parent_item)
+
+    def __sourceRowsChanged(self, parent, *args):
+        self.__clearAncestorsFilterCache(self.sourceModel().getItem(parent))
+
+    def __sourceRowsMoved(self, source_parent, first, last, destination_parent, row):
+        self.__clearAncestorsFilterCache(self.sourceModel().getItem(source_parent))
+        self.__clearAncestorsFilterCache(self.sourceModel().getItem(destination_parent))
+
+    def __sourceRowsAboutToBeRemoved(self, parent, first, last):
+        if not self._recursive_filter_cache and not any(_filter["cache"] for _filter in self._filters):
+            return
+        parent_item = self.sourceModel().getItem(parent)
+        items = parent_item.children()[first:last + 1]
+        for item in parent_item.children()[first:last + 1]:
+            items += self.sourceModel().iterItems(item)
+        self.__clearItemsFilterCache(items)
+
+    def __updateAncestorsOfChangedData(self, top_left, bottom_right, roles=None):
+        self.__updateAncestorsOfChangedRows(top_left.parent(), top_left.row(), bottom_right.row())
+
+    def __updateAncestorsOfRemovedRows(self, parent, first, last):
+        self.__updateAncestorsOfChangedRows(parent)
+
+    def __updateAncestorsOfMovedRows(self, source_parent, first, last, destination_parent, row):
+        if source_parent == destination_parent and last < row:
+            row -= last - first + 1
+        self.__updateAncestorsOfChangedRows(source_parent)
+        self.__updateAncestorsOfChangedRows(destination_parent, row, row + last - first)
+
+    def __updateAncestorsOfChangedRows(self, parent, first=None, last=None):
+        """ Re-filters the ancestors of the rows under the parent provided, if any
+        of them have changed whether they should be accepted.
+
+        Only the ancestors that have changed are filtered again, by emitting
+        dataChanged for them from the source model, which the QSortFilterProxyModel
+        handles by filtering only that row again.  This is done from the top down,
+        and then the rows provided are filtered again, as the QSortFilterProxyModel
+        does not filter rows under an ancestor that is not accepted.
+
+        Args:
+            parent (QModelIndex): source index whose children have changed
+            first (int): first row that has changed
+            last (int): last row that has changed"""
+        if not self._filters or not self.isRecursiveFilteringEnabled() or not parent.isValid():
+            return
+        if self._is_updating_ancestors:
+            return
+
+        source_model = self.sourceModel()
+        changed_items = []
+        item = parent.internalPointer()
+        while item is not None and item is not source_model.rootItem():
+            is_visible = self.mapFromSource(source_model.getIndexFromItem(item)).isValid()
+            if is_visible != self.__filterAcceptsItem(item):
+                changed_items.append(item)
+            item = item.parent()
+        if not changed_items:
+            return
+
+        self._is_updating_ancestors = True
+        try:
+            for item in reversed(changed_items):
+                index = source_model.getIndexFromItem(item)
+                if self.mapFromSource(index).isValid() != self.__filterAcceptsItem(item):
+                    source_model.dataChanged.emit(index, index)
+            if first is not None:
+                source_model.dataChanged.emit(
+                    source_model.index(first, 0, parent),
+                    source_model.index(last, source_model.columnCount(parent) - 1, parent))
+        finally:
+            self._is_updating_ancestors = False
+
+    def __filterAcceptsItem(self, item):
+        """ Determines if the item provided, or any of its descendants if recursive
+        filtering is enabled, is accepted by every filter.
+
+        Args:
+            item (AbstractDragDropModelItem):
+
+        Returns (bool)"""
+        for _filter in self._filters:
+            cache = _filter["cache"]
+            try:
+                result = cache[item]
+            except KeyError:
+                result = _filter["predicate"](item)
+                cache[item] = result
+            if not result:
+                break
+        else:
+            return True
+
+        children = item.children()
+        if not self._is_recursive_filtering_enabled or not children:
+            return False
+
+        # check if any descendants are accepted
+        if self._recursive_filter_generation != self._filter_generation:
+            self._recursive_filter_cache = {}
+            self._recursive_filter_generation = self._filter_generation
+        cache = self._recursive_filter_cache
+        result = cache.get(item)
+        if result is None:
+            result = False
+            for child in children:
+                if self.__filterAcceptsItem(child):
+                    result = True
+                    break
+            cache[item] = result
+        return result
+
+    def __compileFilter(self, _filter):
+        """ Compiles the filter provided into a predicate, and starts a new generation of its cache"""
+        arg = _filter["arg"]
+        if _filter["type"] == AbstractDragDropFilterProxyModel.REGEX:
+            match = self.__compileRegex(_filter["filter"])
+
+            def predicate(item):
+                item_data = item.getArg(arg)
+                return match("" if item_data is None else str(item_data))
+        else:
+            value = _filter["filter"]
+            compare = AbstractDragDropFilterProxyModel.OPERATORS[_filter["operator"]]
+            value_type = None if _filter["operator"] in ("in", "contains") else type(value)
+
+            def predicate(item):
+                item_data = item.getArg(arg)
+                try:
+                    if value_type is not None and not isinstance(item_data, value_type):
+                        item_data = value_type(item_data)
+                    return bool(compare(item_data, value))
+                except (TypeError, ValueError):
                     return False
 
+        self._filter_generation += 1
+        _filter["predicate"] = predicate
+        _filter["generation"] = self._filter_generation
+        _filter["cache"] = {}
+
+    @staticmethod
+    def __compileRegex(regex_filter):
+        """ Returns a function that determines if a string contains a match for the QRegExp provided
+
+        Fixed strings are checked with a substring search, and regular expressions
+        are compiled with python, falling back to the QRegExp if they are not valid
+        python expressions.
+
+        Args:
+            regex_filter (QRegExp):
+
+        Returns (function): that takes a string and returns a bool"""
+        pattern = regex_filter.pattern()
+        case_sensitive = regex_filter.caseSensitivity() == Qt.CaseSensitive
+        syntax = regex_filter.patternSyntax()
+
+        if syntax == QRegExp.FixedString:
+            if case_sensitive:
+                return lambda text: pattern in text
+            pattern = pattern.lower()
+            return lambda text: pattern in text.lower()
+
+        if syntax in (QRegExp.RegExp, QRegExp.RegExp2):
+            try:
+                regex = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+                return lambda text: regex.search(text) is not None
+            except re.error:
+                pass
+
+        return lambda text: regex_filter.indexIn(text, 0) != -1
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # rows are remapped every time that they are sorted/moved, so skip the item lookup when not filtering
+        if not self._filters:
+            return QSortFilterProxyModel.filterAcceptsRow(self, source_row, source_parent)
+
+        if source_parent.isValid():
+            item = source_parent.internalPointer().child(source_row)
+        else:
+            item = self.sourceModel().rootItem().child(source_row)
+        if item and not self.__filterAcceptsItem(item):
+            return False
+
         return QSortFilterProxyModel.filterAcceptsRow(self, source_row, source_parent)
 
 
+class AbstractDragDropFilterScheduler(QObject):
+    """ Applies filter updates to an AbstractDragDropFilterProxyModel from the event loop.
+
+    Updates that happen within the delay of each other (ie each key stroke in a
+    search box) are coalesced into one update.  Once the delay has passed, the
+    filters are updated, and their results are cached for a chunk of items at a
+    time, for no longer than the frame budget, before returning to the event loop.
+    Once every item has been cached, the proxy model is filtered again, which only
+    has to read the cached results.
+
+    Note:
+        If the filtering is cancelled after the delay has passed, the filters
+        will have been updated, but the rows will not have been filtered again.
+
+    Attributes:
+        delay (int): milliseconds to wait after the last update before filtering
+        frame_budget (int): milliseconds to spend filtering before returning
+            to the event loop
+        pending_updates (OrderedDict): of filter name to the pattern that it will be updated to
+        items (list): of AbstractDragDropModelItem being filtered, if this is
+            None, then they will be collected before the next chunk is filtered
+        position (int): index of the next item in the items list to be filtered
+
+    Virtual:
+        filterStartedEvent (scheduler, num_items)
+        filterProgressEvent (scheduler, num_filtered, num_items)
+        filterFinishedEvent (scheduler)
+        filterCancelledEvent (scheduler)
+    """
+    CHUNK_SIZE = 256
+
+    def __init__(self, proxy_model):
+        super(AbstractDragDropFilterScheduler, self).__init__(proxy_model)
+        self._proxy_model = proxy_model
+        self._delay = 150
+        self._frame_budget = 8
+        self._pending_updates = OrderedDict()
+        self._items = []
+        self._position = 0
+        self._source_model = None
+
+        # setup timers
+        self._delay_timer = QTimer(self)
+        self._delay_timer.setSingleShot(True)
+        self._delay_timer.timeout.connect(self.__startFiltering)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(0)
+        self._frame_timer.timeout.connect(self.__filterNextFrame)
+
+    def proxyModel(self):
+        return self._proxy_model
+
+    def delay(self):
+        return self._delay
+
+    def setDelay(self, _delay):
+        self._delay = _delay
+
+    def frameBudget(self):
+        return self._frame_budget
+
+    def setFrameBudget(self, _frame_budget):
+        self._frame_budget = _frame_budget
+
+    def isActive(self):
+        """ Determines if there are updates waiting to be applied, or rows being filtered"""
+        return self._delay_timer.isActive() or self._frame_timer.isActive()
+
+    def updateFilterByName(self, pattern, name):
+        """ Queues an update to the given filter, and restarts the delay
+
+        Args:
+            pattern (str): regex pattern to be updated, or the value to compare
+                to if this is a comparison filter
+            name (str): name of filter to update
+        """
+        self.__stopFiltering()
+        self._pending_updates[name] = pattern
+        self._delay_timer.start(self.delay())
+
+    def flush(self):
+        """ Applies all of the queued updates, and filters the rows immediately"""
+        if not self.isActive():
+            return
+        self._delay_timer.stop()
+        self.__applyPendingUpdates()
+        self.__finishFiltering()
+
+    def cancel(self):
+        """ Stops the current filtering, and discards any queued updates"""
+        if not self.isActive():
+            return
+        self._delay_timer.stop()
+        self._pending_updates.clear()
+        self.__stopFiltering()
+        self.filterCancelledEvent(self)
+
+    def __applyPendingUpdates(self):
+        for name, pattern in self._pending_updates.items():
+            self.proxyModel().updateFilterByName(pattern, name, invalidate=False)
+        self._pending_updates.clear()
+
+    def __startFiltering(self):
+        self.__applyPendingUpdates()
+
+        # restart if items are removed while filtering
+        self._source_model = self.proxyModel().sourceModel()
+        self._source_model.rowsAboutToBeRemoved.connect(self.__resetItems)
+        self._source_model.modelAboutToBeReset.connect(self.__resetItems)
+
+        self._items = list(self._source_model.iterItems())
+        self._position = 0
+        self.filterStartedEvent(self, len(self._items))
+        self._frame_timer.start()
+
+    def __filterNextFrame(self):
+        """ Caches the filter results of chunks of items until the frame budget has been used"""
+        if self._items is None:
+            self._items = list(self._source_model.iterItems())
+            self._position = 0
+
+        end_time = time.perf_counter() + self.frameBudget() / 1000.0
+        num_items = len(self._items)
+        while self._position < num_items:
+            chunk = self._items[self._position:self._position + AbstractDragDropFilterScheduler.CHUNK_SIZE]
+            self.proxyModel().cacheFilterResults(chunk)
+            self._position += len(chunk)
+            if end_time < time.perf_counter():
+                break
+
+        self.filterProgressEvent(self, self._position, num_items)
+        if num_items <= self._position:
+            self.__finishFiltering()
+
+    def __finishFiltering(self):
+        self.__stopFiltering()
+        self.proxyModel().invalidateFilter()
+        self.filterFinishedEvent(self)
+
+    def __stopFiltering(self):
+        self._frame_timer.stop()
+        self._items = []
+        self._position = 0
+        if self._source_model is not None:
+            self._source_model.rowsAboutToBeRemoved.disconnect(self.__resetItems)
+            self._source_model.modelAboutToBeReset.disconnect(self.__resetItems)
+            self._source_model = None
+
+    def __resetItems(self, *args):
+        """ Collects the items again before the next chunk, as some have been removed.
+
+        Items that have already been cached will not be filtered again."""
+        self._items = None
+
+    """ VIRTUAL EVENTS """
+    def setFilterStartedEvent(self, function):
+        self.__filterStartedEvent = function
+
+    def filterStartedEvent(self, scheduler, num_items):
+        self.__filterStartedEvent(scheduler, num_items)
+
+    def __filterStartedEvent(self, scheduler, num_items):
+        pass
+
+    def setFilterProgressEvent(self, function):
+        self.__filterProgressEvent = function
+
+    def filterProgressEvent(self, scheduler, num_filtered, num_items):
+        self.__filterProgressEvent(scheduler, num_filtered, num_items)
+
+    def __filterProgressEvent(self, scheduler, num_filtered, num_items):
+        pass
+
+    def setFilterFinishedEvent(self, function):
+        self.__filterFinishedEvent = function
+
+    def filterFinishedEvent(self, scheduler):
+        self.__filterFinishedEvent(scheduler)
+
+    def __filterFinishedEvent(self, scheduler):
+        pass
+
+    def setFilterCancelledEvent(self, function):
+        self.__filterCancelledEvent = function
+
+    def filterCancelledEvent(self, scheduler):
+        self.__filterCancelledEvent(scheduler)
+
+    def __filterCancelledEvent(self, scheduler):
+        pass
+
+
+class AbstractDragDropItemProvider(object):
+    """ Interface for lazily populating an AbstractDragDropModel.
+
+    When a provider is set on the model, the children of an item are only
+    created when a view asks for them (when the item is expanded, or scrolled
+    to the bottom of), one page at a time.  This should be subclassed, and
+    the hasChildren() / fetchChildren() methods overridden to read from the
+    underlying data (scene graph, file system, etc).  The item provided to
+    each method is the parent item, which can store whatever column data is
+    needed to look up its children (path, node name, etc).
+    """
+    def hasChildren(self, item):
+        """ Determines if the item provided has children that can be fetched.
+
+        This is called for every visible item, so should be cheap.
+
+        Args:
+            item (AbstractDragDropModelItem): parent item
+
+        Returns (bool)"""
+        return False
+
+    def fetchChildren(self, item, start, count):
+        """ Returns the data for a page of children of the item provided
+
+        Args:
+            item (AbstractDragDropModelItem): parent item
+            start (int): index of the first child to return, this is the number
+                of children that have already been fetched from this provider
+            count (int): maximum number of children to return.  If fewer
+                children are returned, the item is assumed to have no more children.
+
+        Returns (list): of dicts in the format used by insertNewIndexes()"""
+        return []
+
+
 class AbstractDragDropModel(QAbstractItemModel):
     """
     Abstract model that is used for the Shoji.  This supports lists, and
@@ -319,6 +1479,15 @@ class AbstractDragDropModel(QAbstractItemModel):
     Attributes:
         item_type (Item): Data item to be stored on each index.  By default this
             set to the AbstractDragDropModelItem
+        item_provider (AbstractDragDropItemProvider): if set, the children of
+            items will be created on demand as the views need them.
+        fetch_page_size (int): maximum number of children created per fetchMore()
+        fetch_limit (int): maximum number of fetched items to keep in the model,
+            once exceeded, the least recently fetched collapsed branches are
+            evicted.  If None, the fetched items are never evicted.
+        fetched_items (OrderedDict): of the items that have had children fetched,
+            from least to most recently fetched.  The values are lists of
+            [num_fetched (int), is_exhausted (bool)]
 
     Export Data
         Uses the "exportModelToDict()" function to return the entire tree as a dictionary.
@@ -337,10 +1506,17 @@ class AbstractDragDropModel(QAbstractItemModel):
             Take one arg, which is a function which should return a dictionary.
             Have the given function return a dictionary, which must include a the keypair
                 "children": []
+
+        Large models can be written/read one item at a time as newline delimited JSON
+        with "exportModelToFile()" / "importModelFromFile()", so that the entire tree
+        never has to be held in memory as a dictionary.
     """
     ITEM_HEIGHT = 35
     ITEM_WIDTH = 100
 
+    # style roles returned by data() that only depend on if the item is enabled
+    CACHED_ROLES = frozenset((Qt.FontRole, Qt.ForegroundRole, Qt.SizeHintRole))
+
     def __init__(self, parent=None, root_item=None):
         super(AbstractDragDropModel, self).__init__(parent)
         # set up default item type
@@ -371,7 +1547,40 @@ class AbstractDragDropModel(QAbstractItemModel):
         #
         self._dropping = False
         self._delete_item_on_drop = True
+        self._move_rows_threshold = 8
         self._last_selected_item = None
+        self._role_cache = {}
+        self._role_cache_color_version = iColor.version()
+
+        # cached fonts / colors need to be recreated when the application theme changes
+        app = QApplication.instance()
+        if app:
+            app.fontChanged.connect(self.clearRoleCache)
+            app.paletteChanged.connect(self.clearRoleCache)
+
+        # lazy population
+        self._item_provider = None
+        self._fetch_page_size = 256
+        self._fetch_limit = None
+        self._fetched_items = OrderedDict()
+        self._num_fetched_items = 0
+        self._is_fetching = False
+        self._evict_timer = QTimer(self)
+        self._evict_timer.setSingleShot(True)
+        self._evict_timer.timeout.connect(self.__evictTimeout)
+
+        # batch updates
+        self._batch_update_depth = 0
+        self._batch_deleted_items = OrderedDict()
+        self._batch_changed_items = OrderedDict()
+        self._batch_delete_events = []
+        self._batch_enabled_events = OrderedDict()
+        self._batch_text_changed_events = []
+
+        # sorting
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._sort_keys = {}
 
     """ UTILS """
     @staticmethod
@@ -383,20 +1592,11 @@ class AbstractDragDropModel(QAbstractItemModel):
 
         Args:
             item (AbstractDragDropModelItem): item to find unique name for"""
-        child_names = [child.name() for child in item.parent().children()]
-        child_names.remove(item.name())
-        item_name = item.name()
-        while item_name in child_names:
-            try:
-                suffix = int(item_name[-1])
-                suffix += 1
-                item_name = item_name[:-1] + str(suffix)
-            except ValueError:
-                item_name = item_name + "0"
-        return item_name
+        return item.parent().childNameIndex().getUniqueName(item.name(), exclude=item)
 
     def setItemEnabled(self, item, enabled):
         item.setIsEnabled(enabled)
+        self.itemDataChanged(item)
         self.itemEnabledEvent(item, enabled)
 
     def deleteItem(self, item, event_update=False, update_first=True):
@@ -416,10 +1616,20 @@ class AbstractDragDropModel(QAbstractItemModel):
             update_first (bool): determines if the update should be run before
                 or after the delete has happened.
 
+        Note:
+            If this is called inside of a batchUpdate(), the item will be removed
+            when the batch update has finished.  The itemDeleteEvent is still run
+            before or after the removal, depending on updateFirst().
+
         Returns:
 
         """
 
+        # queue deletion until the batch update has finished
+        if self.isBatchUpdating():
+            self._batch_deleted_items[item] = self._batch_deleted_items.get(item, False) or event_update
+            return
+
         # preflight
         # todo for some reason this causes a regression with selection
         # if not item.row(): return
@@ -434,8 +1644,11 @@ class AbstractDragDropModel(QAbstractItemModel):
             old_parent_index = self.getParentIndexFromItem(item)
 
             # remove item
-            self.beginRemoveRows(old_parent_index, item.row(), item.row() + 1)
-            old_parent_item.children().remove(item)
+            row = item.row()
+            self.beginRemoveRows(old_parent_index, row, row)
+            old_parent_item.removeChild(row)
+            # keep the parent so that it is still available to the itemDeleteEvent
+            item.setParent(old_parent_item)
             self.endRemoveRows()
 
             if not self.updateFirst():
@@ -447,6 +1660,95 @@ class AbstractDragDropModel(QAbstractItemModel):
             # LALALALALALALALALALA CAN'T NO PROBLEMS HERE
             pass
 
+    def removeItems(self, items, event_update=False):
+        """ Removes all of the items provided in as few operations as possible
+
+        The items are sorted by their position in the tree, and all contiguous
+        items are removed with a single beginRemoveRows/endRemoveRows.  If
+        there are more ranges than the moveRowsThreshold(), the items will be
+        removed inside of one layout change instead.
+
+        Items which are descendants of other items being removed are skipped,
+        as they will be removed with their ancestor.
+
+        Args:
+            items (list): of AbstractDragDropModelItem to remove
+            event_update (bool): if True the itemDeleteEvent will be run on
+                each item removed, before or after the removal depending
+                on the updateFirst() setting.
+
+        Returns (list): of AbstractDragDropModelItem that were removed
+        """
+        items = self.__getRemovableItems(items)
+        if not items: return []
+        runs = self.getContiguousItemRuns(items)
+
+        # run deletion event
+        if event_update and self.updateFirst():
+            for item in items:
+                self.itemDeleteEvent(item)
+
+        # setup layout change
+        is_layout_change = self.moveRowsThreshold() < len(runs)
+        if is_layout_change:
+            self.layoutAboutToBeChanged.emit()
+            persistent_indexes = self.persistentIndexList()
+            persistent_items = [(index.internalPointer(), index.column()) for index in persistent_indexes]
+
+        # remove items, in reverse so that the rows of the remaining runs are still valid
+        for run in reversed(runs):
+            parent_item = run[0].parent()
+            first = run[0].row()
+            last = first + len(run) - 1
+            if is_layout_change:
+                parent_item.removeChildren(first, last)
+            else:
+                parent_index = self.getIndexFromItem(parent_item) if parent_item != self.rootItem() else QModelIndex()
+                self.beginRemoveRows(parent_index, first, last)
+                parent_item.removeChildren(first, last)
+                self.endRemoveRows()
+
+            # keep the parent so that it is still available to the itemDeleteEvent
+            for item in run:
+                item.setParent(parent_item)
+
+        # finish layout change
+        if is_layout_change:
+            removed_items = set(items)
+            new_indexes = []
+            for item, column in persistent_items:
+                if item in removed_items or self.isItemAncestorInSet(item, removed_items):
+                    new_indexes.append(QModelIndex())
+                else:
+                    new_indexes.append(self.createIndex(item.row(), column, item))
+            self.changePersistentIndexList(persistent_indexes, new_indexes)
+            self.layoutChanged.emit()
+
+        # run deletion event
+        if event_update and not self.updateFirst():
+            for item in items:
+                self.itemDeleteEvent(item)
+
+        return items
+
+    def __getRemovableItems(self, items):
+        """ Returns the items that removeItems() will remove, in tree order
+
+        Items that are not in the model, or are descendants of other items
+        being removed, are skipped.
+
+        Args:
+            items (list): of AbstractDragDropModelItem
+
+        Returns (list): of AbstractDragDropModelItem"""
+        removed_items = set(items)
+        items = [
+            item for item in removed_items
+            if item.parent() is not None and item.row() is not None
+            and not self.isItemAncestorInSet(item, removed_items)]
+        items.sort(key=self.getItemPath)
+        return items
+
     def clearModel(self, event_update=False):
         """
         Clears the entire model
@@ -454,8 +1756,160 @@ class AbstractDragDropModel(QAbstractItemModel):
             update_event (bool): determines if user event should be
                 run on each item during the deletion process.
         """
-        for child in reversed(self.rootItem().children()):
-            self.deleteItem(child, event_update=event_update)
+        self.removeItems(list(self.rootItem().children()), event_update=event_update)
+
+    """ BATCH UPDATE """
+    def isBatchUpdating(self):
+        return 0 < self._batch_update_depth
+
+    @contextmanager
+    def batchUpdate(self):
+        """ Context manager which defers all notifications until it exits
+
+        Inside of a batch update:
+            - deleteItem() queues the item, and all of the queued items are
+                removed with removeItems() in as few ranges as possible.
+            - itemDataChanged() queues the item, and one dataChanged signal is
+                emitted for each contiguous range of rows that has changed.
+            - itemDeleteEvent(), itemEnabledEvent() and textChangedEvent() are
+                queued, and delivered with one call to itemsDeleteEvent(),
+                itemsEnabledEvent() and itemsTextChangedEvent().  If updateFirst()
+                is True, the delete events of the queued items are delivered
+                before they are removed.
+
+        Batch updates can be nested, everything is flushed when the outermost
+        batch update exits.
+
+            with model.batchUpdate():
+                for item in items:
+                    model.setItemEnabled(item, False)
+        """
+        self._batch_update_depth += 1
+        try:
+            yield self
+        finally:
+            # always leave the batch update, even if a user event raises during the flush
+            try:
+                if self._batch_update_depth == 1:
+                    self.__flushBatchUpdate()
+            finally:
+                self._batch_update_depth -= 1
+
+    def __flushBatchUpdate(self):
+        """ Removes the queued items, and emits all of the queued signals/events.
+
+        This is run while the batch update is still active, so that the events
+        run by the removal are queued as well."""
+        # remove items
+        deleted_items = self._batch_deleted_items
+        self._batch_deleted_items = OrderedDict()
+        event_items = [item for item, event_update in deleted_items.items() if event_update]
+        if event_items and self.updateFirst():
+            # run the delete events while the items are still in the model
+            event_items = self.__getRemovableItems(event_items)
+            self._batch_update_depth -= 1
+            try:
+                self.itemsDeleteEvent(event_items)
+            finally:
+                self._batch_update_depth += 1
+            self.removeItems(event_items)
+        else:
+            self.removeItems(event_items, event_update=True)
+        self.removeItems([item for item, event_update in deleted_items.items() if not event_update])
+
+        # data changed
+        changed_items = self._batch_changed_items
+        self._batch_changed_items = OrderedDict()
+        self.__emitDataChangedRanges(changed_items)
+
+        # user events
+        delete_events = self._batch_delete_events
+        enabled_events = self._batch_enabled_events
+        text_changed_events = self._batch_text_changed_events
+        self._batch_delete_events = []
+        self._batch_enabled_events = OrderedDict()
+        self._batch_text_changed_events = []
+
+        self._batch_update_depth -= 1
+        try:
+            if delete_events:
+                self.itemsDeleteEvent(delete_events)
+            if enabled_events:
+                self.itemsEnabledEvent(list(enabled_events.items()))
+            if text_changed_events:
+                self.itemsTextChangedEvent(text_changed_events)
+        finally:
+            self._batch_update_depth += 1
+
+    def __emitDataChangedRanges(self, changed_items):
+        """ Emits one dataChanged signal for each contiguous range of changed rows
+
+        Args:
+            changed_items (OrderedDict): of AbstractDragDropModelItem to a list of
+                [first_column (int), last_column (int), roles (set)].  If roles is
+                None, all roles have changed"""
+        changed_rows = {}
+        for item, (first_column, last_column, roles) in changed_items.items():
+            if not self.isItemInModel(item) or item is self.rootItem():
+                continue
+            changed_rows.setdefault(item.parent(), []).append((item.row(), item, first_column, last_column, roles))
+
+        for rows in changed_rows.values():
+            rows.sort(key=operator.itemgetter(0))
+            start = 0
+            for end in range(1, len(rows) + 1):
+                if end < len(rows) and rows[end][0] == rows[end - 1][0] + 1:
+                    continue
+                run = rows[start:end]
+                first_column = min(row[2] for row in run)
+                last_column = max(row[3] for row in run)
+                roles = set()
+                for row in run:
+                    if row[4] is None:
+                        roles = None
+                        break
+                    roles.update(row[4])
+                self.dataChanged.emit(
+                    self.createIndex(run[0][0], first_column, run[0][1]),
+                    self.createIndex(run[-1][0], last_column, run[-1][1]),
+                    sorted(roles) if roles else [])
+                start = end
+
+    def itemDataChanged(self, item, column=None, roles=None):
+        """ Notifies the views that the data of an item has changed.
+
+        Inside of a batchUpdate(), the item is queued and emitted with its
+        neighbours once the batch has finished.
+
+        Args:
+            item (AbstractDragDropModelItem): item that has changed
+            column (int): column that has changed, if None all columns have changed
+            roles (list): of Qt.ItemDataRole that have changed, if None all
+                roles have changed"""
+        if column is None:
+            first_column, last_column = 0, max(0, len(self._header_data) - 1)
+        else:
+            first_column = last_column = column
+
+        if self.isBatchUpdating():
+            changed_data = self._batch_changed_items.get(item)
+            if changed_data is None:
+                self._batch_changed_items[item] = [
+                    first_column, last_column, None if roles is None else set(roles)]
+            else:
+                changed_data[0] = min(changed_data[0], first_column)
+                changed_data[1] = max(changed_data[1], last_column)
+                if roles is None or changed_data[2] is None:
+                    changed_data[2] = None
+                else:
+                    changed_data[2].update(roles)
+            return
+
+        row = item.row()
+        if row is None:
+            return
+        self.dataChanged.emit(
+            self.createIndex(row, first_column, item), self.createIndex(row, last_column, item), roles or [])
 
     def rowCount(self, parent):
         """
@@ -463,11 +1917,8 @@ class AbstractDragDropModel(QAbstractItemModel):
         OUTPUT: int
         """
         if not parent.isValid():
-            parent_item = self._root_item
-        else:
-            parent_item = parent.internalPointer()
-
-        return parent_item.childCount()
+            return len(self._root_item.children())
+        return len(parent.internalPointer().children())
 
     def columnCount(self, parent):
         """
@@ -505,6 +1956,14 @@ class AbstractDragDropModel(QAbstractItemModel):
     def setDeleteItemOnDrop(self, enabled):
         self._delete_item_on_drop = enabled
 
+    def moveRowsThreshold(self):
+        """ Maximum number of contiguous ranges that moveItems() will move with
+        beginMoveRows/endMoveRows before falling back to a single layout change"""
+        return self._move_rows_threshold
+
+    def setMoveRowsThreshold(self, _move_rows_threshold):
+        self._move_rows_threshold = _move_rows_threshold
+
     def data(self, index, role):
         """
         This is the main display class for the model.  Setting different
@@ -521,14 +1980,46 @@ class AbstractDragDropModel(QAbstractItemModel):
         item = index.internalPointer()
 
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            for i in range(self.columnCount(item)):
-                if index.column() == i:
-                    try:
-                        return_val = item.columnData()[self.getHeaderData()[i]]
-                    except KeyError:
-                        return_val = None
-                    return return_val
+            column = index.column()
+            if column < len(self._header_data):
+                return item.getArg(self._header_data[column])
+            return None
+
+        if role not in AbstractDragDropModel.CACHED_ROLES:
+            return self.createRoleValue(item, role)
+
+        # these style roles only depend on if the item is enabled, so they are shared between items
+        if self._role_cache_color_version != iColor.version():
+            self.clearRoleCache()
+        key = (role, item.isEnabled())
+        try:
+            return self._role_cache[key]
+        except KeyError:
+            value = self.createRoleValue(item, role)
+            self._role_cache[key] = value
+            return value
+
+    """ ROLE CACHE """
+    def clearRoleCache(self, *args):
+        """ Clears all of the cached values returned by data() for the CACHED_ROLES.
+
+        This is called when the application font / palette, the iColor text colors,
+        or the item size change."""
+        self._role_cache = {}
+        self._role_cache_color_version = iColor.version()
+
+    def createRoleValue(self, item, role):
+        """ Creates the value that data() returns for the style role provided
 
+        The values returned for the CACHED_ROLES are cached by the role, and if
+        the item is enabled, so they need to only rely on if the item is enabled.
+        All other roles are created for each item every time data() is called.
+
+        Args:
+            item (AbstractDragDropModelItem): item to create the value for
+            role (Qt.ItemDataRole): role to create the value for
+
+        Returns (QFont, QColor, QSize, None)"""
         # change style for disabled items
         if role == Qt.FontRole:
             font = QApplication.font()
@@ -547,6 +2038,8 @@ class AbstractDragDropModel(QAbstractItemModel):
         if role == Qt.SizeHintRole:
             return QSize(self.item_width, self.item_height)
 
+        return None
+
     def setData(self, index, value, role=Qt.EditRole):
         """
         INPUTS: QModelIndex, QVariant, int (flag)
@@ -555,7 +2048,11 @@ class AbstractDragDropModel(QAbstractItemModel):
             if role == Qt.EditRole:
                 item = index.internalPointer()
                 arg = self._header_data[index.column()]
-                item.columnData()[arg] = value
+                item.setArg(arg, value)
+                self.clearItemSortKeys(item)
+                self.itemDataChanged(item, column=index.column(), roles=[role])
+                if index.column() == self._sort_column:
+                    self.updateItemSortPosition(item)
                 return True
         return False
 
@@ -607,11 +2104,13 @@ class AbstractDragDropModel(QAbstractItemModel):
 
         Returns (QModelIndex)
         """
-        parent_item = self.getItem(parent)
-        child_item = parent_item.child(row)
+        if parent.isValid():
+            children = parent.internalPointer().children()
+        else:
+            children = self._root_item.children()
 
-        if child_item:
-            return self.createIndex(row, column, child_item)
+        if 0 <= row < len(children):
+            return self.createIndex(row, column, children[row])
         else:
             return QModelIndex()
 
@@ -687,14 +2186,30 @@ class AbstractDragDropModel(QAbstractItemModel):
                 https://doc.qt.io/archives/qtjambi-4.5.2_01/com/trolltech/qt/core/Qt.MatchFlag.html
         Returns (list): of QModelIndex
 
+        Note:
+            When searching the DisplayRole of a "name" column, this will use the
+            models name index rather than visiting every item.  Exact matches are
+            a single lookup, and all other matches are tested once per unique name.
         """
         indexes = []
 
-        # get children to search from
+        # get item to search from
         if index:
-            children = index.internalPointer().children()
+            search_item = index.internalPointer()
         else:
-            children = self.rootItem().children()
+            search_item = self.rootItem()
+
+        # search name index
+        if role == Qt.DisplayRole and self.getHeaderData()[0] == "name":
+            items = self.__findItemsByName(value, match_type)
+            if items is not None:
+                if search_item is not self.rootItem():
+                    items = [item for item in items if self.isItemDescendantOf(item, search_item)]
+                items.sort(key=self.getItemPath)
+                return [self.createIndex(item.row(), 0, item) for item in items]
+
+        # get children to search from
+        children = search_item.children()
 
         # get list
         for child in children:
@@ -703,9 +2218,129 @@ class AbstractDragDropModel(QAbstractItemModel):
 
         return indexes
 
+    def __findItemsByName(self, value, match_type):
+        """ Finds all of the items whose name matches the value provided using the name index
+
+        Args:
+            value (str): to search for
+            match_type (Qt.MatchFlags): Flags to match with
+
+        Returns (list): of AbstractDragDropModelItem, or None if the match type
+            provided is not supported by the name index"""
+        name_index = self.nameIndex()
+        match_type = int(match_type)
+        case_sensitive = bool(match_type & Qt.MatchCaseSensitive)
+        match = match_type & 0x0F
+
+        # exact
+        if match == Qt.MatchExactly:
+            items = name_index.items(value)
+
+        # regex
+        elif match in (Qt.MatchRegExp, Qt.MatchWildcard):
+            syntax = QRegExp.RegExp if match == Qt.MatchRegExp else QRegExp.Wildcard
+            regex = QRegExp(str(value), Qt.CaseSensitive if case_sensitive else Qt.CaseInsensitive, syntax)
+            items = []
+            for name in list(name_index.names()):
+                if regex.exactMatch(str(name)):
+                    items += name_index.items(name)
+
+        # string
+        elif match in (Qt.MatchFixedString, Qt.MatchContains, Qt.MatchStartsWith, Qt.MatchEndsWith):
+            value = str(value) if case_sensitive else str(value).lower()
+            compare = {
+                Qt.MatchFixedString: str.__eq__,
+                Qt.MatchContains: str.__contains__,
+                Qt.MatchStartsWith: str.startswith,
+                Qt.MatchEndsWith: str.endswith}[match]
+            items = []
+            for name in list(name_index.names()):
+                name_str = str(name) if case_sensitive else str(name).lower()
+                if compare(name_str, value):
+                    items += name_index.items(name)
+        else:
+            return None
+
+        # items without a "name" column are indexed by their first column, which is not displayed
+        return [item for item in items if item.hasArg("name")]
+
+    def nameIndex(self):
+        """ Returns the index of the names of every item in this model
+
+        This is created the first time that it is needed, and then updated
+        by the items as they are added, removed, or renamed.
+
+        Returns (AbstractDragDropNameIndex)"""
+        name_index = AbstractDragDropNameIndex.getRootIndex(self.rootItem())
+        if name_index is None:
+            name_index = AbstractDragDropNameIndex()
+            name_index.addItems(self.rootItem().children())
+            AbstractDragDropNameIndex.setRootIndex(self.rootItem(), name_index)
+        return name_index
+
     def getAllIndexes(self):
-        all_indexes = self.findItems(".*", match_type=Qt.MatchRegExp)
-        return list(set(all_indexes))
+        return list(self.iterIndexes())
+
+    """ TRAVERSAL """
+    def iterItems(self, item=None, depth_first=True, max_depth=None, predicate=None):
+        """ Yields all of the descendants of the item provided
+
+        The tree should not be changed while it is being iterated over, if it
+        needs to be, then convert this to a list first.
+
+        Args:
+            item (AbstractDragDropModelItem): item to start from.  This item is not
+                yielded.  If None is provided, this will start from the root item.
+            depth_first (bool): if True, items are yielded depth first (the same
+                order as they are displayed in a tree view), else breadth first
+            max_depth (int): maximum depth to yield items from, where the children
+                of the item provided are at a depth of 1.  If None is provided,
+                every descendant will be yielded.
+            predicate (function): that takes an item, and returns a bool.  If it returns
+                False, the item and all of its descendants will be skipped.
+
+        Yields (AbstractDragDropModelItem)"""
+        if item is None:
+            item = self.rootItem()
+        if max_depth is not None and max_depth < 1:
+            return
+
+        if depth_first:
+            # stack of iterators over each level of children
+            stack = [iter(item.children())]
+            while stack:
+                for child in stack[-1]:
+                    if predicate is not None and not predicate(child):
+                        continue
+                    yield child
+                    if child.childCount() and (max_depth is None or len(stack) < max_depth):
+                        stack.append(iter(child.children()))
+                        break
+                else:
+                    stack.pop()
+        else:
+            queue = deque((child, 1) for child in item.children())
+            while queue:
+                child, depth = queue.popleft()
+                if predicate is not None and not predicate(child):
+                    continue
+                yield child
+                if max_depth is None or depth < max_depth:
+                    queue.extend((grandchild, depth + 1) for grandchild in child.children())
+
+    def iterIndexes(self, index=None, depth_first=True, max_depth=None, predicate=None, column=0):
+        """ Yields the indexes of all of the descendants of the index provided
+
+        Args:
+            index (QModelIndex): to start from.  If None is provided, this will
+                start from the root.
+            column (int): column of the indexes to yield
+            See iterItems() for the rest of the args
+
+        Yields (QModelIndex)"""
+        item = self.getItem(index) if index is not None else None
+        for item in self.iterItems(item, depth_first=depth_first, max_depth=max_depth, predicate=predicate):
+            yield self.createIndex(item.row(), column, item)
 
     def rootItem(self):
         return self._root_item
@@ -732,6 +2367,85 @@ class AbstractDragDropModel(QAbstractItemModel):
 
         return new_item
 
+    def createNewItemFromData(self, item_data):
+        """ Creates a new item, and all of its descendants, from the data provided.
+
+        The items created are not inserted into the model, this is left to
+        the caller.  See insertNewIndexes() for the format of the data.
+
+        Args:
+            item_data (dict): data to create the item from
+
+        Returns (AbstractDragDropModelItem)
+        """
+        new_item = self.createNewItem()
+
+        # set column data
+        column_data = item_data.get("column_data")
+        if not column_data:
+            column_data = {"name": item_data.get("name", "None")}
+        new_item.setColumnData(column_data)
+
+        # setup flags, new items have no flags set, so only the ones provided need to be set
+        for key, setter in (
+            ("is_editable", new_item.setIsEditable),
+            ("is_selectable", new_item.setIsSelectable),
+            ("is_draggable", new_item.setIsDraggable),
+            ("is_droppable", new_item.setIsDroppable),
+            ("is_enableable", new_item.setIsEnableable),
+            ("is_deletable", new_item.setIsDeletable)
+        ):
+            value = item_data.get(key)
+            if value is not None:
+                setter(value)
+        if "is_enabled" in item_data:
+            new_item.setIsEnabled(item_data["is_enabled"])
+
+        # create children
+        for child_data in item_data.get("children", []):
+            new_item.addChild(self.createNewItemFromData(child_data))
+
+        return new_item
+
+    def cloneItem(self, item):
+        """ Creates a copy of the item provided, and all of its descendants.
+
+        The copies are created off of the model, and only their column data
+        is copied.  The column schema is shared with the original items, so
+        this is much cheaper than a deepcopy of each item.
+
+        Args:
+            item (AbstractDragDropModelItem): item to copy
+
+        Returns (AbstractDragDropModelItem)
+        """
+        new_item = self.createNewItem()
+        new_item.copyColumnData(item)
+
+        # copy descendants
+        stack = [(item, new_item)]
+        while stack:
+            orig_parent, new_parent = stack.pop()
+            new_children = []
+            for orig_child in orig_parent.children():
+                new_child = self.createNewItem()
+                new_child.copyColumnData(orig_child)
+                new_children.append(new_child)
+                if orig_child.childCount():
+                    stack.append((orig_child, new_child))
+            new_parent.insertChildren(0, new_children)
+
+        return new_item
+
+    def cloneItems(self, items):
+        """ Creates a copy of each item provided, see cloneItem()
+
+        Args:
+            items (list): of AbstractDragDropModelItem
+
+        Returns (list): of AbstractDragDropModelItem"""
+        return [self.cloneItem(item) for item in items]
+
     def insertNewIndex(
         self,
         row,
@@ -755,33 +2469,211 @@ class AbstractDragDropModel(QAbstractItemModel):
         Returns (QModelIndex):
 
         """
-        self.insertRow(row, parent)
+        item_data = {
+            "name": name,
+            "column_data": column_data,
+            "is_editable": is_editable,
+            "is_selectable": is_selectable,
+            "is_enableable": is_enableable,
+            "is_deletable": is_deletable,
+            "is_draggable": is_draggable,
+            "is_droppable": is_droppable
+        }
+        new_index = self.insertNewIndexes(row, [item_data], parent=parent)[0]
+
+        return self.createIndex(new_index.row(), 1, new_index.internalPointer())
+
+    def insertNewIndexes(self, row, items_data, parent=QModelIndex()):
+        """ Inserts multiple new indexes, and their descendants, in one batch.
+
+        All of the items are created before they are inserted, and the model
+        will only emit one rowsInserted signal for the entire batch.
 
-        # setup custom object
-        item_type = self.itemType()
-        view_item = item_type()
+        Args:
+            row (int): row to start inserting at
+            items_data (list): of dicts, each one creating an item.  All keys
+                are optional, and the flags accept the same values as insertNewIndex()
+                    {"name": str,
+                    "column_data": dict,
+                    "children": list of dicts in this same format,
+                    "is_enabled": bool,
+                    "is_editable": bool,
+                    "is_selectable": bool,
+                    "is_enableable": bool,
+                    "is_deletable": bool,
+                    "is_draggable": bool,
+                    "is_droppable": bool}
+            parent (QModelIndex): to insert the new indexes under
+
+        Returns (list): of QModelIndex for the top most items inserted
+        """
+        new_items = [self.createNewItemFromData(item_data) for item_data in items_data]
+        return self.insertItems(row, new_items, parent=parent)
 
-        # create new index
-        self.createIndex(row, 1, view_item)
+    def insertItems(self, row, items, parent=QModelIndex()):
+        """ Inserts items that have been created off of the model in one batch.
 
-        # get new index/item created
-        new_index = self.index(row, 1, parent)
-        view_item = new_index.internalPointer()
+        Args:
+            row (int): row to start inserting at, this will be clamped to
+                the number of children the parent has
+            items (list): of AbstractDragDropModelItem
+            parent (QModelIndex): to insert the items under
 
-        # set column data
-        if not column_data:
-            column_data = {"name":name}
-        view_item.setColumnData(column_data)
+        Returns (list): of QModelIndex for each item inserted
+        """
+        if not items: return []
+
+        # get parent, column 0 is used as views only track children of it
+        parent_item = self.getItem(parent)
+        if parent_item == self.rootItem():
+            parent = QModelIndex()
+        else:
+            parent = self.getIndexFromItem(parent_item)
+        row = max(0, min(row, parent_item.childCount()))
+
+        # insert items
+        self.beginInsertRows(parent, row, row + len(items) - 1)
+        parent_item.insertChildren(row, items)
+        self.endInsertRows()
+
+        return [self.createIndex(row + i, 0, item) for i, item in enumerate(items)]
+
+    """ LAZY POPULATION """
+    def itemProvider(self):
+        return self._item_provider
+
+    def setItemProvider(self, item_provider):
+        """ Sets the provider that will populate the children of items on demand
+
+        Args:
+            item_provider (AbstractDragDropItemProvider): or None to disable
+                lazy population"""
+        self._item_provider = item_provider
+        self._fetched_items = OrderedDict()
+        self._num_fetched_items = 0
+
+    def fetchPageSize(self):
+        return self._fetch_page_size
+
+    def setFetchPageSize(self, fetch_page_size):
+        self._fetch_page_size = fetch_page_size
+
+    def fetchLimit(self):
+        return self._fetch_limit
+
+    def setFetchLimit(self, fetch_limit):
+        self._fetch_limit = fetch_limit
+
+    def numFetchedItems(self):
+        """ Returns the number of items currently in the model that were created by the item provider"""
+        return self._num_fetched_items
+
+    def hasChildren(self, parent=QModelIndex()):
+        item = self.getItem(parent)
+        if item.childCount():
+            return True
+        return self.canFetchMore(parent)
+
+    def canFetchMore(self, parent):
+        # views may ask for more while the rows from the current fetch are being inserted
+        if self._item_provider is None or self._is_fetching:
+            return False
+        item = self.getItem(parent)
+        fetch_state = self._fetched_items.get(item)
+        if fetch_state is not None and fetch_state[1]:
+            return False
+        return self._item_provider.hasChildren(item)
+
+    def fetchMore(self, parent):
+        """ Creates the next page of children for the parent provided from the item provider"""
+        if not self.canFetchMore(parent):
+            return
+        item = self.getItem(parent)
+        fetch_state = self._fetched_items.pop(item, [0, False])
+        self._fetched_items[item] = fetch_state
+
+        # create children
+        page_size = self.fetchPageSize()
+        items_data = self._item_provider.fetchChildren(item, fetch_state[0], page_size)
+        fetch_state[0] += len(items_data)
+        fetch_state[1] = len(items_data) < page_size
+        self._num_fetched_items += len(items_data)
+        self._is_fetching = True
+        try:
+            self.insertNewIndexes(item.childCount(), items_data, parent=parent)
+        finally:
+            self._is_fetching = False
+
+        # views are still laying out the expanded item, so rows can not be removed until they have finished
+        if self._fetch_limit is not None and self._fetch_limit < self._num_fetched_items:
+            self._evict_timer.start(0)
+
+    def __evictTimeout(self):
+        if self._fetched_items:
+            self.evictFetchedItems(exclude=next(reversed(self._fetched_items)))
+
+    def evictFetchedItems(self, exclude=None):
+        """ Evicts the least recently fetched branches until the fetch limit is met
+
+        Only branches that are collapsed will be evicted, this relies on the
+        items isExpanded() state, which the AbstractDragDropTreeView keeps
+        in sync with the view.
+
+        Args:
+            exclude (AbstractDragDropModelItem): item whose ancestors should not be evicted"""
+        if self._fetch_limit is None:
+            return
 
-        # setup flags
-        view_item.setIsEditable(is_editable)
-        view_item.setIsSelectable(is_selectable)
-        view_item.setIsDraggable(is_draggable)
-        view_item.setIsDroppable(is_droppable)
-        view_item.setIsEnableable(is_enableable)
-        view_item.setIsDeletable(is_deletable)
+        protected_items = set()
+        while exclude is not None:
+            protected_items.add(exclude)
+            exclude = exclude.parent()
 
-        return new_index
+        for item in list(self._fetched_items.keys()):
+            if self._num_fetched_items <= self._fetch_limit:
+                return
+            if item in protected_items or item not in self._fetched_items:
+                continue
+            if item.isExpanded() and self.isItemInModel(item):
+                continue
+            self.evictItem(item)
+
+    def evictItem(self, item):
+        """ Removes all of the children of an item that has been populated by the item provider.
+
+        The children will be fetched again the next time that the item is expanded.
+
+        Args:
+            item (AbstractDragDropModelItem): item to remove the children of"""
+        fetch_state = self._fetched_items.pop(item, None)
+        if fetch_state is None:
+            return
+
+        # forget any descendants that have been fetched
+        for fetched_item in list(self._fetched_items.keys()):
+            if self.isItemDescendantOf(fetched_item, item):
+                self._num_fetched_items -= self._fetched_items.pop(fetched_item)[0]
+        self._num_fetched_items -= fetch_state[0]
+
+        # remove children
+        if item.childCount() and self.isItemInModel(item):
+            parent_index = self.getIndexFromItem(item) if item != self.rootItem() else QModelIndex()
+            self.beginRemoveRows(parent_index, 0, item.childCount() - 1)
+            item.removeChildren(0, item.childCount() - 1)
+            self.endRemoveRows()
+
+    def isItemInModel(self, item):
+        """ Determines if the item provided is still parented under the root item
+
+        Args:
+            item (AbstractDragDropModelItem):
+
+        Returns (bool)"""
+        while item is not self.rootItem():
+            if item is None or item.row() is None:
+                return False
+            item = item.parent()
+        return True
 
     """ INSERT INDEXES """
     def insertRows(self, position, num_rows, parent=QModelIndex()):
@@ -789,16 +2681,13 @@ class AbstractDragDropModel(QAbstractItemModel):
         INPUTS: int, int, QModelIndex
         """
         parent_item = self.getItem(parent)
-        self.beginResetModel()
-        self.beginInsertRows(parent, position, position + num_rows - 1)
-
-        for row in range(num_rows):
-            childCount = parent_item.childCount()
-            childNode = self.createNewItem()
-            success = parent_item.insertChild(position, childNode)
+        if position < 0 or position > parent_item.childCount():
+            return False
 
+        self.beginInsertRows(parent, position, position + num_rows - 1)
+        success = parent_item.insertChildren(
+            position, [self.createNewItem() for row in range(num_rows)])
         self.endInsertRows()
-        self.endResetModel()
 
         return success
 
@@ -821,15 +2710,292 @@ class AbstractDragDropModel(QAbstractItemModel):
         return success
 
     def setItemParent(self, row, item, parent_index):
-        """ Sets the items parent to a new parent"""
-        self.beginResetModel()
-        new_item = item
-        self.deleteItem(item, event_update=False)
+        """ Sets the items parent to a new parent
 
-        self.beginInsertRows(parent_index, row, row + 1)
-        parent_index.internalPointer().insertChild(row, new_item)
-        self.endInsertRows()
-        self.endResetModel()
+        Args:
+            row (int): row to insert the item at, once it has been removed
+                from its current parent
+            item (AbstractDragDropModelItem): item to be reparented
+            parent_index (QModelIndex): index of new parent"""
+        parent_item = self.getItem(parent_index)
+
+        # convert row to position before the item is removed
+        if item.parent() == parent_item and item.row() < row:
+            row += 1
+
+        self.moveItems([item], parent_item, row)
+
+    def moveItems(self, items, parent_item, row):
+        """ Moves the items provided under a new parent
+
+        The items are sorted by their position in the tree, and all contiguous
+        items are coalesced into a single beginMoveRows/endMoveRows operation.
+        If there are more ranges than the moveRowsThreshold(), the items will
+        be moved inside of one layout change instead, so that attached views
+        only have to update once.
+
+        Items which are descendants of other items being moved, or that would
+        be moved under themselves, are skipped.
+
+        Args:
+            items (list): of AbstractDragDropModelItem
+            parent_item (AbstractDragDropModelItem): new parent
+            row (int): row to move the items to.  This is the row before any
+                of the items have been moved, as expected by beginMoveRows()
+
+        Returns (list): of AbstractDragDropModelItem that were moved, in the
+            order they now appear under the new parent
+        """
+        row = max(0, min(row, parent_item.childCount()))
+
+        # get items to move, in tree order
+        invalid_items = set()
+        ancestor = parent_item
+        while ancestor is not None:
+            invalid_items.add(ancestor)
+            ancestor = ancestor.parent()
+        moving_items = set(items)
+        items = [
+            item for item in items
+            if item not in invalid_items and not self.isItemAncestorInSet(item, moving_items)]
+        items.sort(key=self.getItemPath)
+        runs = self.getContiguousItemRuns(items)
+
+        # setup layout change
+        is_layout_change = self.moveRowsThreshold() < len(runs)
+        if is_layout_change:
+            self.layoutAboutToBeChanged.emit()
+            persistent_indexes = self.persistentIndexList()
+            persistent_items = [(index.internalPointer(), index.column()) for index in persistent_indexes]
+
+        # move items
+        moved_items = []
+        index = 0
+        while index < len(runs):
+            run = runs[index]
+            index += 1
+            source_item = run[0].parent()
+            first = run[0].row()
+            last = first + len(run) - 1
+
+            # run has been split by a previous move
+            if source_item.children()[first:last + 1] != run:
+                runs[index:index] = [[item] for item in run]
+                continue
+
+            # already in place
+            if source_item is parent_item and first <= row <= last + 1:
+                row = last + 1
+                moved_items += run
+                continue
+
+            # move
+            if is_layout_change:
+                source_item.moveChildren(first, last, parent_item, row)
+            else:
+                # indexes are resolved per run, as previous runs may have shifted the parents
+                source_index = self.getIndexFromItem(source_item) if source_item != self.rootItem() else QModelIndex()
+                parent_index = self.getIndexFromItem(parent_item) if parent_item != self.rootItem() else QModelIndex()
+                self.beginMoveRows(source_index, first, last, parent_index, row)
+                source_item.moveChildren(first, last, parent_item, row)
+                self.endMoveRows()
+
+            # update destination row
+            if source_item is parent_item and first < row:
+                row -= len(run)
+            row += len(run)
+            moved_items += run
+
+        # finish layout change
+        if is_layout_change:
+            new_indexes = [self.createIndex(item.row(), column, item) for item, column in persistent_items]
+            self.changePersistentIndexList(persistent_indexes, new_indexes)
+            self.layoutChanged.emit()
+
+        return moved_items
+
+    def getItemPath(self, item):
+        """ Returns the rows from the root to the item provided
+
+        Args:
+            item (AbstractDragDropModelItem):
+
+        Returns (list): of ints"""
+        path = []
+        while item.parent() is not None:
+            path.append(item.row())
+            item = item.parent()
+        path.reverse()
+        return path
+
+    def getContiguousItemRuns(self, items):
+        """ Groups the items provided into lists of contiguous siblings
+
+        Args:
+            items (list): of AbstractDragDropModelItem sorted in tree order
+
+        Returns (list): of lists of AbstractDragDropModelItem"""
+        runs = []
+        for item in items:
+            if runs and runs[-1][-1].parent() is item.parent() and runs[-1][-1].row() + 1 == item.row():
+                runs[-1].append(item)
+            else:
+                runs.append([item])
+        return runs
+
+    def isItemAncestorInSet(self, item, items):
+        """ Determines if any ancestor of the item provided is in the set of items
+
+        Args:
+            item (AbstractDragDropModelItem): item to check the ancestors of
+            items (set): of AbstractDragDropModelItem
+
+        Returns (bool)"""
+        parent = item.parent()
+        while parent is not None:
+            if parent in items:
+                return True
+            parent = parent.parent()
+        return False
+
+    """ SORTING """
+    def sortColumn(self):
+        return self._sort_column
+
+    def sortOrder(self):
+        return self._sort_order
+
+    def setItemSortKeyFunction(self, func):
+        """ Sets the function used to create the key that items are sorted by
+
+        Args:
+            func (function): that takes the args (item, column), and returns
+                a value that can be compared with the keys of the other items"""
+        self.__getItemSortKey = func
+        self._sort_keys = {}
+
+    def getItemSortKey(self, item, column):
+        """ Returns the key that the item provided is sorted by in the column provided
+
+        The keys are cached per item/column, until the items data is changed
+        through setData(), or clearItemSortKeys() is called.
+
+        Args:
+            item (AbstractDragDropModelItem):
+            column (int):"""
+        sort_keys = self._sort_keys.setdefault(column, {})
+        try:
+            return sort_keys[item]
+        except KeyError:
+            key = self.__getItemSortKey(item, column)
+            sort_keys[item] = key
+            return key
+
+    def __getItemSortKey(self, item, column):
+        """ Sorts empty values first, then numbers, then case insensitive strings"""
+        value = item.getArg(self._header_data[column]) if column < len(self._header_data) else None
+        if value is None:
+            return (0, )
+        if isinstance(value, (bool, int, float)):
+            return (1, value)
+        if isinstance(value, str):
+            return (2, value.lower(), value)
+        return (3, str(value))
+
+    def clearItemSortKeys(self, item=None):
+        """ Clears the cached sort keys
+
+        This needs to be called if the items data is changed outside of setData()
+
+        Args:
+            item (AbstractDragDropModelItem): item to clear the keys of, if None
+                the keys of all of the items are cleared"""
+        if item is None:
+            self._sort_keys = {}
+            return
+        for sort_keys in self._sort_keys.values():
+            sort_keys.pop(item, None)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """ Sorts the children of every item by the column provided
+
+        The sort key of each item is only created once, and cached, so
+        sorting the same column again (or in the other order) does not
+        query the items data.  The views are updated with one layout change.
+
+        Args:
+            column (int): column to sort by, if this is -1 the current order is kept
+            order (Qt.SortOrder):"""
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0 or len(self._header_data) <= column:
+            return
+
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        persistent_indexes = self.persistentIndexList()
+        persistent_items = [(index.internalPointer(), index.column()) for index in persistent_indexes]
+
+        # only keep the keys of the items that are still in the model
+        old_sort_keys = self._sort_keys.get(column, {})
+        sort_keys = {}
+        is_descending = order == Qt.DescendingOrder
+        parents = [self.rootItem()]
+        while parents:
+            parent_item = parents.pop()
+            children = parent_item.children()
+            for child in children:
+                try:
+                    sort_keys[child] = old_sort_keys[child]
+                except KeyError:
+                    sort_keys[child] = self.__getItemSortKey(child, column)
+                if child.childCount():
+                    parents.append(child)
+            if 1 < len(children):
+                children.sort(key=sort_keys.__getitem__, reverse=is_descending)
+                parent_item.updateChildRows()
+        self._sort_keys[column] = sort_keys
+
+        self.changePersistentIndexList(
+            persistent_indexes,
+            [self.createIndex(item.row(), column, item) for item, column in persistent_items])
+        self.layoutChanged.emit([], QAbstractItemModel.VerticalSortHint)
+
+    def updateItemSortPosition(self, item):
+        """ Moves a single item to its sorted position amongst its siblings
+
+        The position is found with a binary search of the siblings sort keys,
+        and the item is moved with a single beginMoveRows/endMoveRows.
+
+        Args:
+            item (AbstractDragDropModelItem): item whose data has changed"""
+        column = self._sort_column
+        parent_item = item.parent()
+        row = item.row()
+        if column < 0 or parent_item is None or row is None:
+            return
+
+        # find sorted position, the siblings are already sorted
+        children = parent_item.children()
+        key = self.getItemSortKey(item, column)
+        is_descending = self._sort_order == Qt.DescendingOrder
+        low, high = 0, len(children) - 1
+        while low < high:
+            middle = (low + high) // 2
+            sibling = children[middle if middle < row else middle + 1]
+            sibling_key = self.getItemSortKey(sibling, column)
+            if (sibling_key < key) if is_descending else (key < sibling_key):
+                high = middle
+            else:
+                low = middle + 1
+
+        # move item, the destination is the row before the move has happened
+        destination = low if low < row else low + 1
+        if destination in (row, row + 1):
+            return
+        parent_index = self.getIndexFromItem(parent_item) if parent_item != self.rootItem() else QModelIndex()
+        self.beginMoveRows(parent_index, row, row, parent_index, destination)
+        parent_item.moveChildren(row, row, parent_item, destination)
+        self.endMoveRows()
 
     """ PROPERTIES """
     def lastSelectedItem(self):
@@ -845,6 +3011,7 @@ class AbstractDragDropModel(QAbstractItemModel):
     @item_height.setter
     def item_height(self, _item_height):
         self._item_height = _item_height
+        self.clearRoleCache()
 
     @property
     def item_width(self):
@@ -853,6 +3020,7 @@ class AbstractDragDropModel(QAbstractItemModel):
     @item_width.setter
     def item_width(self, _item_width):
         self._item_width = _item_width
+        self.clearRoleCache()
 
     def updateFirst(self):
         return self._update_first
@@ -1003,12 +3171,7 @@ class AbstractDragDropModel(QAbstractItemModel):
         return mimedata
 
     def dropMimeData(self, data, action, row, column, parent):
-        # todo move this to beginMoveRows?
-        # (QModelIndex, int sourceFirst, int sourceLast, QModelIndex, int destinationChild)
-        # beginMoveRows(sourceParent, 2, 4, destinationParent, 2);
-
         # bypass remove rows
-        self.beginResetModel()
         self._dropping = True
 
         # get parent item
@@ -1016,43 +3179,38 @@ class AbstractDragDropModel(QAbstractItemModel):
         if not parent_item:
             parent_item = self.rootItem()
 
-        # iterate through index list
-        indexes = self.indexes
-        new_items = []
-
-        for item in indexes:
-            # get row
-            """ drop on item"""
-            if row < 0:
-                row = 0
+        # drop on item
+        if row < 0:
+            row = 0
 
-            # drop between items
-            else:
-                # apply offset if dropping below the current location (due to deletion)
-                if row > item.row():
-                    if self.deleteItemOnDrop() or item.deleteOnDrop():
-                        row -= 1
-            # move this to beginMoveRows??
-            # remove item
+        # split items into moved / inserted
+        move_items = []
+        insert_items = []
+        for item in self.indexes:
             if item.deleteOnDrop():
-                self.deleteItem(item, event_update=False)
+                move_items.append(item)
             elif item.deleteOnDrop() is None and self.deleteItemOnDrop():
-                self.deleteItem(item, event_update=False)
+                move_items.append(item)
             else:
-                row += 1
+                insert_items.append(item)
 
-            # duplicate item
-            new_item = item
-            new_items.append(new_item)
+        # move items
+        new_items = self.moveItems(move_items, parent_item, row)
+        if new_items:
+            row = new_items[0].row()
+            insert_row = new_items[-1].row() + 1
+        else:
+            insert_row = row
 
-            # insert item
-            self.beginInsertRows(parent, row, row + 1)
-            parent_item.insertChild(row, new_item)
-            self.endInsertRows()
+        # insert items that are not deleted on drop
+        if insert_items:
+            self.insertItems(insert_row, insert_items, parent=parent)
+            new_items += insert_items
+            if not move_items:
+                row = insert_row
 
         # run virtual function
         self.dropEvent(data, new_items, self, row, parent_item)
-        self.endResetModel()
         return False
 
     """ EXPORT DATA """
@@ -1077,27 +3235,193 @@ class AbstractDragDropModel(QAbstractItemModel):
             item_data (list): of children, each child is returned as a dictionary of
                 {"arg_name":<arg_value>, "arg_name2":<arg_value2>}
             """
-        if item == self.rootItem():
+        if item == self.rootItem() or item_data is None:
             item_data = []
 
-        # index = self.getIndexFromItem(item)
-        for child in item.children():
+        # children data of each item that has been exported
+        children_data = {item: item_data}
+        for child in self.iterItems(item, predicate=lambda child: child.parent() in children_data):
             # todo add defualt item states... expanded, enabled, etc
             """ Will probably need to move this to the view"""
             new_data = self.getItemExportData(child)
 
             # add data if it exists
             if allow_none_types:
-                item_data.append(new_data)
+                children_data[child.parent()].append(new_data)
             else:
                 if new_data:
-                    item_data.append(new_data)
+                    children_data[child.parent()].append(new_data)
 
-            if 0 < child.childCount():
-                self.exportModelToDict(child, item_data=new_data["children"])
+            if 0 < child.childCount() and new_data:
+                children_data[child] = new_data["children"]
 
         return {"data":item_data}
 
+    def getItemStreamData(self, item):
+        """ Returns the data that is written for an item by exportModelToStream()
+
+        This is in the format used by insertNewIndexes(), so that it can be read
+        back with importModelFromStream().  Only the flags that have been set
+        on the item are stored.
+
+        Args:
+            item (AbstractDragDropModelItem):
+
+        Returns (dict)"""
+        item_data = {"column_data": item.columnDataAsDict()}
+        for key, flag in (
+            ("is_editable", item.isEditable()),
+            ("is_selectable", item.isSelectable()),
+            ("is_draggable", item.isDraggable()),
+            ("is_droppable", item.isDroppable()),
+            ("is_enableable", item.isEnableable()),
+            ("is_deletable", item.isDeletable())
+        ):
+            if flag is not None:
+                item_data[key] = bool(flag)
+        if not item.isEnabled():
+            item_data["is_enabled"] = False
+        return item_data
+
+    def exportModelToStream(self, item, stream):
+        """ Writes all of the descendants of the item provided to a stream, one item at a time.
+
+        Each item is written as one line of JSON (newline delimited JSON), in
+        depth first order, with the "depth" of the item below the item provided
+        added to the data returned by getItemStreamData().  Only one item is
+        held in memory at a time, regardless of the size of the tree.
+
+        Args:
+            item (AbstractDragDropModelItem): item to export the descendants of
+            stream (file): text stream to write to
+
+        Returns (int): number of items written
+        """
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        num_items = 0
+        stack = [iter(item.children())]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+
+            item_data = self.getItemStreamData(child)
+            item_data["depth"] = len(stack) - 1
+            stream.write(encode(item_data))
+            stream.write("\n")
+            num_items += 1
+
+            if child.childCount():
+                stack.append(iter(child.children()))
+
+        return num_items
+
+    def exportModelToFile(self, item, filepath):
+        """ Writes all of the descendants of the item provided to a newline delimited JSON file.
+
+        See exportModelToStream()
+
+        Args:
+            item (AbstractDragDropModelItem): item to export the descendants of
+            filepath (str): path on disk to write to
+
+        Returns (int): number of items written"""
+        with open(filepath, "w") as f:
+            return self.exportModelToStream(item, f)
+
+    def importModelFromStream(self, stream, row=None, parent=QModelIndex(), batch_size=10000):
+        """ Reads items written by exportModelToStream(), and inserts them under the parent provided.
+
+        The items are created off of the model, and inserted in batches with
+        insertItems() each time that batch_size items have been read, so that
+        only one batch of items is pending at a time.
+
+        Args:
+            stream (file): text stream to read from
+            row (int): row to insert the items at, if None, they will be
+                added after the parents existing children
+            parent (QModelIndex): to insert the items under
+            batch_size (int): number of items to read before they are inserted
+
+        Returns (int): number of items read
+        """
+        parent_item = self.getItem(parent)
+        if row is None:
+            row = parent_item.childCount()
+
+        # items pending insertion, these are all children of the pending parent.
+        # top_row is where the next item under the parent provided is inserted, as
+        # the items read are inserted before the parents existing children at that row
+        pending = {"parent": parent_item, "row": row, "top_row": row, "items": []}
+
+        def insertPendingItems():
+            if pending["items"]:
+                pending_parent = pending["parent"]
+                pending_index = self.getIndexFromItem(pending_parent) if pending_parent != self.rootItem() else QModelIndex()
+                self.insertItems(pending["row"], pending["items"], parent=pending_index)
+                pending["row"] += len(pending["items"])
+                if pending_parent is parent_item:
+                    pending["top_row"] = pending["row"]
+                pending["items"] = []
+
+        num_items = 0
+        num_pending = 0
+        ancestors = []
+        num_inserted_ancestors = 0
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            item_data = json.loads(line)
+            depth = item_data.pop("depth", 0)
+            if len(ancestors) < depth:
+                raise ValueError("Item {num} is missing its parent (depth {depth})".format(num=num_items, depth=depth))
+
+            new_item = self.createNewItemFromData(item_data)
+            del ancestors[depth:]
+            num_inserted_ancestors = min(num_inserted_ancestors, depth)
+
+            # parent has already been inserted
+            if depth == num_inserted_ancestors:
+                new_parent = ancestors[depth - 1] if depth else parent_item
+                if new_parent is not pending["parent"]:
+                    insertPendingItems()
+                    pending["parent"] = new_parent
+                    pending["row"] = pending["top_row"] if new_parent is parent_item else new_parent.childCount()
+                pending["items"].append(new_item)
+
+            # parent is still pending
+            else:
+                ancestors[depth - 1].addChild(new_item)
+
+            ancestors.append(new_item)
+            num_items += 1
+            num_pending += 1
+
+            if batch_size <= num_pending:
+                insertPendingItems()
+                num_pending = 0
+                num_inserted_ancestors = len(ancestors)
+
+        insertPendingItems()
+        return num_items
+
+    def importModelFromFile(self, filepath, row=None, parent=QModelIndex(), batch_size=10000):
+        """ Reads a newline delimited JSON file written by exportModelToFile()
+
+        See importModelFromStream()
+
+        Args:
+            filepath (str): path on disk to read from
+            row (int): row to insert the items at
+            parent (QModelIndex): to insert the items under
+            batch_size (int): number of items to read before they are inserted
+
+        Returns (int): number of items read"""
+        with open(filepath, "r") as f:
+            return self.importModelFromStream(f, row=row, parent=parent, batch_size=batch_size)
+
     """ VIRTUAL FUNCTIONS """
     def setAddMimeDataFunction(self, function):
         """ During drag/drop of a header item.  This will add additional mimedata
@@ -1120,11 +3444,32 @@ class AbstractDragDropModel(QAbstractItemModel):
         self.setUpdateFirst(update_first)
 
     def itemDeleteEvent(self, item):
+        if self.isBatchUpdating():
+            self._batch_delete_events.append(item)
+            return
         self.__itemDeleteEvent(item)
 
     def __itemDeleteEvent(self, item):
         pass
 
+    def setItemsDeleteEvent(self, function):
+        self.__itemsDeleteEvent = function
+
+    def itemsDeleteEvent(self, items):
+        """
+        Virtual function that is run once a batchUpdate() has finished, with all of
+        the items that were deleted during it.  By default this runs the
+        itemDeleteEvent for each item.
+
+        Args:
+            items (list): of AbstractDragDropModelItem that have been deleted
+        """
+        self.__itemsDeleteEvent(items)
+
+    def __itemsDeleteEvent(self, items):
+        for item in items:
+            self.__itemDeleteEvent(item)
+
     def setDragStartEvent(self, function):
         self.__startDragEvent = function
 
@@ -1167,12 +3512,33 @@ class AbstractDragDropModel(QAbstractItemModel):
             This will run through a for each loop and run for every single item in
             the current selection
         """
+        if self.isBatchUpdating():
+            self._batch_enabled_events[item] = enabled
+            return
         self.__itemEnabledEvent(item, enabled)
 
     def __itemEnabledEvent(self, item, enabled):
         # print(item.columnData()['name'], enabled)
         pass
 
+    def setItemsEnabledEvent(self, function):
+        self.__itemsEnabledEvent = function
+
+    def itemsEnabledEvent(self, items):
+        """
+        Virtual function that is run once a batchUpdate() has finished, with all of
+        the items that were enabled/disabled during it.  By default this runs the
+        itemEnabledEvent for each item.
+
+        Args:
+            items (list): of tuples of (AbstractDragDropModelItem, enabled (bool))
+        """
+        self.__itemsEnabledEvent(items)
+
+    def __itemsEnabledEvent(self, items):
+        for item, enabled in items:
+            self.__itemEnabledEvent(item, enabled)
+
     def setTextChangedEvent(self, function):
         self.__textChangedEvent = function
 
@@ -1185,11 +3551,33 @@ class AbstractDragDropModel(QAbstractItemModel):
             old_value (str):
             new_value (str):
         """
+        if self.isBatchUpdating():
+            self._batch_text_changed_events.append((item, old_value, new_value, column))
+            return
         self.__textChangedEvent(item, old_value, new_value, column=column)
 
     def __textChangedEvent(self, item, old_value, new_value, column=0):
         pass
 
+    def setItemsTextChangedEvent(self, function):
+        self.__itemsTextChangedEvent = function
+
+    def itemsTextChangedEvent(self, changes):
+        """
+        Virtual function that is run once a batchUpdate() has finished, with all of
+        the text changes made during it.  By default this runs the textChangedEvent
+        for each change.
+
+        Args:
+            changes (list): of tuples of
+                (AbstractDragDropModelItem, old_value (str), new_value (str), column (int))
+        """
+        self.__itemsTextChangedEvent(changes)
+
+    def __itemsTextChangedEvent(self, changes):
+        for item, old_value, new_value, column in changes:
+            self.__textChangedEvent(item, old_value, new_value, column=column)
+
     def setItemSelectedEvent(self, function):
         self.__itemSelectedEvent = function
 
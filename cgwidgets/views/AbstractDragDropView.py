@@ -4,12 +4,12 @@
 
 """
 
-import copy
+from collections import OrderedDict
 
 from qtpy import API_NAME
 from qtpy.QtWidgets import (QListView, QTreeView, QProxyStyle, QStyledItemDelegate, QStyleOptionViewItem, QMenu, QAbstractItemView)
 from qtpy.QtCore import Qt, QPoint, QPointF, QRect, QItemSelectionModel, QSortFilterProxyModel, QModelIndex, QAbstractItemModel
-from qtpy.QtGui import QColor, QPen, QBrush, QPolygonF, QPainterPath, QCursor
+from qtpy.QtGui import QColor, QPen, QBrush, QPolygonF, QPainterPath, QCursor, QPalette
 
 from cgwidgets.utils import showWarningDialogue
 from cgwidgets.settings import iColor, attrs, icons
@@ -23,6 +23,12 @@ class AbstractDragDropAbstractView(object):
         copied_indexes (list): of QModelIndexes, currently in the internal clipboard
         context_menu_manifest (list): of AbstractContextMenuItem defining context menu events
             has the args "name", "event", "item_type"
+        selected_items (OrderedDict): of the currently selected AbstractDragDropModelItems, in
+            the order that they were selected.  This is updated from selectionChanged(), and
+            rebuilt from the selection model when rows are removed or the layout changes.
+        selection_generation (int): incremented every time that the selection changes
+        selection_snapshot (dict): cache of the selection for the current generation.
+            See getSelectionSnapshot()
     """
     def __init__(self):
         # attrs
@@ -34,6 +40,13 @@ class AbstractDragDropAbstractView(object):
         self.__pressed = False
         self._proxy_model = None
 
+        # selection
+        self._selected_items = OrderedDict()
+        self._selection_generation = 0
+        self._selection_snapshot = None
+        self._is_selection_dirty = False
+        self._selection_engine_model = None
+
         # setup style
         self.style = AbstractDragDropIndicator()
         self.setStyle(self.style)
@@ -294,16 +307,13 @@ class AbstractDragDropAbstractView(object):
 
         This will return a list of only the indexes in column 0, if it is a tree view."""
         if isinstance(self, AbstractDragDropListView):
-            return self.selectionsourceModel().selectedIndexes()
+            return self.selectionModel().selectedIndexes()
         if isinstance(self, AbstractDragDropTreeView):
-            return self.selectionsourceModel().selectedRows(0)
+            # selectedRows() compares the parents of every pair of indexes, which is quadratic
+            return [index for index in self.selectionModel().selectedIndexes() if index.column() == 0]
 
     def getAllSelectedItems(self):
-        item_list = []
-        for index in self.getAllSelectedIndexes():
-            item_list.append(index.internalPointer())
-
-        return item_list
+        return list(self.getSelectionSnapshot()["items"])
 
     def getItemsSelectedDescendants(self, item, descendants=None):
         """ Gets all of the selected descendants from the item provided
@@ -312,11 +322,9 @@ class AbstractDragDropAbstractView(object):
         if not descendants:
             descendants = []
 
-        for child in item.children():
-            if child in self.getAllSelectedItems():
-                descendants.append(child)
-            if 0 < item.childCount():
-                descendants += self.getItemsDescendants(child)
+        for selected_item in self.getSelectionSnapshot()["items"]:
+            if self.isItemDescendantOf(selected_item, item):
+                descendants.append(selected_item)
 
         return descendants
 
@@ -327,11 +335,8 @@ class AbstractDragDropAbstractView(object):
         if not descendants:
             descendants = []
 
-        for child in item.children():
-            # todo check if copyable?
-            descendants.append(child)
-            if 0 < item.childCount():
-                descendants += self.getItemsDescendants(child)
+        # todo check if copyable?
+        descendants += self.sourceModel().iterItems(item)
 
         return descendants
 
@@ -349,18 +354,93 @@ class AbstractDragDropAbstractView(object):
             return self.getAllSelectedItems()
 
         # Tree View
-        # get attrs
         if not items:
-            items = self.getAllSelectedItems()
-        base_items = self.getAllSelectedItems()
+            return list(self.getSelectionSnapshot()["base_items"])
+
+        # remove all descendants
+        items_set = set(items)
+        return [item for item in items if not self.sourceModel().isItemAncestorInSet(item, items_set)]
+
+    """ SELECTION ENGINE """
+    def selectionGeneration(self):
+        return self._selection_generation
+
+    def getSelectionSnapshot(self):
+        """ Returns the current selection.
 
-        # remove all selected descendants
-        for item in items:
-            for child in self.getItemsSelectedDescendants(item):
-                if child in base_items:
-                    base_items.remove(child)
+        This is cached until the selection changes, so it can be called
+        repeatedly without having to query the selection model.  The values in
+        this should not be modified.
 
-        return base_items
+        Returns (dict):
+            {"generation": int,
+            "items": list of the selected items, in the order they were selected,
+            "items_set": set of the selected items,
+            "base_items": list of the selected items that have no selected ancestors,
+            "copyable_items": list of the base items that can be copied}
+        """
+        if self._is_selection_dirty:
+            self.__rebuildSelection()
+
+        snapshot = self._selection_snapshot
+        if snapshot is None or snapshot["generation"] != self._selection_generation:
+            items = list(self._selected_items.keys())
+            items_set = set(items)
+            if isinstance(self, AbstractDragDropListView):
+                base_items = items
+            else:
+                base_items = [
+                    item for item in items if not self.sourceModel().isItemAncestorInSet(item, items_set)]
+            copyable_items = [item for item in base_items if self.sourceModel().isItemCopyable(item)]
+            snapshot = {
+                "generation": self._selection_generation,
+                "items": items,
+                "items_set": items_set,
+                "base_items": base_items,
+                "copyable_items": copyable_items
+            }
+            self._selection_snapshot = snapshot
+        return snapshot
+
+    def setupSelectionEngine(self, model):
+        """ Connects the selection to the model provided.
+
+        This needs to be called every time that a new model is set, so that the
+        selection can be rebuilt when the model removes or moves rows, or changes
+        its layout, as the selection model can change without calling selectionChanged(),
+        and the base items depend on where the items are.
+
+        Args:
+            model (QAbstractItemModel): model that is set on this view"""
+        if self._selection_engine_model is not None:
+            try:
+                self._selection_engine_model.rowsRemoved.disconnect(self.invalidateSelection)
+                self._selection_engine_model.rowsMoved.disconnect(self.invalidateSelection)
+                self._selection_engine_model.modelReset.disconnect(self.invalidateSelection)
+                self._selection_engine_model.layoutChanged.disconnect(self.invalidateSelection)
+            except (TypeError, RuntimeError):
+                pass
+
+        model.rowsRemoved.connect(self.invalidateSelection)
+        model.rowsMoved.connect(self.invalidateSelection)
+        model.modelReset.connect(self.invalidateSelection)
+        model.layoutChanged.connect(self.invalidateSelection)
+        self._selection_engine_model = model
+        self.invalidateSelection()
+
+    def invalidateSelection(self, *args):
+        """ Rebuilds the selection from the selection model the next time that it is needed"""
+        self._is_selection_dirty = True
+        self._selection_generation += 1
+
+    def __rebuildSelection(self):
+        self._selected_items = OrderedDict()
+        if self.selectionModel():
+            for index in self.getAllSelectedIndexes():
+                item = AbstractDragDropAbstractView.getSourceIndex(index).internalPointer()
+                if item:
+                    self._selected_items[item] = None
+        self._is_selection_dirty = False
 
     """ EXPORT DATA """
     def setItemExportDataFunction(self, func):
@@ -369,6 +449,12 @@ class AbstractDragDropAbstractView(object):
     def exportModelToDict(self, item, item_data=None):
         return self.sourceModel().exportModelToDict(item, item_data=item_data)
 
+    def exportModelToFile(self, item, filepath):
+        return self.sourceModel().exportModelToFile(item, filepath)
+
+    def importModelFromFile(self, filepath, row=None, parent=QModelIndex(), batch_size=10000):
+        return self.sourceModel().importModelFromFile(filepath, row=row, parent=parent, batch_size=batch_size)
+
     """ DELETE """
     def deleteWarningWidget(self):
         return self._delete_warning_widget
@@ -403,14 +489,7 @@ class AbstractDragDropAbstractView(object):
 
         Returns (list): of AbstractDragDropModelItem"""
 
-        copyable_items = self.getAllBaseItems()
-
-        # check to see if items are copyable
-        for item in copyable_items:
-            if not self.sourceModel().isItemCopyable(item):
-                copyable_items.remove(item)
-
-        return copyable_items
+        return list(self.getSelectionSnapshot()["copyable_items"])
 
     def copyCurrentSelectionToInternalClipboard(self):
         copyable_items = self.getAllCopyableItems()
@@ -445,6 +524,12 @@ class AbstractDragDropAbstractView(object):
         else:
             print("Invalid model, please use AbstractDragDropFilterProxyModel")
 
+    def addComparisonFilter(self, value, arg="name", operator="==", name=None):
+        if self.isModelCustomFilterable():
+            self.model().addComparisonFilter(value, arg=arg, operator=operator, name=name)
+        else:
+            print("Invalid model, please use AbstractDragDropFilterProxyModel")
+
     def clearFilters(self):
         if self.isModelCustomFilterable():
             self.model().clearFilters()
@@ -453,9 +538,13 @@ class AbstractDragDropAbstractView(object):
         if self.isModelCustomFilterable():
             return self.model().filters()
 
+    def getFilterByName(self, name):
+        if self.isModelCustomFilterable():
+            return self.model().getFilterByName(name)
+
     def removeFilter(self, regex_filter, arg="name"):
         if self.isModelCustomFilterable():
-            self.model().removeFilter({"filter": regex_filter, "arg": arg})
+            self.model().removeFilter(regex_filter, arg=arg)
 
     def removeFilterByIndex(self, index):
         if self.isModelCustomFilterable():
@@ -475,6 +564,20 @@ class AbstractDragDropAbstractView(object):
         if self.isModelCustomFilterable():
             self.model().updateFilterByName(pattern, name)
 
+    def scheduleFilterUpdate(self, pattern, name):
+        """ Updates the given filter once the user has stopped updating it
+
+        Args:
+            pattern (str): regex pattern to be updated
+            name (str): name of filter to update
+        """
+        if self.isModelCustomFilterable():
+            self.model().scheduleFilterUpdate(pattern, name)
+
+    def filterScheduler(self):
+        if self.isModelCustomFilterable():
+            return self.model().filterScheduler()
+
     @staticmethod
     def getSourceIndex(index):
         if isinstance(index.model(), QSortFilterProxyModel):
@@ -501,16 +604,20 @@ class AbstractDragDropAbstractView(object):
         for index in selected.indexes():
             if index.column() == 0:
                 item = AbstractDragDropAbstractView.getSourceIndex(index).internalPointer()
+                self._selected_items[item] = None
                 self.sourceModel().itemSelectedEvent(item, True)
                 self.sourceModel().setLastSelectedItem(item)
 
         for index in deselected.indexes():
             if index.column() == 0:
                 item = AbstractDragDropAbstractView.getSourceIndex(index).internalPointer()
+                self._selected_items.pop(item, None)
                 self.sourceModel().itemSelectedEvent(item, False)
                 self.sourceModel().setLastSelectedItem(item)
+        self._selection_generation += 1
 
-        self.model().layoutChanged.emit()
+        # repaint the selection
+        self.viewport().update()
 
     def abstractKeyPressEvent(self, event):
         if event.modifiers() == Qt.NoModifier:
@@ -523,9 +630,10 @@ class AbstractDragDropAbstractView(object):
                 # delete events
                 def deleteItems(widget):
                     deletable_items = self.getAllBaseItems()
-                    for item in deletable_items:
-                        if (item.isDeletable() is True) or (item.isDeletable() is None and self.isDeletable() is True):
-                            self.sourceModel().deleteItem(item, event_update=True, update_first=self.updateFirst())
+                    with self.sourceModel().batchUpdate():
+                        for item in deletable_items:
+                            if (item.isDeletable() is True) or (item.isDeletable() is None and self.isDeletable() is True):
+                                self.sourceModel().deleteItem(item, event_update=True, update_first=self.updateFirst())
 
                 def dontDeleteItem(widget):
                     return
@@ -538,13 +646,11 @@ class AbstractDragDropAbstractView(object):
 
             # Disable Item
             if event.key() == Qt.Key_D:
-                indexes = self.selectionModel().selectedRows(0)
-                for index in indexes:
-                    item = index.internalPointer()
-                    if (item.isEnableable() == True) or (item.isEnableable() == None and self.isEnableable() == True):
-                        enabled = False if item.isEnabled() else True
-                        self.sourceModel().setItemEnabled(item, enabled)
-                self.sourceModel().layoutChanged.emit()
+                with self.sourceModel().batchUpdate():
+                    for item in self.getAllSelectedItems():
+                        if (item.isEnableable() == True) or (item.isEnableable() == None and self.isEnableable() == True):
+                            enabled = False if item.isEnabled() else True
+                            self.sourceModel().setItemEnabled(item, enabled)
 
         if self.isCopyable():
             if event.modifiers() == Qt.ControlModifier:
@@ -600,7 +706,7 @@ class AbstractDragDropAbstractView(object):
 
     """ COPY / PASTE """
     def deepCopyItem(self, item, parent_index, row=0):
-        """ Duplicates an item from the one provided
+        """ Duplicates an item, and all of its descendants, from the one provided
 
         Args:
             item (AbstractDragDropModelItem):
@@ -609,12 +715,8 @@ class AbstractDragDropAbstractView(object):
 
         Returns (QModelIndex): of new item
         """
-        name = copy.deepcopy(item.name())
-        column_data = copy.deepcopy(item.columnData())
-
-        # create new index
-        new_index = self.sourceModel().insertNewIndex(row, name=name, column_data=column_data, parent=parent_index)
-        return new_index
+        new_item = self.sourceModel().cloneItem(item)
+        return self.sourceModel().insertItems(row, [new_item], parent=parent_index)[0]
 
     def setCopyEvent(self, function):
         self.__copyEvent = function
@@ -656,51 +758,23 @@ class AbstractDragDropAbstractView(object):
         return self.sourceModel().isItemDescendantOf(item, ancestor)
 
     def pasteEvent(self):
-        """
-        Arg:
-            copied_indexes (list): of QModelIndexes
-            parent_index (QModelIndex):
-        """
+        """ Pastes all of the items in the internal clipboard
+
+        The copies are created off of the model, and then inserted at the
+        paste location in one batch."""
         # Get parent node/item
         parent_item = self.getPasteLocation()
-
+        if parent_item in self.copiedItems():
+            parent_item = parent_item.parent()
         parent_index = self.sourceModel().getIndexFromItem(parent_item)
 
         # paste items
-        pasted_items = []
-        for item in self.copiedItems():
-            # get attrs
-            if item == parent_item:
-                parent_item = item.parent()
-                parent_index = self.sourceModel().getIndexFromItem(parent_item)
-            row = copy.deepcopy(parent_item.childCount())
-            new_index = self.deepCopyItem(item, parent_index, row)
-            new_item = new_index.internalPointer()
-
-            # check for group item
-            self.__pasteGroupItem(item, new_index)
-
-            # store new item
-            pasted_items.append(new_item)
+        pasted_items = self.sourceModel().cloneItems(self.copiedItems())
+        self.sourceModel().insertItems(parent_item.childCount(), pasted_items, parent=parent_index)
 
         # user defined paste event
         self.__pasteEvent(self.copiedItems(), pasted_items, parent_item)
 
-    def __pasteGroupItem(self, item, parent_index):
-        """ Creates all of the children when pasting a GroupItem"""
-        # check for children
-        if 0 < item.childCount():
-            for child in item.children():
-                row = copy.deepcopy(child.row())
-
-                new_index = self.deepCopyItem(child, parent_index, row)
-                # name = copy.deepcopy(item.name())
-                # column_data = copy.deepcopy(item.columnData())
-                # new_index = self.sourceModel().insertNewIndex(
-                #     row, name=name, column_data=column_data, parent=parent_index)
-                if 0 < child.childCount():
-                    self.__pasteGroupItem(child, new_index)
-
     def __pasteEvent(self, copied_items, pasted_items, parent_item):
         pass
 
@@ -713,8 +787,7 @@ class AbstractDragDropAbstractView(object):
         self.__cutEvent(copyable_items)
 
         # delete indexes
-        for item in self.copiedItems():
-            self.sourceModel().deleteItem(item, event_update=True)
+        self.sourceModel().removeItems(self.copiedItems(), event_update=True)
 
     def __cutEvent(self, copied_items):
         pass
@@ -723,23 +796,20 @@ class AbstractDragDropAbstractView(object):
         self.__duplicateEvent = function
 
     def duplicateEvent(self):
-        """ Copies all of the indexes selected to an internal clipboard"""
-        copyable_items = self.copyCurrentSelectionToInternalClipboard()
-        new_items = []
-        for item in self.copiedItems():
-
-            row = copy.deepcopy(item.row())
-            parent = self.sourceModel().getIndexFromItem(item.parent())
-            new_index = self.deepCopyItem(item, parent, row)
-            new_items.append(new_index.internalPointer())
-            # name = copy.deepcopy(item.name())
-            # column_data = copy.deepcopy(item.columnData())
-            #
+        """ Duplicates all of the indexes selected
 
-            # new_index = self.sourceModel().insertNewIndex(row+1, name=name, column_data=column_data, parent=parent)
-            self.__pasteGroupItem(item, new_index)
+        The copies of each contiguous range of items are created off of the
+        model, and inserted in front of the range in one batch."""
+        copyable_items = self.copyCurrentSelectionToInternalClipboard()
+        new_items = {}
+        items = sorted(self.copiedItems(), key=self.sourceModel().getItemPath)
+        for run in self.sourceModel().getContiguousItemRuns(items):
+            run_items = self.sourceModel().cloneItems(run)
+            parent = self.sourceModel().getIndexFromItem(run[0].parent())
+            self.sourceModel().insertItems(run[0].row(), run_items, parent=parent)
+            new_items.update(zip(run, run_items))
 
-        self.__duplicateEvent(copyable_items, new_items)
+        self.__duplicateEvent(copyable_items, [new_items[item] for item in self.copiedItems()])
 
     def __duplicateEvent(self, copied_items, new_items):
         pass
@@ -978,7 +1048,9 @@ class AbstractDragDropListView(QListView, AbstractDragDropAbstractView):
             self._proxy_model = model
         else:
             self._source_model = model
-        return QListView.setModel(self, model)
+        result = QListView.setModel(self, model)
+        self.setupSelectionEngine(model)
+        return result
 
     """ EVENTS """
     def contextMenuEvent(self, event):
@@ -1020,11 +1092,15 @@ class AbstractDragDropTreeView(QTreeView, AbstractDragDropAbstractView):
         # self.addContextMenuEvent("Expand All", self.expandAllEvent)
         # self.addContextMenuEvent("Collapse All", self.collapseAllEvent)
 
+        # keep the items expansion state in sync, so that collapsed branches can be evicted
+        self.expanded.connect(lambda index: self.__setIndexExpanded(index, True))
+        self.collapsed.connect(lambda index: self.__setIndexExpanded(index, False))
+
     """ EVENTS """
-    def expanded(self, index):
-        print("============ EXPANDED ==================")
-        # print("expanded", index.internalPointer().name())
-        return QTreeView.expanded(self, index)
+    def __setIndexExpanded(self, index, is_expanded):
+        item = AbstractDragDropAbstractView.getSourceIndex(index).internalPointer()
+        if item:
+            item.setIsExpanded(is_expanded)
 
     """ EVENTS (CONTEXT MENU)"""
     def expandItemEvent(self, item, indexes):
@@ -1103,7 +1179,9 @@ class AbstractDragDropTreeView(QTreeView, AbstractDragDropAbstractView):
             self._proxy_model = model
         else:
             self._source_model = model
-        return QTreeView.setModel(self, model)
+        result = QTreeView.setModel(self, model)
+        self.setupSelectionEngine(model)
+        return result
 
     """ EVENTS """
     def contextMenuEvent(self, event):
@@ -1158,9 +1236,14 @@ class AbstractDragDropModelDelegate(QStyledItemDelegate):
 
     Attributes:
         delegate_widget (QWidget): constructor to be displayed when editor is shown
+        render_cache (dict): of the palettes that items are painted with, keyed
+            by the views palette, and the state of the item.
     """
+    RENDER_CACHE_SIZE = 64
+
     def __init__(self, parent=None):
         super(AbstractDragDropModelDelegate, self).__init__(parent)
+        self._render_cache = {}
         # importing the default delegate here
         # as it will run into import errors if imported at top most lvl
         from cgwidgets.widgets.AbstractWidgets import AbstractStringInputWidget
@@ -1214,7 +1297,7 @@ class AbstractDragDropModelDelegate(QStyledItemDelegate):
         new_value = editor.text()
 
         # set model data
-        item.columnData()[arg] = new_value
+        model.setData(source_index, new_value)
 
         # emit text changed event
         model.textChangedEvent(item, old_value, new_value, column=source_index.column())
@@ -1237,31 +1320,62 @@ class AbstractDragDropModelDelegate(QStyledItemDelegate):
         widget = constructor(parent)
         return widget
 
+    """ RENDER CACHE """
+    def clearRenderCache(self):
+        """ Clears all of the cached palettes.
+
+        The palettes are cached by the palette provided, and the version of
+        iColor, so this does not need to be called when either changes."""
+        self._render_cache = {}
+
+    def getRenderPalette(self, palette, is_enabled):
+        """ Returns the palette that an item should be painted with
+
+        Args:
+            palette (QPalette): palette provided by the view
+            is_enabled (bool): determines if the item is enabled
+
+        Returns (QPalette)"""
+        key = (palette.cacheKey(), is_enabled, iColor.version())
+        render_palette = self._render_cache.get(key)
+        if render_palette is None:
+            if is_enabled:
+                color = QColor(*iColor["rgba_text"])
+            else:
+                color = QColor(*iColor["rgba_text_disabled"])
+            render_palette = QPalette(palette)
+            render_palette.setBrush(QPalette.Normal, QPalette.HighlightedText, QBrush(color))
+
+            if AbstractDragDropModelDelegate.RENDER_CACHE_SIZE <= len(self._render_cache):
+                self._render_cache = {}
+            self._render_cache[key] = render_palette
+        return render_palette
+
+    def initStyleOption(self, option, index):
+        """ Overrides the selection highlight color.
+
+        This is run on the copy of the option that QStyledItemDelegate
+        paints with, so that a new option does not need to be created
+        on every paint call.
+
+        https://www.qtcentre.org/threads/41299-How-to-Change-QTreeView-highlight-color
+        """
+        QStyledItemDelegate.initStyleOption(self, option, index)
+        item = AbstractDragDropAbstractView.getSourceIndex(index).internalPointer()
+        if item:
+            option.palette = self.getRenderPalette(option.palette, item.isEnabled())
+
     # todo update for proxymodels
     def paint(self, painter, option, index):
         """
-        Overrides the selection highlight color.
+        Paints the item, see initStyleOption() for the highlight color.
 
-        https://www.qtcentre.org/threads/41299-How-to-Change-QTreeView-highlight-color
         Note: this can actually do alot more than that with the QPalette...
             which is something I should learn how to use apparently...
 
         """
-        from qtpy.QtGui import QPalette
-        # item = index.internalPointer()
-        new_option = QStyleOptionViewItem(option)
-        brush = QBrush()
         index = AbstractDragDropAbstractView.getSourceIndex(index)
-        if index.internalPointer():
-            if index.internalPointer().isEnabled():
-                color = QColor(*iColor["rgba_text"])
-            else:
-                color = QColor(*iColor["rgba_text_disabled"])
-
-            brush.setColor(color)
-            new_option.palette.setBrush(QPalette.Normal, QPalette.HighlightedText, brush)
-
-        return QStyledItemDelegate.paint(self, painter, new_option, index)
+        return QStyledItemDelegate.paint(self, painter, option, index)
 
 
 # example drop indicator
@@ -8,16 +8,13 @@ TODO:
 
 from qtpy.QtWidgets import QListView
 from qtpy.QtCore import QModelIndex
-from cgwidgets.settings import iColor
-from cgwidgets.settings.stylesheets import scroll_bar_ss
+from cgwidgets.settings.stylesheets import scroll_bar_ss, compileStyleSheet
 
 
 class CompleterPopup(QListView):
     def __init__(self, parent=None):
         super(CompleterPopup, self).__init__(parent)
-        style_sheet_args = iColor.style_sheet_args
-        style_sheet_args['scroll_bar'] = scroll_bar_ss
-        style_sheet = """
+        style_sheet = compileStyleSheet("""
         CompleterPopup{{
             border: 1px solid rgba{rgba_outline};
             background-color: rgba{rgba_background_00};
@@ -38,7 +35,7 @@ class CompleterPopup(QListView):
             background-color: rgba{rgba_background_01};
         }}
         {scroll_bar}
-        """.format(**style_sheet_args)
+        """, scroll_bar=scroll_bar_ss)
 
         self.setStyleSheet(style_sheet)
 
@@ -1,6 +1,8 @@
 from .AbstractDragDropModel import AbstractDragDropModelItem
 from .AbstractDragDropModel import AbstractDragDropModel
 from .AbstractDragDropModel import AbstractDragDropFilterProxyModel
+from .AbstractDragDropModel import AbstractDragDropFilterScheduler
+from .AbstractDragDropModel import AbstractDragDropItemProvider
 
 from .AbstractDragDropView import AbstractDragDropListView
 from .AbstractDragDropView import AbstractDragDropTreeView
@@ -0,0 +1,793 @@
+import io
+import json
+import time
+import unittest
+import sys
+
+from qtpy.QtWidgets import QApplication
+from qtpy.QtCore import Qt, QModelIndex, QPersistentModelIndex, QRegExp
+from qtpy.QtGui import QFont
+
+from cgwidgets.settings import iColor
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropFilterProxyModel, AbstractDragDropItemProvider
+from cgwidgets.views.AbstractDragDropModel import AbstractDragDropFilterScheduler
+
+
+class TestAbstractDragDropModelItem(unittest.TestCase):
+    def test_columnDataAsDict(self):
+        model = AbstractDragDropModel()
+        item = model.insertNewIndex(0, column_data={"name": "item", "value": 1}).internalPointer()
+        column_data = item.columnDataAsDict()
+        self.assertEqual(json.loads(json.dumps(column_data)), {"name": "item", "value": 1})
+
+        # copy does not write through, the view does
+        column_data["value"] = 2
+        self.assertEqual(item.getArg("value"), 1)
+        item.columnData()["value"] = 3
+        self.assertEqual(item.getArg("value"), 3)
+
+    def test_log(self):
+        model = AbstractDragDropModel()
+        parent_index = model.insertNewIndex(0, name="parent")
+        model.insertNewIndex(0, name="child", parent=parent_index)
+        self.assertIn("|------child", parent_index.internalPointer().log())
+
+
+class TestAbstractDragDropModelNameIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # a(item, Item0, b(item)), c
+        self.model = AbstractDragDropModel()
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "a"}, "children": [
+                {"column_data": {"name": "item"}},
+                {"column_data": {"name": "Item0"}},
+                {"column_data": {"name": "b"}, "children": [{"column_data": {"name": "item"}}]}]},
+            {"column_data": {"name": "c"}}])
+
+    def findPaths(self, value, match_type=Qt.MatchExactly, index=None):
+        return [
+            self.model.getItemPath(index.internalPointer())
+            for index in self.model.findItems(value, index=index, match_type=match_type)]
+
+    def getItem(self, path):
+        item = self.model.rootItem()
+        for row in path:
+            item = item.children()[row]
+        return item
+
+    def test_findItems(self):
+        self.assertEqual(self.findPaths("item"), [[0, 0], [0, 2, 0]])
+        self.assertEqual(self.findPaths("ITEM", match_type=Qt.MatchFixedString), [[0, 0], [0, 2, 0]])
+        self.assertEqual(self.findPaths("item", match_type=Qt.MatchStartsWith), [[0, 0], [0, 1], [0, 2, 0]])
+        self.assertEqual(
+            self.findPaths("item", match_type=Qt.MatchStartsWith | Qt.MatchCaseSensitive), [[0, 0], [0, 2, 0]])
+        self.assertEqual(self.findPaths("i.*0", match_type=Qt.MatchRegExp), [[0, 1]])
+        self.assertEqual(self.findPaths("missing"), [])
+
+        # descendants of the index provided
+        b_index = self.model.getIndexFromItem(self.getItem([0, 2]))
+        self.assertEqual(self.findPaths("item", index=b_index), [[0, 2, 0]])
+
+    def test_updateIndex(self):
+        item = self.getItem([0, 0])
+        item.setArg("name", "renamed")
+        self.assertEqual(self.findPaths("item"), [[0, 2, 0]])
+        self.assertEqual(self.findPaths("renamed"), [[0, 0]])
+
+        # moved and removed items
+        self.model.moveItems([item], self.model.rootItem(), 2)
+        self.assertEqual(self.findPaths("renamed"), [[2]])
+        self.model.deleteItem(self.getItem([0]))
+        self.assertEqual(self.findPaths("item"), [])
+        self.assertEqual(self.findPaths("b"), [])
+
+        self.model.insertNewIndex(0, name="item")
+        self.assertEqual(self.findPaths("item"), [[0]])
+
+    def test_uniqueItemName(self):
+        parent_index = self.model.getIndexFromItem(self.getItem([0]))
+        item = self.model.insertNewIndex(3, name="item", parent=parent_index).internalPointer()
+        self.assertEqual(self.model.getUniqueItemName(item), "item0")
+
+        item.setName("Item0")
+        self.assertEqual(self.model.getUniqueItemName(item), "Item1")
+        item.setName("b")
+        self.assertEqual(self.model.getUniqueItemName(item), "b0")
+
+        # names are only unique amongst the siblings
+        item.setName("c")
+        self.assertEqual(self.model.getUniqueItemName(item), "c")
+
+
+class TestAbstractDragDropModelTraversal(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # a(a1(a11), a2), b(b1)
+        self.model = AbstractDragDropModel()
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "a"}, "children": [
+                {"column_data": {"name": "a1"}, "children": [{"column_data": {"name": "a11"}}]},
+                {"column_data": {"name": "a2"}}]},
+            {"column_data": {"name": "b"}, "children": [{"column_data": {"name": "b1"}}]}])
+
+    def iterNames(self, **kwargs):
+        return [item.name() for item in self.model.iterItems(**kwargs)]
+
+    def test_iterItems(self):
+        self.assertEqual(self.iterNames(), ["a", "a1", "a11", "a2", "b", "b1"])
+        self.assertEqual(self.iterNames(depth_first=False), ["a", "b", "a1", "a2", "b1", "a11"])
+
+        # start item is not yielded
+        a_item = self.model.rootItem().children()[0]
+        self.assertEqual(self.iterNames(item=a_item), ["a1", "a11", "a2"])
+        self.assertEqual(self.iterNames(item=a_item.children()[1]), [])
+
+    def test_maxDepth(self):
+        for depth_first in (True, False):
+            self.assertEqual(self.iterNames(max_depth=1, depth_first=depth_first), ["a", "b"])
+            self.assertEqual(sorted(self.iterNames(max_depth=2, depth_first=depth_first)), ["a", "a1", "a2", "b", "b1"])
+            self.assertEqual(self.iterNames(max_depth=0, depth_first=depth_first), [])
+
+    def test_predicate(self):
+        # rejected items are skipped with all of their descendants
+        predicate = lambda item: item.name() != "a1"
+        self.assertEqual(self.iterNames(predicate=predicate), ["a", "a2", "b", "b1"])
+        self.assertEqual(self.iterNames(predicate=predicate, depth_first=False), ["a", "b", "a2", "b1"])
+
+    def test_iterIndexes(self):
+        indexes = list(self.model.iterIndexes())
+        self.assertEqual([index.internalPointer() for index in indexes], list(self.model.iterItems()))
+        for index in indexes:
+            self.assertEqual(self.model.getIndexFromItem(index.internalPointer()), index)
+
+        a_index = indexes[0]
+        self.assertEqual([index.data() for index in self.model.iterIndexes(a_index, max_depth=1)], ["a1", "a2"])
+        self.assertEqual(len(self.model.getAllIndexes()), 6)
+
+
+class TestAbstractDragDropModelRoleCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.model = AbstractDragDropModel()
+        self.index = self.model.insertNewIndex(0, name="item")
+
+    def test_perItemRoles(self):
+        class Model(AbstractDragDropModel):
+            def createRoleValue(self, item, role):
+                if role == Qt.ToolTipRole:
+                    return item.name()
+                return AbstractDragDropModel.createRoleValue(self, item, role)
+
+        model = Model()
+        indexes = [model.insertNewIndex(row, name="item{row}".format(row=row)) for row in range(2)]
+        self.assertEqual([model.data(index, Qt.ToolTipRole) for index in indexes], ["item0", "item1"])
+
+    def test_colorChanged(self):
+        text_color = iColor["rgba_text"]
+        self.model.data(self.index, Qt.ForegroundRole)
+        try:
+            iColor["rgba_text"] = (1, 2, 3, 255)
+            self.assertEqual(self.model.data(self.index, Qt.ForegroundRole).getRgb(), (1, 2, 3, 255))
+        finally:
+            iColor["rgba_text"] = text_color
+
+    def test_fontChanged(self):
+        app_font = QApplication.font()
+        self.model.data(self.index, Qt.FontRole)
+        try:
+            font = QFont(app_font)
+            font.setPointSize(app_font.pointSize() + 7)
+            QApplication.setFont(font)
+            self.assertEqual(self.model.data(self.index, Qt.FontRole).pointSize(), font.pointSize())
+        finally:
+            QApplication.setFont(app_font)
+
+
+class TestAbstractDragDropFilterProxyModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # a(a1, b1), b(a2, b2), c
+        self.model = AbstractDragDropModel()
+        self.model.setHeaderData(["name", "size"])
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "a", "size": "1"}, "children": [
+                {"column_data": {"name": "a1", "size": "10"}},
+                {"column_data": {"name": "b1", "size": "20"}}]},
+            {"column_data": {"name": "b", "size": "2"}, "children": [
+                {"column_data": {"name": "a2", "size": "30"}},
+                {"column_data": {"name": "b2", "size": "40"}}]},
+            {"column_data": {"name": "c", "size": "3"}}])
+        self.proxy_model = AbstractDragDropFilterProxyModel()
+        self.proxy_model.setSourceModel(self.model)
+
+    def visibleNames(self, parent=QModelIndex()):
+        names = []
+        for row in range(self.proxy_model.rowCount(parent)):
+            index = self.proxy_model.index(row, 0, parent)
+            names.append(self.proxy_model.mapToSource(index).internalPointer().name())
+            names += self.visibleNames(index)
+        return names
+
+    def getItem(self, name):
+        return self.model.findItems(name, match_type=Qt.MatchExactly)[0].internalPointer()
+
+    def test_regexFilter(self):
+        self.proxy_model.addFilter(QRegExp("^b"), name="search")
+        self.assertEqual(self.visibleNames(), ["a", "b1", "b", "b2"])
+
+        self.proxy_model.updateFilterByName("2", "search")
+        self.assertEqual(self.visibleNames(), ["b", "a2", "b2"])
+
+    def test_comparisonFilter(self):
+        self.proxy_model.addComparisonFilter(20, arg="size", operator=">=", name="size")
+        self.assertEqual(self.visibleNames(), ["a", "b1", "b", "a2", "b2"])
+
+        # numbers are compared as numbers, not strings
+        self.proxy_model.updateFilterByName(3, "size")
+        self.assertEqual(self.visibleNames(), ["a", "a1", "b1", "b", "a2", "b2", "c"])
+
+    def test_recursiveFilter(self):
+        self.proxy_model.addFilter(QRegExp("a"), name="search")
+        self.assertEqual(self.visibleNames(), ["a", "a1", "b", "a2"])
+
+        self.proxy_model.setRecursiveFilteringEnabled(False)
+        self.assertEqual(self.visibleNames(), ["a", "a1"])
+
+    def test_editFilter(self):
+        self.proxy_model.addFilter(QRegExp("a"), name="search")
+        self.proxy_model.addComparisonFilter(20, arg="size", operator="<=", name="size")
+        self.assertEqual(self.visibleNames(), ["a", "a1"])
+        size_cache = self.proxy_model.getFilterByName("size")["cache"]
+
+        # only the edited filter is evaluated again
+        self.proxy_model.updateFilterByName("b", "search")
+        self.assertIs(self.proxy_model.getFilterByName("size")["cache"], size_cache)
+        self.assertEqual(self.visibleNames(), ["a", "b1", "b"])
+
+        # adding a filter with the same name replaces it
+        self.proxy_model.addFilter(QRegExp("c"), name="search")
+        self.assertEqual(len(self.proxy_model.filters()), 2)
+        self.assertEqual(self.visibleNames(), ["c"])
+
+    def test_itemChanged(self):
+        self.proxy_model.addFilter(QRegExp("^b"), name="search")
+        self.assertEqual(self.visibleNames(), ["a", "b1", "b", "b2"])
+
+        # ancestors are shown and hidden when the items under them change
+        refilters = []
+        self.proxy_model.layoutChanged.connect(lambda *args: refilters.append(args))
+        self.proxy_model.modelReset.connect(lambda *args: refilters.append(args))
+        item = self.getItem("b1")
+        item.setArg("name", "c1")
+        self.model.itemDataChanged(item)
+        self.assertEqual(self.visibleNames(), ["b", "b2"])
+
+        item.setArg("name", "b1")
+        self.model.itemDataChanged(item)
+        self.assertEqual(self.visibleNames(), ["a", "b1", "b", "b2"])
+
+        self.model.insertNewIndex(0, name="b3", parent=self.model.getIndexFromItem(self.getItem("c")))
+        self.assertEqual(self.visibleNames(), ["a", "b1", "b", "b2", "c", "b3"])
+        self.assertEqual(refilters, [])
+
+    def test_itemChangedRefiltersAncestors(self):
+        class ProxyModel(AbstractDragDropFilterProxyModel):
+            def filterAcceptsRow(self, source_row, source_parent):
+                self.num_filtered += 1
+                return AbstractDragDropFilterProxyModel.filterAcceptsRow(self, source_row, source_parent)
+
+        model = AbstractDragDropModel()
+        model.insertNewIndexes(0, [
+            {"column_data": {"name": "group{x}".format(x=x)}, "children": [{"column_data": {"name": "item"}}]}
+            for x in range(100)])
+        proxy_model = ProxyModel()
+        proxy_model.num_filtered = 0
+        proxy_model.setSourceModel(model)
+        proxy_model.addFilter(QRegExp("found"), name="search")
+        self.assertEqual(proxy_model.rowCount(QModelIndex()), 0)
+
+        proxy_model.num_filtered = 0
+        item = model.rootItem().children()[50].children()[0]
+        item.setArg("name", "found")
+        model.itemDataChanged(item)
+        self.assertEqual(proxy_model.rowCount(QModelIndex()), 1)
+        self.assertLess(proxy_model.num_filtered, 10)
+
+
+class TestAbstractDragDropFilterScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.model = AbstractDragDropModel()
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "item{x}".format(x=x)}} for x in range(1000)])
+        self.proxy_model = AbstractDragDropFilterProxyModel()
+        self.proxy_model.setSourceModel(self.model)
+        self.proxy_model.addFilter(QRegExp(""), name="search")
+
+        # record events
+        self.events = []
+        self.scheduler = self.proxy_model.filterScheduler()
+        self.scheduler.setFilterStartedEvent(lambda scheduler, num_items: self.events.append(("started", num_items)))
+        self.scheduler.setFilterProgressEvent(
+            lambda scheduler, num_filtered, num_items: self.events.append(("progress", num_filtered)))
+        self.scheduler.setFilterFinishedEvent(lambda scheduler: self.events.append(("finished", )))
+        self.scheduler.setFilterCancelledEvent(lambda scheduler: self.events.append(("cancelled", )))
+
+    def waitForScheduler(self):
+        end_time = time.perf_counter() + 10
+        while self.scheduler.isActive() and time.perf_counter() < end_time:
+            self.app.processEvents()
+        self.assertFalse(self.scheduler.isActive())
+
+    def getEvents(self, name):
+        return [event for event in self.events if event[0] == name]
+
+    def test_coalesceUpdates(self):
+        for pattern in ("i", "it", "item99"):
+            self.proxy_model.scheduleFilterUpdate(pattern, "search")
+        self.assertTrue(self.scheduler.isActive())
+        self.assertEqual(self.proxy_model.rowCount(QModelIndex()), 1000)
+
+        self.scheduler.flush()
+        self.assertFalse(self.scheduler.isActive())
+        self.assertEqual(self.proxy_model.getFilterByName("search")["filter"].pattern(), "item99")
+        self.assertEqual(self.proxy_model.rowCount(QModelIndex()), 11)
+        self.assertEqual(self.events, [("finished", )])
+
+    def test_timeSlicing(self):
+        self.scheduler.setDelay(0)
+        self.scheduler.setFrameBudget(0)
+        self.proxy_model.scheduleFilterUpdate("item1", "search")
+        self.waitForScheduler()
+
+        # the items are filtered one chunk per frame
+        num_chunks = -(-1000 // AbstractDragDropFilterScheduler.CHUNK_SIZE)
+        self.assertEqual(self.events[0], ("started", 1000))
+        self.assertEqual(len(self.getEvents("progress")), num_chunks)
+        self.assertEqual(self.events[-1], ("finished", ))
+        self.assertEqual(self.proxy_model.rowCount(QModelIndex()), 111)
+
+    def test_removeItemsWhileFiltering(self):
+        self.scheduler.setDelay(0)
+        self.scheduler.setFrameBudget(0)
+        self.proxy_model.scheduleFilterUpdate("item1", "search")
+        while not self.getEvents("progress"):
+            self.app.processEvents()
+        self.model.removeItems(self.model.rootItem().children()[900:])
+        self.waitForScheduler()
+        self.assertEqual(self.events[-1], ("finished", ))
+        self.assertEqual(self.proxy_model.rowCount(QModelIndex()), 111)
+
+    def test_cancel(self):
+        self.proxy_model.scheduleFilterUpdate("item1", "search")
+        self.scheduler.cancel()
+        self.assertFalse(self.scheduler.isActive())
+        self.assertEqual(self.events, [("cancelled", )])
+        self.assertEqual(self.proxy_model.getFilterByName("search")["filter"].pattern(), "")
+        self.assertEqual(self.proxy_model.rowCount(QModelIndex()), 1000)
+
+
+class TestAbstractDragDropModelMoveItems(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # a(a0..a5), b(b0, b1)
+        self.model = AbstractDragDropModel()
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "a"}, "children": [
+                {"column_data": {"name": "a{x}".format(x=x)}} for x in range(6)]},
+            {"column_data": {"name": "b"}, "children": [
+                {"column_data": {"name": "b{x}".format(x=x)}} for x in range(2)]}])
+
+        self.moves = []
+        self.layout_changes = []
+        self.model.rowsMoved.connect(lambda *args: self.moves.append(args))
+        self.model.layoutChanged.connect(lambda *args: self.layout_changes.append(args))
+
+    def getItem(self, name):
+        return self.model.findItems(name, match_type=Qt.MatchExactly)[0].internalPointer()
+
+    def getItems(self, names):
+        return [self.getItem(name) for name in names]
+
+    def getChildNames(self, name):
+        return [child.name() for child in self.getItem(name).children()]
+
+    def getPersistentIndexes(self, names):
+        return [QPersistentModelIndex(self.model.getIndexFromItem(self.getItem(name))) for name in names]
+
+    def assertPersistentIndexes(self, indexes, names):
+        for index, name in zip(indexes, names):
+            item = self.getItem(name)
+            self.assertTrue(index.isValid())
+            index = QModelIndex(index)
+            self.assertIs(index.internalPointer(), item)
+            self.assertEqual(index.row(), item.row())
+            self.assertIs(index.parent().internalPointer(), item.parent())
+
+    def test_contiguousItemRuns(self):
+        runs = self.model.getContiguousItemRuns(self.getItems(["a0", "a1", "a3", "a4", "a5", "b0"]))
+        self.assertEqual([[item.name() for item in run] for run in runs], [["a0", "a1"], ["a3", "a4", "a5"], ["b0"]])
+        self.assertEqual(self.model.getContiguousItemRuns([]), [])
+
+    def test_moveItems(self):
+        indexes = self.getPersistentIndexes(["a3", "a4", "b1"])
+        moved_items = self.model.moveItems(self.getItems(["a4", "a1", "a2"]), self.getItem("b"), 1)
+        self.assertEqual([item.name() for item in moved_items], ["a1", "a2", "a4"])
+        self.assertEqual(self.getChildNames("a"), ["a0", "a3", "a5"])
+        self.assertEqual(self.getChildNames("b"), ["b0", "a1", "a2", "a4", "b1"])
+
+        # contiguous items are moved together
+        self.assertEqual(len(self.moves), 2)
+        self.assertEqual(self.layout_changes, [])
+        self.assertPersistentIndexes(indexes, ["a3", "a4", "b1"])
+
+    def test_moveItemsInParent(self):
+        indexes = self.getPersistentIndexes(["a0", "a2", "a4"])
+        moved_items = self.model.moveItems(self.getItems(["a0", "a1"]), self.getItem("a"), 4)
+        self.assertEqual([item.name() for item in moved_items], ["a0", "a1"])
+        self.assertEqual(self.getChildNames("a"), ["a2", "a3", "a0", "a1", "a4", "a5"])
+        self.assertPersistentIndexes(indexes, ["a0", "a2", "a4"])
+
+        # already in place
+        self.moves = []
+        moved_items = self.model.moveItems(self.getItems(["a0", "a1"]), self.getItem("a"), 3)
+        self.assertEqual([item.name() for item in moved_items], ["a0", "a1"])
+        self.assertEqual(self.getChildNames("a"), ["a2", "a3", "a0", "a1", "a4", "a5"])
+        self.assertEqual(self.moves, [])
+
+    def test_moveInvalidItems(self):
+        # descendants of moved items are moved with them
+        moved_items = self.model.moveItems(self.getItems(["a0", "a"]), self.getItem("b"), 0)
+        self.assertEqual([item.name() for item in moved_items], ["a"])
+        self.assertEqual(self.getChildNames("b"), ["a", "b0", "b1"])
+        self.assertEqual(len(self.getChildNames("a")), 6)
+
+        # items can not be moved under themselves
+        self.assertEqual(self.model.moveItems(self.getItems(["b"]), self.getItem("a0"), 0), [])
+        self.assertEqual([child.name() for child in self.model.rootItem().children()], ["b"])
+
+    def test_layoutChangeFallback(self):
+        indexes = self.getPersistentIndexes(["a2", "a3", "b1"])
+        self.model.setMoveRowsThreshold(1)
+        moved_items = self.model.moveItems(self.getItems(["a0", "a2", "a4"]), self.getItem("b"), 2)
+        self.assertEqual([item.name() for item in moved_items], ["a0", "a2", "a4"])
+        self.assertEqual(self.getChildNames("a"), ["a1", "a3", "a5"])
+        self.assertEqual(self.getChildNames("b"), ["b0", "b1", "a0", "a2", "a4"])
+
+        # all of the runs are moved inside of one layout change
+        self.assertEqual(self.moves, [])
+        self.assertEqual(len(self.layout_changes), 1)
+        self.assertPersistentIndexes(indexes, ["a2", "a3", "b1"])
+
+
+class ItemProvider(AbstractDragDropItemProvider):
+    """ Provides 5 children for the root item, and each of its children"""
+    def __init__(self, model, num_children=5):
+        self.model = model
+        self.num_children = num_children
+        self.fetches = []
+
+    def hasChildren(self, item):
+        return item is self.model.rootItem() or "." not in item.name()
+
+    def fetchChildren(self, item, start, count):
+        self.fetches.append((item, start, count))
+        prefix = "" if item is self.model.rootItem() else item.name() + "."
+        return [{"column_data": {"name": prefix + str(x)}} for x in range(start, min(start + count, self.num_children))]
+
+
+class TestAbstractDragDropModelLazyFetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.model = AbstractDragDropModel()
+        self.item_provider = ItemProvider(self.model)
+        self.model.setItemProvider(self.item_provider)
+
+    def fetchItem(self, name):
+        index = self.model.findItems(name, match_type=Qt.MatchExactly)[0]
+        self.model.fetchMore(index)
+        return index.internalPointer()
+
+    def getChildNames(self, item):
+        return [child.name() for child in item.children()]
+
+    def test_fetchPages(self):
+        self.model.setFetchPageSize(2)
+        root_item = self.model.rootItem()
+        self.assertEqual(root_item.childCount(), 0)
+        self.assertTrue(self.model.hasChildren(QModelIndex()))
+
+        for child_names in (["0", "1"], ["0", "1", "2", "3"], ["0", "1", "2", "3", "4"]):
+            self.assertTrue(self.model.canFetchMore(QModelIndex()))
+            self.model.fetchMore(QModelIndex())
+            self.assertEqual(self.getChildNames(root_item), child_names)
+
+        # a short page exhausts the item
+        self.assertFalse(self.model.canFetchMore(QModelIndex()))
+        self.model.fetchMore(QModelIndex())
+        self.assertEqual([(start, count) for item, start, count in self.item_provider.fetches], [(0, 2), (2, 2), (4, 2)])
+        self.assertEqual(self.model.numFetchedItems(), 5)
+
+    def test_hasChildren(self):
+        self.model.fetchMore(QModelIndex())
+        item = self.fetchItem("0")
+        self.assertEqual(self.getChildNames(item), ["0.0", "0.1", "0.2", "0.3", "0.4"])
+
+        # children are only fetched when asked for
+        index = self.model.getIndexFromItem(self.model.rootItem().children()[1])
+        self.assertEqual(index.internalPointer().childCount(), 0)
+        self.assertTrue(self.model.hasChildren(index))
+
+        leaf_index = self.model.getIndexFromItem(item.children()[0])
+        self.assertFalse(self.model.hasChildren(leaf_index))
+        self.assertFalse(self.model.canFetchMore(leaf_index))
+
+        # no provider
+        self.model.setItemProvider(None)
+        self.assertFalse(self.model.canFetchMore(index))
+        self.assertFalse(self.model.hasChildren(index))
+
+    def test_evictFetchedItems(self):
+        self.model.fetchMore(QModelIndex())
+        item0, item1 = self.fetchItem("0"), self.fetchItem("1")
+        self.assertEqual(self.model.numFetchedItems(), 15)
+
+        # the least recently fetched, collapsed branch is evicted
+        self.model.setFetchLimit(12)
+        self.model.evictFetchedItems(exclude=item1)
+        self.assertEqual(item0.childCount(), 0)
+        self.assertEqual(item1.childCount(), 5)
+        self.assertEqual(self.model.numFetchedItems(), 10)
+
+        # evicted branches are fetched again
+        index = self.model.getIndexFromItem(item0)
+        self.assertTrue(self.model.canFetchMore(index))
+        self.model.fetchMore(index)
+        self.assertEqual(self.getChildNames(item0), ["0.0", "0.1", "0.2", "0.3", "0.4"])
+        self.assertEqual(self.item_provider.fetches[-1], (item0, 0, self.model.fetchPageSize()))
+
+    def test_expandedItemsNotEvicted(self):
+        self.model.fetchMore(QModelIndex())
+        item0, item1 = self.fetchItem("0"), self.fetchItem("1")
+        item0.setIsExpanded(True)
+        self.model.setFetchLimit(12)
+        self.model.evictFetchedItems(exclude=item1)
+        self.assertEqual(item0.childCount(), 5)
+        self.assertEqual(self.model.numFetchedItems(), 15)
+
+    def test_fetchLimit(self):
+        self.model.setFetchLimit(7)
+        self.model.fetchMore(QModelIndex())
+        item0 = self.fetchItem("0")
+
+        # the branch that was just fetched, and its ancestors, are not evicted
+        self.app.processEvents()
+        self.assertEqual(item0.childCount(), 5)
+
+        # eviction is deferred until the views have finished laying out
+        item1 = self.fetchItem("1")
+        self.assertEqual(item0.childCount(), 5)
+        self.app.processEvents()
+        self.assertEqual(item0.childCount(), 0)
+        self.assertEqual(item1.childCount(), 5)
+        self.assertEqual(self.model.numFetchedItems(), 10)
+
+
+class TestAbstractDragDropModelSort(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # c(b2, a2), B, a(10, 2, None)
+        self.model = AbstractDragDropModel()
+        self.model.setHeaderData(["name", "size"])
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "c", "size": 3}, "children": [
+                {"column_data": {"name": "b2"}},
+                {"column_data": {"name": "a2"}}]},
+            {"column_data": {"name": "B", "size": 1}},
+            {"column_data": {"name": "a", "size": 2}, "children": [
+                {"column_data": {"name": 10}},
+                {"column_data": {"name": 2}},
+                {"column_data": {"name": None}}]}])
+
+        self.layout_changes = []
+        self.moves = []
+        self.model.layoutChanged.connect(lambda *args: self.layout_changes.append(args))
+        self.model.rowsMoved.connect(lambda *args: self.moves.append(args))
+
+    def getChildNames(self, item=None):
+        item = item or self.model.rootItem()
+        return [child.name() for child in item.children()]
+
+    def getItem(self, name):
+        return self.model.findItems(name, match_type=Qt.MatchExactly)[0].internalPointer()
+
+    def test_sort(self):
+        self.model.sort(0)
+        self.assertEqual(self.getChildNames(), ["a", "B", "c"])
+        self.assertEqual(self.getChildNames(self.getItem("a")), [None, 2, 10])
+        self.assertEqual(self.getChildNames(self.getItem("c")), ["a2", "b2"])
+        self.assertEqual([child.row() for child in self.model.rootItem().children()], [0, 1, 2])
+
+        self.model.sort(1, Qt.DescendingOrder)
+        self.assertEqual(self.getChildNames(), ["c", "a", "B"])
+        self.assertEqual((self.model.sortColumn(), self.model.sortOrder()), (1, Qt.DescendingOrder))
+
+        # the whole tree is sorted in one layout change
+        self.assertEqual(len(self.layout_changes), 2)
+        self.assertEqual(self.moves, [])
+
+    def test_sortKeyCache(self):
+        keys = []
+
+        def getItemSortKey(item, column):
+            keys.append(item)
+            return str(item.name()).lower()
+
+        self.model.setItemSortKeyFunction(getItemSortKey)
+        self.model.sort(0)
+        self.model.sort(0, Qt.DescendingOrder)
+        self.assertEqual(len(keys), 8)
+        self.assertEqual(self.getChildNames(), ["c", "B", "a"])
+
+        # editing an item clears its key
+        item = self.getItem("B")
+        self.model.setData(self.model.getIndexFromItem(item), "d")
+        self.assertEqual(keys[-1], item)
+        self.assertEqual(self.model.getItemSortKey(item, 0), "d")
+        self.assertEqual(len(keys), 9)
+
+        self.model.clearItemSortKeys()
+        self.model.getItemSortKey(item, 0)
+        self.assertEqual(len(keys), 10)
+
+    def test_updateItemSortPosition(self):
+        self.model.sort(0)
+        for name, child_names in (("d", ["B", "c", "d"]), ("0", ["0", "c", "d"]), ("e", ["c", "d", "e"])):
+            item = self.model.rootItem().children()[0]
+            self.model.setData(self.model.getIndexFromItem(item), name)
+            self.assertEqual(self.getChildNames(), child_names)
+            self.assertEqual([child.row() for child in self.model.rootItem().children()], [0, 1, 2])
+
+        # each edit is one move, and items that stay in place are not moved
+        self.assertEqual(len(self.moves), 2)
+        self.assertEqual(len(self.layout_changes), 1)
+
+        # other columns do not move the item
+        self.model.setData(self.model.index(2, 1, QModelIndex()), "a")
+        self.assertEqual(self.getChildNames(), ["c", "d", "e"])
+        self.assertEqual(len(self.moves), 2)
+
+    def test_persistentIndexes(self):
+        indexes = [QPersistentModelIndex(self.model.findItems(name, match_type=Qt.MatchExactly)[0])
+                   for name in ("c", "b2", 10)]
+        self.model.sort(0)
+        self.assertEqual([QModelIndex(index).internalPointer().name() for index in indexes], ["c", "b2", 10])
+        self.assertEqual([index.row() for index in indexes], [2, 1, 2])
+
+    def test_proxySort(self):
+        proxy_model = AbstractDragDropFilterProxyModel()
+        proxy_model.setSourceModel(self.model)
+        proxy_model.sort(0)
+        self.assertEqual(self.model.sortColumn(), 0)
+        self.assertEqual(
+            [proxy_model.mapToSource(proxy_model.index(row, 0)).internalPointer().name() for row in range(3)],
+            ["a", "B", "c"])
+
+
+class TestAbstractDragDropModelBatchUpdate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.model = AbstractDragDropModel()
+        self.parent_index = self.model.insertNewIndex(0, name="parent")
+        for row in range(3):
+            self.model.insertNewIndex(row, name="child{row}".format(row=row), parent=self.parent_index)
+        self.parent_item = self.parent_index.internalPointer()
+
+    def test_flushRaises(self):
+        def itemsEnabledEvent(items):
+            raise RuntimeError("itemsEnabledEvent")
+        self.model.setItemsEnabledEvent(itemsEnabledEvent)
+
+        with self.assertRaises(RuntimeError):
+            with self.model.batchUpdate():
+                self.model.setItemEnabled(self.parent_item.children()[0], False)
+        self.assertFalse(self.model.isBatchUpdating())
+
+        # deletes are no longer queued
+        self.model.setItemsEnabledEvent(lambda items: None)
+        for child in list(self.parent_item.children()):
+            self.model.deleteItem(child)
+        self.assertEqual(self.parent_item.children(), [])
+
+    def deleteItems(self, update_first):
+        deleted = []
+
+        def itemDeleteEvent(item):
+            deleted.append((item.name(), item in item.parent().children(), self.model.getIndexFromItem(item).isValid()))
+        self.model.setItemDeleteEvent(itemDeleteEvent, update_first=update_first)
+
+        with self.model.batchUpdate():
+            for child in list(self.parent_item.children())[:2]:
+                self.model.deleteItem(child, event_update=True)
+        self.assertEqual([child.name() for child in self.parent_item.children()], ["child2"])
+        return deleted
+
+    def test_deleteUpdateFirst(self):
+        deleted = self.deleteItems(True)
+        self.assertEqual(deleted, [("child0", True, True), ("child1", True, True)])
+
+    def test_deleteUpdateLast(self):
+        deleted = self.deleteItems(False)
+        self.assertEqual(deleted, [("child0", False, False), ("child1", False, False)])
+
+
+class TestAbstractDragDropModelStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+        # A(A1(A11, A12)), B
+        model = AbstractDragDropModel()
+        a_index = model.insertNewIndex(0, name="A")
+        model.insertNewIndex(1, name="B")
+        a1_index = model.insertNewIndex(0, name="A1", parent=a_index)
+        model.insertNewIndex(0, name="A11", parent=a1_index)
+        model.insertNewIndex(1, name="A12", parent=a1_index)
+        stream = io.StringIO()
+        model.exportModelToStream(model.rootItem(), stream)
+        cls.stream = stream.getvalue()
+
+    def importModel(self, row, batch_size):
+        model = AbstractDragDropModel()
+        model.insertNewIndex(0, name="x")
+        model.insertNewIndex(1, name="y")
+        model.importModelFromStream(io.StringIO(self.stream), row=row, batch_size=batch_size)
+        return model
+
+    def test_importRow(self):
+        for row, names in ((0, ["A", "B", "x", "y"]), (1, ["x", "A", "B", "y"]), (None, ["x", "y", "A", "B"])):
+            for batch_size in (1, 2, 3, 4, 5, 10000):
+                model = self.importModel(row, batch_size)
+                root_item = model.rootItem()
+                self.assertEqual([child.name() for child in root_item.children()], names, (row, batch_size))
+
+                a_item = root_item.children()[names.index("A")]
+                self.assertEqual([child.name() for child in a_item.children()], ["A1"])
+                self.assertEqual([child.name() for child in a_item.children()[0].children()], ["A11", "A12"])
+
+
+def mainFunction():
+    app = QApplication(sys.argv)
+    unittest.main()
+
+
+if __name__ == '__main__':
+    mainFunction()
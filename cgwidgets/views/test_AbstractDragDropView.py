@@ -0,0 +1,192 @@
+import unittest
+import sys
+
+from qtpy.QtWidgets import QApplication
+from qtpy.QtCore import Qt
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropTreeView, AbstractDragDropListView
+
+
+class TestAbstractDragDropViewSelection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # a(a1(a11), a2), b
+        self.model = AbstractDragDropModel()
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "a"}, "children": [
+                {"column_data": {"name": "a1"}, "children": [{"column_data": {"name": "a11"}}]},
+                {"column_data": {"name": "a2"}}]},
+            {"column_data": {"name": "b"}}])
+        self.view = AbstractDragDropTreeView()
+        self.view.setModel(self.model)
+        self.view.setMultiSelect(True)
+
+    def getItem(self, name):
+        return self.model.findItems(name, match_type=Qt.MatchExactly)[0].internalPointer()
+
+    def selectItems(self, names, selected=True):
+        for name in names:
+            self.view.setItemSelected(self.getItem(name), selected)
+
+    def getNames(self, items):
+        return [item.name() for item in items]
+
+    def test_baseItems(self):
+        self.selectItems(["a11", "a", "b"])
+        snapshot = self.view.getSelectionSnapshot()
+        self.assertEqual(self.getNames(snapshot["items"]), ["a11", "a", "b"])
+        self.assertEqual(self.getNames(snapshot["base_items"]), ["a", "b"])
+        self.assertEqual(self.getNames(self.view.getAllBaseItems()), ["a", "b"])
+
+        # descendants become base items when their ancestor is deselected
+        self.selectItems(["a"], selected=False)
+        self.assertEqual(self.getNames(self.view.getAllBaseItems()), ["a11", "b"])
+
+    def test_selectedDescendants(self):
+        self.selectItems(["a11", "a2", "b"])
+        self.assertEqual(self.getNames(self.view.getItemsSelectedDescendants(self.getItem("a"))), ["a11", "a2"])
+        self.assertEqual(self.getNames(self.view.getItemsSelectedDescendants(self.getItem("a1"))), ["a11"])
+        self.assertEqual(self.view.getItemsSelectedDescendants(self.getItem("b")), [])
+
+    def test_snapshotCache(self):
+        self.selectItems(["a1"])
+        snapshot = self.view.getSelectionSnapshot()
+        self.assertIs(self.view.getSelectionSnapshot(), snapshot)
+
+        self.selectItems(["a11"])
+        self.assertIsNot(self.view.getSelectionSnapshot(), snapshot)
+        self.assertEqual(self.getNames(self.view.getAllBaseItems()), ["a1"])
+
+    def test_itemsMoved(self):
+        self.selectItems(["a", "a11"])
+        self.assertEqual(self.getNames(self.view.getAllBaseItems()), ["a"])
+
+        # moving an item out of a selected ancestor makes it a base item
+        self.model.moveItems([self.getItem("a11")], self.model.rootItem(), 2)
+        self.assertEqual(sorted(self.getNames(self.view.getAllBaseItems())), ["a", "a11"])
+
+    def test_itemsRemoved(self):
+        self.selectItems(["a1", "b"])
+        self.model.deleteItem(self.getItem("a1"))
+        self.assertEqual(self.getNames(self.view.getAllSelectedItems()), ["b"])
+
+    def test_noLayoutChange(self):
+        layout_changes = []
+        self.model.layoutChanged.connect(lambda *args: layout_changes.append(args))
+        self.selectItems(["a", "b"])
+        self.selectItems(["a"], selected=False)
+        self.assertEqual(layout_changes, [])
+
+
+class TestAbstractDragDropViewCopyPaste(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        # a(a1(a11), a2), b
+        self.model = AbstractDragDropModel()
+        self.model.insertNewIndexes(0, [
+            {"column_data": {"name": "a"}, "children": [
+                {"column_data": {"name": "a1"}, "children": [{"column_data": {"name": "a11"}}]},
+                {"column_data": {"name": "a2"}}]},
+            {"column_data": {"name": "b"}}])
+        self.view = AbstractDragDropTreeView()
+        self.view.setModel(self.model)
+        self.view.setMultiSelect(True)
+        self.view.setIsCopyable(True)
+
+        self.inserts = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.inserts.append((first, last)))
+
+    def getItem(self, name):
+        return self.model.findItems(name, match_type=Qt.MatchExactly)[0].internalPointer()
+
+    def selectItems(self, names):
+        self.view.clearItemSelection()
+        for name in names:
+            self.view.setItemSelected(self.getItem(name), True)
+
+    def getChildNames(self, item):
+        return [child.name() for child in item.children()]
+
+    def test_paste(self):
+        pasted = []
+        self.view.setPasteEvent(lambda copied_items, pasted_items, parent_item: pasted.append(
+            (copied_items, pasted_items, parent_item)))
+        self.selectItems(["a1", "a2"])
+        self.view.copyEvent()
+        self.selectItems(["b"])
+        self.view.pasteEvent()
+
+        # the copies are inserted in one batch
+        b_item = self.getItem("b")
+        self.assertEqual(self.getChildNames(b_item), ["a1", "a2"])
+        self.assertEqual(self.getChildNames(b_item.children()[0]), ["a11"])
+        self.assertEqual(self.inserts, [(0, 1)])
+
+        copied_items, pasted_items, parent_item = pasted[0]
+        self.assertEqual(copied_items, [self.getItem("a1"), self.getItem("a2")])
+        self.assertEqual(pasted_items, b_item.children())
+        self.assertIs(parent_item, b_item)
+        self.assertEqual(self.getChildNames(self.getItem("a")), ["a1", "a2"])
+
+    def test_duplicate(self):
+        duplicated = []
+        self.view.setDuplicateEvent(lambda copied_items, new_items: duplicated.append(new_items))
+        self.selectItems(["a2", "a1", "b"])
+        self.view.duplicateEvent()
+
+        # each contiguous run is inserted in front of itself in one batch
+        a_item = self.getItem("a")
+        self.assertEqual(self.getChildNames(a_item), ["a1", "a2", "a1", "a2"])
+        self.assertEqual([child.name() for child in self.model.rootItem().children()], ["a", "b", "b"])
+        self.assertEqual(sorted(self.inserts), [(0, 1), (1, 1)])
+
+        # the new items are in the same order as the copied items
+        self.assertEqual(duplicated[0], [a_item.children()[1], a_item.children()[0], self.model.rootItem().children()[1]])
+        self.assertIsNot(a_item.children()[0], self.view.copiedItems()[1])
+
+    def test_cut(self):
+        cut = []
+        self.view.setCutEvent(lambda copied_items: cut.append(copied_items))
+        self.selectItems(["a1", "b"])
+        a1_item, b_item = self.getItem("a1"), self.getItem("b")
+        self.view.cutEvent()
+        self.assertEqual(cut, [[a1_item, b_item]])
+        self.assertEqual(self.getChildNames(self.getItem("a")), ["a2"])
+        self.assertEqual([child.name() for child in self.model.rootItem().children()], ["a"])
+
+        # cut items can be pasted
+        self.selectItems(["a2"])
+        self.view.pasteEvent()
+        self.assertEqual(self.getChildNames(self.getItem("a2")), ["a1", "b"])
+        self.assertEqual(self.getChildNames(self.getItem("a2").children()[0]), ["a11"])
+
+
+class TestAbstractDragDropListViewSelection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_baseItems(self):
+        model = AbstractDragDropModel()
+        model.insertNewIndexes(0, [{"column_data": {"name": "item{x}".format(x=x)}} for x in range(3)])
+        view = AbstractDragDropListView()
+        view.setModel(model)
+        view.setMultiSelect(True)
+        for item in reversed(model.rootItem().children()):
+            view.setItemSelected(item, True)
+        self.assertEqual([item.name() for item in view.getAllBaseItems()], ["item2", "item1", "item0"])
+
+
+def mainFunction():
+    app = QApplication(sys.argv)
+    unittest.main()
+
+
+if __name__ == '__main__':
+    mainFunction()
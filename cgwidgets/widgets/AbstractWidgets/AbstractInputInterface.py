@@ -12,7 +12,7 @@ from cgwidgets.utils import (
 
 from cgwidgets.settings import icons
 from cgwidgets.settings.stylesheets import input_widget_ss
-from cgwidgets.settings.hover_display import installHoverDisplaySS, removeHoverDisplay
+from cgwidgets.settings.hover_display import installHoverDisplaySS, updateHoverDisplaySS
 
 
 class iAbstractInputWidget(object):
@@ -69,12 +69,12 @@ class iAbstractInputWidget(object):
         style_sheet = """
             {input_widget_ss}
         """.format(input_widget_ss=input_widget_ss.format(**style_sheet_args))
-        self.setStyleSheet(style_sheet)
 
-        # install hover/focus display
-        self.installHoverDisplay()
+        # install hover/focus display, and set the style sheet with its rules appended
+        self.installHoverDisplay(update_style_sheet=False)
+        updateHoverDisplaySS(self, style_sheet)
 
-    def installHoverDisplay(self):
+    def installHoverDisplay(self, update_style_sheet=True):
         # add hover display
         hover_type_flags = {
             'focus':{'input_hover':True},
@@ -89,7 +89,8 @@ class iAbstractInputWidget(object):
             self,
             name="INPUT WIDGETS",
             hover_type_flags=hover_type_flags,
-            default_ss=default_ss)
+            default_ss=default_ss,
+            update_style_sheet=update_style_sheet)
 
     """ UTILS """
     def setValidateInputFunction(self, function):
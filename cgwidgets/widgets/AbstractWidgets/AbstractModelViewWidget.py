@@ -2,7 +2,7 @@ import sys
 import os
 
 from qtpy.QtWidgets import (QSplitterHandle, QApplication, QLabel, QCompleter, QTreeView, QWidget, QVBoxLayout)
-from qtpy.QtCore import Qt, QModelIndex, QItemSelectionModel, QEvent, QSortFilterProxyModel
+from qtpy.QtCore import Qt, QModelIndex, QItemSelectionModel, QEvent, QSortFilterProxyModel, QRegExp
 from qtpy.QtGui import QCursor
 from cgwidgets.widgets import AbstractStringInputWidget, AbstractListInputWidget
 from cgwidgets.views import (
@@ -246,6 +246,17 @@ class AbstractModelViewWidget(AbstractShojiLayout):
 
         return new_index
 
+    def insertNewIndexes(self, row, items_data, parent=QModelIndex()):
+        """ Inserts multiple indexes in one batch, see AbstractDragDropModel.insertNewIndexes()
+
+        Args:
+            row (int): row to start inserting at
+            items_data (list): of dicts, each one creating an item
+            parent (QModelIndex): to insert the new indexes under
+
+        Returns (list): of QModelIndex"""
+        return self.model().insertNewIndexes(row, items_data, parent=parent)
+
     def clearModel(self):
         self.model().clearModel()
 
@@ -265,7 +276,7 @@ class AbstractModelViewWidget(AbstractShojiLayout):
 
     """ MODEL FILTERS"""
     def isModelCustomFilterable(self):
-        self.view().isModelCustomFilterable()
+        return self.view().isModelCustomFilterable()
 
     def makeModelFilterable(self):
         self.view().makeModelFilterable()
@@ -273,14 +284,20 @@ class AbstractModelViewWidget(AbstractShojiLayout):
     def addFilter(self, regex_filter, arg="name", name=None):
         self.view().addFilter(regex_filter=regex_filter, arg=arg, name=name)
 
+    def addComparisonFilter(self, value, arg="name", operator="==", name=None):
+        self.view().addComparisonFilter(value, arg=arg, operator=operator, name=name)
+
     def clearFilters(self):
         self.view().clearFilters()
 
     def filters(self):
         return self.view().filters()
 
+    def getFilterByName(self, name):
+        return self.view().getFilterByName(name)
+
     def removeFilter(self, regex_filter, arg="name"):
-        self.view().removeFilter({"filter": regex_filter, "arg": arg})
+        self.view().removeFilter(regex_filter, arg=arg)
 
     def removeFilterByIndex(self, index):
         self.view().removeFilterByIndex(index)
@@ -297,6 +314,12 @@ class AbstractModelViewWidget(AbstractShojiLayout):
         """
         self.view().updateFilterByName(pattern, name)
 
+    def scheduleFilterUpdate(self, pattern, name):
+        self.view().scheduleFilterUpdate(pattern, name)
+
+    def filterScheduler(self):
+        return self.view().filterScheduler()
+
     """ SELECTION """
     def clearItemSelection(self):
         self.view().clearItemSelection()
@@ -332,6 +355,13 @@ class AbstractModelViewWidget(AbstractShojiLayout):
     def getAllIndexes(self):
         return self.model().getAllIndexes()
 
+    def iterItems(self, item=None, depth_first=True, max_depth=None, predicate=None):
+        return self.model().iterItems(item, depth_first=depth_first, max_depth=max_depth, predicate=predicate)
+
+    def iterIndexes(self, index=None, depth_first=True, max_depth=None, predicate=None, column=0):
+        return self.model().iterIndexes(
+            index, depth_first=depth_first, max_depth=max_depth, predicate=predicate, column=column)
+
     def getAllSelectedItems(self):
         return self.view().getAllSelectedItems()
 
@@ -477,6 +507,9 @@ class AbstractModelViewWidget(AbstractShojiLayout):
     def setItemDeleteEvent(self, function, update_first=True):
         self.model().setItemDeleteEvent(function, update_first=update_first)
 
+    def setItemsDeleteEvent(self, function):
+        self.model().setItemsDeleteEvent(function)
+
     def setDragStartEvent(self, function):
         self.model().setDragStartEvent(function)
 
@@ -486,9 +519,15 @@ class AbstractModelViewWidget(AbstractShojiLayout):
     def setItemEnabledEvent(self, function):
         self.model().setItemEnabledEvent(function)
 
+    def setItemsEnabledEvent(self, function):
+        self.model().setItemsEnabledEvent(function)
+
     def setTextChangedEvent(self, function):
         self.model().setTextChangedEvent(function)
 
+    def setItemsTextChangedEvent(self, function):
+        self.model().setItemsTextChangedEvent(function)
+
     def setIndexSelectedEvent(self, function):
         self.model().setItemSelectedEvent(function)
 
@@ -607,6 +646,12 @@ class AbstractModelViewWidget(AbstractShojiLayout):
     def exportModelToDict(self, item, item_data=None):
         return self.model().exportModelToDict(item, item_data=item_data)
 
+    def exportModelToFile(self, item, filepath):
+        return self.model().exportModelToFile(item, filepath)
+
+    def importModelFromFile(self, filepath, row=None, parent=QModelIndex(), batch_size=10000):
+        return self.model().importModelFromFile(filepath, row=row, parent=parent, batch_size=batch_size)
+
     """ EVENTS """
     def eventFilter(self, obj, event):
         """ Event filter for handling the hide/show events for the delegate widgets"""
@@ -746,12 +791,57 @@ class ModelViewSearchWidget(AbstractShojiLayout):
 
 
 class ModelViewSearchBox(AbstractStringInputWidget):
+    """
+    When the select flag is set to "FILTER", the model will be filtered as the
+    user types.  The filter updates are scheduled, so that the model is only
+    filtered once the user stops typing.  See AbstractDragDropFilterScheduler
+    """
+    FILTER_NAME = "__search__"
+
     def __init__(self, parent=None):
         super(ModelViewSearchBox, self).__init__(parent)
-        #self.textChanged.connect(self.filterCompletionResults)
+        self.textChanged.connect(self.filterResults)
         completer = QCompleter()
         self.setCompleter(completer)
 
+    """ FILTER """
+    def isFilterEnabled(self):
+        return self.parent().select_flags.text() == "FILTER"
+
+    def getFilterPattern(self, text):
+        """ Returns the regex pattern to filter with for the text provided, based
+        off of the current match flags
+
+        Args:
+            text (str):
+
+        Returns (str)"""
+        match_type = self.parent().match_flags.text()
+        if match_type == "REGEX":
+            return text
+        if match_type == "CONTAINS" or not text:
+            return QRegExp.escape(text)
+        if match_type == "STARTS WITH":
+            return "^" + QRegExp.escape(text)
+        return "^" + QRegExp.escape(text) + "$"
+
+    def filterResults(self, text):
+        """ Schedules an update to the search filter with the text provided"""
+        if not self.isFilterEnabled():
+            return
+
+        model_view_widget = getWidgetAncestor(self, AbstractModelViewWidget)
+        if not model_view_widget.isModelCustomFilterable():
+            model_view_widget.makeModelFilterable()
+
+        pattern = self.getFilterPattern(text)
+        if not model_view_widget.getFilterByName(ModelViewSearchBox.FILTER_NAME):
+            model_view_widget.addFilter(
+                QRegExp(pattern, Qt.CaseInsensitive), arg=model_view_widget.model().getHeaderData()[0],
+                name=ModelViewSearchBox.FILTER_NAME)
+        else:
+            model_view_widget.scheduleFilterUpdate(pattern, ModelViewSearchBox.FILTER_NAME)
+
     """ COMPLETER """
     def selectIndexes(self, indexes):
         """
@@ -778,7 +868,12 @@ class ModelViewSearchBox(AbstractStringInputWidget):
     def keyPressEvent(self, event):
         from cgwidgets.settings.keylist import ACCEPT_KEYS
 
-        if event.key() in ACCEPT_KEYS:
+        if event.key() in ACCEPT_KEYS and self.isFilterEnabled():
+            model_view_widget = getWidgetAncestor(self, AbstractModelViewWidget)
+            if model_view_widget.isModelCustomFilterable():
+                model_view_widget.filterScheduler().flush()
+
+        elif event.key() in ACCEPT_KEYS:
             text = self.text()
             model_view_widget = getWidgetAncestor(self, AbstractModelViewWidget)
 
@@ -800,7 +895,8 @@ class ModelViewSelectFlags(AbstractListInputWidget):
     List input that displays all of the available search options.
     """
     SELECT = [
-        "SELECT"
+        "SELECT",
+        "FILTER"
     ]
     def __init__(self, parent=None):
         super(ModelViewSelectFlags, self).__init__(parent)
@@ -3,7 +3,7 @@ from qtpy.QtWidgets import (QLabel, QStackedWidget)
 from qtpy.QtCore import QEvent
 from qtpy.QtGui import QPixmap
 
-from cgwidgets.settings.hover_display import installHoverDisplaySS, removeHoverDisplay
+from cgwidgets.settings.hover_display import installHoverDisplaySS, uninstallHoverDisplaySS
 from cgwidgets.widgets.AbstractWidgets.AbstractInputInterface import iAbstractInputWidget
 from cgwidgets.widgets import AbstractLabelWidget, AbstractStringInputWidget
 
@@ -137,8 +137,7 @@ class AbstractOverlayInputWidget(QStackedWidget, iAbstractInputWidget):
         # setup attr
         self._delegate_widget = widget
 
-        style_sheet = removeHoverDisplay(widget.styleSheet(), "INPUT WIDGETS")
-        widget.setStyleSheet(style_sheet)
+        uninstallHoverDisplaySS(widget, "INPUT WIDGETS")
 
         # install user finished editing
         if user_finished_editing_event:
@@ -171,8 +170,7 @@ class AbstractOverlayInputWidget(QStackedWidget, iAbstractInputWidget):
         self._display_mode = display_mode
 
         if display_mode == AbstractOverlayInputWidget.DISABLED:
-            style_sheet = removeHoverDisplay(self.styleSheet(), "INPUT WIDGETS")
-            self.setStyleSheet(style_sheet)
+            uninstallHoverDisplaySS(self, "INPUT WIDGETS")
 
         else:
             self.updateStyleSheet()
@@ -195,8 +193,7 @@ class AbstractOverlayInputWidget(QStackedWidget, iAbstractInputWidget):
 
     """ UTILS """
     def disableHoverDisplay(self, widget):
-        style_sheet = removeHoverDisplay(widget.styleSheet(), "INPUT WIDGETS")
-        widget.setStyleSheet(style_sheet)
+        uninstallHoverDisplaySS(widget, "INPUT WIDGETS")
 
     """ User Finished Editing"""
     def userFinishedEditingEventWrapper(self, *args, **kwargs):
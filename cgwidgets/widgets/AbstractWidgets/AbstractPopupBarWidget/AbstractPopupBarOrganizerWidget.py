@@ -158,7 +158,6 @@ from cgwidgets.utils import (
     isCursorOverWidget,
     getWidgetAncestor,
     getDefaultSavePath,
-    getJSONData,
     installResizeEventFinishedEvent,
     runDelayedEvent)
 
@@ -180,7 +179,9 @@ from cgwidgets.widgets import (
     AbstractSplitterWidget
     )
 
-from .AbstractPopupBarWidget import AbstractPopupBarWidget, AbstractPopupBarItemWidget, AbstractPopupBarDisplayWidget
+from .AbstractPopupBarWidget import (
+    AbstractPopupBarWidget, AbstractPopupBarItemWidget, AbstractPopupBarDisplayWidget, AbstractPopupBarSnapshotWidget,
+    constructor_code_cache, pip_file_registry, pip_file_writer)
 
 
 class AbstractPopupBarOrganizerWidget(AbstractShojiModelViewWidget):
@@ -332,21 +333,78 @@ class AbstractPopupBarOrganizerWidget(AbstractShojiModelViewWidget):
         return self._settings_widget
 
     """ WIDGETS """
-    def createNewWidgetFromConstructorCode(self, constructor_code, name="", resize_popup_bar=True):
+    def createNewWidgetFromConstructorCode(self, constructor_code, name="", resize_popup_bar=True, deferred=False):
         """
         Retuns a QWidget from the constructor code provided.
 
         The widget returned will be the variable "widget" from the constructor code
         Args:
             constructor_code (code):
+            deferred (bool): if True, a snapshot of the widget will be displayed,
+                and the widget will only be created when it is enlarged, or set as the current widget
 
         Returns (QModelIndex):
         """
-        widget = self.popupBarDisplayWidget().createWidgetFromConstructorCode(constructor_code)
+        if deferred:
+            widget = AbstractPopupBarSnapshotWidget(
+                constructor_code=constructor_code, constructor_widget=self.popupBarDisplayWidget(), name=name)
+        else:
+            widget = self.popupBarDisplayWidget().createWidgetFromConstructorCode(constructor_code)
         index = self.createNewWidget(widget, name=name, resize_popup_bar=resize_popup_bar)
         index.internalPointer().setConstructorCode(constructor_code)
         return index
 
+    def createNewWidgetsFromConstructorCode(self, widgets, resize_popup_bar=True, deferred=False):
+        """
+        Creates a new widget for each name / constructor code provided in one batch.
+
+        This is the bulk version of createNewWidgetFromConstructorCode().  The widget
+        indexes are only updated once all of the widgets have been created, and all of
+        the organizer items are created off of the model, and inserted with one call.
+
+        Args:
+            widgets (list): of (name, constructor_code) tuples.  Like createNewWidget(),
+                each widget is inserted at the front, so these should be in reverse order
+                of how they will be displayed.
+            resize_popup_bar (bool): if the popupBarWidget should be updated or not
+            deferred (bool): if True, a snapshot of the widgets will be displayed,
+                and the widgets will only be created when they are enlarged, or set as the current widget
+
+        Returns (list): of QModelIndex, in the same order as the widgets provided
+        """
+        model = self.popupBarOrganizerWidget().model()
+
+        # create widgets
+        new_items = []
+        with self.popupBarWidget().batchUpdate():
+            for name, constructor_code in widgets:
+                if deferred:
+                    widget = AbstractPopupBarSnapshotWidget(
+                        constructor_code=constructor_code, constructor_widget=self.popupBarDisplayWidget(), name=name)
+                else:
+                    widget = self.popupBarDisplayWidget().createWidgetFromConstructorCode(constructor_code)
+                popup_bar_widget = self.popupBarDisplayWidget().createNewWidget(
+                    widget, name=name, resize_popup_bar=resize_popup_bar)
+
+                # create item
+                item = model.createNewItemFromData({"name": name})
+                item.setWidget(popup_bar_widget)
+                item.setConstructorCode(constructor_code)
+                popup_bar_widget.setItem(item)
+                new_items.append(item)
+
+        # insert items, each item goes in front of the last one
+        model.insertItems(0, list(reversed(new_items)))
+
+        # destroy temp widgets
+        if 1 < self.popupBarDisplayWidget().numWidgets():
+            num_temp_widgets = len(model.findItems("", match_type=Qt.MatchExactly))
+            num_named_widgets = len([name for name, constructor_code in widgets if name != ""])
+            for _ in range(min(num_temp_widgets, num_named_widgets)):
+                self.removeTempWidget()
+
+        return [model.getIndexFromItem(item) for item in new_items]
+
     def createNewWidget(self, widget, name="", resize_popup_bar=True):
         """
         Args:
@@ -370,8 +428,7 @@ class AbstractPopupBarOrganizerWidget(AbstractShojiModelViewWidget):
         # popup_bar_widget.setIndex(0)
         popup_bar_widget.setItem(item)
 
-        # update indexes
-        self.popupBarWidget().updateWidgetIndexes()
+        # indexes are updated by the popup bar when the widget is created
         # self.updateWidgetIndexes()
 
         # # destroy temp widgets
@@ -387,10 +444,9 @@ class AbstractPopupBarOrganizerWidget(AbstractShojiModelViewWidget):
 
         This will need to be done every time a new widget is added
         """
-        for index in self.popupBarOrganizerWidget().model().getAllIndexes():
-            item = index.internalPointer()
+        for item in self.popupBarOrganizerWidget().model().iterItems():
             if hasattr(item, "_widget"):
-                item.widget().setIndex(index.row())
+                item.widget().setIndex(item.row())
 
     def removeAllWidgets(self):
         """ Clears all of the widgets from the current AbstractPopupBarOrganizerWidget"""
@@ -675,21 +731,21 @@ organizer_widget.popupBarDisplayWidget().resizePopupBar()
             "type": attrs.FLOAT,
             "value": 0.25,
             "value_list": [0.01, 0.025, 0.05, 0.1],
-            "range": [True, 0.1, 1],
+            "range": [0.1, 1],
             "code": """organizer_widget.popupBarDisplayWidget().setPiPScale(float(value))""",
             "help": "The amount of space the PiPWidget will take up when not enlarged"},
         "Enlarged Scale": {
             "type": attrs.FLOAT,
             "value": 0.8,
             "value_list": [0.01, 0.025, 0.05, 0.1],
-            "range": [True, 0.1, 0.95],
+            "range": [0.1, 0.95],
             "code": """organizer_widget.popupBarDisplayWidget().setEnlargedScale(float(value))""",
             "help": "The amount of space (percent) the PiPWidget will take when enlarged"},
         "Enlarged Size": {
             "type": attrs.FLOAT,
             "value": 500.0,
             "value_list": [1, 5, 10, 25, 50],
-            "range": [True, 25, 2000],
+            "range": [25, 2000],
             "code": """organizer_widget.popupBarDisplayWidget().setEnlargedSize(float(value))""",
             "help": """The size (pixels) in the expanding direction of the enlarged widget.
     ie. if the expanding direction is set to East, this will be the width in pixels"""
@@ -698,7 +754,7 @@ organizer_widget.popupBarDisplayWidget().resizePopupBar()
             "type": attrs.FLOAT,
             "value": 50.0,
             "value_list": [1, 5, 10, 25, 50],
-            "range": [True, 0, 500],
+            "range": [0, 500],
             "code": """organizer_widget.popupBarDisplayWidget().setEnlargedOffset(float(value))""",
             "help": """The size (pixels) of the offset of the direction perpendicular to the direction."""
         },
@@ -706,7 +762,7 @@ organizer_widget.popupBarDisplayWidget().resizePopupBar()
             "type": attrs.FLOAT,
             "value": 100.00,
             "value_list": [1, 5, 10, 25],
-            "range": [True, 25, 500],
+            "range": [25, 500],
             "code": """
 organizer_widget.popupBarDisplayWidget().setTaskbarSize(float(value))
 organizer_widget.popupBarDisplayWidget().resizePopupBar()
@@ -844,7 +900,7 @@ You can use $ENVAR/local/dir to access a directory from an environment variable"
         loc['value'] = value
 
         # run update
-        exec(compile(code, "code", "exec"), globals(), loc)
+        exec(constructor_code_cache.compile(code, filename="code"), globals(), loc)
 
         # update local settings dictionary
         self.settings()[name]["value"] = value
@@ -1127,13 +1183,10 @@ class PiPGlobalOrganizerWidget(AbstractModelViewWidget):
         """
         # remove from JSON
         if item.itemType() == PiPGlobalOrganizerItem.PIP:
-            pip_data = self.currentPiPFileData()
             name = item.columnData()['name']
-            del pip_data[name]
 
             # save json PiP File
-            save_widget = self.saveWidget()
-            save_widget.dumpPiPDataToJSON(self.currentSaveFilePath(), pip_data)
+            pip_file_writer.removeEntry(self.currentSaveFilePath(), name)
 
     def duplicateItemOnDrop(self, data, items, model, row, parent):
         for item in items:
@@ -1199,8 +1252,8 @@ class PiPSaveWidget(QWidget):
                 --> save
                     --> savePiPWidgetItem
                         --> updatePiPWidgetItemInFile
-                        --> savePiPWidgetItemToFile
-                    --> savePiPGroupItem --> dumpPiPDataToJSON
+                        --> savePiPWidgetItemToFile --> pip_file_writer.setEntry
+                    --> savePiPGroupItem --> dumpPiPDataToJSON --> pip_file_writer.setData
         load
 
     Data Structure (Resources):
@@ -1314,16 +1367,14 @@ class PiPSaveWidget(QWidget):
         widgets_list = []
 
         # Display Child PiPWidgets of Selection
-        if self.currentSaveFilePath():
-            for name in self.currentPiPFileData().keys():
-                widgets_list.append(name)
+        file_path = self.currentSaveFilePath()
+        if file_path:
+            widgets_list += pip_file_registry.names(file_path)
 
         # Display ALL PiPWidgets
         else:
-            for key, data in self.getAllPiPData().items():
-                data = getJSONData(data['file_path'])
-                for name in data.keys():
-                    widgets_list.append(name)
+            for data in self.getPiPSaveData().values():
+                widgets_list += pip_file_registry.names(data['file_path'])
 
         return widgets_list
 
@@ -1343,12 +1394,13 @@ class PiPSaveWidget(QWidget):
                 data: {PiPData}}
             }
 
-        Note: see class notes for PiPData data structure
+        Note: see class notes for PiPData data structure.  The PiPData is shared
+            with the pip_file_registry, and should not be modified.
         """
         pip_data = {}
         for pip_file_name, data in self.getPiPSaveData().items():
             pip_data[pip_file_name] = {}
-            pip_data[pip_file_name]["data"] = getJSONData(data['file_path'])
+            pip_data[pip_file_name]["data"] = pip_file_registry.data(data['file_path'])
             pip_data[pip_file_name]["locked"] = data["locked"]
             pip_data[pip_file_name]["file_path"] = data["file_path"]
         return pip_data
@@ -1436,10 +1488,16 @@ class PiPSaveWidget(QWidget):
         return item_dict
 
     def dumpPiPDataToJSON(self, file_path, data):
+        """ Queues the PiPData provided to be written to the file provided.
+
+        Only the PiPWidgets that have changed are written, see PiPFileWriter
+
+        Args:
+            file_path (str): path on disk to PiPFile
+            data (dict): PiPData
+        """
         if file_path:
-            # Writing JSON data
-            with open(file_path, 'w') as f:
-                json.dump(data, f)
+            pip_file_writer.setData(file_path, data)
 
     def currentSaveFilePath(self):
         """
@@ -1484,8 +1542,12 @@ class PiPSaveWidget(QWidget):
                 {"widget name": "constructor code"}],
             "settings": {"setting name": "value"}}
         }
+
+        Note:
+            This is a copy of the data in the pip_file_registry, so that PiPWidgets
+            can be added / removed before it is dumped back to disk.
         """
-        return getJSONData(self.currentSaveFilePath())
+        return OrderedDict(pip_file_writer.data(self.currentSaveFilePath()))
 
     """ SAVE """
     def save(self, this):
@@ -1616,11 +1678,10 @@ class PiPSaveWidget(QWidget):
         """
 
         name = self.nameWidget().delegateWidget().text()
-        pip_data = self.currentPiPFileData()
+        pip_data = {name: self.getPiPWidgetItemDict()}
 
         # save pip file
-        pip_data[name] = self.getPiPWidgetItemDict()
-        self.dumpPiPDataToJSON(self.currentSaveFilePath(), pip_data)
+        pip_file_writer.setEntry(self.currentSaveFilePath(), name, pip_data[name])
 
         # create new index
         main_widget = getWidgetAncestor(self, AbstractPopupBarOrganizerWidget)
@@ -1734,7 +1795,7 @@ class PiPPopupBarOrganizerWidget(AbstractModelViewWidget):
 
     """ UTILS """
     def widgets(self):
-        return [index.internalPointer().widget() for index in self.model().getAllIndexes() if hasattr(index.internalPointer(), "_widget")]
+        return [item.widget() for item in self.model().iterItems() if hasattr(item, "_widget")]
 
     """ EVENTS """
     def updateGlobalSettings(self, item, enabled):
@@ -1757,12 +1818,21 @@ class PiPPopupBarOrganizerWidget(AbstractModelViewWidget):
         # if in mini viewer
         # reset parent and insert back into mini viewer
         if widget.parent() == popup_bar:
+            # get new index, the current widget is in the organizer, but not the popup bar
+            old_index = widget.index()
+            index = len([
+                item for item in items[0].parent().children()[:row]
+                if item is not items[0] and item.widget().parent() == popup_bar])
+
+            # the spacer widget holds a position in the splitter, but does not have an index
             widget.setParent(None)
-            widget.setIndex(row)
-            popup_bar.addWidget(widget)
+            spacer_position = popup_bar.indexOf(popup_bar.spacerWidget())
+            position = index if spacer_position < 0 or index < spacer_position else index + 1
+            widget.setIndex(index)
+            popup_bar.insertWidget(position, widget)
 
-        # update all widget indexes
-        popup_bar.updateWidgetIndexes()
+            # update the widget indexes that have changed
+            popup_bar.updateWidgetIndexes(start=min(old_index, index), end=max(old_index, index))
         # main_widget.updateWidgetIndexes()
 
     def editWidget(self, item, old_value, new_value):
@@ -9,24 +9,26 @@ Todo:
 Todo ( Cleanup )
     *   currentWidget does not work...
 Todo (Features):
-    *   To give the illusion of instantaneous loading:
-            When closing, save image of last state.
-            When loading, load that image while showing the widget
-            Swap image for widget.
     *   Leave event, not over widget, need to accomdate for ellipse...
         todo update ellipse popup
 AbstractPopupBarDisplayWidget --> QWidget()
     display_widget --> AbstractPopupBarWidget
     popup_bar_widget --> AbstractPopupBarWidget
 """
+import atexit
+from contextlib import contextmanager
+import hashlib
 import json
+import marshal
 from collections import OrderedDict
 import os
+import sys
+import weakref
 
 from qtpy.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QSplitter, QSplitterHandle, QApplication)
-from qtpy.QtCore import QEvent, Qt, QPoint
-from qtpy.QtGui import QRegion
+from qtpy.QtCore import QEvent, Qt, QPoint, QFileSystemWatcher, QTimer
+from qtpy.QtGui import QRegion, QPixmap, QPainter
 
 from cgwidgets.utils import (
     isWidgetDescendantOf,
@@ -51,6 +53,844 @@ PIN_OFFSET = PIN_SIZE * 1.5
 ENLARGED_WIDGET_MASK_SCALE = 4
 
 
+class ConstructorCodeCache(object):
+    """
+    Cache of the compiled code objects for constructor code.
+
+    The constructor code of every PiP widget is compiled once, and the code object
+    is stored by the hash of its source, so identical constructor code is shared
+    across all displays.  If a cache directory is set, the code objects are also
+    marshalled to disk, so that they do not need to be compiled in the next session.
+
+    Attributes:
+        cache_dir (str): path on disk to the directory that will hold the marshalled
+            code objects.  If this is not set, the code will only be cached in memory.
+        code (dict): of {hash(str): code}
+        hits (int): number of times a compiled code object was returned from the cache
+        misses (int): number of times the source code had to be compiled
+    """
+    def __init__(self, cache_dir=None):
+        self._cache_dir = None
+        self._code = {}
+        self._is_dirty = False
+        self._hits = 0
+        self._misses = 0
+        if cache_dir:
+            self.setCacheDir(cache_dir)
+
+        atexit.register(self.save)
+
+    @staticmethod
+    def getKey(source):
+        """
+        Args:
+            source (str): constructor code
+
+        Returns (str): hash of the source code
+        """
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def compile(self, source, filename="constructor_code"):
+        """
+        Returns the compiled code object for the source provided
+
+        Args:
+            source (str): constructor code
+            filename (str): filename to be displayed in tracebacks
+
+        Returns (code):
+        """
+        key = ConstructorCodeCache.getKey(source)
+        if key in self._code:
+            self._hits += 1
+            return self._code[key]
+
+        self._misses += 1
+        code = compile(source, filename, "exec")
+        self._code[key] = code
+        self._is_dirty = True
+        return code
+
+    def precompile(self, pip_data):
+        """
+        Compiles all of the constructor code in the PiP data provided, and
+        writes the code to disk if a cache directory is set.
+
+        Args:
+            pip_data (dict): PiPData from a PiP file
+                {"PiPName": {"widgets": {"widget name": {"code": "constructor_code"}}}}
+        """
+        for data in pip_data.values():
+            widgets = data.get("widgets") if isinstance(data, dict) else None
+            if not isinstance(widgets, dict):
+                continue
+            for widget_data in widgets.values():
+                # errors will be raised when the widget is created
+                try:
+                    self.compile(widget_data["code"])
+                except (KeyError, TypeError, SyntaxError, ValueError):
+                    pass
+        self.save()
+
+    def clear(self):
+        """ Clears the in memory cache"""
+        self._code = {}
+
+    def resetCounters(self):
+        self._hits = 0
+        self._misses = 0
+
+    """ DISK """
+    def cacheFilepath(self):
+        """
+        Returns (str): path on disk to the marshalled code objects.  As marshalled
+            code is specific to the version of Python, this includes the cache tag.
+        """
+        if not self.cacheDir():
+            return None
+        return os.path.join(self.cacheDir(), "constructor_code.{tag}.marshal".format(tag=sys.implementation.cache_tag))
+
+    def load(self):
+        """ Loads the marshalled code objects from the cache directory"""
+        filepath = self.cacheFilepath()
+        if not filepath or not os.path.exists(filepath):
+            return
+
+        try:
+            with open(filepath, "rb") as f:
+                code = marshal.load(f)
+        except (EOFError, ValueError, TypeError, OSError):
+            return
+
+        if isinstance(code, dict):
+            code.update(self._code)
+            self._code = code
+
+    def save(self):
+        """ Writes the code objects to the cache directory if they have changed"""
+        filepath = self.cacheFilepath()
+        if not filepath or not self._is_dirty:
+            return
+
+        try:
+            os.makedirs(self.cacheDir(), exist_ok=True)
+            temp_filepath = "{filepath}.{pid}.tmp".format(filepath=filepath, pid=os.getpid())
+            with open(temp_filepath, "wb") as f:
+                marshal.dump(self._code, f)
+            os.replace(temp_filepath, filepath)
+            self._is_dirty = False
+        except OSError:
+            pass
+
+    """ PROPERTIES """
+    def cacheDir(self):
+        return self._cache_dir
+
+    def setCacheDir(self, cache_dir):
+        """
+        Sets the directory to store the marshalled code objects in, and loads
+        any code that has previously been stored there.
+
+        Args:
+            cache_dir (str): path on disk to directory, or None to disable the disk cache
+        """
+        self._cache_dir = cache_dir
+        self.load()
+
+    def code(self):
+        return self._code
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+
+constructor_code_cache = ConstructorCodeCache()
+
+
+class PopupBarSnapshotCache(object):
+    """
+    Cache of the snapshots of deferred PiP widgets.
+
+    When a PiPWidget is loaded in deferred mode, every widget is displayed as a
+    snapshot of its last render (AbstractPopupBarSnapshotWidget), and is only
+    created from its constructor code when it is enlarged, or set as the current widget.
+    The snapshots are stored by the name and constructor code of the widget, and
+    are updated every time the widget is hidden from the user.  If a cache directory
+    is set, the snapshots are also written to disk, so that they can be displayed
+    in the next session.
+
+    This also tracks the deferred widgets that have been created, so that the idle
+    widgets can be frozen back into snapshots.
+
+    Attributes:
+        cache_dir (str): path on disk to the directory that will hold the snapshots.
+            If this is not set, the snapshots will only be cached in memory.
+        live_widgets (OrderedDict): of {id(int): weakref(AbstractPopupBarItemWidget)} of all
+            the deferred widgets that have been created, from least to most recently used.
+        max_live_widgets (int): maximum number of deferred widgets that can be created
+            at one time.  Once exceeded, the least recently used widgets that are idle
+            will be frozen back into snapshots.  If this is 0, widgets will never be frozen.
+        snapshots (dict): of {key(str): QPixmap}
+    """
+    SNAPSHOT_SIZE = 512
+
+    def __init__(self, cache_dir=None, max_live_widgets=0):
+        self._cache_dir = cache_dir
+        self._max_live_widgets = max_live_widgets
+        self._live_widgets = OrderedDict()
+        self._snapshots = {}
+
+    @staticmethod
+    def getKey(name, constructor_code):
+        """
+        Args:
+            name (str): name of widget
+            constructor_code (str): constructor code of widget
+
+        Returns (str): hash of the name and constructor code
+        """
+        return ConstructorCodeCache.getKey("{name}\n{code}".format(name=name, code=constructor_code))
+
+    def snapshot(self, key):
+        """
+        Returns the last snapshot taken of a widget
+
+        Args:
+            key (str): key of widget, from getKey()
+
+        Returns (QPixmap): or None if no snapshot has been taken
+        """
+        if key in self._snapshots:
+            return self._snapshots[key]
+
+        filepath = self.snapshotFilepath(key)
+        if not filepath or not os.path.exists(filepath):
+            return None
+
+        snapshot = QPixmap(filepath)
+        if snapshot.isNull():
+            return None
+        self._snapshots[key] = snapshot
+        return snapshot
+
+    def setSnapshot(self, key, snapshot):
+        """
+        Stores the snapshot provided, and writes it to the cache directory if set.
+
+        Args:
+            key (str): key of widget, from getKey()
+            snapshot (QPixmap): will be scaled down to fit the SNAPSHOT_SIZE
+        """
+        if snapshot.isNull():
+            return
+        if PopupBarSnapshotCache.SNAPSHOT_SIZE < max(snapshot.width(), snapshot.height()):
+            snapshot = snapshot.scaled(
+                PopupBarSnapshotCache.SNAPSHOT_SIZE,
+                PopupBarSnapshotCache.SNAPSHOT_SIZE,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation)
+        self._snapshots[key] = snapshot
+
+        # write to disk
+        filepath = self.snapshotFilepath(key)
+        if not filepath:
+            return
+        try:
+            os.makedirs(self.cacheDir(), exist_ok=True)
+        except OSError:
+            return
+        temp_filepath = "{filepath}.{pid}.tmp".format(filepath=filepath, pid=os.getpid())
+        if snapshot.save(temp_filepath, "PNG"):
+            try:
+                os.replace(temp_filepath, filepath)
+            except OSError:
+                pass
+
+    def snapshotFilepath(self, key):
+        """
+        Returns (str): path on disk to the snapshot of the key provided
+        """
+        if not self.cacheDir():
+            return None
+        return os.path.join(self.cacheDir(), "{key}.png".format(key=key))
+
+    def clear(self):
+        """ Clears the in memory cache"""
+        self._snapshots = {}
+
+    """ LIVE WIDGETS """
+    def touchLiveWidget(self, widget):
+        """
+        Marks the deferred widget provided as the most recently used
+
+        Args:
+            widget (AbstractPopupBarItemWidget):
+        """
+        self._live_widgets.pop(id(widget), None)
+        self._live_widgets[id(widget)] = weakref.ref(widget)
+
+    def removeLiveWidget(self, widget):
+        """
+        Args:
+            widget (AbstractPopupBarItemWidget):
+        """
+        self._live_widgets.pop(id(widget), None)
+
+    def freezeIdleWidgets(self):
+        """ Freezes the least recently used idle widgets until the maxLiveWidgets() is met"""
+        if not self.maxLiveWidgets():
+            return
+
+        for key, widget_ref in list(self._live_widgets.items()):
+            if len(self._live_widgets) <= self.maxLiveWidgets():
+                return
+            widget = widget_ref()
+            try:
+                if widget is not None:
+                    widget.freeze()
+                else:
+                    self._live_widgets.pop(key, None)
+            # widget has been deleted
+            except RuntimeError:
+                self._live_widgets.pop(key, None)
+
+    """ PROPERTIES """
+    def cacheDir(self):
+        return self._cache_dir
+
+    def setCacheDir(self, cache_dir):
+        """
+        Args:
+            cache_dir (str): path on disk to directory, or None to disable the disk cache
+        """
+        self._cache_dir = cache_dir
+
+    def liveWidgets(self):
+        widgets = [widget_ref() for widget_ref in self._live_widgets.values()]
+        return [widget for widget in widgets if widget is not None]
+
+    def maxLiveWidgets(self):
+        return self._max_live_widgets
+
+    def setMaxLiveWidgets(self, max_live_widgets):
+        self._max_live_widgets = max_live_widgets
+        self.freezeIdleWidgets()
+
+    def snapshots(self):
+        return self._snapshots
+
+
+popup_bar_snapshot_cache = PopupBarSnapshotCache()
+
+
+class PiPFileRegistry(object):
+    """
+    Registry of the parsed PiP files.
+
+    Every PiP file is only parsed once, and the data is stored by the path of the
+    file, along with the modification time / size of the file when it was parsed.
+    The files are watched for changes, so that a lookup can return the data from
+    memory without touching the disk, and only the files that have changed will
+    be parsed again the next time that they are looked up.  If the files cannot
+    be watched (no QApplication), the modification time is checked on every lookup.
+
+    The constructor code of each file is precompiled when the file is parsed.
+
+    PiPWidgets can also be stored in their own files (see PiPFileWriter), in which
+    case the PiP file only holds a reference to that file, {"PiPName": {"$file": "relative/path"}},
+    which is resolved when the PiP file is looked up.
+
+    Note:
+        The data returned is shared by every lookup, and should not be modified.
+
+    Attributes:
+        entries (dict): of {filepath(str): {"stat": (mtime, size), "data": OrderedDict, "names": list, "refs": dict}}
+            where refs is a dict of {PiPName(str): filepath(str)} of the PiPWidgets stored in their own file
+        parses (int): number of times a PiP file has been parsed
+        watcher (QFileSystemWatcher): watching all of the files in the registry
+    """
+    REF_KEY = "$file"
+
+    def __init__(self):
+        self._entries = {}
+        self._parses = 0
+        self._stale_filepaths = set()
+        self._watched_filepaths = set()
+        self._watcher = None
+
+    @staticmethod
+    def getStat(filepath):
+        """
+        Args:
+            filepath (str): path on disk to PiP file
+
+        Returns (tuple): of (mtime(int), size(int)), or None if the file does not exist
+        """
+        try:
+            stat = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def entry(self, filepath):
+        """
+        Returns the entry for the PiP file provided, parsing the file if it
+        has not been parsed, or has changed since it was last parsed.
+
+        Args:
+            filepath (str): path on disk to PiP file
+
+        Returns (dict): {"stat": (mtime, size), "data": OrderedDict, "names": list}
+        """
+        filepath = os.path.normpath(filepath)
+        entry = self._entries.get(filepath)
+
+        # watched, and unchanged
+        if entry and filepath not in self._stale_filepaths and self.__isWatched(filepath):
+            return self.__updateRefs(filepath, entry)
+
+        # check if changed
+        stat = PiPFileRegistry.getStat(filepath)
+        self._stale_filepaths.discard(filepath)
+        if entry and entry["stat"] == stat:
+            return self.__updateRefs(filepath, entry)
+
+        # parse
+        data = getJSONData(filepath)
+        if data is None:
+            data = OrderedDict()
+        self._parses += 1
+
+        # resolve PiPWidgets stored in their own files
+        refs = {}
+        for pip_name, pip_data in data.items():
+            if isinstance(pip_data, dict) and PiPFileRegistry.REF_KEY in pip_data:
+                refs[pip_name] = os.path.join(os.path.dirname(filepath), pip_data[PiPFileRegistry.REF_KEY])
+        if refs:
+            data = OrderedDict(
+                (pip_name, self.data(refs[pip_name]) if pip_name in refs else pip_data)
+                for pip_name, pip_data in data.items())
+
+        constructor_code_cache.precompile(data)
+        return self.setData(filepath, data, stat=stat, refs=refs)
+
+    def __updateRefs(self, filepath, entry):
+        """ Updates the data of the PiPWidgets stored in their own files, if any of those files have changed
+
+        Args:
+            filepath (str): path on disk to PiP file
+            entry (dict): current entry of the PiP file
+
+        Returns (dict): entry of the PiP file
+        """
+        refs = entry["refs"]
+        if all(self.data(ref_filepath) is entry["data"][pip_name] for pip_name, ref_filepath in refs.items()):
+            return entry
+
+        data = OrderedDict(
+            (pip_name, self.data(refs[pip_name]) if pip_name in refs else pip_data)
+            for pip_name, pip_data in entry["data"].items())
+        constructor_code_cache.precompile(data)
+        return self.setData(filepath, data, stat=entry["stat"], refs=refs)
+
+    def data(self, filepath):
+        """
+        Args:
+            filepath (str): path on disk to PiP file
+
+        Returns (OrderedDict): PiPData of the file
+            {"PiPName": {"widgets": {...}, "settings": {...}}}
+        """
+        return self.entry(filepath)["data"]
+
+    def names(self, filepath):
+        """
+        Args:
+            filepath (str): path on disk to PiP file
+
+        Returns (list): of the names of all of the PiPWidgets in the file
+        """
+        return self.entry(filepath)["names"]
+
+    def setData(self, filepath, data, stat=None, refs=None):
+        """
+        Stores the data provided as the current data of the PiP file.  This should
+        be called after writing the data to disk, so that it is not parsed again.
+
+        Args:
+            filepath (str): path on disk to PiP file
+            data (dict): PiPData that is currently on disk
+            stat (tuple): of (mtime, size) of the file when the data was read / written.
+                If not provided, this will be read from disk
+            refs (dict): of {PiPName(str): filepath(str)} of the PiPWidgets in the data
+                that are stored in their own files
+
+        Returns (dict): entry of the PiP file
+        """
+        filepath = os.path.normpath(filepath)
+        if stat is None:
+            stat = PiPFileRegistry.getStat(filepath)
+        entry = {"stat": stat, "data": data, "names": list(data.keys()), "refs": refs or {}}
+        self._entries[filepath] = entry
+        self._stale_filepaths.discard(filepath)
+        self.__watch(filepath)
+        return entry
+
+    def invalidate(self, filepath):
+        """
+        Marks the PiP file provided as changed, so that it is checked on the next lookup
+
+        Args:
+            filepath (str): path on disk to PiP file
+        """
+        self._stale_filepaths.add(os.path.normpath(filepath))
+
+    def remove(self, filepath):
+        """
+        Removes the entry of the PiP file provided
+
+        Args:
+            filepath (str): path on disk to PiP file
+        """
+        filepath = os.path.normpath(filepath)
+        self._entries.pop(filepath, None)
+        self._stale_filepaths.discard(filepath)
+        if self.__isWatched(filepath):
+            self._watcher.removePath(filepath)
+            self._watched_filepaths.discard(filepath)
+
+    def clear(self):
+        """ Clears all of the entries"""
+        if self._watcher and self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+        self._entries = {}
+        self._stale_filepaths = set()
+        self._watched_filepaths = set()
+
+    """ WATCHER """
+    def __watch(self, filepath):
+        watcher = self.watcher()
+        if watcher and filepath not in self._watched_filepaths and os.path.exists(filepath):
+            watcher.addPath(filepath)
+            self._watched_filepaths.add(filepath)
+
+    def __isWatched(self, filepath):
+        return filepath in self._watched_filepaths
+
+    def __fileChanged(self, filepath):
+        """ When a file has changed on disk, it is marked as stale, and
+        re-watched, as saving by replacing the file will remove it from the watcher"""
+        filepath = os.path.normpath(filepath)
+        self.invalidate(filepath)
+        if filepath not in self._watcher.files():
+            self._watched_filepaths.discard(filepath)
+        if filepath in self._entries:
+            self.__watch(filepath)
+
+    def watcher(self):
+        """
+        Returns (QFileSystemWatcher): or None if there is no QApplication to run it
+        """
+        if self._watcher is None and QApplication.instance():
+            self._watcher = QFileSystemWatcher()
+            self._watcher.fileChanged.connect(self.__fileChanged)
+        return self._watcher
+
+    """ PROPERTIES """
+    def entries(self):
+        return self._entries
+
+    @property
+    def parses(self):
+        return self._parses
+
+
+pip_file_registry = PiPFileRegistry()
+
+
+class PiPFileWriter(object):
+    """
+    Writes changes to the PiP files.
+
+    Changes to a PiP file are stored in the pip_file_registry as soon as they are
+    made, and are written to disk in one batch once no more changes have been made
+    for the delay provided.  Only the PiPWidgets that have changed are serialized,
+    the PiPWidgets that have not changed are reused from the last time that the file
+    was written.  Files are written to a temp file which then replaces the PiP file,
+    so that a PiP file is never left partially written.
+
+    If is_split is enabled, every PiPWidget is stored in its own file, in the
+    directory "<PiP file>.d", and the PiP file only holds the order of the PiPWidgets,
+    and the references to their files.  Saving a PiPWidget then only writes that
+    PiPWidgets file, and the PiP file.
+
+    Attributes:
+        delay (int): in milliseconds to wait after the last change, before writing
+            the changes to disk
+        dirty (dict): of {filepath(str): set(PiPName(str))} of the PiPWidgets that have
+            changed since the PiP file was last written.  A PiP file with no changed
+            PiPWidgets has still had PiPWidgets removed, or reordered.
+        fragments (dict): of {filepath(str): {PiPName(str): (PiPData, JSON(str))}} the
+            serialized PiPWidgets from the last time the PiP file was written
+        is_split (bool): determines if every PiPWidget should be stored in its own file
+        pending (dict): of {filepath(str): PiPData} of the PiP files that need to be written
+        timer (QTimer): that will write the changes once the delay has passed
+    """
+    SPLIT_DIR_SUFFIX = ".d"
+
+    def __init__(self, delay=500, is_split=False):
+        self._delay = delay
+        self._dirty = {}
+        self._fragments = {}
+        self._is_split = is_split
+        self._pending = OrderedDict()
+        self._timer = None
+
+        atexit.register(self.flush)
+
+    """ CHANGES """
+    def data(self, filepath):
+        """
+        Returns the current data of the PiP file provided, including any changes
+        that have not been written yet.
+
+        Args:
+            filepath (str): path on disk to PiP file
+
+        Returns (OrderedDict): PiPData
+        """
+        filepath = os.path.normpath(filepath)
+        if filepath in self._pending:
+            return self._pending[filepath]
+        if os.path.exists(filepath):
+            return pip_file_registry.data(filepath)
+        return OrderedDict()
+
+    def setData(self, filepath, data):
+        """
+        Sets the data of the entire PiP file provided.  Only the PiPWidgets
+        that are different to the current data will be serialized.
+
+        Args:
+            filepath (str): path on disk to PiP file
+            data (dict): PiPData
+        """
+        current_data = self.data(filepath)
+        data = OrderedDict(data)
+        dirty = []
+        for pip_name, pip_data in data.items():
+            current_pip_data = current_data.get(pip_name)
+            if pip_data is current_pip_data:
+                continue
+
+            # PiPWidgets that are unchanged keep the current data, so that their serialized fragment is reused
+            if pip_data == current_pip_data:
+                data[pip_name] = current_pip_data
+            else:
+                dirty.append(pip_name)
+        self.__setPending(filepath, data, dirty)
+
+    def setEntry(self, filepath, pip_name, pip_data):
+        """
+        Sets the data of a single PiPWidget in the PiP file provided.  If the
+        PiPWidget does not exist, it is added to the end of the PiP file.
+
+        Args:
+            filepath (str): path on disk to PiP file
+            pip_name (str): name of PiPWidget
+            pip_data (dict): {"widgets": {...}, "settings": {...}}
+        """
+        data = OrderedDict(self.data(filepath))
+        data[pip_name] = pip_data
+        self.__setPending(filepath, data, [pip_name])
+
+    def removeEntry(self, filepath, pip_name):
+        """
+        Removes a single PiPWidget from the PiP file provided
+
+        Args:
+            filepath (str): path on disk to PiP file
+            pip_name (str): name of PiPWidget
+        """
+        data = OrderedDict(self.data(filepath))
+        data.pop(pip_name, None)
+        self.__setPending(filepath, data, [])
+
+    def __setPending(self, filepath, data, dirty):
+        """ Stores the changed data, and queues it to be written"""
+        filepath = os.path.normpath(filepath)
+        self._pending[filepath] = data
+        self._dirty.setdefault(filepath, set()).update(dirty)
+        pip_file_registry.setData(filepath, data)
+
+        # write
+        timer = self.timer()
+        if timer:
+            timer.start(self.delay())
+        else:
+            self.flush()
+
+    """ WRITE """
+    def flush(self, filepath=None):
+        """
+        Writes all of the pending changes to disk
+
+        Args:
+            filepath (str): path on disk to PiP file to write.  If not provided, all
+                of the PiP files with changes will be written.
+        """
+        if filepath:
+            filepaths = [os.path.normpath(filepath)]
+        else:
+            filepaths = list(self._pending.keys())
+            if self._timer:
+                self._timer.stop()
+
+        for filepath in filepaths:
+            if filepath not in self._pending:
+                continue
+            data = self._pending.pop(filepath)
+            dirty = self._dirty.pop(filepath, set())
+            if self.isSplit():
+                refs = self.__writeSplit(filepath, data, dirty)
+            else:
+                refs = self.__write(filepath, data, dirty)
+            pip_file_registry.setData(filepath, data, refs=refs)
+
+    def __write(self, filepath, data, dirty):
+        """ Writes the PiP file with all of the PiPWidgets in it
+
+        Returns (dict): of {PiPName(str): filepath(str)} of the PiPWidgets stored in their own files"""
+        fragments = self._fragments.setdefault(filepath, {})
+        for pip_name in list(fragments.keys()):
+            if pip_name not in data:
+                del fragments[pip_name]
+
+        # serialize changed PiPWidgets
+        text = []
+        for pip_name, pip_data in data.items():
+            fragment = fragments.get(pip_name)
+            if pip_name in dirty or fragment is None or fragment[0] is not pip_data:
+                fragment = (pip_data, json.dumps(pip_data))
+                fragments[pip_name] = fragment
+            text.append("{pip_name}: {pip_data}".format(pip_name=json.dumps(pip_name), pip_data=fragment[1]))
+
+        PiPFileWriter.writeFile(filepath, "{" + ", ".join(text) + "}")
+        self.__removeSplitFiles(filepath, {})
+        return {}
+
+    def __writeSplit(self, filepath, data, dirty):
+        """ Writes the changed PiPWidgets to their own files, and the PiP file with the references to them
+
+        Returns (dict): of {PiPName(str): filepath(str)} of the PiPWidgets stored in their own files"""
+        self._fragments.pop(filepath, None)
+        split_dir = self.splitDir(filepath)
+        split_dir_name = os.path.basename(split_dir)
+        refs = {}
+        index = OrderedDict()
+        for pip_name, pip_data in data.items():
+            ref_filename = "{key}.json".format(key=ConstructorCodeCache.getKey(pip_name))
+            ref_filepath = os.path.join(split_dir, ref_filename)
+            refs[pip_name] = ref_filepath
+            index[pip_name] = {PiPFileRegistry.REF_KEY: os.path.join(split_dir_name, ref_filename)}
+
+            # write changed PiPWidgets
+            entry = pip_file_registry.entries().get(ref_filepath)
+            if pip_name in dirty or not entry or entry["data"] is not pip_data:
+                os.makedirs(split_dir, exist_ok=True)
+                PiPFileWriter.writeFile(ref_filepath, json.dumps(pip_data))
+                pip_file_registry.setData(ref_filepath, pip_data)
+
+        PiPFileWriter.writeFile(filepath, json.dumps(index))
+        self.__removeSplitFiles(filepath, refs)
+        return refs
+
+    def __removeSplitFiles(self, filepath, refs):
+        """ Removes the files of the PiPWidgets that are no longer stored in their own files"""
+        split_dir = self.splitDir(filepath)
+        if not os.path.isdir(split_dir):
+            return
+
+        ref_filepaths = set(refs.values())
+        for filename in os.listdir(split_dir):
+            ref_filepath = os.path.join(split_dir, filename)
+            if filename.endswith(".json") and ref_filepath not in ref_filepaths:
+                pip_file_registry.remove(ref_filepath)
+                try:
+                    os.remove(ref_filepath)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def writeFile(filepath, text):
+        """
+        Writes the text provided to a temp file, which then replaces the file provided
+
+        Args:
+            filepath (str): path on disk to write to
+            text (str): to be written
+        """
+        temp_filepath = "{filepath}.{pid}.tmp".format(filepath=filepath, pid=os.getpid())
+        try:
+            with open(temp_filepath, "w") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_filepath, filepath)
+        except OSError:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+            raise
+
+    """ PROPERTIES """
+    def delay(self):
+        return self._delay
+
+    def setDelay(self, delay):
+        self._delay = delay
+
+    def dirty(self):
+        return self._dirty
+
+    def fragments(self):
+        return self._fragments
+
+    def isSplit(self):
+        return self._is_split
+
+    def setIsSplit(self, is_split):
+        self._is_split = is_split
+
+    def pending(self):
+        return self._pending
+
+    def splitDir(self, filepath):
+        """
+        Returns (str): path on disk to the directory that holds the PiPWidgets of the PiP
+            file provided, when each PiPWidget is stored in its own file
+        """
+        return os.path.normpath(filepath) + PiPFileWriter.SPLIT_DIR_SUFFIX
+
+    def timer(self):
+        """
+        Returns (QTimer): or None if there is no QApplication to run it, in which
+            case changes are written immediately
+        """
+        if self._timer is None and QApplication.instance():
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.flush)
+        return self._timer
+
+
+pip_file_writer = PiPFileWriter()
+
+
 class AbstractPopupBarWidget(AbstractSplitterWidget):
     """
     Widget that contains all of the PiPWidgets.
@@ -117,6 +957,8 @@ class AbstractPopupBarWidget(AbstractSplitterWidget):
         self._display_mode = AbstractPopupBarDisplayWidget.STANDALONETASKBAR
         self._current_widget = None
         self._enlarged_widget = None
+        self._batch_update_depth = 0
+        self._batch_update_start = None
         # self._is_popup_enabled = False
 
         self.__createSpacerWidget()
@@ -322,11 +1164,60 @@ class AbstractPopupBarWidget(AbstractSplitterWidget):
         sizes = [1 for widget in self.widgets()]
         self.setSizes(sizes)
 
-    def updateWidgetIndexes(self):
-        """ Updates all of the widget indexes to their current position """
+    @contextmanager
+    def batchUpdate(self):
+        """ Context manager which defers updating the widget indexes until it exits
+
+        Inside of a batch update, updateWidgetIndexes() only stores the lowest
+        index that has changed, and the indexes are updated once, from that index,
+        when the outermost batch update exits.
+
+            with popup_bar_widget.batchUpdate():
+                for widget in widgets:
+                    popup_bar_widget.createNewWidget(widget)
+        """
+        self._batch_update_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_update_depth -= 1
+            if self._batch_update_depth == 0 and self._batch_update_start is not None:
+                start = self._batch_update_start
+                self._batch_update_start = None
+                self.updateWidgetIndexes(start=start)
+
+    def updateWidgetIndexes(self, start=0, end=None):
+        """ Updates the widget indexes to their current position
+
+        Args:
+            start (int): first index to update, the widgets before this
+                index are assumed to be unchanged
+            end (int): last index to update, if None, this will update
+                all of the widgets after the start index
+        """
+        # defer to end of batch
+        if self._batch_update_depth:
+            if self._batch_update_start is None or start < self._batch_update_start:
+                self._batch_update_start = start
+            return
+
+        # the spacer widget holds a position in the splitter, but does not have an index
+        spacer_position = self.indexOf(self.spacerWidget())
+        if end is None:
+            end = self.count()
+
         # update indexes
-        for i, widget in enumerate(self.widgets()):
-            widget.setIndex(i)
+        position = start
+        if 0 <= spacer_position <= start:
+            position += 1
+        index = start
+        while position < self.count() and index <= end:
+            widget = self.widget(position)
+            if isinstance(widget, AbstractPopupBarItemWidget):
+                if widget.index() != index:
+                    widget.setIndex(index)
+                index += 1
+            position += 1
 
     def settings(self):
         """ returns a dict of the current settings which can be set with updateSettings()"""
@@ -735,6 +1626,9 @@ class AbstractPopupBarWidget(AbstractSplitterWidget):
         if self.widget(widget.index()) == self.spacerWidget(): return
         if self.widget(widget.index()).parent() == self.spacerWidget().parent(): return
 
+        # create deferred widget
+        widget.instantiate()
+
         # make sure meta data has been cleared
         if self.enlargedWidget():
             self.enlargedWidget().clearMask()
@@ -900,6 +1794,7 @@ class AbstractPopupBarWidget(AbstractSplitterWidget):
         self.setIsFrozen(True)
         widget_under_cursor = getWidgetUnderCursor()
         _enlarged_widget = self.enlargedWidget()
+        _enlarged_widget.updateSnapshot()
         _enlarged_widget.delegateWidget().setProperty("is_enlarged_widget", False)
         self.removePinningToggleButton(_enlarged_widget)
         _enlarged_widget.setIsEnlargedWidget(False)
@@ -974,6 +1869,9 @@ class AbstractPopupBarWidget(AbstractSplitterWidget):
 
         runDelayedEvent(self, self.unfreeze, delay_amount=10)
 
+        # freeze deferred widgets
+        popup_bar_snapshot_cache.freezeIdleWidgets()
+
     def unfreeze(self):
         self.setIsFrozen(False)
 
@@ -1017,7 +1915,10 @@ class AbstractPopupBarWidget(AbstractSplitterWidget):
 
         self.insertWidget(index, mini_widget)
 
-        self.updateWidgetIndexes()
+        # widgets inserted out of range are appended
+        if not 0 <= index < self.count():
+            index = 0
+        self.updateWidgetIndexes(start=index)
         return mini_widget
 
     def insertWidget(self, index, widget, name=""):
@@ -1081,6 +1982,11 @@ class AbstractPopupBarItemWidget(AbstractOverlayInputWidget):
                 as the current PiPWidget json file
         index (int): current index in model
         item (AbstractPopupBarWidgetOrganizerItem)
+        constructor_code (str): code used to create the delegate widget.  This is only set
+            if the delegate widget is deferred, by providing an AbstractPopupBarSnapshotWidget
+            as the delegate_widget
+        constructor_widget (QWidget): widget that will create the delegate widget from the
+            constructor code.  This is imported as the local var "self" in the constructor code.
     """
     def __init__(
         self,
@@ -1104,6 +2010,13 @@ class AbstractPopupBarItemWidget(AbstractOverlayInputWidget):
         self._overlay_image = ""
         self._index = 0
         self._direction = direction
+        self._constructor_code = None
+        self._constructor_widget = None
+
+        # setup deferred widget
+        if isinstance(delegate_widget, AbstractPopupBarSnapshotWidget):
+            self._constructor_code = delegate_widget.constructorCode()
+            self._constructor_widget = delegate_widget.constructorWidget()
 
         # create delegate widget
         delegate_widget = AbstractLabelledInputWidget(
@@ -1263,6 +2176,90 @@ class AbstractPopupBarItemWidget(AbstractOverlayInputWidget):
                     image_path = os.environ[envar] + image_path[image_path.index("/"):]
         self.setImage(image_path)
 
+    """ DEFERRED """
+    def constructorCode(self):
+        return self._constructor_code
+
+    def constructorWidget(self):
+        return self._constructor_widget
+
+    def isDeferred(self):
+        """ Determines if the delegate widget is created from constructor code on demand"""
+        return self._constructor_code is not None
+
+    def isInstantiated(self):
+        """ Determines if the delegate widget has been created, or if a snapshot is being displayed"""
+        return not isinstance(self.popupWidget(), AbstractPopupBarSnapshotWidget)
+
+    def snapshotKey(self):
+        return PopupBarSnapshotCache.getKey(self.name(), self.constructorCode())
+
+    def updateSnapshot(self):
+        """ Stores a snapshot of the delegate widget, if it is deferred and currently visible"""
+        if not self.isDeferred(): return
+        if not self.isInstantiated(): return
+        if not self.popupWidget().isVisible(): return
+
+        popup_bar_snapshot_cache.setSnapshot(self.snapshotKey(), self.popupWidget().grab())
+
+    def instantiate(self):
+        """ Creates the delegate widget from the constructor code, if it is deferred
+
+        Returns (QWidget): delegate widget"""
+        if self.isInstantiated():
+            if self.isDeferred():
+                popup_bar_snapshot_cache.touchLiveWidget(self)
+            return self.popupWidget()
+
+        # create widget
+        widget = self.constructorWidget().createWidgetFromConstructorCode(self.constructorCode())
+        from .AbstractPopupBarOrganizerWidget import AbstractPopupBarOrganizerWidget
+        if isinstance(widget, AbstractPopupBarOrganizerWidget) or isinstance(widget, AbstractPiPDisplayWidget):
+            widget.setIsPopupBarWidget(True)
+        self.__setPopupWidget(widget)
+
+        # update budget
+        popup_bar_snapshot_cache.touchLiveWidget(self)
+        popup_bar_snapshot_cache.freezeIdleWidgets()
+        return widget
+
+    def freeze(self):
+        """ Replaces the delegate widget with a snapshot of it, if it is deferred and idle
+
+        Returns (bool): if the widget was frozen"""
+        if not self.isDeferred(): return False
+        if not self.isInstantiated(): return False
+        if self.isCurrentWidget() or self.isEnlargedWidget() or self.isPinned(): return False
+
+        self.updateSnapshot()
+        widget = self.popupWidget()
+        self.__setPopupWidget(AbstractPopupBarSnapshotWidget(
+            constructor_code=self.constructorCode(), constructor_widget=self.constructorWidget(), name=self.name()))
+        widget.deleteLater()
+
+        popup_bar_snapshot_cache.removeLiveWidget(self)
+        return True
+
+    def __setPopupWidget(self, widget):
+        """ Swaps the delegate widget, and installs the drag patches from the popup bar
+
+        Args:
+            widget (QWidget):"""
+        old_widget = self.popupWidget()
+        self.delegateWidget().setDelegateWidget(widget)
+        if isinstance(old_widget, AbstractPopupBarSnapshotWidget):
+            old_widget.deleteLater()
+
+        # install drag patches
+        popup_bar_widget = getWidgetAncestor(self, AbstractPopupBarWidget)
+        if not popup_bar_widget:
+            pip_display_widget = getWidgetAncestor(self, AbstractPiPDisplayWidget)
+            if pip_display_widget:
+                popup_bar_widget = pip_display_widget.popupBarWidget()
+        if popup_bar_widget:
+            popup_bar_widget.installDragEnterMonkeyPatch(widget)
+            popup_bar_widget.installDragMoveMonkeyPatch(widget)
+
     """ UTILS """
 
     # todo update ellipse popup
@@ -1311,6 +2308,56 @@ class AbstractPopupBarItemWidget(AbstractOverlayInputWidget):
         self.setMask(region)
 
 
+class AbstractPopupBarSnapshotWidget(QLabel):
+    """
+    Placeholder for a deferred widget, that will be created from its constructor code
+    when the AbstractPopupBarItemWidget that holds it is enlarged, or set as the current widget.
+
+    This displays the last snapshot of the widget from the popup_bar_snapshot_cache, or
+    the name of the widget if no snapshot has been taken yet.
+
+    Args:
+        constructor_code (str): code to create the widget with
+        constructor_widget (QWidget): widget that will create the widget from the constructor code.
+            This needs to have a createWidgetFromConstructorCode method.
+        name (str): name of widget
+    """
+    def __init__(self, parent=None, constructor_code="", constructor_widget=None, name=""):
+        super(AbstractPopupBarSnapshotWidget, self).__init__(name, parent)
+        self._constructor_code = constructor_code
+        self._constructor_widget = constructor_widget
+        self._snapshot = popup_bar_snapshot_cache.snapshot(PopupBarSnapshotCache.getKey(name, constructor_code))
+        self.setAlignment(Qt.AlignCenter)
+
+    def constructorCode(self):
+        return self._constructor_code
+
+    def constructorWidget(self):
+        return self._constructor_widget
+
+    def snapshot(self):
+        return self._snapshot
+
+    def setSnapshot(self, snapshot):
+        self._snapshot = snapshot
+        self.update()
+
+    def paintEvent(self, event):
+        """ Draws the snapshot, scaled to fit the widget.
+
+        This is drawn instead of setting the pixmap, so that the size of the
+        snapshot does not change the size hint of the label."""
+        if not self.snapshot():
+            return QLabel.paintEvent(self, event)
+
+        snapshot = self.snapshot().scaled(self.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+        painter = QPainter(self)
+        painter.drawPixmap(
+            int((self.width() - snapshot.width()) * 0.5),
+            int((self.height() - snapshot.height()) * 0.5),
+            snapshot)
+
+
 class AbstractPopupBarDisplayWidget(QWidget):
     """ Abstract class for displaying all PopupWidget types (PIP | PIPTASKBAR | TASKBAR)
 
@@ -1452,7 +2499,7 @@ class AbstractPopupBarDisplayWidget(QWidget):
         loc = {}
         loc['self'] = self
 
-        exec(compile(constructor_code, "constructor_code", "exec"), globals(), loc)
+        exec(constructor_code_cache.compile(constructor_code), globals(), loc)
         widget = loc['widget']
         return widget
 
@@ -1476,15 +2523,18 @@ class AbstractPopupBarDisplayWidget(QWidget):
             return self.displayWidget().createNewWidget(widget, name=name, resize_popup_bar=resize_popup_bar)
 
     """ LOAD (file)"""
-    def loadPopupDisplayFromFile(self, filepath, pip_name, organizer=False):
+    def loadPopupDisplayFromFile(self, filepath, pip_name, organizer=False, deferred=False):
         """ Loads the PiPWidget from the file/name provided
 
         Args:
             filepath (str): path on disk to pipfile to load
             pip_name (str): name of pip in filepath to load
             organizer (bool): determines if this is loading from the organizer widget
+            deferred (bool): determines if the widgets should be displayed as snapshots,
+                and only be created when they are enlarged, or set as the current widget
         """
-        data = getJSONData(filepath)[pip_name]
+        pip_data = pip_file_registry.data(filepath)
+        data = pip_data[pip_name]
 
         display_mode = data["settings"]["Display Mode"]
         self.setPiPName(pip_name)
@@ -1494,22 +2544,24 @@ class AbstractPopupBarDisplayWidget(QWidget):
         self.removeAllWidgets()
         # load stand alone taskbar
         if display_mode == AbstractPopupBarDisplayWidget.STANDALONETASKBAR:
-            self.__loadStandaloneTaskbar(data, organizer=organizer)
+            self.__loadStandaloneTaskbar(data, organizer=organizer, deferred=deferred)
 
         # load pip/piptaskbar
         elif display_mode in AbstractPopupBarDisplayWidget.PIPDISPLAYS:
-            self.__loadPiPWidget(filepath, pip_name, organizer=organizer)
+            self.__loadPiPWidget(filepath, pip_name, organizer=organizer, deferred=deferred)
 
         # load settings
         self.popupBarWidget().updateSettings(data["settings"])
 
-    def __loadStandaloneTaskbar(self, data, organizer=False):
+    def __loadStandaloneTaskbar(self, data, organizer=False, deferred=False):
         """ Loads a standalone taskbar from the data provided
 
         Args:
             data (dict): An individual PopupBar widgets data located in the
                 JSON file.
-                    ie: getJSONData(filepath)[pip_name]"""
+                    ie: getJSONData(filepath)[pip_name]
+            organizer (bool): determines if this is loading from the organizer widget
+            deferred (bool): determines if the widgets should be created when they are enlarged"""
 
         # clear popupbar organizer
         if organizer:
@@ -1519,30 +2571,33 @@ class AbstractPopupBarDisplayWidget(QWidget):
 
         # load widgets
         reversed_widgets = OrderedDict(reversed(list(data["widgets"].items())))
+        new_items = []
 
-        for widget_name, widget_data in reversed_widgets.items():
-            widget = self.createWidgetFromConstructorCode(widget_data["code"])
-            widget = self.addWidget(widget, name=widget_name)
-            widget.setTitle(widget_data["Overlay Text"])
-            widget.setOverlayImage(widget_data["Overlay Image"])
-
-            # create popup bar items
-            if organizer:
-                from .AbstractPopupBarOrganizerWidget import AbstractPopupBarOrganizerWidget
-                organizer_widget = getWidgetAncestor(self, AbstractPopupBarOrganizerWidget)
-                index = organizer_widget.popupBarOrganizerWidget().model().insertNewIndex(0, name=widget_name)
-
-                item = index.internalPointer()
-                item.setWidget(widget)
-                item.setConstructorCode(widget_data["code"])
+        with self.popupBarWidget().batchUpdate():
+            for widget_name, widget_data in reversed_widgets.items():
+                if deferred:
+                    widget = AbstractPopupBarSnapshotWidget(
+                        constructor_code=widget_data["code"], constructor_widget=self, name=widget_name)
+                else:
+                    widget = self.createWidgetFromConstructorCode(widget_data["code"])
+                widget = self.addWidget(widget, name=widget_name)
+                widget.setTitle(widget_data["Overlay Text"])
+                widget.setOverlayImage(widget_data["Overlay Image"])
 
-                # widget.setIndex(0)
-                widget.setItem(item)
+                # create popup bar items
+                if organizer:
+                    item = organizer_widget.popupBarOrganizerWidget().model().createNewItemFromData(
+                        {"name": widget_name})
+                    item.setWidget(widget)
+                    item.setConstructorCode(widget_data["code"])
+                    widget.setItem(item)
+                    new_items.append(item)
 
-                # update indexes
-                organizer_widget.popupBarWidget().updateWidgetIndexes()
+        # insert all popup bar items in one batch, each widget was inserted at the front
+        if organizer:
+            organizer_widget.popupBarOrganizerWidget().model().insertItems(0, list(reversed(new_items)))
 
-    def __loadPiPWidget(self, filepath, pip_name, organizer=False):
+    def __loadPiPWidget(self, filepath, pip_name, organizer=False, deferred=False):
         """ Loads a PiP Widget from the data provided
 
         Args:
@@ -1551,8 +2606,10 @@ class AbstractPopupBarDisplayWidget(QWidget):
                     ie: getJSONData(filepath)[pip_name]
             filepath (str): path on disk to JSON file
             pip_name (str: name of PiPWidget to load
-            organizer (bool): determines if this is loading from the organizer widget"""
-        self.displayWidget().loadPiPWidgetFromFile(filepath, pip_name, organizer=organizer)
+            organizer (bool): determines if this is loading from the organizer widget
+            deferred (bool): determines if the widgets should be created when they are enlarged,
+                or set as the current widget"""
+        self.displayWidget().loadPiPWidgetFromFile(filepath, pip_name, organizer=organizer, deferred=deferred)
 
     """ PROPERTIES"""
     def direction(self):
@@ -2021,22 +3078,27 @@ class AbstractPiPDisplayWidget(QWidget):
         loc = {}
         loc['self'] = self
 
-        exec(compile(constructor_code, "constructor_code", "exec"), globals(), loc)
+        exec(constructor_code_cache.compile(constructor_code), globals(), loc)
         widget = loc['widget']
         return widget
 
-    def createNewWidgetFromConstructorCode(self, constructor_code, name="", resize_popup_bar=True):
+    def createNewWidgetFromConstructorCode(self, constructor_code, name="", resize_popup_bar=True, deferred=False):
         """
         Retuns a QWidget from the constructor code provided.
 
         The widget returned will be the variable "widget" from the constructor code
         Args:
             constructor_code (code):
+            deferred (bool): if True, a snapshot of the widget will be displayed,
+                and the widget will only be created when it is enlarged, or set as the current widget
 
         Returns (AbstractPopupBarItemWidget):
         """
-
-        widget = self.createWidgetFromConstructorCode(constructor_code)
+        if deferred:
+            widget = AbstractPopupBarSnapshotWidget(
+                constructor_code=constructor_code, constructor_widget=self, name=name)
+        else:
+            widget = self.createWidgetFromConstructorCode(constructor_code)
         popup_bar_widget = self.createNewWidget(widget, name, resize_popup_bar)
         return popup_bar_widget
 
@@ -2080,9 +3142,7 @@ class AbstractPiPDisplayWidget(QWidget):
         if resize_popup_bar:
             self.resizePopupBar()
 
-        # update indexes
-        self.popupBarWidget().updateWidgetIndexes()
-
+        # indexes are updated by the popup bar when a mini viewer widget is created
         return popup_bar_widget
 
     def addWidget(self, widget, resize_popup_bar=True):
@@ -2116,17 +3176,19 @@ class AbstractPiPDisplayWidget(QWidget):
             self.mainViewerWidget().widget().setParent(None)
         self.popupBarWidget().removeAllWidgets()
 
-    def loadPiPWidgetFromFile(self, filepath, pip_name, organizer=False):
+    def loadPiPWidgetFromFile(self, filepath, pip_name, organizer=False, deferred=False):
         """ Loads the PiPWidget from the file/name provided
 
         Args:
             filepath (str): path on disk to pipfile to load
             pip_name (str): name of pip in filepath to load
             organizer (bool): determines if this is loading from the organizer widget
+            deferred (bool): determines if the widgets should be displayed as snapshots,
+                and only be created when they are enlarged, or set as the current widget
         """
         # load json data
         self._filepath = filepath
-        data = getJSONData(filepath)
+        data = pip_file_registry.data(filepath)
         self.popupBarWidget().setFilepath(filepath)
         # preflight
         if not pip_name in data.keys():
@@ -2137,15 +3199,19 @@ class AbstractPiPDisplayWidget(QWidget):
         self.loadPiPWidgetFromData(
             data[pip_name]["widgets"],
             data[pip_name]["settings"],
-            organizer=organizer)
+            organizer=organizer,
+            deferred=deferred)
 
-    def loadPiPWidgetFromData(self, widgets, settings, organizer=False):
+    def loadPiPWidgetFromData(self, widgets, settings, organizer=False, deferred=False):
         """ Loads the PiPWidget from the data provided.
 
         Args:
             widgets (dict): of {widget_name(str): constructor_code(str)}
             settings (dict): of {setting (str): value}
             organizer (bool): determines if this is loading from the organizer widget
+            deferred (bool): determines if the widgets should be displayed as snapshots,
+                and only be created when they are enlarged, or set as the current widget.
+                The current widget is always created.
         """
         reversed_widgets = OrderedDict(reversed(list(widgets.items())))
 
@@ -2165,20 +3231,24 @@ class AbstractPiPDisplayWidget(QWidget):
 
         # populate pip view
         # load widgets
-        for widget_name, widget_data in reversed_widgets.items():
-            constructor_code = widget_data["code"]
-            if organizer:
-                from .AbstractPopupBarOrganizerWidget import AbstractPopupBarOrganizerWidget
-                organizer_widget = getWidgetAncestor(self, AbstractPopupBarOrganizerWidget)
-                index = organizer_widget.createNewWidgetFromConstructorCode(
-                    constructor_code, name=widget_name, resize_popup_bar=False)
-                widget = index.internalPointer().widget()
-            else:
-                widget = self.createNewWidgetFromConstructorCode(
-                    constructor_code, name=widget_name, resize_popup_bar=False)
-
-            # update widget overlay text/image if set in Taskbar mode
-            if settings["Display Mode"] in AbstractPopupBarDisplayWidget.TASKBARS:
+        if organizer:
+            from .AbstractPopupBarOrganizerWidget import AbstractPopupBarOrganizerWidget
+            organizer_widget = getWidgetAncestor(self, AbstractPopupBarOrganizerWidget)
+            indexes = organizer_widget.createNewWidgetsFromConstructorCode(
+                [(widget_name, widget_data["code"]) for widget_name, widget_data in reversed_widgets.items()],
+                resize_popup_bar=False,
+                deferred=deferred)
+            new_widgets = [index.internalPointer().widget() for index in indexes]
+        else:
+            with self.popupBarWidget().batchUpdate():
+                new_widgets = [
+                    self.createNewWidgetFromConstructorCode(
+                        widget_data["code"], name=widget_name, resize_popup_bar=False, deferred=deferred)
+                    for widget_name, widget_data in reversed_widgets.items()]
+
+        # update widget overlay text/image if set in Taskbar mode
+        if settings["Display Mode"] in AbstractPopupBarDisplayWidget.TASKBARS:
+            for widget, widget_data in zip(new_widgets, reversed_widgets.values()):
                 widget.setTitle(widget_data["Overlay Text"])
                 widget.setOverlayImage(widget_data["Overlay Image"])
 
@@ -2217,6 +3287,9 @@ class AbstractPiPDisplayWidget(QWidget):
         Args:
             widget (QPopupBarWidget): widget to be set as full screen
         """
+        # create deferred widget
+        widget.instantiate()
+
         # todo multi recursive swapping cleanup
         if widget.isPopupWidget():
             from .AbstractPopupBarOrganizerWidget import AbstractPopupBarOrganizerWidget
@@ -2273,6 +3346,7 @@ class AbstractPiPDisplayWidget(QWidget):
                 self.popupBarWidget().setIsEnlarged(False)
 
             # setup mini viewer widget
+            self._current_widget.updateSnapshot()
             self.popupBarWidget().insertWidget(widget.index(), self._current_widget)
             self._current_widget.setIndex(widget.index())
 
@@ -2304,6 +3378,9 @@ class AbstractPiPDisplayWidget(QWidget):
                 self.previousWidget().setIsOverlayDisplayed(True)
             self.currentWidget().setIsOverlayDisplayed(False)
 
+        # freeze deferred widgets
+        popup_bar_snapshot_cache.freezeIdleWidgets()
+
     def clearCurrentWidget(self):
         self._current_widget = None
 
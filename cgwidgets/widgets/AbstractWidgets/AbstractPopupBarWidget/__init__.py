@@ -1,2 +1,5 @@
 from .AbstractPopupBarOrganizerWidget import AbstractPopupBarOrganizerWidget
-from .AbstractPopupBarWidget import AbstractPopupBarWidget, AbstractPopupBarDisplayWidget, AbstractPopupBarItemWidget
+from .AbstractPopupBarWidget import (
+    AbstractPopupBarWidget, AbstractPopupBarDisplayWidget, AbstractPopupBarItemWidget, AbstractPopupBarSnapshotWidget,
+    ConstructorCodeCache, PiPFileRegistry, PiPFileWriter, PopupBarSnapshotCache, constructor_code_cache,
+    pip_file_registry, pip_file_writer, popup_bar_snapshot_cache)
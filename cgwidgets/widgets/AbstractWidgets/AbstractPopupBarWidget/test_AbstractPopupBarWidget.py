@@ -0,0 +1,415 @@
+import copy
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+from qtpy.QtWidgets import QApplication
+from qtpy.QtGui import QPixmap
+from qtpy.QtTest import QTest
+
+from cgwidgets.widgets import (
+    PiPFileRegistry, PiPFileWriter, pip_file_registry, ConstructorCodeCache, constructor_code_cache, PopupBarDisplayWidget,
+    PopupBarSnapshotCache, popup_bar_snapshot_cache, PopupBarOrganizerWidget)
+
+
+class TestPiPFileWriter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dir, "PiPWidgets.json")
+        self.data = OrderedDict(
+            ("pip{index}".format(index=index), {"widgets": {}, "settings": {"index": index}})
+            for index in range(5))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def countSerializations(self, function):
+        """ Returns (int): number of PiPWidgets serialized when running the function, and flushing the writer"""
+        serialized = []
+        dumps = json.dumps
+
+        def countedDumps(obj, *args, **kwargs):
+            if isinstance(obj, dict) and "settings" in obj:
+                serialized.append(obj)
+            return dumps(obj, *args, **kwargs)
+
+        with mock.patch.object(json, "dumps", countedDumps):
+            function()
+            self.writer.flush()
+        return len(serialized)
+
+    def readFile(self):
+        pip_file_registry.invalidate(self.filepath)
+        return pip_file_registry.data(self.filepath)
+
+    def editedData(self, index):
+        data = copy.deepcopy(self.data)
+        data["pip{index}".format(index=index)]["settings"]["edited"] = True
+        return data
+
+    def writeChanges(self, is_split):
+        self.writer = PiPFileWriter(is_split=is_split)
+        self.assertEqual(self.countSerializations(lambda: self.writer.setData(self.filepath, self.data)), 5)
+
+        # rebuilt data only serializes the PiPWidgets that have changed
+        data = self.editedData(1)
+        self.assertEqual(self.countSerializations(lambda: self.writer.setData(self.filepath, data)), 1)
+        self.assertEqual(self.readFile(), data)
+        self.assertEqual(self.countSerializations(lambda: self.writer.setData(self.filepath, copy.deepcopy(data))), 0)
+
+        # entries
+        pip_data = {"widgets": {}, "settings": {"index": 5}}
+        self.assertEqual(self.countSerializations(lambda: self.writer.setEntry(self.filepath, "pip5", pip_data)), 1)
+        self.assertEqual(self.countSerializations(lambda: self.writer.removeEntry(self.filepath, "pip0")), 0)
+        data.pop("pip0")
+        data["pip5"] = pip_data
+        self.assertEqual(self.readFile(), data)
+        self.assertEqual(list(self.readFile().keys()), ["pip1", "pip2", "pip3", "pip4", "pip5"])
+
+    def test_write(self):
+        self.writeChanges(False)
+        self.assertFalse(os.path.exists(self.writer.splitDir(self.filepath)))
+
+    def test_writeSplit(self):
+        self.writeChanges(True)
+        self.assertEqual(len(os.listdir(self.writer.splitDir(self.filepath))), 5)
+
+    def test_debounce(self):
+        self.writer = PiPFileWriter(delay=10000)
+        self.writer.setData(self.filepath, self.data)
+        self.assertFalse(os.path.exists(self.filepath))
+        self.assertEqual(self.writer.data(self.filepath), self.data)
+        self.writer.flush()
+        self.assertEqual(self.readFile(), self.data)
+
+
+class TestPiPFileRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dir, "PiPWidgets.json")
+        self.registry = PiPFileRegistry()
+
+    def tearDown(self):
+        self.registry.clear()
+        shutil.rmtree(self.dir)
+
+    def writeFile(self, filepath, data):
+        with open(filepath, "w") as f:
+            json.dump(data, f)
+
+    def test_parseOnce(self):
+        self.writeFile(self.filepath, {"b": {"widgets": {}}, "a": {"widgets": {}}})
+        data = self.registry.data(self.filepath)
+        self.assertEqual(self.registry.names(self.filepath), ["b", "a"])
+        self.assertIs(self.registry.data(self.filepath), data)
+        self.assertEqual(self.registry.parses, 1)
+
+        # unchanged files are not parsed again
+        self.registry.invalidate(self.filepath)
+        self.assertIs(self.registry.data(self.filepath), data)
+        self.assertEqual(self.registry.parses, 1)
+
+    def test_fileChanged(self):
+        self.writeFile(self.filepath, {"a": {"widgets": {}}})
+        self.registry.data(self.filepath)
+        self.writeFile(self.filepath, {"a": {"widgets": {}}, "b": {"widgets": {}}})
+        self.registry.invalidate(self.filepath)
+        self.assertEqual(self.registry.names(self.filepath), ["a", "b"])
+        self.assertEqual(self.registry.parses, 2)
+
+    def test_setData(self):
+        data = OrderedDict([("a", {"widgets": {}})])
+        self.writeFile(self.filepath, data)
+        self.registry.setData(self.filepath, data)
+        self.assertIs(self.registry.data(self.filepath), data)
+        self.assertEqual(self.registry.parses, 0)
+
+        self.registry.remove(self.filepath)
+        self.assertEqual(self.registry.data(self.filepath), data)
+        self.assertEqual(self.registry.parses, 1)
+
+    def test_emptyFile(self):
+        self.writeFile(self.filepath, None)
+        self.assertEqual(self.registry.data(self.filepath), OrderedDict())
+        self.assertEqual(self.registry.names(self.filepath), [])
+
+    def test_refs(self):
+        ref_filepath = os.path.join(self.dir, "PiPWidgets", "a.json")
+        os.makedirs(os.path.dirname(ref_filepath))
+        self.writeFile(ref_filepath, {"widgets": {}, "settings": {"index": 0}})
+        self.writeFile(self.filepath, {"a": {PiPFileRegistry.REF_KEY: "PiPWidgets/a.json"}, "b": {"widgets": {}}})
+        self.assertEqual(self.registry.data(self.filepath)["a"], {"widgets": {}, "settings": {"index": 0}})
+        self.assertEqual(self.registry.parses, 2)
+
+        # only the file that has changed is parsed
+        self.writeFile(ref_filepath, {"widgets": {}, "settings": {"index": 10}})
+        self.registry.invalidate(ref_filepath)
+        self.assertEqual(self.registry.data(self.filepath)["a"], {"widgets": {}, "settings": {"index": 10}})
+        self.assertEqual(self.registry.names(self.filepath), ["a", "b"])
+        self.assertEqual(self.registry.parses, 3)
+
+
+class TestConstructorCodeCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.code = "from qtpy.QtWidgets import QLabel\nwidget = QLabel('{name}')"
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_compile(self):
+        cache = ConstructorCodeCache()
+        code = cache.compile(self.code.format(name="a"))
+        self.assertIs(cache.compile(self.code.format(name="a")), code)
+        self.assertIsNot(cache.compile(self.code.format(name="b")), code)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        cache.clear()
+        cache.compile(self.code.format(name="a"))
+        self.assertEqual(cache.misses, 3)
+
+    def test_precompile(self):
+        cache = ConstructorCodeCache()
+        pip_data = {
+            "pip": {"widgets": {
+                "a": {"code": self.code.format(name="a")},
+                "b": {"code": "widget = ("},
+                "c": {}}},
+            "invalid": None}
+
+        # errors are left to be raised when the widget is created
+        cache.precompile(pip_data)
+        self.assertEqual(list(cache.code().keys()), [ConstructorCodeCache.getKey(self.code.format(name="a"))])
+
+    def test_diskCache(self):
+        cache = ConstructorCodeCache(cache_dir=self.dir)
+        cache.precompile({"pip": {"widgets": {"a": {"code": self.code.format(name="a")}}}})
+        self.assertTrue(os.path.exists(cache.cacheFilepath()))
+
+        # the code is loaded in a new session
+        cache = ConstructorCodeCache(cache_dir=self.dir)
+        cache.compile(self.code.format(name="a"))
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+        # unreadable caches are ignored
+        with open(cache.cacheFilepath(), "wb") as f:
+            f.write(b"invalid")
+        cache = ConstructorCodeCache(cache_dir=self.dir)
+        self.assertEqual(cache.code(), {})
+
+    def test_createWidget(self):
+        display_widget = PopupBarDisplayWidget()
+        constructor_code_cache.resetCounters()
+        widgets = [display_widget.createWidgetFromConstructorCode(self.code.format(name="test")) for x in range(2)]
+        self.assertEqual([widget.text() for widget in widgets], ["test", "test"])
+        self.assertEqual(constructor_code_cache.hits, 1)
+
+
+class TestPopupBarSnapshotCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_setSnapshot(self):
+        cache = PopupBarSnapshotCache()
+        key = PopupBarSnapshotCache.getKey("a", "widget = None")
+        self.assertNotEqual(PopupBarSnapshotCache.getKey("b", "widget = None"), key)
+        self.assertIsNone(cache.snapshot(key))
+
+        # snapshots are scaled down
+        snapshot = QPixmap(PopupBarSnapshotCache.SNAPSHOT_SIZE * 2, PopupBarSnapshotCache.SNAPSHOT_SIZE)
+        cache.setSnapshot(key, snapshot)
+        self.assertEqual(
+            (cache.snapshot(key).width(), cache.snapshot(key).height()),
+            (PopupBarSnapshotCache.SNAPSHOT_SIZE, PopupBarSnapshotCache.SNAPSHOT_SIZE // 2))
+
+        cache.setSnapshot(PopupBarSnapshotCache.getKey("b", "widget = None"), QPixmap())
+        self.assertEqual(list(cache.snapshots().keys()), [key])
+
+    def test_diskCache(self):
+        cache = PopupBarSnapshotCache(cache_dir=self.dir)
+        key = PopupBarSnapshotCache.getKey("a", "widget = None")
+        cache.setSnapshot(key, QPixmap(100, 50))
+        self.assertTrue(os.path.exists(cache.snapshotFilepath(key)))
+
+        # the snapshot is loaded in a new session
+        cache = PopupBarSnapshotCache(cache_dir=self.dir)
+        self.assertEqual(cache.snapshot(key).size(), QPixmap(100, 50).size())
+
+
+class TestDeferredLoading(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.dir, "PiPWidgets.json")
+        settings = PopupBarDisplayWidget().settings()
+        settings.update({
+            "sizes": [],
+            "Display Mode": PopupBarDisplayWidget.PIP,
+            "PiP Scale": [0.25, 0.25],
+            "Taskbar Size": 100,
+            "Overlay Text": "",
+            "Overlay Image": ""})
+        widgets = OrderedDict(
+            ("widget{index}".format(index=index), {
+                "code": "from qtpy.QtWidgets import QLabel\nwidget = QLabel('{index}')".format(index=index),
+                "Overlay Text": "",
+                "Overlay Image": ""})
+            for index in range(4))
+        with open(self.filepath, "w") as f:
+            json.dump({"test": {"widgets": widgets, "settings": settings}}, f)
+
+        self.popup_bar_widget = PopupBarDisplayWidget()
+        self.popup_bar_widget.resize(400, 300)
+        self.popup_bar_widget.loadPopupDisplayFromFile(self.filepath, "test", deferred=True)
+        self.popup_bar_widget.show()
+        self.app.processEvents()
+
+    def tearDown(self):
+        # let the delayed resize event run before the widget is deleted
+        QTest.qWait(200)
+        popup_bar_snapshot_cache.setMaxLiveWidgets(0)
+        popup_bar_snapshot_cache.clear()
+        self.popup_bar_widget.close()
+        shutil.rmtree(self.dir)
+
+    def getWidgets(self):
+        display_widget = self.popup_bar_widget.displayWidget()
+        return self.popup_bar_widget.popupBarWidget().widgets() + [display_widget.currentWidget()]
+
+    def getInstantiatedWidgets(self):
+        return sorted(widget.name() for widget in self.getWidgets() if widget.isInstantiated())
+
+    def test_deferred(self):
+        # only the current widget is created
+        self.assertTrue(all(widget.isDeferred() for widget in self.getWidgets()))
+        self.assertEqual(self.getInstantiatedWidgets(), ["widget3"])
+        self.assertEqual(self.getWidgets()[0].popupWidget().text(), "widget0")
+
+        # widgets are created when they are set as the current widget
+        widget = self.getWidgets()[0]
+        self.popup_bar_widget.displayWidget().setCurrentWidget(widget)
+        self.assertEqual(self.getInstantiatedWidgets(), ["widget0", "widget3"])
+        self.assertEqual(widget.popupWidget().text(), "0")
+        self.assertIs(widget.instantiate(), widget.popupWidget())
+
+    def test_maxLiveWidgets(self):
+        self.popup_bar_widget.displayWidget().setCurrentWidget(self.getWidgets()[0])
+        self.app.processEvents()
+
+        # idle widgets are frozen into a snapshot of their last render
+        popup_bar_snapshot_cache.setMaxLiveWidgets(1)
+        self.assertEqual(self.getInstantiatedWidgets(), ["widget0"])
+        frozen_widget = [widget for widget in self.getWidgets() if widget.name() == "widget3"][0]
+        self.assertIsNotNone(frozen_widget.popupWidget().snapshot())
+        self.assertFalse(frozen_widget.freeze())
+
+        # the current widget is not frozen
+        self.assertFalse(self.popup_bar_widget.displayWidget().currentWidget().freeze())
+
+
+class TestPopupBarOrganizerBulkLoad(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.widgets = [
+            ("widget{index}".format(index=index), "from qtpy.QtWidgets import QLabel\nwidget = QLabel('{index}')".format(
+                index=index))
+            for index in reversed(range(5))]
+
+    def createOrganizer(self):
+        organizer_widget = PopupBarOrganizerWidget()
+        organizer_widget.removeAllWidgets()
+        self.app.processEvents()
+        return organizer_widget
+
+    def getWidgetIndexes(self, organizer_widget):
+        return [(widget.name(), widget.index()) for widget in organizer_widget.popupBarWidget().widgets()]
+
+    def test_bulkLoad(self):
+        # matches creating the widgets one at a time
+        organizer_widget = self.createOrganizer()
+        for name, constructor_code in self.widgets:
+            organizer_widget.createNewWidgetFromConstructorCode(constructor_code, name=name, resize_popup_bar=False)
+
+        batch_organizer_widget = self.createOrganizer()
+        inserts = []
+        batch_organizer_widget.popupBarOrganizerWidget().model().rowsInserted.connect(
+            lambda parent, first, last: inserts.append((first, last)))
+        indexes = batch_organizer_widget.createNewWidgetsFromConstructorCode(self.widgets, resize_popup_bar=False)
+
+        self.assertEqual(
+            [item.name() for item in batch_organizer_widget.items()],
+            ["widget0", "widget1", "widget2", "widget3", "widget4"])
+        self.assertEqual(
+            [item.name() for item in batch_organizer_widget.items()], [item.name() for item in organizer_widget.items()])
+        self.assertEqual(self.getWidgetIndexes(batch_organizer_widget), self.getWidgetIndexes(organizer_widget))
+
+        # the organizer items are inserted in one call
+        self.assertEqual(inserts, [(0, 4)])
+        self.assertEqual([index.internalPointer().name() for index in indexes], [name for name, code in self.widgets])
+        for item in batch_organizer_widget.items():
+            self.assertIs(item.widget().item(), item)
+
+    def test_batchUpdate(self):
+        organizer_widget = self.createOrganizer()
+        organizer_widget.createNewWidgetsFromConstructorCode(self.widgets, resize_popup_bar=False)
+        popup_bar_widget = organizer_widget.popupBarWidget()
+        widgets = popup_bar_widget.widgets()
+
+        # indexes are only updated when the outermost batch exits
+        with popup_bar_widget.batchUpdate():
+            with popup_bar_widget.batchUpdate():
+                widgets[-1].setParent(None)
+                popup_bar_widget.insertWidget(0, widgets[-1])
+                popup_bar_widget.updateWidgetIndexes()
+            self.assertEqual(widgets[-1].index(), 4)
+        self.assertEqual(
+            self.getWidgetIndexes(organizer_widget),
+            [("widget4", 0), ("widget0", 1), ("widget1", 2), ("widget2", 3), ("widget3", 4)])
+
+    def test_itemReordered(self):
+        organizer_widget = self.createOrganizer()
+        organizer_widget.createNewWidgetsFromConstructorCode(self.widgets, resize_popup_bar=False)
+        widget = organizer_widget.popupBarWidget().widgets()[3]
+        organizer_widget.popupBarOrganizerWidget().itemReordered(None, [widget.item()], None, 1, None)
+        self.assertEqual(
+            self.getWidgetIndexes(organizer_widget),
+            [("widget0", 0), ("widget3", 1), ("widget1", 2), ("widget2", 3), ("widget4", 4)])
+
+
+def mainFunction():
+    app = QApplication(sys.argv)
+    unittest.main()
+
+
+if __name__ == '__main__':
+    mainFunction()
@@ -35,18 +35,88 @@ TODO:
             Full Screen / Collapse All
 """
 
+from collections import OrderedDict
+
 from qtpy.QtWidgets import QSplitter, QSplitterHandle, QApplication
-from qtpy.QtCore import Qt, QEvent
+from qtpy.QtCore import Qt, QEvent, QObject, QTimer
 from qtpy.QtGui import QCursor
 
 from cgwidgets.settings import iColor
-from cgwidgets.settings.stylesheets import splitter_handle_ss
-from cgwidgets.settings.hover_display import installHoverDisplaySS
+from cgwidgets.settings.stylesheets import splitter_handle_ss, compileStyleSheet
+from cgwidgets.settings.hover_display import installHoverDisplaySS, getHoverDisplaySS
 from cgwidgets.utils import updateStyleSheet, getWidgetUnderCursor, getWidgetsDescendants, isWidgetDescendantOfInstance
 
 from cgwidgets.widgets.AbstractWidgets.AbstractSplitterWidget import AbstractSplitterWidget
 
 
+class AbstractShojiLayoutPass(QObject):
+    """
+    Collects the size and style invalidations of widgets during an event loop
+    cycle, and applies them all at once when control returns to the event loop.
+
+    Resizing a window, or dragging a handle, sends a resize event to every nested
+    Shoji Layout, which previously reformatted, and reapplied its entire style sheet
+    on every event.  Widgets are instead registered here with invalidate(), and
+    every widget will have its applyLayoutPass(flags) called at most once per cycle,
+    with all of the flags that were invalidated since the last pass.
+
+    Widgets registered must provide an applyLayoutPass(flags) method.
+
+    Attributes:
+        SIZE (int): flag for geometry only changes, these should never touch the style sheet
+        STYLE (int): flag for changes that need the style sheet to be regenerated
+    """
+    SIZE = 1
+    STYLE = 2
+    __instance = None
+
+    def __init__(self, parent=None):
+        super(AbstractShojiLayoutPass, self).__init__(parent)
+        self._invalidated_widgets = OrderedDict()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    @staticmethod
+    def instance():
+        """
+        Returns (AbstractShojiLayoutPass): shared scheduler for all widgets
+        """
+        if not AbstractShojiLayoutPass.__instance:
+            AbstractShojiLayoutPass.__instance = AbstractShojiLayoutPass(QApplication.instance())
+        return AbstractShojiLayoutPass.__instance
+
+    def invalidate(self, widget, flags):
+        """
+        Schedules a layout pass for the widget provided
+
+        Args:
+            widget (QWidget): widget to update on the next pass
+            flags (int): AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE
+        """
+        self._invalidated_widgets[widget] = self._invalidated_widgets.get(widget, 0) | flags
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def invalidatedWidgets(self):
+        """
+        Returns (OrderedDict): of the widgets waiting for a pass, mapped to their flags
+        """
+        return self._invalidated_widgets
+
+    def flush(self):
+        """ Applies all of the pending invalidations"""
+        self._timer.stop()
+        while self._invalidated_widgets:
+            widget, flags = self._invalidated_widgets.popitem(last=False)
+            try:
+                widget.applyLayoutPass(flags)
+            except RuntimeError:
+                # widget has been deleted since it was invalidated
+                pass
+
+
 class AbstractShojiLayout(AbstractSplitterWidget):
     """
     Splitter widget that has advanced functionality.  This serves as a base
@@ -87,6 +157,14 @@ class AbstractShojiLayout(AbstractSplitterWidget):
     UNSOLO_VIEW_HOTKEY = [Qt.Key_Escape]
     MODIFIER = Qt.AltModifier
     SOLOEVENTACTIVE = False
+    STYLE_SHEET = """
+/* VIEW */
+
+{base_style_sheet}
+
+/* HANDLE */
+{splitter_handle_ss}
+        """
 
     def __init__(self, parent=None, orientation=Qt.Vertical):
         super(AbstractShojiLayout, self).__init__(parent)
@@ -376,9 +454,9 @@ class AbstractShojiLayout(AbstractSplitterWidget):
         return QSplitter.keyReleaseEvent(self, event)
 
     def resizeEvent(self, event):
-        """TODO why was I resizing here..."""
-        #pass
-        self.updateStyleSheet()
+        """ The handle margins only depend on the size when the handle length is set"""
+        if 0 <= self.handleLength():
+            self.invalidateLayoutPass(AbstractShojiLayoutPass.STYLE)
         return QSplitter.resizeEvent(self, event)
 
     def eventFilter(self, obj, event):
@@ -417,6 +495,9 @@ class AbstractShojiLayout(AbstractSplitterWidget):
 
         Returns:
 
+        Note:
+            The rules are installed in this widgets style sheet, so that
+            they are shared by all of the children.
         """
         # widget.installEventFilter(self)
         hover_type_flags = {
@@ -427,7 +508,8 @@ class AbstractShojiLayout(AbstractSplitterWidget):
         installHoverDisplaySS(
             widget,
             name="SHOJI VIEW",
-            hover_type_flags=hover_type_flags)
+            hover_type_flags=hover_type_flags,
+            scope=self)
 
     def isolateWidgets(self, widget_list):
         """
@@ -436,7 +518,12 @@ class AbstractShojiLayout(AbstractSplitterWidget):
         Args:
             widget_list (list): of widgets to be displayed
         """
-        self.displayAllWidgets(False)
+        # only hide the widgets that are currently shown
+        widgets = set(widget_list)
+        for index in range(self.count()):
+            widget = self.widget(index)
+            if widget not in widgets and not widget.isHidden():
+                widget.hide()
         for widget in widget_list:
             widget.show()
 
@@ -752,6 +839,28 @@ class AbstractShojiLayout(AbstractSplitterWidget):
 
         return margins
 
+    """ LAYOUT PASS """
+    def invalidateLayoutPass(self, flags=AbstractShojiLayoutPass.STYLE):
+        """
+        Schedules this widget to be updated once control returns to the event loop.
+
+        Args:
+            flags (int): AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE
+        """
+        AbstractShojiLayoutPass.instance().invalidate(self, flags)
+
+    def applyLayoutPass(self, flags):
+        """
+        Applies the invalidations collected since the last pass.  The geometry of
+        the splitter and its handles is managed by the QSplitter, so only style
+        invalidations need to be handled here.
+
+        Args:
+            flags (int): AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE
+        """
+        if flags & AbstractShojiLayoutPass.STYLE:
+            self.updateStyleSheet()
+
     """ COLORS """
     def baseStyleSheet(self):
         return self._base_style_sheet
@@ -767,13 +876,11 @@ class AbstractShojiLayout(AbstractSplitterWidget):
             color (rgba): color to display when not hovering over handle
             hover_color (rgba): color to display when hover over handle
 
-        ToDo: Style display bug
-            Since this isnt resizing the handle sizes wont update anymore...
+        Note:
+            The style sheet is only applied if it differs from the current one, as
+            setting a style sheet will re-polish this widget, and all of its children.
         """
-
-        style_sheet_args = iColor.style_sheet_args
-
-        style_sheet_args.update({
+        style_sheet_args = {
             'rgba_flag': repr(self.rgba_flag),
             'rgba_handle': repr(self.rgba_handle),
             'rgba_handle_hover': repr(self.rgba_handle_hover),
@@ -781,20 +888,16 @@ class AbstractShojiLayout(AbstractSplitterWidget):
             'rgba_text': repr(self.rgba_text),
             'handle_length_margin': self.getHandleLengthMargin(),
             'type': type(self).__name__,
-        })
+        }
         style_sheet_args.update({
-            'splitter_handle_ss': splitter_handle_ss.format(**style_sheet_args),
+            'splitter_handle_ss': compileStyleSheet(splitter_handle_ss, **style_sheet_args),
             'base_style_sheet': self.baseStyleSheet()
         })
         # TODO is_solo_view causing pixel issue
-        style_sheet = """
-/* VIEW */
-
-{base_style_sheet}
+        style_sheet = compileStyleSheet(AbstractShojiLayout.STYLE_SHEET, **style_sheet_args)
 
-/* HANDLE */
-{splitter_handle_ss}
-        """.format(**style_sheet_args)
+        # add the hover displays of the children
+        style_sheet += getHoverDisplaySS(self)
 
         # update hover display property
         # for child in self.children():
@@ -803,7 +906,8 @@ class AbstractShojiLayout(AbstractSplitterWidget):
         #     else:
         #         child.setProperty("hover_display", False)
 
-        self.setStyleSheet(style_sheet)
+        if style_sheet != self.styleSheet():
+            self.setStyleSheet(style_sheet)
 
     @property
     def rgba_handle(self):
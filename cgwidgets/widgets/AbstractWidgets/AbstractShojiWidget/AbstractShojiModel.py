@@ -34,6 +34,9 @@ class AbstractShojiModelItem(AbstractDragDropModelItem, iShojiDynamicWidget):
             selected
         dynamic_widget_base_class (QWidget): Widget to be shown when this item is
             selected if the Shoji is in DYNAMIC mode.
+        delegate_widget_factory (function): returns the widget to be shown when this
+            item is selected.  If set, the delegate widget is only created the first
+            time that it is needed.
         image_path (str): path on disk to image to be displayed as overlay
         display_overlay (bool) determines if the overlay for this should be dispalyed
             or not.
@@ -41,10 +44,10 @@ class AbstractShojiModelItem(AbstractDragDropModelItem, iShojiDynamicWidget):
     def __init__(self, parent=None):
         super(AbstractShojiModelItem, self).__init__(parent)
         #self._data = data
-        self._column_data = {}
         self._children = []
         self._parent = parent
         self._delegate_widget = None
+        self._delegate_widget_factory = None
         self._dynamicWidgetFunction = None
 
         self._image_path = None
@@ -100,6 +103,12 @@ class AbstractShojiModelItem(AbstractDragDropModelItem, iShojiDynamicWidget):
     def setDelegateWidget(self, _delegate_widget):
         self._delegate_widget = _delegate_widget
 
+    def delegateWidgetFactory(self):
+        return self._delegate_widget_factory
+
+    def setDelegateWidgetFactory(self, _delegate_widget_factory):
+        self._delegate_widget_factory = _delegate_widget_factory
+
 
 class AbstractShojiModel(AbstractDragDropModel):
     """
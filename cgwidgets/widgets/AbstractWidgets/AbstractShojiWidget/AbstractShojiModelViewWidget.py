@@ -15,11 +15,14 @@ TODO: View scroll bar needs to change locations
 
 TODO: Check dynamic display updates... I feel like I wrote 95 functions for this...
 """
+from collections import OrderedDict
+import time
+
 from qtpy import API_NAME
 
 from qtpy.QtWidgets import (
     QWidget, QAbstractItemView, QScrollArea, QSplitter, QApplication)#, qApp)
-from qtpy.QtCore import Qt, QModelIndex, QEvent, QSortFilterProxyModel
+from qtpy.QtCore import Qt, QModelIndex, QEvent, QSortFilterProxyModel, QTimer
 from qtpy.QtGui import QCursor
 
 from cgwidgets.utils import getWidgetAncestor, updateStyleSheet, getWidgetUnderCursor
@@ -30,7 +33,8 @@ from cgwidgets.widgets import (
     AbstractOverlayInputWidget,
     AbstractModelViewWidget,
     AbstractShojiLayout,
-    AbstractShojiLayoutHandle)
+    AbstractShojiLayoutHandle,
+    AbstractShojiLayoutPass)
 
 from .AbstractShojiModel import AbstractShojiModel, AbstractShojiModelItem
 from .iShojiDynamicWidget import iShojiDynamicWidget
@@ -59,6 +63,25 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         header_width (int): the default width of the tab label in pixels
             only works when the mode is set to view the labels on the east/west
         header_view_position (attrs.DIRECTION): Where the header should be placed
+        delegate_widget_limit (int): maximum number of lazily created delegate widgets
+            to keep loaded.  Once exceeded, the widgets that have been hidden the
+            longest are unloaded, and will be created again when next selected.
+            If None, the widgets are never unloaded.
+        delegate_unload_delay (int): milliseconds that a lazily created delegate widget
+            must have been hidden for before it can be unloaded
+        is_delegate_prewarm_enabled (bool): if True, the lazily created delegate widgets
+            are created one at a time while the event loop is idle
+        loaded_delegate_items (OrderedDict): of the items that have had their delegate widget
+            lazily created, to the time they were hidden, or None if they are visible.
+            These are ordered from least to most recently hidden.  Items are removed
+            from this, and their widgets destroyed, when they are removed from the model.
+        prewarm_items (OrderedDict): of items whose delegate widgets are waiting to be
+            prewarmed, to None.  This is only populated while prewarming is enabled
+        dynamic_widget_pool_size (int): maximum number of dynamic widgets of each type to keep
+            for reuse once their item has been deselected.  If 0, dynamic widgets are
+            not reused.
+        dynamic_widget_pool (dict): of dynamic widget type to a list of the
+            AbstractShojiModelDelegateWidgets available for reuse
 
     Class Attrs:
         TYPE
@@ -106,11 +129,30 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         self._delegate_header_direction = Qt.Vertical
         self._initializing = True
 
+        # lazy delegate widgets
+        self._delegate_widget_limit = None
+        self._delegate_unload_delay = 30000
+        self._is_delegate_prewarm_enabled = False
+        self._loaded_delegate_items = OrderedDict()
+        self._prewarm_items = OrderedDict()
+        self._delegate_model = None
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.timeout.connect(self.__prewarmNextDelegateWidget)
+        self._unload_timer = QTimer(self)
+        self._unload_timer.setSingleShot(True)
+        self._unload_timer.timeout.connect(self.unloadDelegateWidgets)
+
+        # dynamic widget pool
+        self._dynamic_widget_pool_size = 0
+        self._dynamic_widget_pool = {}
+
         # setup model / view
         self._header_widget = AbstractShojiHeader(self)
         #self._model = self.headerViewWidget().model()
         #self._header_widget.setModel(self._model)
         self._header_widget.setIndexSelectedEvent(self._header_widget.selectionChanged)
+        self.__setupDelegateModel(self.model())
 
         # setup delegate
         delegate_widget = AbstractShojiMainDelegateWidget(self)
@@ -153,7 +195,8 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         is_enableable=None,
         is_deletable=None,
         is_draggable=None,
-        is_droppable=None):
+        is_droppable=None,
+        widget_factory=None):
         """
         Creates a new tab at  the specified index
 
@@ -167,6 +210,10 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
                 tab underneath
             row (int): index to insert widget at
             widget (QWidget): widget to be displayed at that index
+            widget_factory (function): takes no args, and returns the widget to be
+                displayed at that index.  This can be provided instead of the widget,
+                in which case the widget is only created the first time that the
+                tab is selected (or prewarmed).  Only used in STACKED mode.
 
             image_path (str): path on disk to image to be displayed as overlaid image
             display_overlay (bool): determines if an image/text should be overlaid over
@@ -200,7 +247,14 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         view_item.setIsDeletable(is_deletable)
 
         # add to layout if stacked
-        if self.getDelegateType() == AbstractShojiModelViewWidget.STACKED:
+        if self.getDelegateType() == AbstractShojiModelViewWidget.STACKED and widget is None and widget_factory:
+            # create widget when first needed
+            view_item.setDelegateWidgetFactory(widget_factory)
+            if self.isDelegatePrewarmEnabled():
+                self._prewarm_items[view_item] = None
+                self._prewarm_timer.start(0)
+
+        elif self.getDelegateType() == AbstractShojiModelViewWidget.STACKED:
             # create tab widget widget
             view_delegate_widget = self.createShojiModelDelegateWidget(view_item, widget)
             view_item.setDelegateWidget(view_delegate_widget)
@@ -264,6 +318,13 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
     def getAllIndexes(self):
         return self.model().getAllIndexes()
 
+    def iterItems(self, item=None, depth_first=True, max_depth=None, predicate=None):
+        return self.model().iterItems(item, depth_first=depth_first, max_depth=max_depth, predicate=predicate)
+
+    def iterIndexes(self, index=None, depth_first=True, max_depth=None, predicate=None, column=0):
+        return self.model().iterIndexes(
+            index, depth_first=depth_first, max_depth=max_depth, predicate=predicate, column=column)
+
     def getAllSelectedItems(self):
         return self.headerWidget().getAllSelectedItems()
 
@@ -314,6 +375,9 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
     def setHeaderItemDeleteEvent(self, function, update_first=True):
         self.headerWidget().setItemDeleteEvent(function, update_first=update_first)
 
+    def setHeaderItemsDeleteEvent(self, function):
+        self.headerWidget().setItemsDeleteEvent(function)
+
     def setHeaderItemDragStartEvent(self, function):
         """
         Sets the function to be run after the drag has been initiated
@@ -331,9 +395,15 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
     def setHeaderItemEnabledEvent(self, function):
         self.headerWidget().setItemEnabledEvent(function)
 
+    def setHeaderItemsEnabledEvent(self, function):
+        self.headerWidget().setItemsEnabledEvent(function)
+
     def setHeaderItemTextChangedEvent(self, function):
         self.headerWidget().setTextChangedEvent(function)
 
+    def setHeaderItemsTextChangedEvent(self, function):
+        self.headerWidget().setItemsTextChangedEvent(function)
+
     def setHeaderItemSelectedEvent(self, function):
         """
         Event run when the toggle is hidden/shown
@@ -472,6 +542,7 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
             model.setItemType(AbstractShojiModelItem)
         self._header_widget.setModel(model)
         self._header_widget.setIndexSelectedEvent(self._header_widget.selectionChanged)
+        self.__setupDelegateModel(self.model())
 
     def clearModel(self, event_update=False):
         """
@@ -488,7 +559,7 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         self.model().deleteItem(item, event_update=event_update)
 
     def isModelCustomFilterable(self):
-        self.headerWidget().isModelCustomFilterable()
+        return self.headerWidget().isModelCustomFilterable()
 
     def makeModelFilterable(self):
         self.headerWidget().makeModelFilterable()
@@ -497,14 +568,20 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
     def addFilter(self, regex_filter, arg="name", name=None):
         self.headerWidget().addFilter(regex_filter=regex_filter, arg=arg, name=name)
 
+    def addComparisonFilter(self, value, arg="name", operator="==", name=None):
+        self.headerWidget().addComparisonFilter(value, arg=arg, operator=operator, name=name)
+
     def clearFilters(self):
         self.headerWidget().clearFilters()
 
     def filters(self):
         return self.headerWidget().filters()
 
+    def getFilterByName(self, name):
+        return self.headerWidget().getFilterByName(name)
+
     def removeFilter(self, regex_filter, arg="name"):
-        self.headerWidget().removeFilter({"filter": regex_filter, "arg": arg})
+        self.headerWidget().removeFilter(regex_filter, arg=arg)
 
     def removeFilterByIndex(self, index):
         self.headerWidget().removeFilterByIndex(index)
@@ -521,6 +598,12 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         """
         self.headerWidget().updateFilterByName(pattern, name)
 
+    def scheduleFilterUpdate(self, pattern, name):
+        self.headerWidget().scheduleFilterUpdate(pattern, name)
+
+    def filterScheduler(self):
+        return self.headerWidget().filterScheduler()
+
     """ EXPORT DATA """
     def setItemExportDataFunction(self, func):
         self.model().setItemExportDataFunction(func)
@@ -528,6 +611,12 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
     def exportModelToDict(self, item, item_data=None):
         return self.model().exportModelToDict(item, item_data=item_data)
 
+    def exportModelToFile(self, item, filepath):
+        return self.model().exportModelToFile(item, filepath)
+
+    def importModelFromFile(self, filepath, row=None, parent=QModelIndex(), batch_size=10000):
+        return self.model().importModelFromFile(filepath, row=row, parent=parent, batch_size=batch_size)
+
     """ VIEW """
     def headerWidget(self):
         return self._header_widget
@@ -677,6 +766,46 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         if item.textColor():
             display_widget.setTextColor(item.textColor())
 
+        self.__updateShojiModelDelegateWidgetHeader(display_widget, item)
+
+        return display_widget
+
+    def rebindShojiModelDelegateWidget(self, display_widget, item):
+        """ Switches an existing delegate widget over to display the item provided
+
+        Args:
+            display_widget (AbstractShojiModelDelegateWidget): widget to rebind
+            item (AbstractShojiModelItem): item that the widget will display"""
+        # only update the attrs that have changed, as most of these update the style sheet
+        old_item = display_widget.item()
+        display_widget.setItem(item)
+
+        # title
+        name = self.model().getItemName(item)
+        display_widget.setTitle(name)
+        display_widget.delegateWidget().setTitle(name)
+
+        # image
+        if display_widget.image() != item.imagePath():
+            display_widget.setImage(item.imagePath())
+
+        # overlay
+        if item.displayOverlay():
+            display_widget.setCurrentIndex(0)
+            display_mode = AbstractOverlayInputWidget.ENTER
+        else:
+            display_widget.setCurrentIndex(1)
+            display_mode = AbstractOverlayInputWidget.DISABLED
+        if display_widget.displayMode() != display_mode:
+            display_widget.setDisplayMode(display_mode)
+
+        # text color
+        if old_item.textColor() != item.textColor():
+            display_widget.setTextColor(item.textColor() or iColor["rgba_text"])
+
+        self.__updateShojiModelDelegateWidgetHeader(display_widget, item)
+
+    def __updateShojiModelDelegateWidgetHeader(self, display_widget, item):
         # display title
         if item.displayDelegateTitle():
             is_delegate_title_shown = item.displayDelegateTitle()
@@ -687,8 +816,6 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         # set direction
         display_widget.delegateWidget().setDirection(self.delegateHeaderDirection())
 
-        return display_widget
-
     def addContextMenuSeparator(self, conditions=None):
         """Adds a separator into the RMB popup menu.
 
@@ -718,17 +845,16 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
     """ DELEGATE """
     def activeDelegateWidgets(self):
         """ Returns all of the currently visible delegate widgets"""
-        _delegate_widgets = []
-        for x in range(1, self.delegateWidget().count()):
-            _delegate_widgets.append(self.delegateWidget().widget(x).getMainWidget())
-
-        return _delegate_widgets
+        return [widget.getMainWidget() for widget in self.activeModelDelegateWidgets()]
 
     def activeModelDelegateWidgets(self):
         """ Returns a list of all of the currently active delegate widgets parents"""
+        pooled_widgets = set(self.pooledDynamicWidgets())
         _delegate_widgets = []
         for x in range(1, self.delegateWidget().count()):
-            _delegate_widgets.append(self.delegateWidget().widget(x))
+            widget = self.delegateWidget().widget(x)
+            if widget not in pooled_widgets:
+                _delegate_widgets.append(widget)
 
         return _delegate_widgets
 
@@ -764,12 +890,19 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
             self.toggleDelegateSpacerWidget()
             selection_model = self.headerWidget().selectionModel()
             widget_list = []
+            selected_items = set()
             for index in selection_model.selectedRows(0):
                 item = index.internalPointer()
-                widget = item.delegateWidget()
-                widget_list.append(widget)
+                widget = self.loadDelegateWidget(item)
+                if widget:
+                    widget_list.append(widget)
+                selected_items.add(item)
             self.delegateWidget().isolateWidgets(widget_list)
 
+            # update when the lazy widgets were last visible
+            for item in list(self._loaded_delegate_items.keys()):
+                self.__setDelegateItemVisible(item, item in selected_items)
+
         # update dynamic delagate
         elif self.getDelegateType() == AbstractShojiModelViewWidget.DYNAMIC:
             selection_model = self.headerWidget().selectionModel()
@@ -788,6 +921,8 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         # todo column registry.
         ## note that this is set so that it will not run for each column
         if self.getDelegateType() == AbstractShojiModelViewWidget.STACKED:
+            if selected:
+                self.loadDelegateWidget(item)
             if item.delegateWidget():
                 self.__updateStackedDisplay(item, selected)
 
@@ -808,6 +943,215 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
                 item.delegateWidget().hide()
             except AttributeError:
                 pass
+        self.__setDelegateItemVisible(item, selected)
+
+    """ LAZY DELEGATE """
+    def delegateWidgetLimit(self):
+        return self._delegate_widget_limit
+
+    def setDelegateWidgetLimit(self, _delegate_widget_limit):
+        self._delegate_widget_limit = _delegate_widget_limit
+        self.unloadDelegateWidgets()
+        if self.isDelegatePrewarmEnabled() and self._prewarm_items:
+            self._prewarm_timer.start(0)
+
+    def delegateUnloadDelay(self):
+        return self._delegate_unload_delay
+
+    def setDelegateUnloadDelay(self, _delegate_unload_delay):
+        self._delegate_unload_delay = _delegate_unload_delay
+
+    def isDelegatePrewarmEnabled(self):
+        return self._is_delegate_prewarm_enabled
+
+    def setIsDelegatePrewarmEnabled(self, enabled):
+        self._is_delegate_prewarm_enabled = enabled
+        if enabled:
+            self._prewarm_items = OrderedDict(
+                (item, None) for item in self.model().iterItems()
+                if item.delegateWidgetFactory() and item.delegateWidget() is None)
+        else:
+            self._prewarm_items = OrderedDict()
+
+        if self._prewarm_items:
+            self._prewarm_timer.start(0)
+        else:
+            self._prewarm_timer.stop()
+
+    def loadedDelegateItems(self):
+        """ Returns (list): of items whose delegate widgets have been lazily created"""
+        return list(self._loaded_delegate_items.keys())
+
+    def prewarmItems(self):
+        """ Returns (list): of items whose delegate widgets are waiting to be prewarmed"""
+        return list(self._prewarm_items.keys())
+
+    def loadDelegateWidget(self, item):
+        """ Creates the delegate widget of an item that was inserted with a widget_factory
+
+        Args:
+            item (AbstractShojiModelItem):
+
+        Returns (AbstractShojiModelDelegateWidget): or None if the item has no delegate widget"""
+        if item.delegateWidget() is not None or not item.delegateWidgetFactory():
+            return item.delegateWidget()
+
+        view_delegate_widget = self.createShojiModelDelegateWidget(item, item.delegateWidgetFactory()())
+        item.setDelegateWidget(view_delegate_widget)
+        self.delegateWidget().insertWidget(self.__getDelegateWidgetPosition(item), view_delegate_widget)
+        view_delegate_widget.hide()
+
+        self._loaded_delegate_items[item] = time.time()
+        self.__scheduleUnloadDelegateWidgets()
+        return view_delegate_widget
+
+    def unloadDelegateWidget(self, item):
+        """ Destroys the delegate widget of an item that was inserted with a widget_factory
+
+        The widget will be created again the next time that the item is selected.
+
+        Args:
+            item (AbstractShojiModelItem):"""
+        if not self.__destroyDelegateWidget(item):
+            return
+
+        if self.isDelegatePrewarmEnabled():
+            self._prewarm_items[item] = None
+
+    def __destroyDelegateWidget(self, item):
+        """ Destroys the lazily created delegate widget of the item provided
+
+        Args:
+            item (AbstractShojiModelItem):
+
+        Returns (bool): if the widget was destroyed"""
+        delegate_widget = item.delegateWidget()
+        if delegate_widget is None or not item.delegateWidgetFactory():
+            return False
+
+        self._loaded_delegate_items.pop(item, None)
+        item.setDelegateWidget(None)
+        delegate_widget.setParent(None)
+        delegate_widget.deleteLater()
+        return True
+
+    def __setupDelegateModel(self, model):
+        """ Connects the lazy delegate widgets to the model provided, so that the
+        widgets of items that are removed from the model are destroyed
+
+        Args:
+            model (AbstractShojiModel):"""
+        if self._delegate_model is not None:
+            self._delegate_model.rowsAboutToBeRemoved.disconnect(self.__removeDelegateItems)
+            self._delegate_model.layoutChanged.disconnect(self.__removeDelegateItemsNotInModel)
+            self._delegate_model.modelReset.disconnect(self.__removeDelegateItemsNotInModel)
+
+        model.rowsAboutToBeRemoved.connect(self.__removeDelegateItems)
+        model.layoutChanged.connect(self.__removeDelegateItemsNotInModel)
+        model.modelReset.connect(self.__removeDelegateItemsNotInModel)
+        self._delegate_model = model
+
+    def __removeDelegateItems(self, parent, first, last):
+        """ Removes the items that are about to be removed from the model, and all
+        of their descendants, from the lazy delegate widgets"""
+        if not self._loaded_delegate_items and not self._prewarm_items:
+            return
+
+        model = self.model()
+        parent_item = model.getItem(parent)
+        items = parent_item.children()[first:last + 1]
+        for item in parent_item.children()[first:last + 1]:
+            items += model.iterItems(item)
+        for item in items:
+            self.__destroyDelegateWidget(item)
+            self._prewarm_items.pop(item, None)
+
+    def __removeDelegateItemsNotInModel(self, *args):
+        """ Removes the items that are no longer in the model from the lazy delegate widgets.
+
+        Items removed with a layout change do not emit rowsAboutToBeRemoved, so this
+        checks all of the items instead."""
+        model = self.model()
+        for item in list(self._loaded_delegate_items.keys()):
+            if not model.isItemInModel(item):
+                self.__destroyDelegateWidget(item)
+        for item in list(self._prewarm_items.keys()):
+            if not model.isItemInModel(item):
+                del self._prewarm_items[item]
+
+    def unloadDelegateWidgets(self):
+        """ Unloads the lazy delegate widgets that have been hidden the longest, until the
+        delegate widget limit is met.
+
+        Widgets are only unloaded once they have been hidden for the delegate unload delay,
+        if there are none that have, this will run again once the next one has been."""
+        if self._delegate_widget_limit is None:
+            return
+
+        now = time.time()
+        unload_delay = self._delegate_unload_delay / 1000.0
+        for item, hidden_time in list(self._loaded_delegate_items.items()):
+            if len(self._loaded_delegate_items) <= self._delegate_widget_limit:
+                return
+            # visible
+            if hidden_time is None:
+                continue
+            # items are ordered by when they were hidden, so the rest have been hidden for less time
+            if now - hidden_time < unload_delay:
+                self._unload_timer.start(int((unload_delay - (now - hidden_time)) * 1000) + 1)
+                return
+            self.unloadDelegateWidget(item)
+
+    def __scheduleUnloadDelegateWidgets(self):
+        if self._delegate_widget_limit is None:
+            return
+        if self._delegate_widget_limit < len(self._loaded_delegate_items) and not self._unload_timer.isActive():
+            self._unload_timer.start(0)
+
+    def __setDelegateItemVisible(self, item, visible):
+        """ Stores when a lazy delegate widget was hidden, so that the least recently
+        visible widgets can be unloaded first.
+
+        Args:
+            item (AbstractShojiModelItem):
+            visible (bool):"""
+        if item not in self._loaded_delegate_items:
+            return
+        hidden_time = self._loaded_delegate_items[item]
+        if visible:
+            self._loaded_delegate_items[item] = None
+        elif hidden_time is None:
+            self._loaded_delegate_items[item] = time.time()
+            self._loaded_delegate_items.move_to_end(item)
+            self.__scheduleUnloadDelegateWidgets()
+
+    def __prewarmNextDelegateWidget(self):
+        """ Creates the next lazy delegate widget, one per pass of the event loop"""
+        while self._prewarm_items:
+            if self._delegate_widget_limit is not None and self._delegate_widget_limit <= len(self._loaded_delegate_items):
+                return
+            item = self._prewarm_items.popitem(last=False)[0]
+            if item.delegateWidget() is None and item.row() is not None:
+                self.loadDelegateWidget(item)
+                break
+
+        if self._prewarm_items and self.isDelegatePrewarmEnabled():
+            self._prewarm_timer.start(0)
+
+    def __getDelegateWidgetPosition(self, item):
+        """ Returns (int): index in the delegate widget that the items widget should be
+        inserted at, so that the widgets are in the same order as the items"""
+        model = self.model()
+        item_path = model.getItemPath(item)
+        delegate_widget = self.delegateWidget()
+        for index in range(1, delegate_widget.count()):
+            widget = delegate_widget.widget(index)
+            if not hasattr(widget, "item"):
+                continue
+            widget_path = model.getItemPath(widget.item())
+            if None not in widget_path and item_path < widget_path:
+                return index
+        return delegate_widget.count()
 
     def __updateDynamicDisplay(self, item, selected):
         """
@@ -817,9 +1161,16 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         if selected:
             # create dynamic widget
             dynamic_widget = self.createNewDynamicWidget(item)
-            self.delegateWidget().addWidget(dynamic_widget)
+            if dynamic_widget.parent() is self.delegateWidget():
+                # pooled widgets are still in the delegate, so only need to be moved to the end
+                QSplitter.addWidget(self.delegateWidget(), dynamic_widget)
+                dynamic_widget.show()
+            else:
+                self.delegateWidget().addWidget(dynamic_widget)
             item.setDelegateWidget(dynamic_widget)
             self.updateDynamicWidget(self, dynamic_widget, item)
+        elif self.dynamicWidgetPoolSize() and item.delegateWidget():
+            self.__releaseDynamicWidget(item)
         else:
             # destroy widget
             try:
@@ -836,10 +1187,75 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         else:
             dynamic_widget_class = self.getDynamicWidgetBaseClass()
 
+        # reuse pooled widget
+        pool = self._dynamic_widget_pool.get(dynamic_widget_class)
+        if pool:
+            new_widget = pool.pop()
+            self.rebindShojiModelDelegateWidget(new_widget, item)
+            if item.getDynamicRebindFunction():
+                dynamic_rebind_function = item.getDynamicRebindFunction()
+            else:
+                dynamic_rebind_function = self.getDynamicRebindFunction()
+            if dynamic_rebind_function:
+                dynamic_rebind_function(self, new_widget, item)
+            return new_widget
+
         new_dynamic_widget = dynamic_widget_class()
         new_widget = self.createShojiModelDelegateWidget(item, new_dynamic_widget)
+
+        # store the pool key, as the base class can be a factory function
+        new_widget.setDynamicWidgetBaseClass(dynamic_widget_class)
         return new_widget
 
+    def dynamicWidgetPoolSize(self):
+        return self._dynamic_widget_pool_size
+
+    def setDynamicWidgetPoolSize(self, _dynamic_widget_pool_size):
+        """ Sets the maximum number of dynamic widgets of each type kept for reuse
+
+        When an item is deselected, its dynamic widget is returned to the pool, and
+        is rebound to the next item selected, rather than creating a new widget.  The
+        dynamic update function is run on the widget as normal, after the dynamic
+        rebind function (if one is set).
+
+        Args:
+            _dynamic_widget_pool_size (int): if 0, the dynamic widgets are not reused"""
+        self._dynamic_widget_pool_size = _dynamic_widget_pool_size
+        for pool in self._dynamic_widget_pool.values():
+            while _dynamic_widget_pool_size < len(pool):
+                widget = pool.pop()
+                widget.setParent(None)
+                widget.deleteLater()
+
+    def pooledDynamicWidgets(self):
+        """ Returns (list): of AbstractShojiModelDelegateWidgets waiting to be reused"""
+        return [widget for pool in self._dynamic_widget_pool.values() for widget in pool]
+
+    def clearDynamicWidgetPool(self):
+        """ Destroys all of the dynamic widgets that are waiting to be reused"""
+        for widget in self.pooledDynamicWidgets():
+            widget.setParent(None)
+            widget.deleteLater()
+        self._dynamic_widget_pool = {}
+
+    def __releaseDynamicWidget(self, item):
+        """ Returns the dynamic widget of a deselected item to the pool, if there is room
+
+        Args:
+            item (AbstractShojiModelItem): item that has been deselected"""
+        widget = item.delegateWidget()
+        item.setDelegateWidget(None)
+        pool = self._dynamic_widget_pool.setdefault(widget.getDynamicWidgetBaseClass(), [])
+        if widget in pool:
+            return
+
+        # pooled widgets are hidden in the delegate, so that they do not need to be installed again
+        if len(pool) < self._dynamic_widget_pool_size:
+            widget.hide()
+            pool.append(widget)
+        else:
+            widget.setParent(None)
+
     def updateDynamicWidget(self, parent, widget, item, *args, **kwargs):
         """
         Updates the dynamic widget
@@ -868,9 +1284,33 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
                 attrs.SOUTH
             ]:
                 width = int( self.width() / num_items )
-                if AbstractShojiModel.ITEM_WIDTH < width:
+                if AbstractShojiModel.ITEM_WIDTH < width and width != model.item_width:
                     model.item_width = width
-                    self.updateStyleSheet()
+                    self.invalidateLayoutPass(AbstractShojiLayoutPass.SIZE)
+
+    """ LAYOUT PASS """
+    def invalidateLayoutPass(self, flags=AbstractShojiLayoutPass.STYLE):
+        """
+        Schedules this widget to be updated once control returns to the event loop.
+
+        Args:
+            flags (int): AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE
+        """
+        AbstractShojiLayoutPass.instance().invalidate(self, flags)
+
+    def applyLayoutPass(self, flags):
+        """
+        Applies the invalidations collected since the last pass.  The header item
+        sizes are provided by the models size hint, so a size invalidation only needs
+        to relayout the header view, and will not touch the style sheet.
+
+        Args:
+            flags (int): AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE
+        """
+        if flags & AbstractShojiLayoutPass.STYLE:
+            self.updateStyleSheet()
+        if flags & AbstractShojiLayoutPass.SIZE:
+            self.headerWidget().view().doItemsLayout()
 
     """ EVENTS """
     def showEvent(self, event):
@@ -958,7 +1398,7 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         self.setHandleWidth(0)
 
         # create style sheet
-        style_sheet_args = iColor.style_sheet_args
+        style_sheet_args = dict(iColor.style_sheet_args)
         style_sheet_args = AbstractDragDropAbstractView.createAbstractStyleSheet(
             self.headerWidget().view(),
             style_sheet_args,
@@ -971,11 +1411,12 @@ class AbstractShojiModelViewWidget(QSplitter, iShojiDynamicWidget):
         {header_style_sheet}
         {splitter_style_sheet}
         """.format(**style_sheet_args)
-        self.setStyleSheet(style_sheet)
+        if style_sheet != self.styleSheet():
+            self.setStyleSheet(style_sheet)
 
         # update hover display of children
-        for index in self.model().getAllIndexes():
-            widget = index.internalPointer().delegateWidget()
+        for item in self.model().iterItems():
+            widget = item.delegateWidget()
             if widget:
                 self.delegateWidget().installHoverDisplay(widget)
 
@@ -1075,7 +1516,8 @@ class AbstractShojiMainDelegateWidget(AbstractShojiLayout):
                 widget,
                 name="SHOJI VIEW",
                 hover_type_flags=hover_type_flags,
-                border_walls=border_walls)
+                border_walls=border_walls,
+                scope=self)
 
         # install event filter
         widget.installEventFilter(self)
@@ -1173,6 +1615,16 @@ class AbstractShojiModelDelegateWidget(AbstractOverlayInputWidget):
     def item(self):
         return self._item
 
+    def setDynamicWidgetBaseClass(self, dynamic_widget_class):
+        """ Sets the dynamic widget base class that the main widget was created from.
+        This is used as the key of the dynamic widget pool."""
+        self._dynamic_widget_base_class = dynamic_widget_class
+
+    def getDynamicWidgetBaseClass(self):
+        if hasattr(self, '_dynamic_widget_base_class'):
+            return self._dynamic_widget_base_class
+        return type(self.getMainWidget())
+
 
 """ HEADER """
 class AbstractShojiHeader(AbstractModelViewWidget):
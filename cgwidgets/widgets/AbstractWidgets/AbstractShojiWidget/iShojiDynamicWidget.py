@@ -30,4 +30,16 @@ class iShojiDynamicWidget(object):
             return self._dynamicWidgetFunction
         return None
 
+    def setDynamicRebindFunction(self, function):
+        """
+        Sets the function that is run when a pooled dynamic widget is
+        reused for a different item.  This takes the args (parent, widget, item),
+        and should reset any state that the widget has from its previous item,
+        before the dynamic update function is run.
+        """
+        self._dynamic_rebind_function = function
 
+    def getDynamicRebindFunction(self):
+        if hasattr(self, '_dynamic_rebind_function'):
+            return self._dynamic_rebind_function
+        return None
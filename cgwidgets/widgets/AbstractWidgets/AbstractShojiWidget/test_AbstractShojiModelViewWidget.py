@@ -0,0 +1,195 @@
+import unittest
+import sys
+
+from qtpy.QtWidgets import QApplication, QLabel
+
+from cgwidgets.widgets import AbstractShojiModelViewWidget
+
+
+class TestAbstractShojiModelViewWidgetLazyDelegate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.created = []
+        self.shoji_widget = AbstractShojiModelViewWidget()
+        self.shoji_widget.setMultiSelect(True)
+        self.shoji_widget.setDelegateUnloadDelay(0)
+        for x in range(4):
+            self.shoji_widget.insertShojiWidget(
+                x, column_data={"name": "tab{x}".format(x=x)}, widget_factory=lambda x=x: self.createWidget(x))
+        self.items = list(self.shoji_widget.rootItem().children())
+
+    def tearDown(self):
+        self.shoji_widget.deleteLater()
+
+    def createWidget(self, x):
+        self.created.append(x)
+        return QLabel("tab{x}".format(x=x))
+
+    def displayItem(self, item):
+        self.shoji_widget.setItemSelected(item, True)
+        self.shoji_widget.setItemSelected(item, False)
+
+    def test_lazyCreation(self):
+        self.assertEqual(self.created, [])
+        self.assertIsNone(self.items[1].delegateWidget())
+
+        self.shoji_widget.setItemSelected(self.items[1], True)
+        self.assertEqual(self.created, [1])
+        self.assertEqual(self.shoji_widget.loadedDelegateItems(), [self.items[1]])
+        self.assertEqual(self.shoji_widget.activeDelegateWidgets()[-1].text(), "tab1")
+
+        # widgets are only created once
+        self.shoji_widget.setItemSelected(self.items[1], False)
+        self.shoji_widget.setItemSelected(self.items[1], True)
+        self.assertEqual(self.created, [1])
+
+    def test_unload(self):
+        self.shoji_widget.setDelegateWidgetLimit(1)
+        self.displayItem(self.items[0])
+        self.displayItem(self.items[1])
+        self.shoji_widget.unloadDelegateWidgets()
+        self.assertEqual(self.shoji_widget.loadedDelegateItems(), [self.items[1]])
+        self.assertIsNone(self.items[0].delegateWidget())
+
+        # unloaded widgets are created again
+        self.shoji_widget.setItemSelected(self.items[0], True)
+        self.assertEqual(self.created, [0, 1, 0])
+
+    def test_visibleWidgetsNotUnloaded(self):
+        self.shoji_widget.setDelegateWidgetLimit(1)
+        self.shoji_widget.setItemSelected(self.items[0], True)
+        self.shoji_widget.setItemSelected(self.items[1], True)
+        self.shoji_widget.unloadDelegateWidgets()
+        self.assertEqual(set(self.shoji_widget.loadedDelegateItems()), {self.items[0], self.items[1]})
+
+    def test_budgetDeletedItems(self):
+        self.shoji_widget.setDelegateWidgetLimit(2)
+        self.displayItem(self.items[0])
+        self.displayItem(self.items[1])
+        deleted_widget = self.items[0].delegateWidget()
+        self.shoji_widget.deleteItem(self.items[0])
+        self.assertEqual(self.shoji_widget.loadedDelegateItems(), [self.items[1]])
+        self.assertIsNone(self.items[0].delegateWidget())
+        self.assertIsNone(deleted_widget.parent())
+
+        # deleted items do not count against the limit
+        self.displayItem(self.items[2])
+        self.shoji_widget.unloadDelegateWidgets()
+        self.assertEqual(self.created, [0, 1, 2])
+        self.assertEqual(len(self.shoji_widget.loadedDelegateItems()), 2)
+
+    def test_layoutChangeDeletedItems(self):
+        self.displayItem(self.items[0])
+        self.displayItem(self.items[2])
+        model = self.shoji_widget.model()
+        model.setMoveRowsThreshold(0)
+        model.removeItems([self.items[0], self.items[2]])
+        self.assertEqual(self.shoji_widget.loadedDelegateItems(), [])
+
+    def test_prewarm(self):
+        # items are only queued while prewarming is enabled
+        self.displayItem(self.items[0])
+        self.shoji_widget.unloadDelegateWidget(self.items[0])
+        self.assertEqual(self.shoji_widget.prewarmItems(), [])
+
+        self.shoji_widget.setDelegateWidgetLimit(3)
+        self.shoji_widget.setIsDelegatePrewarmEnabled(True)
+        self.assertEqual(self.shoji_widget.prewarmItems(), self.items)
+        self.shoji_widget.deleteItem(self.items[3])
+        self.assertEqual(self.shoji_widget.prewarmItems(), self.items[:3])
+        for x in range(10):
+            self.app.processEvents()
+        self.assertEqual(sorted(self.created), [0, 0, 1, 2])
+        self.assertEqual(self.shoji_widget.prewarmItems(), [])
+
+        self.shoji_widget.setIsDelegatePrewarmEnabled(False)
+        self.shoji_widget.unloadDelegateWidget(self.items[0])
+        self.assertEqual(self.shoji_widget.prewarmItems(), [])
+
+
+class TestAbstractShojiModelViewWidgetDynamicPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.created = []
+        self.rebound = []
+        self.updated = []
+        self.shoji_widget = AbstractShojiModelViewWidget()
+        self.shoji_widget.setDelegateType(
+            AbstractShojiModelViewWidget.DYNAMIC,
+            dynamic_widget=self.createWidget,
+            dynamic_function=lambda parent, widget, item: self.updated.append((widget, item)))
+        self.shoji_widget.setDynamicRebindFunction(
+            lambda parent, widget, item: self.rebound.append((widget, item)))
+        self.shoji_widget.setDynamicWidgetPoolSize(1)
+        for x in range(3):
+            self.shoji_widget.insertShojiWidget(x, column_data={"name": "tab{x}".format(x=x)})
+        self.items = list(self.shoji_widget.rootItem().children())
+
+    def tearDown(self):
+        self.shoji_widget.deleteLater()
+
+    def createWidget(self):
+        widget = QLabel()
+        self.created.append(widget)
+        return widget
+
+    def selectItem(self, item):
+        self.shoji_widget.clearItemSelection()
+        self.shoji_widget.setItemSelected(item, True)
+
+    def test_rebind(self):
+        self.selectItem(self.items[0])
+        widget = self.items[0].delegateWidget()
+        self.assertEqual(self.rebound, [])
+
+        # the widget of the previous item is reused for the new item
+        self.selectItem(self.items[1])
+        self.assertEqual(len(self.created), 1)
+        self.assertIs(self.items[1].delegateWidget(), widget)
+        self.assertIs(widget.item(), self.items[1])
+        self.assertEqual(self.rebound, [(widget, self.items[1])])
+        self.assertEqual(self.updated[-1], (widget, self.items[1]))
+
+        self.selectItem(self.items[2])
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.rebound[-1], (widget, self.items[2]))
+
+    def test_itemBaseClass(self):
+        item_widgets = []
+
+        def createItemWidget():
+            widget = QLabel()
+            item_widgets.append(widget)
+            return widget
+        self.items[1].setDynamicWidgetBaseClass(createItemWidget)
+
+        self.selectItem(self.items[0])
+        self.selectItem(self.items[1])
+        self.selectItem(self.items[0])
+        self.selectItem(self.items[1])
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(len(item_widgets), 1)
+        self.assertIs(self.items[1].delegateWidget().getMainWidget(), item_widgets[0])
+
+    def test_poolSize(self):
+        self.shoji_widget.setDynamicWidgetPoolSize(0)
+        self.selectItem(self.items[0])
+        self.selectItem(self.items[1])
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.shoji_widget.pooledDynamicWidgets(), [])
+        self.assertEqual(self.rebound, [])
+
+
+def mainFunction():
+    app = QApplication(sys.argv)
+    unittest.main()
+
+
+if __name__ == '__main__':
+    mainFunction()
@@ -3,7 +3,7 @@ from qtpy.QtCore import Qt
 
 from cgwidgets.settings import iColor
 from cgwidgets.settings import icons
-from cgwidgets.settings.hover_display import installHoverDisplaySS
+from cgwidgets.settings.hover_display import installHoverDisplaySS, updateHoverDisplaySS
 
 from cgwidgets.utils import setAsWindow, centerWidgetOnScreen, setAsAlwaysOnTop
 from cgwidgets.widgets import AbstractLabelWidget, AbstractButtonInputWidget
@@ -78,8 +78,8 @@ class AbstractWarningWidget(QWidget):
         self._cancel_button = AbstractGIFWidget(cancel_gif)
 
         # install hover displays
-        installHoverDisplaySS(self.acceptButton(), hover_color=iColor["rgba_accept"])
-        installHoverDisplaySS(self.cancelButton(), hover_color=iColor["rgba_cancel"])
+        installHoverDisplaySS(self.acceptButton(), hover_color=iColor["rgba_accept"], scope=self)
+        installHoverDisplaySS(self.cancelButton(), hover_color=iColor["rgba_cancel"], scope=self)
 
         # setup style
         if not button_width:
@@ -129,13 +129,7 @@ around it when you hover over it means to go back...
 FYI:
 You can also hit <ESCAPE> to go back...
         """)
-        self.setStyleSheet("""
-            QToolTip {
-                background-color: black;
-                color: white;
-                border: black solid 1px
-            }"""
-        )
+        self.updateStyleSheet()
 
     def setButtonWidth(self, width):
         """
@@ -149,13 +143,19 @@ You can also hit <ESCAPE> to go back...
         style_sheet = """
 {type}{{
     background-color: rgba{rgba_background_00};
+}}
+QToolTip {{
+    background-color: black;
+    color: white;
+    border: black solid 1px
 }}
         """.format(
             type=type(self).__name__,
             rgba_background_00=iColor["rgba_background_00"]
         )
 
-        self.setStyleSheet(style_sheet)
+        # the rules for the hover displays of the buttons are installed here
+        updateHoverDisplaySS(self, style_sheet)
 
     """ PROPERTIES """
     def cancelButton(self):
@@ -22,5 +22,5 @@ from .AbstractBaseInputWidgets import AbstractInputPlainText as AbstractInputPla
 from .AbstractSplitterWidget import AbstractSplitterWidget
 
 from .AbstractGIFWidget import AbstractGIFWidget
-from .AbstractShojiLayout import AbstractShojiLayout, AbstractShojiLayoutHandle
+from .AbstractShojiLayout import AbstractShojiLayout, AbstractShojiLayoutHandle, AbstractShojiLayoutPass
 from .AbstractScriptEditor import *
@@ -0,0 +1,118 @@
+import unittest
+import sys
+
+from qtpy.QtWidgets import QApplication, QLabel
+from qtpy.QtCore import QObject
+
+from cgwidgets.widgets import ShojiLayout, ShojiModelViewWidget
+from cgwidgets.widgets.AbstractWidgets import AbstractShojiLayoutPass
+
+
+class LayoutPassWidget(QObject):
+    def __init__(self, parent=None):
+        super(LayoutPassWidget, self).__init__(parent)
+        self.layout_passes = []
+
+    def applyLayoutPass(self, flags):
+        self.layout_passes.append(flags)
+
+
+class DeletedWidget(QObject):
+    def applyLayoutPass(self, flags):
+        raise RuntimeError("wrapped C/C++ object has been deleted")
+
+
+class StyleSheetShojiLayout(ShojiLayout):
+    def __init__(self, parent=None):
+        self.num_style_sheets = 0
+        super(StyleSheetShojiLayout, self).__init__(parent)
+
+    def setStyleSheet(self, style_sheet):
+        self.num_style_sheets += 1
+        return ShojiLayout.setStyleSheet(self, style_sheet)
+
+
+class TestAbstractShojiLayoutPass(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        self.layout_pass = AbstractShojiLayoutPass.instance()
+        self.layout_pass.flush()
+
+    def test_coalesceFlags(self):
+        widget = LayoutPassWidget()
+        self.layout_pass.invalidate(widget, AbstractShojiLayoutPass.SIZE)
+        self.layout_pass.invalidate(widget, AbstractShojiLayoutPass.STYLE)
+        self.layout_pass.invalidate(widget, AbstractShojiLayoutPass.SIZE)
+        self.assertEqual(widget.layout_passes, [])
+        self.assertEqual(
+            self.layout_pass.invalidatedWidgets()[widget], AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE)
+
+        # the pass is applied once, when control returns to the event loop
+        self.app.processEvents()
+        self.app.processEvents()
+        self.assertEqual(widget.layout_passes, [AbstractShojiLayoutPass.SIZE | AbstractShojiLayoutPass.STYLE])
+        self.assertEqual(len(self.layout_pass.invalidatedWidgets()), 0)
+
+    def test_deletedWidget(self):
+        widget = LayoutPassWidget()
+        self.layout_pass.invalidate(DeletedWidget(), AbstractShojiLayoutPass.STYLE)
+        self.layout_pass.invalidate(widget, AbstractShojiLayoutPass.STYLE)
+        self.layout_pass.flush()
+        self.assertEqual(widget.layout_passes, [AbstractShojiLayoutPass.STYLE])
+
+    def test_resizeShojiLayout(self):
+        shoji_layout = StyleSheetShojiLayout()
+        for x in range(2):
+            shoji_layout.addWidget(QLabel(str(x)))
+        shoji_layout.show()
+        self.layout_pass.flush()
+
+        # without a handle length, the style sheet does not depend on the size
+        num_style_sheets = shoji_layout.num_style_sheets
+        shoji_layout.resize(300, 200)
+        shoji_layout.resize(400, 200)
+        self.app.processEvents()
+        self.assertNotIn(shoji_layout, self.layout_pass.invalidatedWidgets())
+        self.assertEqual(shoji_layout.num_style_sheets, num_style_sheets)
+
+        # with a handle length, every resize in a cycle is one style update
+        shoji_layout.setHandleLength(10)
+        num_style_sheets = shoji_layout.num_style_sheets
+        shoji_layout.resize(500, 200)
+        shoji_layout.resize(500, 300)
+        self.assertEqual(self.layout_pass.invalidatedWidgets()[shoji_layout], AbstractShojiLayoutPass.STYLE)
+        self.layout_pass.flush()
+        self.assertEqual(shoji_layout.num_style_sheets, num_style_sheets + 1)
+
+        # unchanged style sheets are not reapplied
+        shoji_layout.applyLayoutPass(AbstractShojiLayoutPass.STYLE)
+        self.assertEqual(shoji_layout.num_style_sheets, num_style_sheets + 1)
+        shoji_layout.close()
+
+    def test_resizeShojiModelViewWidget(self):
+        shoji_widget = ShojiModelViewWidget()
+        for x in range(2):
+            shoji_widget.insertShojiWidget(x, column_data={"name": str(x)}, widget=QLabel(str(x)))
+        shoji_widget.show()
+        self.layout_pass.flush()
+
+        # header items are resized without a style sheet change
+        style_sheet = shoji_widget.styleSheet()
+        shoji_widget.resize(1000, 400)
+        self.assertEqual(self.layout_pass.invalidatedWidgets().get(shoji_widget), AbstractShojiLayoutPass.SIZE)
+        self.layout_pass.flush()
+        self.assertEqual(shoji_widget.model().item_width, 500)
+        self.assertEqual(shoji_widget.styleSheet(), style_sheet)
+        shoji_widget.close()
+
+
+def mainFunction():
+    app = QApplication(sys.argv)
+    unittest.main()
+
+
+if __name__ == '__main__':
+    mainFunction()
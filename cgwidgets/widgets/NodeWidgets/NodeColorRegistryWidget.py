@@ -889,22 +889,34 @@ MMB to clear an items color""")
 
         Args:
             children (list): of item data"""
-        for child in reversed(children):
+        items_data = self.getPopulateItemsData(children)
+        self.nodeColorsWidget().insertNewIndexes(0, items_data, parent=parent)
+
+    def getPopulateItemsData(self, children):
+        """ Converts the exported item data into data for the models insertNewIndexes()
+
+        Args:
+            children (list): of item data
+
+        Returns (list): of dicts"""
+        items_data = []
+        for child in children:
             if child["item_type"] == COLOR:
-                # column_data = child
-                new_index = self.nodeColorsWidget().insertNewIndex(
-                    0, name=child["name"], column_data=child, is_droppable=False, parent=parent)
+                items_data.append({
+                    "name": child["name"],
+                    "column_data": child,
+                    "is_droppable": False,
+                    "is_enabled": child["enabled"]})
                 self.appendNodeType(child["name"])
             elif child["item_type"] == GROUP:
-                new_index = self.nodeColorsWidget().insertNewIndex(
-                    0, name="group", column_data=child, is_droppable=True, parent=parent)
-                self.populate(child["children"], parent=new_index)
-                pass
-
-            # setup enable/disabled
-            if not child["enabled"]:
-                new_item = new_index.internalPointer()
-                new_item.setIsEnabled(child["enabled"])
+                items_data.append({
+                    "name": "group",
+                    "column_data": child,
+                    "is_droppable": True,
+                    "is_enabled": child["enabled"],
+                    "children": self.getPopulateItemsData(child["children"])})
+
+        return items_data
 
     def loadColorFile(self, filepath):
         """ Loads the color config file provided
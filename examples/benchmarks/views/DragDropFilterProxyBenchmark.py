@@ -0,0 +1,74 @@
+""" Filter benchmark for the AbstractDragDropFilterProxyModel
+
+Creates a flat model of 100k items with two filters, a regex filter on the
+name, and a comparison filter on the size, and times how long it takes to
+re-filter after one of the filters is edited.  Only the filter that has been
+edited needs to be evaluated again, the other one is read from its cache.
+
+Then creates a nested model of 1000 groups with 100 items each, where none of
+the items are accepted, and times editing an item in 100 of the groups so that
+they are accepted, and their groups are shown.  Only the edited item and its
+ancestors are filtered again, rather than re-filtering the entire model.
+"""
+import sys
+import time
+
+from qtpy.QtCore import QRegExp, Qt
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropFilterProxyModel
+
+app = QApplication(sys.argv)
+
+NUM_ITEMS = 100000
+NUM_GROUPS = 1000
+NUM_GROUP_ITEMS = 100
+NUM_EDITS = 100
+
+# create model
+model = AbstractDragDropModel()
+model.setHeaderData(["name", "size"])
+model.insertNewIndexes(0, [
+    {"column_data": {"name": "item{x}".format(x=x), "size": str(x % 1000)}} for x in range(NUM_ITEMS)])
+
+proxy_model = AbstractDragDropFilterProxyModel()
+proxy_model.setSourceModel(model)
+
+RESULT = "{name:<32} {ms:10.2f} ms | {rows} rows"
+
+
+def timeFilter(name, function):
+    start = time.perf_counter()
+    function()
+    rows = proxy_model.rowCount(proxy_model.index(-1, -1))
+    print(RESULT.format(name=name, ms=(time.perf_counter() - start) * 1e3, rows=rows))
+
+
+regex = QRegExp("item1")
+regex.setCaseSensitivity(Qt.CaseInsensitive)
+timeFilter("add regex filter", lambda: proxy_model.addFilter(regex, name="search"))
+timeFilter("add comparison filter", lambda: proxy_model.addComparisonFilter(500, arg="size", operator="<", name="size"))
+timeFilter("edit regex filter", lambda: proxy_model.updateFilterByName("item2", "search"))
+timeFilter("edit comparison filter", lambda: proxy_model.updateFilterByName(100, "size"))
+timeFilter("invalidate (all cached)", proxy_model.invalidateFilter)
+
+# nested model
+model = AbstractDragDropModel()
+model.setHeaderData(["name", "size"])
+model.insertNewIndexes(0, [
+    {"column_data": {"name": "group{x}".format(x=x), "size": "0"}, "children": [
+        {"column_data": {"name": "item{y}".format(y=y), "size": str(y)}} for y in range(NUM_GROUP_ITEMS)]}
+    for x in range(NUM_GROUPS)])
+proxy_model = AbstractDragDropFilterProxyModel()
+proxy_model.setSourceModel(model)
+timeFilter("add recursive filter", lambda: proxy_model.addFilter(QRegExp("found"), name="search"))
+
+
+def editItems():
+    for x in range(NUM_EDITS):
+        item = model.rootItem().children()[x].children()[1]
+        item.setArg("name", "found{x}".format(x=x))
+        model.itemDataChanged(item)
+
+
+timeFilter("edit items", editItems)
@@ -0,0 +1,86 @@
+""" Batch update benchmark for the AbstractDragDropModel
+
+Creates a tree of 10k items displayed in an AbstractDragDropTreeView, and
+times disabling, renaming and deleting the first half of the items in every
+group, one item at a time, with and without a batchUpdate().  Inside of a
+batch update the signals are merged into contiguous ranges, and the user
+events are delivered in one call, so the views only update once per range
+instead of once per item.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropTreeView
+
+app = QApplication(sys.argv)
+
+NUM_GROUPS = 100
+NUM_CHILDREN = 99
+
+RESULT = "{name:<24} {ms:10.2f} ms | dataChanged: {data_changed} | removed: {removed} | layout changes: {layout} | " \
+         "events: {events}"
+
+
+def createModel():
+    model = AbstractDragDropModel()
+    model.insertNewIndexes(0, [
+        {"name": "group{x}".format(x=x), "children": [{"name": "item{y}".format(y=y)} for y in range(NUM_CHILDREN)]}
+        for x in range(NUM_GROUPS)])
+    return model
+
+
+def disable(model, items):
+    for item in items:
+        model.setItemEnabled(item, False)
+
+
+def rename(model, items):
+    for item in items:
+        model.setData(model.getIndexFromItem(item), "renamed")
+
+
+def delete(model, items):
+    for item in items:
+        model.deleteItem(item, event_update=True)
+
+
+for name, function in (("disable", disable), ("rename", rename), ("delete", delete)):
+    for is_batch in (False, True):
+        # setup model/view
+        model = createModel()
+        view = AbstractDragDropTreeView()
+        view.setModel(model)
+        view.expandAll()
+        view.show()
+        app.processEvents()
+
+        # track signals / events
+        signals = {"data_changed": 0, "removed": 0, "layout": 0, "events": 0}
+        model.dataChanged.connect(lambda *args: signals.__setitem__("data_changed", signals["data_changed"] + 1))
+        model.rowsRemoved.connect(lambda *args: signals.__setitem__("removed", signals["removed"] + 1))
+        model.layoutChanged.connect(lambda *args: signals.__setitem__("layout", signals["layout"] + 1))
+        model.setItemsEnabledEvent(lambda items: signals.__setitem__("events", signals["events"] + 1))
+        model.setItemsDeleteEvent(lambda items: signals.__setitem__("events", signals["events"] + 1))
+        model.setItemEnabledEvent(lambda item, enabled: signals.__setitem__("events", signals["events"] + 1))
+        model.setItemDeleteEvent(lambda item: signals.__setitem__("events", signals["events"] + 1))
+
+        items = [
+            item for item in model.iterItems()
+            if item.parent() is not model.rootItem() and item.row() < NUM_CHILDREN // 2]
+
+        start = time.perf_counter()
+        if is_batch:
+            with model.batchUpdate():
+                function(model, items)
+        else:
+            function(model, items)
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+
+        print(RESULT.format(
+            name="{name} {batch}".format(name=name, batch="(batch)" if is_batch else ""),
+            ms=elapsed * 1e3, **signals))
+        view.close()
+        view.deleteLater()
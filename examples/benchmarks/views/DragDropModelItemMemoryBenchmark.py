@@ -0,0 +1,42 @@
+""" Memory benchmark for the AbstractDragDropModelItem
+
+Creates a flat list of items, each with the same column keys, and reports the
+number of bytes allocated per item.  Items store their flags in a single
+bitfield, and their column data as a list of values with a schema of keys
+that is shared between all of them.
+"""
+import gc
+import tracemalloc
+
+from cgwidgets.views import AbstractDragDropModelItem
+
+SIZES = [100000, 1000000]
+
+
+def createItems(num_items):
+    """ Creates the number of items provided under a single parent
+
+    Args:
+        num_items (int): number of items to create
+
+    Returns (AbstractDragDropModelItem): parent item"""
+    parent_item = AbstractDragDropModelItem()
+    for x in range(num_items):
+        item = AbstractDragDropModelItem(parent=parent_item)
+        item.setColumnData({"name": x, "value": x})
+        item.setIsDraggable(True)
+        item.setIsEditable(False)
+    return parent_item
+
+
+for size in SIZES:
+    gc.collect()
+    tracemalloc.start()
+    parent_item = createItems(size)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{size:>8} items | {per_item:8.1f} bytes per item | {total:8.1f} MB total".format(
+        size=size, per_item=current / size, total=current / 1024 / 1024))
+
+    del parent_item
@@ -0,0 +1,68 @@
+""" Lazy population benchmark for the AbstractDragDropModel
+
+Displays a virtual tree of 1M items (100 groups, each with 100 sub groups of
+100 items) in an AbstractDragDropTreeView using an AbstractDragDropItemProvider,
+and times showing the view, and expanding branches.  Only the children of the
+branches that are expanded are created, one page at a time, and once the
+fetch limit is exceeded, the collapsed branches are evicted.
+"""
+import sys
+import time
+
+from qtpy.QtCore import QModelIndex
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropItemProvider, AbstractDragDropTreeView
+
+app = QApplication(sys.argv)
+
+NUM_CHILDREN = 100
+DEPTH = 3
+PAGE_SIZE = 50
+FETCH_LIMIT = 2000
+
+
+class TreeProvider(AbstractDragDropItemProvider):
+    """ Provides a tree of NUM_CHILDREN children per item, DEPTH levels deep"""
+    def hasChildren(self, item):
+        path = item.getArg("path") or ""
+        return path.count("/") < DEPTH
+
+    def fetchChildren(self, item, start, count):
+        path = item.getArg("path") or ""
+        return [
+            {"column_data": {"name": "item{x}".format(x=x), "path": "{path}/{x}".format(path=path, x=x)}}
+            for x in range(start, min(NUM_CHILDREN, start + count))]
+
+
+# create model
+model = AbstractDragDropModel()
+model.setItemProvider(TreeProvider())
+model.setFetchPageSize(PAGE_SIZE)
+model.setFetchLimit(FETCH_LIMIT)
+
+RESULT = "{name:<24} {ms:10.2f} ms | {num} items in model"
+
+
+def timeEvent(name, function):
+    start = time.perf_counter()
+    function()
+    app.processEvents()
+    print(RESULT.format(
+        name=name, ms=(time.perf_counter() - start) * 1e3, num=len(list(model.iterItems()))))
+
+
+# create view
+view = AbstractDragDropTreeView()
+view.setModel(model)
+timeEvent("show", view.show)
+
+# expand / collapse branches
+for row in range(20):
+    group_index = model.index(row, 0, QModelIndex())
+    timeEvent("expand group{row}".format(row=row), lambda: view.expand(group_index))
+    sub_group_index = model.index(0, 0, group_index)
+    timeEvent("expand group{row}/item0".format(row=row), lambda: view.expand(sub_group_index))
+    view.collapse(group_index)
+
+print("{num} items fetched | {limit} fetch limit".format(num=model.numFetchedItems(), limit=FETCH_LIMIT))
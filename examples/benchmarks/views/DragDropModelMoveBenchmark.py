@@ -0,0 +1,70 @@
+""" Drop benchmark for the AbstractDragDropModel
+
+Creates a tree of 50k items displayed in a QTreeView, and drops 1k of them
+onto a group.  Contiguous items are moved with one beginMoveRows/endMoveRows,
+scattered items are moved inside of a single layout change, and the model
+should never reset.  Most of the remaining time is the view updating the layout
+of its expanded rows.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication, QTreeView
+
+from cgwidgets.views import AbstractDragDropModel
+
+app = QApplication(sys.argv)
+
+NUM_GROUPS = 50
+NUM_CHILDREN = 1000
+NUM_DROPPED = 1000
+
+# create model
+model = AbstractDragDropModel()
+items_data = [
+    {"name": "group{x}".format(x=x), "children": [{"name": "item{y}".format(y=y)} for y in range(NUM_CHILDREN)]}
+    for x in range(NUM_GROUPS)]
+model.insertNewIndexes(0, items_data)
+
+# create view
+view = QTreeView()
+view.setModel(model)
+view.expandAll()
+view.show()
+app.processEvents()
+
+# track signals
+signals = {"moved": 0, "layout": 0, "reset": 0}
+model.rowsMoved.connect(lambda *args: signals.__setitem__("moved", signals["moved"] + 1))
+model.layoutChanged.connect(lambda *args: signals.__setitem__("layout", signals["layout"] + 1))
+model.modelReset.connect(lambda *args: signals.__setitem__("reset", signals["reset"] + 1))
+
+
+def dropItems(items, parent_item, row):
+    model.indexes = items
+    parent_index = model.getIndexFromItem(parent_item)
+    start = time.perf_counter()
+    model.dropMimeData(None, None, row, 0, parent_index)
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+# contiguous selection, coalesced into one move
+source_group = model.rootItem().children()[0]
+target_group = model.rootItem().children()[-1]
+contiguous_time = dropItems(source_group.children()[:NUM_DROPPED], target_group, 0)
+RESULT = "{name:<12} drop of {num} items: {ms:8.2f} ms | moves: {moved} | layout changes: {layout} | resets: {reset}"
+print(RESULT.format(
+    name="contiguous",
+    num=NUM_DROPPED, ms=contiguous_time * 1e3, **signals))
+
+# scattered selection, every 50th item of each group
+signals.update({"moved": 0, "layout": 0, "reset": 0})
+scattered_items = []
+for group in model.rootItem().children()[1:-1]:
+    scattered_items += group.children()[::50]
+scattered_items = scattered_items[:NUM_DROPPED]
+scattered_time = dropItems(scattered_items, target_group, target_group.childCount())
+print(RESULT.format(
+    name="scattered",
+    num=len(scattered_items), ms=scattered_time * 1e3, **signals))
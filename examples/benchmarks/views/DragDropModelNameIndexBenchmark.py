@@ -0,0 +1,48 @@
+""" Name lookup benchmark for the AbstractDragDropModel
+
+Creates a tree of 50k items, and times exact / regex searches with
+findItems(), and the creation of unique names for items that are duplicated
+under the same parent.  Names are looked up through the models name index,
+so exact searches, and each unique name, should take roughly constant time.
+"""
+import sys
+import time
+
+from qtpy.QtCore import Qt
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel
+
+app = QApplication(sys.argv)
+
+NUM_GROUPS = 50
+NUM_CHILDREN = 1000
+NUM_DUPLICATES = 2000
+
+# create model
+model = AbstractDragDropModel()
+items_data = [
+    {"name": "group{x}".format(x=x), "children": [{"name": "item{y}".format(y=y)} for y in range(NUM_CHILDREN)]}
+    for x in range(NUM_GROUPS)]
+model.insertNewIndexes(0, items_data)
+
+RESULT = "{name:<24} {ms:10.3f} ms | {num} results"
+
+# searches
+for name, value, match_type in (
+        ("exact (first, builds index)", "item500", Qt.MatchExactly),
+        ("exact", "item501", Qt.MatchExactly),
+        ("regex", "item5.*", Qt.MatchRegExp),
+        ("starts with", "item99", Qt.MatchStartsWith)):
+    start = time.perf_counter()
+    indexes = model.findItems(value, match_type=match_type)
+    print(RESULT.format(name=name, ms=(time.perf_counter() - start) * 1e3, num=len(indexes)))
+
+# duplicate items under the same parent
+group_index = model.getIndexFromItem(model.rootItem().children()[0])
+start = time.perf_counter()
+for x in range(NUM_DUPLICATES):
+    item = model.insertNewIndex(0, name="duplicate", parent=group_index).internalPointer()
+    item.setName(model.getUniqueItemName(item))
+print(RESULT.format(
+    name="unique names", ms=(time.perf_counter() - start) * 1e3, num=NUM_DUPLICATES))
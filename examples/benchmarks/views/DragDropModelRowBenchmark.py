@@ -0,0 +1,68 @@
+""" Row lookup benchmark for the AbstractDragDropModel
+
+Populates a single level of the model with an increasing number of children,
+and times the cost of calling parent() / index() / getIndexFromItem() on the
+last child of that level (parent() is called on a grandchild, so that it has
+to resolve the row of the last child).  As the row of each item is cached,
+these should remain flat regardless of how many siblings the item has.
+"""
+import sys
+import timeit
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropModelItem
+
+app = QApplication(sys.argv)
+
+NUM_CALLS = 10000
+SIZES = [100, 1000, 10000, 100000]
+
+
+def populateModel(num_children):
+    """ Creates a model with one group item holding the number of children provided
+
+    Args:
+        num_children (int): number of children to create under the group
+
+    Returns (AbstractDragDropModel, QModelIndex)"""
+    model = AbstractDragDropModel()
+    group_index = model.insertNewIndex(0, name="group")
+    group_item = group_index.internalPointer()
+    for x in range(num_children):
+        item = AbstractDragDropModelItem(parent=group_item)
+        item.setColumnData({"name": "item{x}".format(x=x)})
+    return model, model.getIndexFromItem(group_item)
+
+
+print("{:>10} | {:>14} | {:>14} | {:>14}".format(
+    "children", "parent() us", "index() us", "getIndex() us"))
+for size in SIZES:
+    model, group_index = populateModel(size)
+    last_row = size - 1
+    last_index = model.index(last_row, 0, group_index)
+    last_item = last_index.internalPointer()
+    grandchild_item = AbstractDragDropModelItem(parent=last_item)
+    grandchild_index = model.index(0, 0, last_index)
+
+    # warm up row cache
+    last_item.row()
+
+    parent_time = timeit.timeit(lambda: model.parent(grandchild_index), number=NUM_CALLS)
+    index_time = timeit.timeit(lambda: model.index(last_row, 0, group_index), number=NUM_CALLS)
+    get_index_time = timeit.timeit(lambda: model.getIndexFromItem(last_item), number=NUM_CALLS)
+
+    print("{:>10} | {:>14.3f} | {:>14.3f} | {:>14.3f}".format(
+        size,
+        parent_time / NUM_CALLS * 1e6,
+        index_time / NUM_CALLS * 1e6,
+        get_index_time / NUM_CALLS * 1e6))
+
+# reorder and time a single rebuild of the row index
+model, group_index = populateModel(SIZES[-1])
+group_item = group_index.internalPointer()
+group_item.insertChild(0, AbstractDragDropModelItem())
+last_item = group_item.children()[-1]
+rebuild_time = timeit.timeit(last_item.row, number=1)
+print("rebuild after insert at row 0 ({size} children): {ms:.3f} ms".format(
+    size=SIZES[-1], ms=rebuild_time * 1e3))
@@ -0,0 +1,65 @@
+""" Sort benchmark for the AbstractDragDropModel
+
+Creates a flat model of 100k items with random names, and times sorting it
+through a plain QSortFilterProxyModel, which compares the data() of every pair
+of rows, against the models own sort(), which creates one cached key per item.
+Single item edits are then timed, which move the item to its sorted position
+with a binary search, instead of sorting the entire model again.  Note that
+the QSortFilterProxyModel still remaps all of the rows under the parent when
+a row is moved, so the edits are timed with and without the proxy model.
+"""
+import random
+import sys
+import time
+
+from qtpy.QtCore import Qt, QModelIndex, QSortFilterProxyModel
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropFilterProxyModel
+
+app = QApplication(sys.argv)
+
+NUM_ITEMS = 100000
+NUM_EDITS = 1000
+
+RESULT = "{name:<32} {ms:10.2f} ms"
+
+random.seed(0)
+
+
+def createModel():
+    model = AbstractDragDropModel()
+    model.insertNewIndexes(0, [
+        {"name": "item{x}".format(x=random.randint(0, NUM_ITEMS))} for _ in range(NUM_ITEMS)])
+    return model
+
+
+def timeEvent(name, function):
+    start = time.perf_counter()
+    function()
+    print(RESULT.format(name=name, ms=(time.perf_counter() - start) * 1e3))
+
+
+# QSortFilterProxyModel
+model = createModel()
+proxy_model = QSortFilterProxyModel()
+proxy_model.setSourceModel(model)
+timeEvent("QSortFilterProxyModel.sort()", lambda: proxy_model.sort(0, Qt.AscendingOrder))
+timeEvent("QSortFilterProxyModel.sort() desc", lambda: proxy_model.sort(0, Qt.DescendingOrder))
+
+# native sort
+model = createModel()
+proxy_model = AbstractDragDropFilterProxyModel()
+proxy_model.setSourceModel(model)
+timeEvent("AbstractDragDropModel.sort()", lambda: proxy_model.sort(0, Qt.AscendingOrder))
+timeEvent("AbstractDragDropModel.sort() desc", lambda: proxy_model.sort(0, Qt.DescendingOrder))
+
+# single item edits
+def editItems():
+    for item in random.sample(model.rootItem().children(), NUM_EDITS):
+        model.setData(model.getIndexFromItem(item), "item{x}".format(x=random.randint(0, NUM_ITEMS)))
+
+
+timeEvent("{num} edits (proxy)".format(num=NUM_EDITS), editItems)
+proxy_model.setSourceModel(AbstractDragDropModel())
+timeEvent("{num} edits".format(num=NUM_EDITS), editItems)
@@ -0,0 +1,69 @@
+""" Streaming export/import benchmark for the AbstractDragDropModel
+
+Round trips a tree of 1M items (1000 groups of 999 items) through a newline
+delimited JSON file with exportModelToFile() / importModelFromFile(), and
+reports the time taken, and the peak memory allocated on top of the items
+themselves.  Items are written and read one at a time, and inserted into the
+model in batches, so the peak should stay close to the size of the model.
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from qtpy.QtCore import QModelIndex
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel
+
+app = QApplication(sys.argv)
+
+NUM_GROUPS = 1000
+NUM_CHILDREN = 999
+
+RESULT = "{name:<8} {s:8.2f} s | {num} items"
+MEMORY_RESULT = "{name:<8} {model:8.1f} MB model | {peak:8.1f} MB peak | {overhead:8.1f} MB overhead"
+
+
+def createModel():
+    model = AbstractDragDropModel()
+    model.setHeaderData(["name", "value"])
+    model.insertNewIndexes(0, [
+        {"column_data": {"name": "group{x}".format(x=x), "value": x}, "children": [
+            {"column_data": {"name": "item{y}".format(y=y), "value": y}} for y in range(NUM_CHILDREN)]}
+        for x in range(NUM_GROUPS)])
+    return model
+
+
+def timeEvent(name, function):
+    start = time.perf_counter()
+    result = function()
+    print(RESULT.format(name=name, s=time.perf_counter() - start, num=result))
+
+
+filepath = os.path.join(tempfile.mkdtemp(), "model.ndjson")
+
+# export
+model = createModel()
+timeEvent("export", lambda: model.exportModelToFile(model.rootItem(), filepath))
+print("{size:.1f} MB file".format(size=os.path.getsize(filepath) / 1024 / 1024))
+del model
+
+# import
+new_model = AbstractDragDropModel()
+timeEvent("import", lambda: new_model.importModelFromFile(filepath, parent=QModelIndex()))
+del new_model
+
+# memory allocated while importing, on top of the items that are created
+gc.collect()
+tracemalloc.start()
+new_model = AbstractDragDropModel()
+new_model.importModelFromFile(filepath, parent=QModelIndex())
+current, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(MEMORY_RESULT.format(
+    name="import", model=current / 1024 / 1024, peak=peak / 1024 / 1024, overhead=(peak - current) / 1024 / 1024))
+
+os.remove(filepath)
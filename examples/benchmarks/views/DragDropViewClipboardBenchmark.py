@@ -0,0 +1,67 @@
+""" Clipboard benchmark for the AbstractDragDropTreeView
+
+Creates a tree of 10k items, and times copy/paste, duplicate and cut of every
+other group.  The copies are created off of the model and inserted in one
+batch per contiguous range, and cuts are removed one range at a time, so the
+number of signals emitted should stay low regardless of the number of items.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropTreeView
+
+app = QApplication(sys.argv)
+
+NUM_GROUPS = 100
+NUM_CHILDREN = 99
+
+# create model
+model = AbstractDragDropModel()
+model.setIsCopyable(True)
+model.insertNewIndexes(0, [
+    {"name": "group{x}".format(x=x), "children": [{"name": "item{y}".format(y=y)} for y in range(NUM_CHILDREN)]}
+    for x in range(NUM_GROUPS)])
+
+# create view
+view = AbstractDragDropTreeView()
+view.setModel(model)
+view.show()
+app.processEvents()
+
+# track signals
+signals = {"inserted": 0, "removed": 0, "layout": 0, "reset": 0}
+model.rowsInserted.connect(lambda *args: signals.__setitem__("inserted", signals["inserted"] + 1))
+model.rowsRemoved.connect(lambda *args: signals.__setitem__("removed", signals["removed"] + 1))
+model.layoutChanged.connect(lambda *args: signals.__setitem__("layout", signals["layout"] + 1))
+model.modelReset.connect(lambda *args: signals.__setitem__("reset", signals["reset"] + 1))
+
+RESULT = "{name:<12} {ms:10.2f} ms | {num} items | inserted: {inserted} | removed: {removed} | " \
+         "layout changes: {layout} | resets: {reset}"
+
+
+def timeEvent(name, function, items):
+    view.clearItemSelection()
+    for item in items:
+        view.setItemSelected(item, True)
+    num_items = len(list(model.iterItems()))
+    signals.update({"inserted": 0, "removed": 0, "layout": 0, "reset": 0})
+
+    start = time.perf_counter()
+    function()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    print(RESULT.format(
+        name=name, ms=elapsed * 1e3, num=abs(len(list(model.iterItems())) - num_items), **signals))
+
+
+def copyPaste():
+    view.copyEvent()
+    view.clearItemSelection()
+    view.pasteEvent()
+
+
+timeEvent("copy/paste", copyPaste, model.rootItem().children()[::2])
+timeEvent("duplicate", view.duplicateEvent, model.rootItem().children()[:NUM_GROUPS:2])
+timeEvent("cut", view.cutEvent, model.rootItem().children()[::2])
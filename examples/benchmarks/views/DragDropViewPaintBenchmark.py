@@ -0,0 +1,76 @@
+""" Paint benchmark for the AbstractDragDropModelDelegate
+
+Creates a flat model of 100k items displayed in an offscreen list view, and
+scrolls through it one page at a time, repainting the viewport after every
+scroll.  The delegates paint() and the models data() are also timed on their
+own, as most of the time spent scrolling is spent inside of Qt.  The palettes that the delegate paints with, and the fonts/colors
+returned from the models data(), are cached by the state of the item, so
+no new Qt objects should be created per item while painting.
+"""
+import sys
+import time
+
+from qtpy.QtCore import Qt, QItemSelection, QItemSelectionModel, QModelIndex, QRect
+from qtpy.QtGui import QImage, QPainter
+from qtpy.QtWidgets import QApplication, QStyleOptionViewItem
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropListView
+
+app = QApplication(sys.argv)
+
+NUM_ITEMS = 100000
+NUM_PAGES = 200
+NUM_CALLS = 20000
+
+# create model
+model = AbstractDragDropModel()
+model.insertNewIndexes(0, [
+    {"name": "item{x}".format(x=x), "is_enabled": bool(x % 3)} for x in range(NUM_ITEMS)])
+
+# create view
+view = AbstractDragDropListView()
+view.setUniformItemSizes(True)
+view.setModel(model)
+view.resize(400, 800)
+view.show()
+app.processEvents()
+
+# select the first half, so that both selected and unselected items are painted
+selection = QItemSelection(model.index(0, 0, QModelIndex()), model.index(NUM_ITEMS // 2, 0, QModelIndex()))
+view.selectionModel().select(selection, QItemSelectionModel.Select)
+app.processEvents()
+
+# scroll
+scroll_bar = view.verticalScrollBar()
+step = max(1, scroll_bar.maximum() // NUM_PAGES)
+start = time.perf_counter()
+for page in range(NUM_PAGES):
+    scroll_bar.setValue(page * step)
+    view.viewport().repaint()
+elapsed = time.perf_counter() - start
+
+print("{pages} pages: {ms:8.2f} ms total | {per_page:6.2f} ms per page".format(
+    pages=NUM_PAGES, ms=elapsed * 1e3, per_page=elapsed / NUM_PAGES * 1e3))
+
+# paint directly
+image = QImage(400, 35, QImage.Format_ARGB32)
+painter = QPainter(image)
+option = QStyleOptionViewItem()
+option.initFrom(view)
+option.rect = QRect(0, 0, 400, 35)
+delegate = view.itemDelegate()
+indexes = [model.index(row, 0, QModelIndex()) for row in range(NUM_CALLS)]
+start = time.perf_counter()
+for index in indexes:
+    delegate.paint(painter, option, index)
+elapsed = time.perf_counter() - start
+painter.end()
+print("{name:<16} {us:6.2f} us per call".format(name="paint()", us=elapsed / NUM_CALLS * 1e6))
+
+# query data
+for name, role in (("DisplayRole", Qt.DisplayRole), ("FontRole", Qt.FontRole), ("ForegroundRole", Qt.ForegroundRole)):
+    start = time.perf_counter()
+    for index in indexes:
+        model.data(index, role)
+    elapsed = time.perf_counter() - start
+    print("{name:<16} {us:6.2f} us per call".format(name=name, us=elapsed / NUM_CALLS * 1e6))
@@ -0,0 +1,61 @@
+""" Selection benchmark for the AbstractDragDropTreeView
+
+Creates a tree of 10k items, selects all of them in one selection change, and
+times the selection queries that are used by the copy/delete/drag operations.
+The selected items are tracked in an ordered set as the selection changes, and
+the base/copyable items are computed once per selection change, so repeated
+queries are read from the cached snapshot.
+"""
+import sys
+import time
+
+from qtpy.QtCore import QItemSelection, QItemSelectionModel, QModelIndex
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.views import AbstractDragDropModel, AbstractDragDropTreeView
+
+app = QApplication(sys.argv)
+
+NUM_GROUPS = 100
+NUM_CHILDREN = 99
+
+# create model
+model = AbstractDragDropModel()
+model.setIsCopyable(True)
+model.insertNewIndexes(0, [
+    {"name": "group{x}".format(x=x), "children": [{"name": "item{y}".format(y=y)} for y in range(NUM_CHILDREN)]}
+    for x in range(NUM_GROUPS)])
+
+# create view
+view = AbstractDragDropTreeView()
+view.setModel(model)
+view.expandAll()
+view.show()
+app.processEvents()
+
+RESULT = "{name:<32} {ms:10.2f} ms | {num} items"
+
+
+def timeQuery(name, function):
+    start = time.perf_counter()
+    result = function()
+    print(RESULT.format(name=name, ms=(time.perf_counter() - start) * 1e3, num=len(result)))
+
+
+def selectAll():
+    # one range per parent, as a select all from the view would do
+    selection = QItemSelection()
+    for parent_index in [QModelIndex()] + [model.index(row, 0, QModelIndex()) for row in range(NUM_GROUPS)]:
+        last_row = model.rowCount(parent_index) - 1
+        selection.select(model.index(0, 0, parent_index), model.index(last_row, 0, parent_index))
+    view.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+    app.processEvents()
+    return view.getAllSelectedItems()
+
+
+timeQuery("select all", selectAll)
+timeQuery("getAllSelectedItems", view.getAllSelectedItems)
+timeQuery("getAllBaseItems", view.getAllBaseItems)
+timeQuery("getAllCopyableItems", view.getAllCopyableItems)
+timeQuery("getAllBaseItems (cached)", view.getAllBaseItems)
+timeQuery("getAllCopyableItems (cached)", view.getAllCopyableItems)
@@ -0,0 +1,70 @@
+""" Hover display benchmark
+
+Creates a window with 2k AbstractStringInputWidgets, which set their own style
+sheet, and times creating them, updating their style sheets, and then toggling
+their hover display off and on again.  The rules for the hover display are only
+created once, and are appended to the style sheet of the input widget when it
+is set, so toggling only updates the "hover_display_ss_<name>" property of each
+widget, and re-polishes that widget.
+
+The same is then timed for 2k QLabels in a ShojiLayout, where the rules are
+installed once in the style sheet of the layout, and shared by all of its children.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication, QLabel, QWidget, QGridLayout
+
+from cgwidgets.settings.hover_display import uninstallHoverDisplaySS
+from cgwidgets.widgets import AbstractStringInputWidget, ShojiLayout
+
+app = QApplication(sys.argv)
+
+NUM_ROWS = 50
+NUM_COLUMNS = 40
+
+RESULT = "{name:<20} {ms:10.2f} ms | {num} widgets"
+
+
+def timeEvent(name, widgets, function):
+    start = time.perf_counter()
+    for widget in widgets:
+        function(widget)
+    app.processEvents()
+    print(RESULT.format(name=name, ms=(time.perf_counter() - start) * 1e3, num=len(widgets)))
+
+
+# create input widgets
+start = time.perf_counter()
+window = QWidget()
+layout = QGridLayout(window)
+widgets = []
+for row in range(NUM_ROWS):
+    for column in range(NUM_COLUMNS):
+        widget = AbstractStringInputWidget()
+        widget.setText("{row}.{column}".format(row=row, column=column))
+        layout.addWidget(widget, row, column)
+        widgets.append(widget)
+window.show()
+app.processEvents()
+print(RESULT.format(name="input create", ms=(time.perf_counter() - start) * 1e3, num=len(widgets)))
+
+timeEvent("input update", widgets, lambda widget: widget.updateStyleSheet())
+timeEvent("input uninstall", widgets, lambda widget: uninstallHoverDisplaySS(widget, name="INPUT WIDGETS"))
+timeEvent("input reinstall", widgets, lambda widget: widget.installHoverDisplay())
+window.close()
+
+# create shoji layout
+start = time.perf_counter()
+shoji_layout = ShojiLayout()
+labels = []
+for x in range(NUM_ROWS * NUM_COLUMNS):
+    label = QLabel(str(x))
+    shoji_layout.addWidget(label)
+    labels.append(label)
+shoji_layout.show()
+app.processEvents()
+print(RESULT.format(name="shoji create", ms=(time.perf_counter() - start) * 1e3, num=len(labels)))
+
+timeEvent("shoji uninstall", labels, lambda widget: uninstallHoverDisplaySS(widget, name="SHOJI VIEW"))
+timeEvent("shoji reinstall", labels, lambda widget: shoji_layout.installHoverDisplay(widget))
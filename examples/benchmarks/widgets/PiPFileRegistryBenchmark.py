@@ -0,0 +1,79 @@
+""" PiP file registry benchmark
+
+Writes 5 PiP files, each with 200 PiPWidgets of 10 widgets, and times looking up
+the names of all of the PiPWidgets, and all of the PiPData 100 times.  This is
+what the PiPSaveWidget does during routine interactions, such as updating the
+save button when the user types a name.  Without the registry, every lookup
+parses every PiP file, while the registry only parses a file the first time it
+is looked up, or after it has changed on disk.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.utils import getJSONData
+from cgwidgets.widgets import PiPFileRegistry
+
+app = QApplication(sys.argv)
+
+NUM_FILES = 5
+NUM_PIPS = 200
+NUM_WIDGETS = 10
+NUM_LOOKUPS = 100
+
+RESULT = "{name:<20} {ms:10.2f} ms | {parses} parses"
+
+CONSTRUCTOR_CODE = """
+from qtpy.QtWidgets import QLabel
+widget = QLabel("{index}")
+"""
+
+# write pip files
+directory = tempfile.mkdtemp()
+filepaths = []
+for file_index in range(NUM_FILES):
+    pip_data = {
+        "pip{index}".format(index=pip_index): {
+            "widgets": {
+                "widget{index}".format(index=index): {
+                    "code": CONSTRUCTOR_CODE.format(index=index),
+                    "Overlay Text": "",
+                    "Overlay Image": ""}
+                for index in range(NUM_WIDGETS)},
+            "settings": {}}
+        for pip_index in range(NUM_PIPS)}
+    filepath = os.path.join(directory, "PiPWidgets_{index}.json".format(index=file_index))
+    with open(filepath, "w") as f:
+        json.dump(pip_data, f)
+    filepaths.append(filepath)
+
+
+def timeLookups(name, get_data):
+    start = time.perf_counter()
+    for lookup in range(NUM_LOOKUPS):
+        names = []
+        for filepath in filepaths:
+            names += list(get_data(filepath).keys())
+    return name, (time.perf_counter() - start) * 1e3
+
+
+# parse every lookup
+name, ms = timeLookups("parse", getJSONData)
+print(RESULT.format(name=name, ms=ms, parses=NUM_FILES * NUM_LOOKUPS))
+
+# registry
+registry = PiPFileRegistry()
+name, ms = timeLookups("registry", registry.data)
+print(RESULT.format(name=name, ms=ms, parses=registry.parses))
+
+# change one file on disk, only that file is parsed again
+time.sleep(0.1)
+with open(filepaths[0], "w") as f:
+    json.dump({"pip": {"widgets": {}, "settings": {}}}, f)
+app.processEvents()
+name, ms = timeLookups("registry (changed)", registry.data)
+print(RESULT.format(name=name, ms=ms, parses=registry.parses))
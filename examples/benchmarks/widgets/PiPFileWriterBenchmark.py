@@ -0,0 +1,105 @@
+""" PiP file writer benchmark
+
+Writes a PiP file with 500 PiPWidgets of 20 widgets, and times saving an edit
+to a single PiPWidget 100 times.  Without the writer, the entire PiP file is
+serialized and written on every save.  The writer only serializes the PiPWidget
+that has changed, and when every PiPWidget is stored in its own file (split),
+only that PiPWidgets file, and the PiP file with the references are written.
+When the saves are debounced, all of the saves are written once.  Saving the
+entire PiP file, with every PiPWidget rebuilt (as the organizer does), should
+still only serialize the PiPWidget that has changed.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.widgets import PiPFileWriter
+
+app = QApplication(sys.argv)
+
+NUM_PIPS = 500
+NUM_WIDGETS = 20
+NUM_SAVES = 100
+
+RESULT = "{name:<20} {ms:10.2f} ms"
+
+CONSTRUCTOR_CODE = """
+from qtpy.QtWidgets import QLabel
+widget = QLabel("{index}")
+"""
+
+pip_data = OrderedDict(
+    ("pip{index}".format(index=pip_index), {
+        "widgets": {
+            "widget{index}".format(index=index): {
+                "code": CONSTRUCTOR_CODE.format(index=index),
+                "Overlay Text": "",
+                "Overlay Image": ""}
+            for index in range(NUM_WIDGETS)},
+        "settings": {"save": 0}})
+    for pip_index in range(NUM_PIPS))
+
+
+def createPiPFile():
+    filepath = os.path.join(tempfile.mkdtemp(), "PiPWidgets.json")
+    with open(filepath, "w") as f:
+        json.dump(pip_data, f)
+    return filepath
+
+
+def editedPiPWidget(save):
+    pip_widget = dict(pip_data["pip0"])
+    pip_widget["settings"] = {"save": save}
+    return pip_widget
+
+
+# write the entire file
+filepath = createPiPFile()
+start = time.perf_counter()
+for save in range(NUM_SAVES):
+    pip_data["pip0"] = editedPiPWidget(save)
+    with open(filepath, "w") as f:
+        json.dump(pip_data, f)
+print(RESULT.format(name="entire file", ms=(time.perf_counter() - start) * 1e3))
+
+# writer, written on every save
+for name, is_split in (("writer", False), ("writer (split)", True)):
+    filepath = createPiPFile()
+    writer = PiPFileWriter(is_split=is_split)
+    writer.setEntry(filepath, "pip0", editedPiPWidget(0))
+    writer.flush()
+    start = time.perf_counter()
+    for save in range(NUM_SAVES):
+        writer.setEntry(filepath, "pip0", editedPiPWidget(save))
+        writer.flush()
+    print(RESULT.format(name=name, ms=(time.perf_counter() - start) * 1e3))
+
+# writer, debounced
+filepath = createPiPFile()
+writer = PiPFileWriter()
+start = time.perf_counter()
+for save in range(NUM_SAVES):
+    writer.setEntry(filepath, "pip0", editedPiPWidget(save))
+writer.flush()
+print(RESULT.format(name="writer (debounced)", ms=(time.perf_counter() - start) * 1e3))
+
+# writer, entire file rebuilt on every save
+for name, is_split in (("writer (set data)", False), ("writer (set split)", True)):
+    filepath = createPiPFile()
+    writer = PiPFileWriter(is_split=is_split)
+    writer.setData(filepath, json.loads(json.dumps(pip_data), object_pairs_hook=OrderedDict))
+    writer.flush()
+    duration = 0
+    for save in range(NUM_SAVES):
+        data = json.loads(json.dumps(pip_data), object_pairs_hook=OrderedDict)
+        data["pip0"] = editedPiPWidget(save)
+        start = time.perf_counter()
+        writer.setData(filepath, data)
+        writer.flush()
+        duration += time.perf_counter() - start
+    print(RESULT.format(name=name, ms=duration * 1e3))
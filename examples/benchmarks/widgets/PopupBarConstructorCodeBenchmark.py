@@ -0,0 +1,105 @@
+""" Constructor code cache benchmark for the PopupBarDisplayWidget
+
+Writes a PiP file with 300 widgets, each with its own constructor code, and
+times loading it into a PopupBarDisplayWidget.  On the first load, all of the
+constructor code is compiled, afterwards the compiled code is reused from the
+cache in memory, or from the marshalled cache on disk in a new session.  The
+time taken to only run the constructor code, with and without the cache, is
+also reported, as it is only a portion of the total load time.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.widgets import PopupBarDisplayWidget, constructor_code_cache
+
+app = QApplication(sys.argv)
+
+NUM_WIDGETS = 300
+
+RESULT = "{name:<16} {ms:10.2f} ms | {hits} hits | {misses} misses"
+
+CONSTRUCTOR_CODE = """
+from qtpy.QtWidgets import QWidget, QFormLayout, QLineEdit, QLabel
+
+# create form
+widget = QWidget()
+widget.setObjectName("widget_{index}")
+layout = QFormLayout(widget)
+
+# create fields
+fields = {{}}
+for name in ["name", "path", "value"]:
+    field = QLineEdit()
+    field.setObjectName("{{name}}_{index}".format(name=name))
+    field.setPlaceholderText("{{name}} of widget {index}".format(name=name))
+    layout.addRow(QLabel(name), field)
+    fields[name] = field
+widget.fields = fields
+"""
+
+# write pip file
+popup_bar_widget = PopupBarDisplayWidget()
+settings = popup_bar_widget.settings()
+settings["sizes"] = []
+widgets = {
+    "widget{index}".format(index=index): {
+        "code": CONSTRUCTOR_CODE.format(index=index),
+        "Overlay Text": "",
+        "Overlay Image": ""}
+    for index in range(NUM_WIDGETS)}
+filepath = os.path.join(tempfile.mkdtemp(), "PiPWidgets.json")
+with open(filepath, "w") as f:
+    json.dump({"benchmark": {"widgets": widgets, "settings": settings}}, f)
+
+
+def timeLoad(name):
+    constructor_code_cache.resetCounters()
+    popup_bar_widget = PopupBarDisplayWidget()
+    start = time.perf_counter()
+    popup_bar_widget.loadPopupDisplayFromFile(filepath, "benchmark")
+    print(RESULT.format(
+        name=name, ms=(time.perf_counter() - start) * 1e3,
+        hits=constructor_code_cache.hits, misses=constructor_code_cache.misses))
+    popup_bar_widget.deleteLater()
+    app.processEvents()
+
+
+def timeConstructorCode(name, clear_cache):
+    constructor_code_cache.resetCounters()
+    popup_bar_widget = PopupBarDisplayWidget()
+    start = time.perf_counter()
+    for widget_data in widgets.values():
+        if clear_cache:
+            constructor_code_cache.clear()
+        popup_bar_widget.createWidgetFromConstructorCode(widget_data["code"]).deleteLater()
+    print(RESULT.format(
+        name=name, ms=(time.perf_counter() - start) * 1e3,
+        hits=constructor_code_cache.hits, misses=constructor_code_cache.misses))
+    popup_bar_widget.deleteLater()
+    app.processEvents()
+
+
+# constructor code only
+timeConstructorCode("code (compile)", True)
+constructor_code_cache.precompile({"benchmark": {"widgets": widgets}})
+timeConstructorCode("code (cached)", False)
+
+# load
+constructor_code_cache.clear()
+timeLoad("load (cold)")
+timeLoad("load (memory)")
+
+# disk cache, as if loaded in a new session
+constructor_code_cache.setCacheDir(tempfile.mkdtemp())
+constructor_code_cache.save()
+constructor_code_cache.clear()
+start = time.perf_counter()
+constructor_code_cache.load()
+print("{num} code objects loaded from disk in {ms:.2f} ms".format(
+    num=len(constructor_code_cache.code()), ms=(time.perf_counter() - start) * 1e3))
+timeLoad("load (disk)")
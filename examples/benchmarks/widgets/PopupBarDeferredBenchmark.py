@@ -0,0 +1,93 @@
+""" Deferred loading benchmark for the PopupBarDisplayWidget
+
+Writes a PiP file with 100 widgets, each a form of input fields, and times
+loading it into a PopupBarDisplayWidget, with every widget created up front,
+and in deferred mode.  In deferred mode, only the current widget is created,
+and every other widget displays a snapshot of its last render until it is
+set as the current widget.  The time to swap through all of the widgets is
+also reported, as this is where the deferred widgets are created, and with a
+budget of live widgets, where the idle widgets are frozen back into snapshots.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.widgets import PopupBarDisplayWidget, popup_bar_snapshot_cache
+
+app = QApplication(sys.argv)
+
+NUM_WIDGETS = 100
+MAX_LIVE_WIDGETS = 5
+
+RESULT = "{name:<20} {ms:10.2f} ms | {num} widgets created"
+
+CONSTRUCTOR_CODE = """
+from qtpy.QtWidgets import QWidget, QFormLayout, QLineEdit, QLabel
+
+widget = QWidget()
+layout = QFormLayout(widget)
+for row in range(20):
+    layout.addRow(QLabel("field {{row}}".format(row=row)), QLineEdit("{index}"))
+"""
+
+# write pip file
+settings = PopupBarDisplayWidget().settings()
+settings.update({
+    "sizes": [],
+    "Display Mode": PopupBarDisplayWidget.PIP,
+    "PiP Scale": [0.25, 0.25],
+    "Taskbar Size": 100,
+    "Overlay Text": "",
+    "Overlay Image": ""})
+widgets = {
+    "widget{index}".format(index=index): {
+        "code": CONSTRUCTOR_CODE.format(index=index),
+        "Overlay Text": "",
+        "Overlay Image": ""}
+    for index in range(NUM_WIDGETS)}
+filepath = os.path.join(tempfile.mkdtemp(), "PiPWidgets.json")
+with open(filepath, "w") as f:
+    json.dump({"benchmark": {"widgets": widgets, "settings": settings}}, f)
+
+
+def numCreatedWidgets(popup_bar_widget):
+    return len([widget for widget in popup_bar_widget.widgets() if widget.isInstantiated()])
+
+
+def timeLoad(name, popup_bar_widget, deferred):
+    start = time.perf_counter()
+    popup_bar_widget.loadPopupDisplayFromFile(filepath, "benchmark", deferred=deferred)
+    popup_bar_widget.show()
+    app.processEvents()
+    print(RESULT.format(
+        name=name, ms=(time.perf_counter() - start) * 1e3, num=numCreatedWidgets(popup_bar_widget)))
+
+
+def timeSwap(name, popup_bar_widget):
+    start = time.perf_counter()
+    for index in range(NUM_WIDGETS - 1):
+        widget = popup_bar_widget.popupBarWidget().widgets()[index]
+        popup_bar_widget.displayWidget().setCurrentWidget(widget)
+        app.processEvents()
+    print(RESULT.format(
+        name=name, ms=(time.perf_counter() - start) * 1e3, num=numCreatedWidgets(popup_bar_widget)))
+
+
+for deferred in (False, True):
+    popup_bar_widget = PopupBarDisplayWidget()
+    popup_bar_widget.resize(800, 600)
+    timeLoad("load (deferred)" if deferred else "load", popup_bar_widget, deferred)
+
+# swap through widgets
+timeSwap("swap (deferred)", popup_bar_widget)
+
+# swap again with the snapshots of the last render, freezing idle widgets
+popup_bar_widget = PopupBarDisplayWidget()
+popup_bar_widget.resize(800, 600)
+popup_bar_snapshot_cache.setMaxLiveWidgets(MAX_LIVE_WIDGETS)
+timeLoad("load (snapshots)", popup_bar_widget, True)
+timeSwap("swap (budget)", popup_bar_widget)
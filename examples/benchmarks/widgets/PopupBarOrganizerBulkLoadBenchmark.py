@@ -0,0 +1,62 @@
+""" Bulk load benchmark for the PopupBarOrganizerWidget
+
+Times creating 1k widgets in a PopupBarOrganizerWidget one at a time with
+createNewWidgetFromConstructorCode(), and in one batch with
+createNewWidgetsFromConstructorCode(), which is what loading a PiP file into
+the organizer uses.  Creating the widgets one at a time updates every widget
+index, and inserts an organizer item for each widget, while the batch only
+updates the indexes once, and inserts all of the organizer items together.
+The time to move a widget in the organizer is also reported, where only the
+indexes between the old and new position are updated.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication
+
+from cgwidgets.widgets import PopupBarOrganizerWidget
+
+app = QApplication(sys.argv)
+
+NUM_WIDGETS = 1000
+NUM_MOVES = 100
+
+RESULT = "{name:<12} {ms:10.2f} ms | {num} widgets"
+
+CONSTRUCTOR_CODE = """
+from qtpy.QtWidgets import QLabel
+widget = QLabel("{index}")
+"""
+
+widgets = [
+    ("widget{index}".format(index=index), CONSTRUCTOR_CODE.format(index=index))
+    for index in reversed(range(NUM_WIDGETS))]
+
+
+def createOrganizer():
+    organizer_widget = PopupBarOrganizerWidget()
+    organizer_widget.removeAllWidgets()
+    app.processEvents()
+    return organizer_widget
+
+
+# one at a time
+organizer_widget = createOrganizer()
+start = time.perf_counter()
+for name, constructor_code in widgets:
+    organizer_widget.createNewWidgetFromConstructorCode(constructor_code, name=name, resize_popup_bar=False)
+print(RESULT.format(name="per widget", ms=(time.perf_counter() - start) * 1e3, num=len(organizer_widget.items())))
+
+# batch
+organizer_widget = createOrganizer()
+start = time.perf_counter()
+organizer_widget.createNewWidgetsFromConstructorCode(widgets, resize_popup_bar=False)
+print(RESULT.format(name="batch", ms=(time.perf_counter() - start) * 1e3, num=len(organizer_widget.items())))
+
+# move widgets
+popup_bar_organizer_widget = organizer_widget.popupBarOrganizerWidget()
+start = time.perf_counter()
+for move in range(NUM_MOVES):
+    widget = organizer_widget.popupBarWidget().widgets()[-2]
+    popup_bar_organizer_widget.itemReordered(None, [widget.item()], None, NUM_WIDGETS - 3, None)
+print(RESULT.format(name="move (each)", ms=(time.perf_counter() - start) * 1e3 / NUM_MOVES, num=len(organizer_widget.items())))
@@ -0,0 +1,68 @@
+""" Dynamic widget pool benchmark for the ShojiModelViewWidget
+
+Creates a DYNAMIC ShojiModelViewWidget with 200 tabs, whose dynamic widget
+is a form of 20 labelled line edits, and times changing the selection from
+one tab to the next, with and without a dynamic widget pool.  Without the
+pool, a new form is constructed and polished for every selection, with the
+pool, the form of the previously selected tab is rebound to the new tab.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication, QWidget, QFormLayout, QLineEdit
+
+from cgwidgets.widgets import ShojiModelViewWidget
+
+app = QApplication(sys.argv)
+
+NUM_TABS = 200
+NUM_FIELDS = 20
+
+RESULT = "{name:<16} {ms:8.2f} ms per selection | {num} widgets constructed"
+
+
+class FormWidget(QWidget):
+    num_constructed = 0
+
+    def __init__(self, parent=None):
+        super(FormWidget, self).__init__(parent)
+        FormWidget.num_constructed += 1
+        layout = QFormLayout(self)
+        self.fields = []
+        for x in range(NUM_FIELDS):
+            field = QLineEdit()
+            layout.addRow("field{x}".format(x=x), field)
+            self.fields.append(field)
+
+    @staticmethod
+    def updateGUI(parent, widget, item):
+        if item:
+            for field in widget.getMainWidget().fields:
+                field.setText(item.name())
+
+
+for pool_size in (0, 1):
+    FormWidget.num_constructed = 0
+    shoji_widget = ShojiModelViewWidget()
+    shoji_widget.setDelegateType(
+        ShojiModelViewWidget.DYNAMIC, dynamic_widget=FormWidget, dynamic_function=FormWidget.updateGUI)
+    shoji_widget.setDynamicWidgetPoolSize(pool_size)
+    for x in range(NUM_TABS):
+        shoji_widget.insertShojiWidget(x, column_data={"name": "tab{x}".format(x=x)})
+    shoji_widget.show()
+    app.processEvents()
+
+    items = shoji_widget.rootItem().children()
+    start = time.perf_counter()
+    for item in items:
+        shoji_widget.clearItemSelection()
+        shoji_widget.setItemSelected(item, True)
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    print(RESULT.format(
+        name="pool size {size}".format(size=pool_size),
+        ms=elapsed / NUM_TABS * 1e3,
+        num=FormWidget.num_constructed))
+    shoji_widget.close()
+    shoji_widget.deleteLater()
@@ -0,0 +1,79 @@
+""" Layout pass benchmark for the ShojiLayout / ShojiModelViewWidget
+
+Creates a ShojiModelViewWidget with 20 tabs, each holding a grid of nested
+ShojiLayouts, and times resizing the window, and dragging the handles of the
+nested layouts, processing the events after every step like a frame would.
+The style sheet changes are counted with an event filter on the application,
+geometry only changes should update without any style sheet being applied.
+"""
+import sys
+import time
+
+from qtpy.QtCore import QEvent, QObject
+from qtpy.QtWidgets import QApplication, QLabel
+
+from cgwidgets.widgets import ShojiModelViewWidget, ShojiLayout
+
+app = QApplication(sys.argv)
+
+NUM_TABS = 20
+NUM_ROWS = 10
+NUM_COLUMNS = 10
+NUM_FRAMES = 100
+
+RESULT = "{name:<12} {ms:8.2f} ms per frame | {num} style sheet changes"
+
+
+class StyleChangeCounter(QObject):
+    num_changes = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.StyleChange:
+            StyleChangeCounter.num_changes += 1
+        return False
+
+
+def createLayoutGrid():
+    grid = ShojiLayout()
+    for row in range(NUM_ROWS):
+        row_layout = ShojiLayout()
+        for column in range(NUM_COLUMNS):
+            row_layout.addWidget(QLabel("{row}.{column}".format(row=row, column=column)))
+        grid.addWidget(row_layout)
+    return grid
+
+
+def timeFrames(name, function):
+    app.processEvents()
+    StyleChangeCounter.num_changes = 0
+    start = time.perf_counter()
+    for frame in range(NUM_FRAMES):
+        function(frame)
+        app.processEvents()
+    print(RESULT.format(
+        name=name, ms=(time.perf_counter() - start) * 1e3 / NUM_FRAMES, num=StyleChangeCounter.num_changes))
+
+
+# create widget
+shoji_widget = ShojiModelViewWidget()
+for x in range(NUM_TABS):
+    shoji_widget.insertShojiWidget(x, column_data={"name": "tab{x}".format(x=x)}, widget=createLayoutGrid())
+shoji_widget.resize(800, 600)
+shoji_widget.show()
+shoji_widget.setItemSelected(shoji_widget.rootItem().children()[0], True)
+
+counter = StyleChangeCounter()
+app.installEventFilter(counter)
+
+# resize
+timeFrames("resize", lambda frame: shoji_widget.resize(800 + frame, 600 + frame))
+
+
+# handle drags
+def dragHandles(frame):
+    for widget in shoji_widget.findChildren(ShojiLayout):
+        if 1 < widget.count():
+            widget.moveSplitter(10 + frame, 1)
+
+
+timeFrames("drag", dragHandles)
@@ -0,0 +1,59 @@
+""" Lazy delegate benchmark for the ShojiModelViewWidget
+
+Inserts 300 tabs into a STACKED ShojiModelViewWidget, once with the widgets
+created up front, and once with a widget_factory, and times inserting the tabs,
+and then selecting/deselecting 10 of them.  With a widget_factory, the widgets
+are only created when their tab is first selected, so the delegate only holds
+the widgets that have been displayed, and isolating the selected widgets no
+longer touches every tab.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication, QLabel
+
+from cgwidgets.widgets import ShojiModelViewWidget
+
+app = QApplication(sys.argv)
+
+NUM_TABS = 300
+NUM_SELECTIONS = 10
+
+RESULT = "{name:<16} {insert:10.2f} ms insert | {select:10.2f} ms select | {num} widgets created"
+
+
+def createWidget(x):
+    return QLabel("tab{x}".format(x=x))
+
+
+for is_lazy in (False, True):
+    shoji_widget = ShojiModelViewWidget()
+    shoji_widget.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    for x in range(NUM_TABS):
+        if is_lazy:
+            shoji_widget.insertShojiWidget(
+                x, column_data={"name": "tab{x}".format(x=x)}, widget_factory=lambda x=x: createWidget(x))
+        else:
+            shoji_widget.insertShojiWidget(x, column_data={"name": "tab{x}".format(x=x)}, widget=createWidget(x))
+    app.processEvents()
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for x in range(NUM_SELECTIONS):
+        item = shoji_widget.rootItem().children()[x * (NUM_TABS // NUM_SELECTIONS)]
+        shoji_widget.setItemSelected(item, True)
+        app.processEvents()
+        shoji_widget.setItemSelected(item, False)
+        app.processEvents()
+    select_time = time.perf_counter() - start
+
+    print(RESULT.format(
+        name="lazy" if is_lazy else "eager",
+        insert=insert_time * 1e3,
+        select=select_time * 1e3,
+        num=shoji_widget.delegateWidget().count() - 1))
+    shoji_widget.close()
+    shoji_widget.deleteLater()
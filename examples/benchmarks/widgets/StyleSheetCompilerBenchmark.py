@@ -0,0 +1,48 @@
+""" Style sheet compiler benchmark
+
+Creates 2k ShojiLayouts, and installs a hover display on 2k QLineEdits, and
+times updating all of their style sheets, with the style sheet cache disabled
+(max size of 0), and enabled.  With the cache enabled, every template is only
+formatted once for each unique set of arguments, and the widgets are handed
+the identical style sheet, so they do not need to be polished again.
+"""
+import sys
+import time
+
+from qtpy.QtWidgets import QApplication, QLineEdit
+
+from cgwidgets.settings.hover_display import installHoverDisplaySS
+from cgwidgets.settings.stylesheets import style_sheet_compiler
+from cgwidgets.widgets import ShojiLayout
+
+app = QApplication(sys.argv)
+
+NUM_WIDGETS = 2000
+NUM_UPDATES = 5
+
+RESULT = "{name:<16} {ms:10.2f} ms | {hits} hits | {misses} misses"
+
+layouts = [ShojiLayout() for _ in range(NUM_WIDGETS)]
+line_edits = [QLineEdit() for _ in range(NUM_WIDGETS)]
+
+
+def updateStyleSheets():
+    for _ in range(NUM_UPDATES):
+        for layout in layouts:
+            layout.updateStyleSheet()
+        for line_edit in line_edits:
+            installHoverDisplaySS(line_edit, name="BENCHMARK")
+
+
+for name, max_size in (("uncached", 0), ("cached", style_sheet_compiler.MAX_SIZE)):
+    style_sheet_compiler.clearCache()
+    style_sheet_compiler.setMaxSize(max_size)
+    style_sheet_compiler.resetCounters()
+
+    start = time.perf_counter()
+    updateStyleSheets()
+    print(RESULT.format(
+        name=name,
+        ms=(time.perf_counter() - start) * 1e3,
+        hits=style_sheet_compiler.hits,
+        misses=style_sheet_compiler.misses))